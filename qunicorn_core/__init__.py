@@ -102,6 +102,71 @@ def create_app(test_config: Optional[Dict[str, Any]] = None):
 
         if "CIRCUIT_CUTTING_URL" in environ:
             config["CIRCUIT_CUTTING_URL"] = environ["CIRCUIT_CUTTING_URL"]
+
+        if "CIRCUIT_CUT_CACHE_SIZE" in environ:
+            config["CIRCUIT_CUT_CACHE_SIZE"] = int(environ["CIRCUIT_CUT_CACHE_SIZE"])
+
+        if "IDEMPOTENCY_KEY_TTL" in environ:
+            config["IDEMPOTENCY_KEY_TTL"] = int(environ["IDEMPOTENCY_KEY_TTL"])
+
+        if "SIMULATOR_RESULT_CACHE" in environ:
+            config["SIMULATOR_RESULT_CACHE"] = environ["SIMULATOR_RESULT_CACHE"] == "True"
+
+        if "SIMULATOR_RESULT_CACHE_TTL" in environ:
+            config["SIMULATOR_RESULT_CACHE_TTL"] = int(environ["SIMULATOR_RESULT_CACHE_TTL"])
+
+        if "SIMULATOR_RESULT_CACHE_SIZE" in environ:
+            config["SIMULATOR_RESULT_CACHE_SIZE"] = int(environ["SIMULATOR_RESULT_CACHE_SIZE"])
+
+        if "PRETRANSLATE_DEPLOYMENTS" in environ:
+            config["PRETRANSLATE_DEPLOYMENTS"] = environ["PRETRANSLATE_DEPLOYMENTS"] == "True"
+
+        for key in ("ISA_COMPILATION_CACHE_SIZE", "BACKEND_VERSION_TTL"):
+            if key in environ:
+                config[key] = int(environ[key])
+
+        if "TRANSPILER_COST_MODEL" in environ:
+            config["TRANSPILER_COST_MODEL"] = environ["TRANSPILER_COST_MODEL"]
+
+        if "SANDBOX_UNSAFE_TRANSPILERS" in environ:
+            config["SANDBOX_UNSAFE_TRANSPILERS"] = environ["SANDBOX_UNSAFE_TRANSPILERS"] == "True"
+
+        for key in ("SANDBOX_POOL_SIZE", "SANDBOX_TIMEOUT", "SANDBOX_MEMORY_LIMIT", "SANDBOX_MAX_TASKS"):
+            if key in environ:
+                config[key] = int(environ[key])
+
+        for key in (
+            "SIMULATION_PROCESSES",
+            "SIMULATION_MEMORY_LIMIT",
+            "SIMULATION_MAX_TASKS",
+            "CANCELLATION_POLL_INTERVAL",
+        ):
+            if key in environ:
+                config[key] = int(environ[key])
+
+        for key in ("IN_PROCESS_WORKERS", "IN_PROCESS_POLL_INTERVAL"):
+            if key in environ:
+                config[key] = int(environ[key])
+
+        if "VARIATIONAL_MAX_ITERATIONS" in environ:
+            config["VARIATIONAL_MAX_ITERATIONS"] = int(environ["VARIATIONAL_MAX_ITERATIONS"])
+
+        if "SHOT_CHUNK_SIZE" in environ:
+            config["SHOT_CHUNK_SIZE"] = int(environ["SHOT_CHUNK_SIZE"])
+
+        if "EXACT_PROBABILITIES_MAX_QUBITS" in environ:
+            config["EXACT_PROBABILITIES_MAX_QUBITS"] = int(environ["EXACT_PROBABILITIES_MAX_QUBITS"])
+
+        for key in ("RIGETTI_PARALLEL_PROGRAMS", "RIGETTI_EXECUTABLE_CACHE_SIZE"):
+            if key in environ:
+                config[key] = int(environ[key])
+
+        for key in ("JOB_HEARTBEAT_INTERVAL", "JOB_HEARTBEAT_TIMEOUT", "STUCK_JOB_MAX_REQUEUES", "WATCHDOG_INTERVAL"):
+            if key in environ:
+                config[key] = int(environ[key])
+
+        if "STUCK_JOB_POLICY" in environ:
+            config["STUCK_JOB_POLICY"] = environ["STUCK_JOB_POLICY"]
     else:
         # load the test config if passed in
         config.from_mapping(test_config)
@@ -156,6 +221,8 @@ def create_app(test_config: Optional[Dict[str, Any]] = None):
 
     db.register_db(app)
 
+    core.task_executor.register_task_executor(app)
+
     api.register_root_api(app)
 
     # allow cors requests everywhere (CONFIGURE THIS TO YOUR PROJECTS NEEDS!)
@@ -37,6 +37,7 @@ class VersionsRootSchema(MaBaseSchema):
     devices = ma.fields.Url(required=False, allow_none=False, dump_only=True)
     deployments = ma.fields.Url(required=False, allow_none=False, dump_only=True)
     provider = ma.fields.Url(required=False, allow_none=False, dump_only=True)
+    transpilers = ma.fields.Url(required=False, allow_none=False, dump_only=True)
     api_spec = ma.fields.Url(required=False, allow_none=False, dump_only=True)
     swagger_ui = ma.fields.Url(required=False, allow_none=False, dump_only=True)
     rapidoc = ma.fields.Url(required=False, allow_none=False, dump_only=True)
@@ -62,6 +63,7 @@ class RootView(MethodView):
             "devices": url_for("device-api.DeviceView", _external=True),
             "deployments": url_for("deployment-api.DeploymentIDView", _external=True),
             "provider": url_for("provider-api.ProviderView", _external=True),
+            "transpilers": url_for("transpiler-api.TranspilerView", _external=True),
             "api_spec": url_for("api-docs.openapi_json", _external=True),
             "swagger_ui": url_for("api-docs.openapi_swagger_ui", _external=True),
             "rapidoc": url_for("api-docs.openapi_rapidoc", _external=True),
@@ -76,6 +78,7 @@ def register_root_api(app: Flask):
     from .job_api import JOBMANAGER_API
     from .jwt import SECURITY_SCHEMES
     from .provider_api import PROVIDER_API
+    from .transpiler_api import TRANSPILER_API
 
     API.init_app(app)
 
@@ -89,3 +92,4 @@ def register_root_api(app: Flask):
     API.register_blueprint(DEVICES_API)
     API.register_blueprint(DEPLOYMENT_API)
     API.register_blueprint(PROVIDER_API)
+    API.register_blueprint(TRANSPILER_API)
@@ -16,11 +16,11 @@
 """Module containing all Dtos and their Schemas for tasks in the Jobmanager API."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 import marshmallow as ma
 from flask import url_for
-from marshmallow.validate import OneOf, Range
+from marshmallow.validate import Length, OneOf, Range, Regexp
 
 from .device_dtos import DeviceDto, DeviceDtoSchema
 from .result_dtos import ResultDto, ResultDtoSchema
@@ -39,12 +39,15 @@ __all__ = [
     "JobFilterParamsSchema",
     "QueuedJobsDtoSchema",
     "JobCommandSchema",
+    "JobIdempotencyHeaderSchema",
 ]
 
 from ...static.enums.error_mitigation import ErrorMitigationMethod
 
 from ...static.enums.job_state import JobState
 from ...static.enums.job_type import JobType
+from ...static.enums.optimizer_method import OptimizerMethod
+from ...static.enums.probability_mode import ProbabilityMode
 from ...static.enums.provider_name import ProviderName
 
 
@@ -61,6 +64,11 @@ class JobRequestDto:
     cut_to_width: Optional[int]
     type: JobType
     deployment_id: int
+    seed: Optional[int] = None
+    parameter_bindings: Optional[List[Dict[str, float]]] = None
+    observables: Optional[List[List[str]]] = None
+    optimizer: Optional[dict] = None
+    probability_mode: ProbabilityMode = ProbabilityMode.SAMPLED
 
 
 @dataclass
@@ -95,6 +103,31 @@ class JobExecutePythonFileDto:
     python_file_inputs: str | None = None
 
 
+class OptimizerDtoSchema(MaBaseSchema):
+    method = ma.fields.Enum(
+        required=False, enum=OptimizerMethod, load_default=OptimizerMethod.COBYLA, metadata={"example": "COBYLA"}
+    )
+    initial_parameters = ma.fields.Dict(
+        keys=ma.fields.String(),
+        values=ma.fields.Float(),
+        required=True,
+        metadata={"example": {"theta": 0.0}, "description": "initial values of the parameters of the circuits"},
+    )
+    max_iterations = ma.fields.Integer(
+        required=False,
+        load_default=100,
+        validate=Range(min=1),
+        metadata={"example": 100, "description": "maximum number of circuit executions per program"},
+    )
+    coefficients = ma.fields.List(
+        ma.fields.List(ma.fields.Float()),
+        required=False,
+        allow_none=True,
+        missing=None,
+        metadata={"example": None, "description": "coefficients of the observables, one list per program"},
+    )
+
+
 class JobRequestDtoSchema(MaBaseSchema):
     name = ma.fields.String(required=True, metadata={"example": "JobName"})
     provider_name = ma.fields.Enum(required=True, metadata={"example": ProviderName.IBM}, enum=ProviderName)
@@ -115,6 +148,59 @@ class JobRequestDtoSchema(MaBaseSchema):
     token = ma.fields.String(required=True, metadata={"example": ""})
     type = ma.fields.Enum(required=True, metadata={"example": JobType.RUNNER}, enum=JobType)
     deployment_id = ma.fields.Integer(required=False, allow_none=True, metadata={"example": 1})
+    seed = ma.fields.Integer(
+        required=False,
+        allow_none=True,
+        missing=None,
+        validate=Range(min=0, max=2**31 - 1),
+        metadata={"example": None, "description": "seed for simulators to make results reproducible"},
+    )
+    parameter_bindings = ma.fields.List(
+        ma.fields.Dict(keys=ma.fields.String(), values=ma.fields.Float()),
+        required=False,
+        allow_none=True,
+        missing=None,
+        validate=Length(min=1),
+        metadata={
+            "example": None,
+            "description": "values for the parameters of parameterized circuits (e.g. OpenQASM 3 inputs), the"
+            " circuits are compiled once and executed for every binding",
+        },
+    )
+    observables = ma.fields.List(
+        ma.fields.List(ma.fields.String(validate=Regexp("^[IXYZ]+$")), validate=Length(min=1)),
+        required=False,
+        allow_none=True,
+        missing=None,
+        validate=Length(min=1),
+        metadata={
+            "example": None,
+            "description": "Pauli observables (e.g. 'ZI') of estimator jobs, one list per program of the deployment,"
+            " all observables of a program are estimated in a single execution",
+        },
+    )
+    optimizer = ma.fields.Nested(
+        OptimizerDtoSchema,
+        required=False,
+        allow_none=True,
+        missing=None,
+        metadata={
+            "example": None,
+            "description": "optimizer of VARIATIONAL jobs, minimizing the sum of the estimated observables",
+        },
+    )
+    probability_mode = ma.fields.Enum(
+        required=False,
+        enum=ProbabilityMode,
+        load_default=ProbabilityMode.SAMPLED,
+        dump_default=ProbabilityMode.SAMPLED,
+        metadata={
+            "example": ProbabilityMode.SAMPLED,
+            "description": "EXACT calculates the probabilities of RUNNER jobs on local simulators from the final state"
+            " instead of sampling them (for circuits of up to EXACT_PROBABILITIES_MAX_QUBITS measured qubits),"
+            " EXACT_WITH_COUNTS samples the counts in addition",
+        },
+    )
 
 
 class JobResponseDtoSchema(MaBaseSchema):
@@ -187,3 +273,17 @@ class JobCommandSchema(MaBaseSchema):
         required=True, validate=OneOf(["run", "rerun", "cancel"]), metadata={"example": "cancel"}
     )
     token = ma.fields.String(required=False, allow_none=True, missing=None, metadata={"example": ""})
+
+
+class JobIdempotencyHeaderSchema(MaBaseSchema):
+    idempotency_key = ma.fields.String(
+        data_key="Idempotency-Key",
+        required=False,
+        allow_none=True,
+        missing=None,
+        load_only=True,
+        validate=Length(min=1, max=100),
+        description="Repeated submissions with the same key return the existing job instead of creating a new one. "
+        "Requires an authenticated user, the key cannot be reused for a different request.",
+        metadata={"example": "6f1c2a9e-0b7d-4c55-9a51-2d8e4b0f3c7a"},
+    )
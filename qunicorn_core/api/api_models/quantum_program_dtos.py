@@ -34,6 +34,7 @@ class QuantumProgramDto:
     assembler_language: AssemblerLanguage | None = None
     python_file_path: str | None = None
     python_file_metadata: str | None = None
+    translation_errors: dict[str, str] | None = None
 
 
 @dataclass
@@ -80,6 +81,18 @@ class QuantumProgramDtoSchema(MaBaseSchema):
     assembler_language = ma.fields.Enum(required=True, dump_only=True, enum=AssemblerLanguage)
     python_file_path = ma.fields.String(required=False, dump_only=True)
     python_file_metadata = ma.fields.String(required=False, dump_only=True)
+    translation_errors = ma.fields.Dict(
+        keys=ma.fields.String(),
+        values=ma.fields.String(),
+        required=False,
+        allow_none=True,
+        dump_only=True,
+        metadata={
+            "description": "The errors of the translations that failed when the program was pre-translated, "
+            "keyed by the target format (empty if all translations succeeded, null if the program was not "
+            "pre-translated yet, see PRETRANSLATE_DEPLOYMENTS)."
+        },
+    )
     self = ma.fields.Function(
         lambda obj: url_for(
             "deployment-api.DeploymentProgramDetailsView", program_id=obj.id, deployment_id=obj.deployment_id
@@ -0,0 +1,56 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module containing all Dtos and their Schemas for the Transpiler API."""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import marshmallow as ma
+
+from ..flask_api_utils import MaBaseSchema
+
+__all__ = ["TranspilerDtoSchema", "TranspilerDto"]
+
+
+@dataclass
+class TranspilerDto:
+    name: str
+    source: str
+    target: str
+    cost: int
+    unsafe: bool
+    samples: int = 0
+    duration: Optional[float] = None
+    duration_by_size: Dict[int, float] = field(default_factory=dict)
+
+
+class TranspilerDtoSchema(MaBaseSchema):
+    name = ma.fields.String(required=True, allow_none=False)
+    source = ma.fields.String(required=True, allow_none=False, metadata={"description": "The source format."})
+    target = ma.fields.String(required=True, allow_none=False, metadata={"description": "The target format."})
+    cost = ma.fields.Integer(required=True, allow_none=False, metadata={"description": "The static cost."})
+    unsafe = ma.fields.Boolean(required=True, allow_none=False)
+    samples = ma.fields.Integer(
+        required=True, allow_none=False, metadata={"description": "The number of measured transpilations."}
+    )
+    duration = ma.fields.Float(
+        required=False,
+        allow_none=True,
+        metadata={"description": "Moving average of the transpilation duration in seconds."},
+    )
+    duration_by_size = ma.fields.Dict(
+        keys=ma.fields.Integer(),
+        values=ma.fields.Float(),
+        metadata={"description": "Moving average of the duration by the maximum size of the transpiled circuits."},
+    )
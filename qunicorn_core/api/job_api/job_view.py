@@ -29,6 +29,7 @@ from ..api_models.job_dtos import (
     JobResponseDto,
     JobResponseDtoSchema,
     JobFilterParamsSchema,
+    JobIdempotencyHeaderSchema,
     QueuedJobsDtoSchema,
     SimpleJobDto,
     SimpleJobDtoSchema,
@@ -67,20 +68,33 @@ class JobIDView(MethodView):
         return jobs
 
     @JOBMANAGER_API.arguments(JobFilterParamsSchema(only=["deployment"]), location="query", as_kwargs=True)
+    @JOBMANAGER_API.arguments(JobIdempotencyHeaderSchema(), location="headers", as_kwargs=True)
     @JOBMANAGER_API.arguments(JobRequestDtoSchema(), location="json")
     @JOBMANAGER_API.response(HTTPStatus.CREATED, SimpleJobDtoSchema())
     @JOBMANAGER_API.require_jwt(optional=True)
-    def post(self, body: dict, jwt_subject: Optional[str], deployment: Optional[int] = None):
+    def post(
+        self,
+        body: dict,
+        jwt_subject: Optional[str],
+        deployment: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+    ):
         """Create/Register and run new job.
 
         The deployment can be set in the body as `deploymentId`or with the query parameter `deployment`.
         If both are given, the query parameter will be used.
+
+        Set the `Idempotency-Key` header to safely retry a submission. Repeated requests with the same key
+        return the job created by the first request instead of running the job again. Idempotency keys require
+        an authenticated user, reusing a key for a different request is rejected with 422.
         """
         current_app.logger.info("Request: create and run new job")
         if deployment is not None:
             body["deployment_id"] = deployment
         job_dto: JobRequestDto = JobRequestDto(**body)
-        job_response: SimpleJobDto = job_service.create_and_run_job(job_dto, user_id=jwt_subject)
+        job_response: SimpleJobDto = job_service.create_and_run_job(
+            job_dto, user_id=jwt_subject, idempotency_key=idempotency_key
+        )
         return job_response
 
 
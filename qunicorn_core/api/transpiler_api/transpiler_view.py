@@ -0,0 +1,34 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module containing the routes of the Transpiler API."""
+from http import HTTPStatus
+
+from flask.globals import current_app
+from flask.views import MethodView
+
+from .blueprint import TRANSPILER_API
+from ..api_models.transpiler_dtos import TranspilerDtoSchema
+from ...core import translation_service
+
+
+@TRANSPILER_API.route("/")
+class TranspilerView(MethodView):
+    """Root endpoint of the transpiler api, to list all registered transpilers."""
+
+    @TRANSPILER_API.response(HTTPStatus.OK, TranspilerDtoSchema(many=True))
+    def get(self):
+        """Get the transpilers of the workers with the transpilation durations measured by all workers."""
+        current_app.logger.info("Request: get all transpilers")
+        return translation_service.get_transpilers()
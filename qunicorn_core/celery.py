@@ -32,10 +32,19 @@ CELERY = Celery(
 )
 
 
+# default interval in seconds of the periodic watchdog task reclaiming stuck jobs (see job_watchdog_service)
+DEFAULT_WATCHDOG_INTERVAL: int = 60
+
+
 def register_celery(app: Flask):
     """Load the celery config from the app instance."""
     CELERY.conf.update(
         app.config.get("CELERY", {}),
-        beat_schedule={},
+        beat_schedule={
+            "reap-stuck-jobs": {
+                "task": "qunicorn_core.core.job_watchdog_service.reap_stuck_jobs",
+                "schedule": app.config.get("WATCHDOG_INTERVAL", DEFAULT_WATCHDOG_INTERVAL),
+            },
+        },
     )
     CELERY.flask_app = app
@@ -16,6 +16,18 @@
 from . import create_app
 
 from .celery import CELERY  # noqa
+from .core import job_watchdog_service  # noqa: F401 (registers the periodic watchdog task)
+from .core.pilotmanager.pilot_manager import get_pilots
+from .core.translation_service import sync_transpiler_statistics
+from .core.transpiler import load_transpiler_plugins
 
 # create an app instance to load the celery config from the flask app
-create_app()
+app = create_app()
+
+# the API loads pilots and transpilers on first use, workers need them (and their celery tasks) right away
+get_pilots()
+load_transpiler_plugins()
+
+# list the transpilers of the workers in the transpiler api and start from the durations measured by other workers
+with app.app_context():
+    sync_transpiler_statistics()
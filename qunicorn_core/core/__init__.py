@@ -20,5 +20,6 @@ from . import (
     mapper,
     pilotmanager,
     provider_service,
+    task_executor,
     transpiler,
 )
@@ -0,0 +1,105 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import cache, lru_cache
+from typing import Any, Dict, Sequence
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+
+from qunicorn_core.core.simulation_executor import get_available_threads
+
+"""
+Selects the simulation method and the parallelization of the Aer simulator for the circuits of a job.
+
+* circuits with only Clifford gates are simulated with the ``stabilizer`` method, which scales to thousands of qubits
+* wide circuits with little entanglement (few two-qubit gates across any cut between neighboring qubits) are simulated
+  as ``matrix_product_state``, the bond dimension of the MPS grows at most exponentially in these gates
+* all other circuits are simulated as ``statevector`` (or as ``matrix_product_state`` if the statevector does not fit
+  into memory)
+"""
+
+CLIFFORD_GATES = frozenset(
+    ["id", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg", "cx", "cy", "cz", "swap", "ecr", "pauli"]
+)
+NON_UNITARY_INSTRUCTIONS = frozenset(["measure", "barrier", "reset", "delay"])
+
+# circuits with fewer qubits are always simulated as statevector, which is fast for them
+MPS_MIN_QUBITS: int = 20
+# maximum number of two-qubit gates across a cut between neighboring qubits for the matrix product state method
+MPS_MAX_CUT_GATES: int = 12
+# experiments of a batch are simulated in parallel if they have at most this many qubits (i.e. use little memory)
+PARALLEL_EXPERIMENTS_MAX_QUBITS: int = 20
+
+
+def get_aer_options(circuits: Sequence[QuantumCircuit]) -> Dict[str, Any]:
+    """Get the simulation method and the parallelization options of the Aer simulator for the circuits."""
+    threads = get_available_threads()
+    options: Dict[str, Any] = {
+        "method": select_simulation_method(circuits),
+        "max_parallel_threads": threads,
+        "max_parallel_experiments": 1,
+        "max_parallel_shots": threads,
+    }
+    width = max((c.num_qubits for c in circuits), default=0)
+    if len(circuits) > 1 and width <= PARALLEL_EXPERIMENTS_MAX_QUBITS:
+        # small circuits of a batch are simulated in parallel, the shots of every circuit sequentially
+        options["max_parallel_experiments"] = min(len(circuits), threads)
+        options["max_parallel_shots"] = 1
+    return options
+
+
+def select_simulation_method(circuits: Sequence[QuantumCircuit]) -> str:
+    """Select the fastest simulation method that can simulate all circuits (see module documentation)."""
+    if circuits and all(is_clifford(c) for c in circuits):
+        return "stabilizer"
+    width = max((c.num_qubits for c in circuits), default=0)
+    if width >= MPS_MIN_QUBITS and all(get_max_cut_gates(c) <= MPS_MAX_CUT_GATES for c in circuits):
+        return "matrix_product_state"
+    if width > get_max_statevector_qubits():
+        return "matrix_product_state"
+    return "statevector"
+
+
+def is_clifford(circuit: QuantumCircuit) -> bool:
+    """Check if the circuit only contains Clifford gates (and measurements)."""
+    return all(i.operation.name in CLIFFORD_GATES or i.operation.name in NON_UNITARY_INSTRUCTIONS for i in circuit.data)
+
+
+def get_max_cut_gates(circuit: QuantumCircuit) -> int:
+    """Get the maximum number of multi-qubit gates across any cut between two neighboring qubits."""
+    crossings = np.zeros(max(circuit.num_qubits - 1, 1), dtype=int)
+    for instruction in circuit.data:
+        if len(instruction.qubits) < 2 or instruction.operation.name in NON_UNITARY_INSTRUCTIONS:
+            continue
+        indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        crossings[min(indices) : max(indices)] += 1
+    return int(crossings.max())
+
+
+@cache
+def get_max_statevector_qubits() -> int:
+    """Get the maximum number of qubits of a statevector simulation (limited by the memory of the machine)."""
+    return AerSimulator(method="statevector").num_qubits
+
+
+@lru_cache(maxsize=64)
+def get_aer_backend(method: str, num_qubits: int) -> AerSimulator:
+    """Get a simulator for compiling circuits of up to num_qubits qubits for the simulation method.
+
+    The target of an aer simulator is built again on every access with an entry per qubit for every instruction, so
+    the simulator is limited to the qubits of the circuits (the stabilizer method supports 10000 qubits).
+    """
+    return AerSimulator(method=method, n_qubits=num_qubits)
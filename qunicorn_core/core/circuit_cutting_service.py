@@ -11,17 +11,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import Counter
-from random import choices
+import json
+from hashlib import sha256
 from urllib.parse import urljoin
 from typing import Optional, List, Dict, Sequence, Tuple
 
+import numpy as np
 from flask.globals import current_app
 from requests import post
 
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.circuit_cut import CircuitCutDataclass
 from qunicorn_core.static.enums.result_type import ResultType
 from qunicorn_core.static.qunicorn_exception import QunicornError
-from qunicorn_core.util import utils
 
 
 def cut_circuit(cutting_params: dict, circuit_cutting_service: Optional[str] = None) -> dict:
@@ -35,16 +37,46 @@ def cut_circuit(cutting_params: dict, circuit_cutting_service: Optional[str] = N
     return cut_result.json()
 
 
+# default maximum number of stored circuit cuts, the least recently used cuts are evicted first
+DEFAULT_CIRCUIT_CUT_CACHE_SIZE: int = 1000
+
+
+def get_or_cut_circuit(cutting_params: dict, circuit_cutting_service: Optional[str] = None) -> dict:
+    """Cut the circuit, reusing a previous cut of the same circuit with the same cutting parameters.
+
+    Cutting large circuits can take minutes, so the cuts are stored in the database and shared by all jobs.
+    Set ``CIRCUIT_CUT_CACHE_SIZE`` to 0 to always call the circuit cutting service.
+    """
+    cache_size: int = current_app.config.get("CIRCUIT_CUT_CACHE_SIZE", DEFAULT_CIRCUIT_CUT_CACHE_SIZE)
+    if cache_size <= 0:
+        return cut_circuit(cutting_params, circuit_cutting_service)
+
+    cache_key = sha256(json.dumps(cutting_params, sort_keys=True).encode()).hexdigest()
+    circuit_cut: Optional[CircuitCutDataclass] = CircuitCutDataclass.get_by_cache_key(cache_key)
+    if circuit_cut is not None:
+        current_app.logger.info("Reusing stored circuit cut.")
+        circuit_cut.mark_used()
+        circuit_cut.save(commit=True)
+        return circuit_cut.cut_data
+
+    cut_data = cut_circuit(cutting_params, circuit_cutting_service)
+    # the same circuit may have been cut concurrently by another job
+    CircuitCutDataclass(cache_key=cache_key, cut_data=cut_data).save_unless_stored()
+    CircuitCutDataclass.delete_least_recently_used(cache_size)
+    DB.session.commit()
+    return cut_data
+
+
 def prepare_results_for_combination(
     fragment_results: Dict[int, List[dict]], circuit_fragment_ids: Sequence[int]
-) -> List[List[float]]:
+) -> List[np.ndarray]:
     """Prepares qunicorn style subcircuit results in the format required for combining results with the cutting service.
 
     The results for the cutting service are a probability distribution over all possible measurements.
-    Probabilities are stored as a list, where the list index corresponds to the measurement
-    (i.e. ``0b00`` = ``l[0]`` and ``0b10`` = ``l[2]``).
+    Probabilities are stored as an array, where the array index corresponds to the measurement
+    (i.e. ``0b00`` = ``a[0]`` and ``0b10`` = ``a[2]``).
     """
-    subcircuit_results: List[List[float]] = []
+    subcircuit_results: List[np.ndarray] = []
 
     for fragment_id in circuit_fragment_ids:
         fragment_sub_results = fragment_results[fragment_id]
@@ -52,18 +84,15 @@ def prepare_results_for_combination(
         for job_result in fragment_sub_results:  # PilotJobResult as dictionary
             result_type: ResultType = ResultType(job_result["result_type"])
 
-            if result_type == ResultType.COUNTS:
-                probabilities = utils.calculate_probabilities(job_result["data"])
-            elif result_type == ResultType.PROBABILITIES:
-                probabilities = job_result["data"]
-            else:
+            if result_type not in (ResultType.COUNTS, ResultType.PROBABILITIES):
                 continue
 
+            measurements: Dict[str, float] = job_result["data"]
             measurement_format = job_result["meta"]["format"]
 
             if measurement_format == "bin":
                 base = 2
-                arbitrary_measurement_key: str = next(iter(probabilities.keys()))
+                arbitrary_measurement_key: str = next(iter(measurements.keys()))
 
                 if arbitrary_measurement_key.startswith("0b"):
                     qubit_count = len(arbitrary_measurement_key) - 2
@@ -78,10 +107,15 @@ def prepare_results_for_combination(
             else:
                 raise QunicornError(f"unknown measurement format {measurement_format}")
 
-            cutting_format = [0.0 for _ in range(2**qubit_count)]
+            # only the measured outcomes are converted, all other probabilities stay zero
+            indices = np.fromiter((int(m, base) for m in measurements.keys()), dtype=np.int64, count=len(measurements))
+            values = np.fromiter(measurements.values(), dtype=np.float64, count=len(measurements))
+
+            if result_type == ResultType.COUNTS:
+                values /= values.sum()
 
-            for measurement, count in probabilities.items():
-                cutting_format[int(measurement, base)] = count
+            cutting_format = np.zeros(2**qubit_count, dtype=np.float64)
+            cutting_format[indices] = values
 
             subcircuit_results.append(cutting_format)
             break
@@ -92,7 +126,7 @@ def prepare_results_for_combination(
 
 
 def combine_results(
-    results: List[List[float]],
+    results: Sequence[np.ndarray | List[float]],
     cut_data: dict,
     original_circuit: str,
     circuit_format: str,
@@ -104,7 +138,7 @@ def combine_results(
         raise ValueError("URL for circuit cutting service must not be None!")
     data = {
         "circuit": original_circuit,
-        "subcircuit_results": results,
+        "subcircuit_results": [np.asarray(r, dtype=np.float64).tolist() for r in results],
         "cuts": {
             "max_subcircuit_width": cut_data["max_subcircuit_width"],
             "subcircuits": cut_data["subcircuits"],
@@ -119,23 +153,39 @@ def combine_results(
         # "unnormalized_results": "True",
         # "shot_scaling_factor": 100,
     }
-    combined_result = post(urljoin(circuit_cutting_service, "/combineResults"), json=data)
+    # the subcircuit results grow exponentially with the subcircuit width, send them without any whitespace
+    combined_result = post(
+        urljoin(circuit_cutting_service, "/combineResults"),
+        data=json.dumps(data, separators=(",", ":")),
+        headers={"Content-Type": "application/json"},
+    )
     combined_result.raise_for_status()
     return combined_result.json()["result"]
 
 
 def prepare_combined_results(
-    results: List[float], shots: int, registers: List[Dict]
+    results: Sequence[float], shots: int, registers: List[Dict]
 ) -> List[Tuple[Dict, Dict, ResultType]]:
-    print(results)
-    counts: Dict[int, int] = dict(Counter(choices(list(range(len(results))), results, k=shots)))
-    counts_hex = {hex(k): v for k, v in counts.items()}
+    """Samples counts for the given number of shots from the combined probability distribution of a cut circuit.
+
+    Small negative probabilities caused by the reconstruction of the cut circuit are treated as zero.
+    Measurements with a probability of zero are not included in the results.
+    """
+    probabilities = np.clip(np.asarray(results, dtype=np.float64), 0, None)
+    total_probability = probabilities.sum()
+    if total_probability <= 0:
+        raise QunicornError("The combined results of the cut circuit do not contain any valid probabilities.")
+
+    counts = np.random.default_rng().multinomial(shots, probabilities / total_probability)
+    measured = np.flatnonzero(counts)
+    counts_hex = {hex(k): int(v) for k, v in zip(measured.tolist(), counts[measured].tolist())}
     counts_metadata = {"format": "hex", "shots": shots, "registers": registers}
 
-    probabilities = {hex(k): v for k, v in enumerate(results)}
+    possible = np.flatnonzero(probabilities)
+    probabilities_hex = {hex(k): v for k, v in zip(possible.tolist(), probabilities[possible].tolist())}
     probability_metadata = {"format": "hex", "shots": shots, "registers": registers}
 
     return [
         (counts_hex, counts_metadata, ResultType.COUNTS),
-        (probabilities, probability_metadata, ResultType.PROBABILITIES),
+        (probabilities_hex, probability_metadata, ResultType.PROBABILITIES),
     ]
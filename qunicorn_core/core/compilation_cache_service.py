@@ -0,0 +1,169 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from hashlib import sha256
+from io import BytesIO
+from threading import Lock
+from time import monotonic
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import qiskit
+from flask.globals import current_app
+from qiskit import QuantumCircuit, qasm3, qpy, transpile
+from qiskit.providers import BackendV2
+from qiskit.qasm3 import QASM3ExporterError
+
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.compiled_circuit import CompiledCircuitDataclass
+from qunicorn_core.db.models.device import DeviceDataclass
+
+"""
+This module contains the cache for circuits compiled for the instruction set architecture (ISA) of a device.
+Routing and optimizing a circuit for a real device is often the most expensive part of a job, so compiled circuits
+are stored in QPY format and reused for identical circuits, as long as the device and its calibration do not change.
+Set ``ISA_COMPILATION_CACHE_SIZE`` to 0 to always compile the circuits.
+"""
+
+# default maximum number of stored compiled circuits, the least recently used circuits are evicted first
+DEFAULT_ISA_COMPILATION_CACHE_SIZE: int = 1000
+
+# default number of seconds the version of a backend is reused before its properties are requested again
+DEFAULT_BACKEND_VERSION_TTL: int = 900
+
+# (device id, backend name) -> (backend version, moment the version was determined)
+_BACKEND_VERSIONS: Dict[Tuple[int, str], Tuple[str, float]] = {}
+_BACKEND_VERSIONS_LOCK = Lock()
+
+
+def get_backend_version(backend: BackendV2) -> str:
+    """Get a version string that changes if the target or the calibration of the backend changes."""
+    version = [
+        backend.name,
+        str(getattr(backend, "backend_version", backend.version)),
+        str(backend.num_qubits),
+        qiskit.__version__,
+    ]
+    properties = getattr(backend, "properties", None)
+    if callable(properties):
+        last_update = getattr(properties(), "last_update_date", None)
+        if last_update is not None:
+            version.append(str(last_update))
+    return "/".join(version)
+
+
+def get_device_backend_version(backend: BackendV2, device: DeviceDataclass) -> str:
+    """Get the version of the backend of the device (see get_backend_version), reusing recently determined versions.
+
+    Requesting the properties of a remote backend is slow, so the version is only determined again after
+    ``BACKEND_VERSION_TTL`` seconds or after the devices were refreshed by this process.
+    """
+    ttl: int = current_app.config.get("BACKEND_VERSION_TTL", DEFAULT_BACKEND_VERSION_TTL)
+    key = (device.id, backend.name)
+    with _BACKEND_VERSIONS_LOCK:
+        version, determined_at = _BACKEND_VERSIONS.get(key, (None, 0.0))
+    if version is None or monotonic() - determined_at >= ttl:
+        version = get_backend_version(backend)
+        with _BACKEND_VERSIONS_LOCK:
+            _BACKEND_VERSIONS[key] = (version, monotonic())
+    return version
+
+
+def get_cache_key(
+    circuit: QuantumCircuit, backend_version: str, seed: Optional[int], optimization_level: Optional[int]
+) -> Optional[str]:
+    """Get the cache key for compiling the circuit, returns None if the circuit cannot be serialized canonically."""
+    try:
+        serialized_circuit = qasm3.dumps(circuit)
+    except QASM3ExporterError:
+        return None
+    key_data = {
+        "circuit": serialized_circuit,
+        "backend": backend_version,
+        "seed": seed,
+        "optimization_level": optimization_level,
+    }
+    return sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def compile_circuits(
+    circuits: Sequence[QuantumCircuit],
+    backend: BackendV2,
+    device: DeviceDataclass,
+    seed: Optional[int] = None,
+    optimization_level: Optional[int] = None,
+) -> List[QuantumCircuit]:
+    """Compile the circuits for the backend, reusing stored compilations of identical circuits.
+
+    Circuits for local simulators are always compiled, as compiling them is cheaper than loading them.
+    All pending changes of the session are committed if compiled circuits were stored.
+    """
+    cache_size: int = current_app.config.get("ISA_COMPILATION_CACHE_SIZE", DEFAULT_ISA_COMPILATION_CACHE_SIZE)
+    if cache_size <= 0 or device.is_local:
+        return _transpile(circuits, backend, seed, optimization_level)
+
+    backend_version = get_device_backend_version(backend, device)
+    cache_keys = [get_cache_key(c, backend_version, seed, optimization_level) for c in circuits]
+    stored = {c.cache_key: c for c in CompiledCircuitDataclass.get_by_cache_keys([k for k in cache_keys if k])}
+
+    compiled: List[Optional[QuantumCircuit]] = [None] * len(circuits)
+    for i, cache_key in enumerate(cache_keys):
+        if cache_key in stored:
+            compiled[i] = _load(stored[cache_key], circuits[i])
+            stored[cache_key].mark_used()
+
+    missing = [i for i, c in enumerate(compiled) if c is None]
+    if missing:
+        for i, circuit in zip(missing, _transpile([circuits[i] for i in missing], backend, seed, optimization_level)):
+            compiled[i] = circuit
+            if cache_keys[i] is not None and cache_keys[i] not in stored:
+                stored[cache_keys[i]] = _store(cache_keys[i], circuit, device)
+        CompiledCircuitDataclass.delete_least_recently_used(cache_size)
+
+    DB.session.commit()
+    return compiled
+
+
+def invalidate_compiled_circuits(devices: Sequence[DeviceDataclass]):
+    """Delete all compiled circuits of the devices, e.g. after the device data was refreshed."""
+    device_ids = [d.id for d in devices if d.id is not None]
+    if device_ids:
+        CompiledCircuitDataclass.delete_for_devices(device_ids)
+    with _BACKEND_VERSIONS_LOCK:
+        for key in [k for k in _BACKEND_VERSIONS if k[0] in device_ids]:
+            del _BACKEND_VERSIONS[key]
+
+
+def _transpile(
+    circuits: Sequence[QuantumCircuit], backend: BackendV2, seed: Optional[int], optimization_level: Optional[int]
+) -> List[QuantumCircuit]:
+    return transpile(list(circuits), backend, seed_transpiler=seed, optimization_level=optimization_level)
+
+
+def _load(compiled_circuit: CompiledCircuitDataclass, circuit: QuantumCircuit) -> QuantumCircuit:
+    loaded = qpy.load(BytesIO(compiled_circuit.quantum_circuit))[0]
+    # the name and metadata are not part of the cache key, they are taken from the circuit that is compiled
+    loaded.name = circuit.name
+    loaded.metadata = circuit.metadata
+    return loaded
+
+
+def _store(cache_key: str, circuit: QuantumCircuit, device: DeviceDataclass) -> CompiledCircuitDataclass:
+    buffer = BytesIO()
+    qpy.dump(circuit, buffer)
+    compiled_circuit = CompiledCircuitDataclass(
+        cache_key=cache_key, device_id=device.id, quantum_circuit=buffer.getvalue()
+    )
+    # the same circuit may have been compiled concurrently by another job
+    compiled_circuit.save_unless_stored()
+    return compiled_circuit
@@ -17,9 +17,11 @@ from typing import Optional
 
 from qunicorn_core.api.api_models import DeploymentDto, DeploymentUpdateDto, QuantumProgramDto
 from qunicorn_core.core.mapper import deployment_mapper, quantum_program_mapper
+from qunicorn_core.core.translation_service import schedule_pretranslation
 from qunicorn_core.db.models.deployment import DeploymentDataclass
 from qunicorn_core.db.models.quantum_program import QuantumProgramDataclass
 from qunicorn_core.static.qunicorn_exception import QunicornError
+from qunicorn_core.util.circuit_metadata import extract_circuit_metadata
 
 
 def get_all_deployments(user_id: Optional[str] = None) -> list[DeploymentDto]:
@@ -82,8 +84,10 @@ def update_deployment(
             for qc in deployment_dto.programs
         ]
         for p in db_deployment.programs:
+            update_circuit_metadata(p)
             p.save()  # add programs to session
         db_deployment.save(commit=True)
+        schedule_pretranslation(db_deployment.id)
         return deployment_mapper.dataclass_to_dto(db_deployment)
     except AttributeError:
         raise QunicornError(
@@ -117,6 +121,24 @@ def create_deployment(deployment_dto: DeploymentUpdateDto, user_id: Optional[str
         deployed_by=user_id,
     )
     for p in deployment.programs:
+        update_circuit_metadata(p)
         p.save()
     deployment.save(commit=True)
+    schedule_pretranslation(deployment.id)
     return deployment_mapper.dataclass_to_dto(deployment)
+
+
+def update_circuit_metadata(program: QuantumProgramDataclass) -> bool:
+    """Extract the metadata of the quantum circuit of the program without transpiling it.
+
+    Returns False if the metadata could not be extracted from the circuit, e.g. because of an unsupported format.
+    """
+    metadata = extract_circuit_metadata(program.quantum_circuit, program.assembler_language)
+    if metadata is None:
+        return False
+    program.num_qubits = metadata.num_qubits
+    program.num_clbits = metadata.num_clbits
+    program.classical_registers = metadata.registers
+    program.depth = metadata.depth
+    program.gate_counts = metadata.gate_counts
+    return True
@@ -12,28 +12,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import datetime, timezone
 from functools import partial
 from math import ceil
-from typing import Any, List, Optional, Sequence, Tuple, Dict
+from threading import Event, Thread
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Dict
 
+from celery import chord
 from flask import current_app
 
 from qunicorn_core.celery import CELERY
-from qunicorn_core.core.circuit_cutting_service import cut_circuit
+from qunicorn_core.core.circuit_cutting_service import get_or_cut_circuit
+from qunicorn_core.core.deployment_service import update_circuit_metadata
 from qunicorn_core.core.mapper import result_mapper
 from qunicorn_core.core.pilotmanager import pilot_manager
 from qunicorn_core.core.pilotmanager.base_pilot import Pilot, PilotJob
+from qunicorn_core.core.shot_splitting_service import get_shot_chunks
+from qunicorn_core.core.translation_service import (
+    get_translation_sources,
+    get_transpiler_cost_model,
+    persist_target_translation,
+    persist_translation,
+    sync_transpiler_statistics,
+)
 from qunicorn_core.core.transpiler import transpile_circuit, TranspilationError
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.job import JobDataclass
 from qunicorn_core.db.models.job_state import TransientJobStateDataclass
-from qunicorn_core.db.models.quantum_program import QuantumProgramDataclass, TranslatedProgramDataclass
+from qunicorn_core.db.models.quantum_program import QuantumProgramDataclass
 from qunicorn_core.db.models.result import ResultDataclass
+from qunicorn_core.static.enums.execution_backend import ExecutionBackend
 from qunicorn_core.static.enums.job_state import JobState
-from qunicorn_core.static.qunicorn_exception import QunicornError
+from qunicorn_core.static.qunicorn_exception import JobCanceledError, QunicornError
+from qunicorn_core.util.utils import get_execution_backend
 
 """This Class is responsible for running a job on a pilot and scheduling them with celery"""
 
+# default interval in seconds for recording the heartbeats of running jobs, no heartbeats are recorded if 0
+DEFAULT_JOB_HEARTBEAT_INTERVAL: int = 60
+
 
 @CELERY.task()
 def run_job(job_id: int):
@@ -42,7 +59,11 @@ def run_job(job_id: int):
     if job is None:
         raise QunicornError(f"Could not execute job with id '{job_id}'. Did not find job in database!")
     job.state = JobState.RUNNING.value
+    job.heartbeat_at = datetime.now(timezone.utc)
     job.save(commit=True)
+    stop_heartbeat = _start_heartbeat(job_id)
+    # start from the transpilation durations measured by the other workers
+    sync_transpiler_statistics()
 
     try:
         device = job.executed_on
@@ -56,22 +77,249 @@ def run_job(job_id: int):
 
         # Transpile and Run the Job on the correct provider
         pilot: Pilot = pilot_manager.get_matching_pilot(device.provider.name)
-        pilot_jobs = _prepare_pilot_jobs(job, pilot.supported_languages)
+        chunks = get_shot_chunks(job)
+        # the shot chunks executed by other tasks start from the stored translations of the programs
+        persist_targets = chunks is not None and _runs_parts_in_tasks(job)
+        pilot_jobs, cut_programs = _prepare_pilot_jobs(job, pilot.supported_languages, persist_targets)
+
+        for program_id in cut_programs:
+            _run_circuit_fragments(job, program_id)
+
+        if chunks is not None:
+            split_programs = _split_shots(job, pilot_jobs, chunks)
+            for program_id in split_programs:
+                program_jobs = [j for j in pilot_jobs if j.program.id == program_id]
+                execute_chunk = partial(_execute_shot_chunk, pilot_jobs=program_jobs)
+                _run_circuit_fragments(job, program_id, run_shot_chunk, execute_chunk, "SHOT_CHUNKS")
+            pilot_jobs = [j for j in pilot_jobs if j.program.id not in split_programs]
+
+        if pilot_jobs:
+            current_app.logger.info(f"Run job with id {job_id} on {pilot.__class__}")
+            pilot.execute(pilot_jobs, token=token)
+
+    except JobCanceledError:
+        _handle_job_cancellation(job)
+    except Exception as err:
+        _handle_job_error(job, err)
+        raise err
+    finally:
+        stop_heartbeat.set()
+        sync_transpiler_statistics()
+
+
+@CELERY.task()
+def run_circuit_fragment(job_id: int, program_id: int, circuit_fragment_id: int):
+    """Transpile a single fragment of a cut circuit and execute it on the pilot of the job"""
+    _run_job_part(job_id, partial(_execute_circuit_fragment, program_id=program_id, fragment_id=circuit_fragment_id))
+
+
+@CELERY.task()
+def run_shot_chunk(job_id: int, program_id: int, chunk_id: int):
+    """Execute a single chunk of the split shots of a program on the pilot of the job"""
+    _run_job_part(job_id, partial(_execute_shot_chunk, program_id=program_id, fragment_id=chunk_id))
 
-        current_app.logger.info(f"Run job with id {job_id} on {pilot.__class__}")
-        pilot.execute(pilot_jobs, token=token)
 
+def _run_job_part(job_id: int, execute: Callable[[JobDataclass], None]):
+    """Execute a part of the job (e.g. a circuit fragment) in its own task, which handles errors and cancellation."""
+    job = JobDataclass.get_by_id(job_id)
+    if job is None:
+        raise QunicornError(f"Could not execute job with id '{job_id}'. Did not find job in database!")
+    if job.state in (JobState.ERROR, JobState.CANCELED):
+        return  # another part of the job already failed
+    job.heartbeat_at = datetime.now(timezone.utc)
+    stop_heartbeat = _start_heartbeat(job_id)
+
+    try:
+        execute(job)
+    except JobCanceledError:
+        _handle_job_cancellation(job)
     except Exception as err:
-        if isinstance(err, QunicornError) and err.data.get("message", "").startswith("Transpilation Error"):
-            # transpilation has already saved the errors for the job, nothing to do
-            raise err
-        for transient_state in job._transient:
-            transient_state.delete()
-        job.save_error(err)
+        _handle_job_error(job, err)
         raise err
+    finally:
+        stop_heartbeat.set()
+        sync_transpiler_statistics()
+
+
+def _execute_circuit_fragment(job: JobDataclass, program_id: int, fragment_id: int):
+    program: QuantumProgramDataclass = QuantumProgramDataclass.get_by_id_or_404(program_id)
+    cut_state = _get_program_state(job, program, "CUT_CIRCUIT")
+    token = job.get_transient_state_key("token", None)
+
+    pilot: Pilot = pilot_manager.get_matching_pilot(job.executed_on.provider.name)
+    source_format = "QASM2" if cut_state.data["circuit_format"] == "openqasm2" else "QASM3"
+    circuit = cut_state.data["cut_data"]["individual_subcircuits"][fragment_id]
+
+    pilot_jobs = _transpile_circuit(
+        job=job,
+        program=program,
+        circuit_fragment_id=fragment_id,
+        circuit=(source_format, circuit, 0),
+        dest_languages=pilot.supported_languages,
+    )
+    DB.session.commit()
+
+    current_app.logger.info(f"Run fragment {fragment_id} of job with id {job.id} on {pilot.__class__}")
+    pilot.execute(pilot_jobs, token=token)
+
+
+def _execute_shot_chunk(
+    job: JobDataclass, program_id: int, fragment_id: int, pilot_jobs: Optional[Sequence[PilotJob]] = None
+):
+    """Execute a shot chunk, the pilot jobs of the program are transpiled from its stored translations if not given."""
+    program: QuantumProgramDataclass = QuantumProgramDataclass.get_by_id_or_404(program_id)
+    shots, seed = _get_program_state(job, program, "SHOT_CHUNKS").data["chunks"][fragment_id]
+    token = job.get_transient_state_key("token", None)
+
+    pilot: Pilot = pilot_manager.get_matching_pilot(job.executed_on.provider.name)
+    if pilot_jobs is None and program.assembler_language:
+        pilot_jobs = _transpile_circuit(
+            job=job,
+            program=program,
+            circuit=(program.assembler_language, program.quantum_circuit, 0),
+            dest_languages=pilot.supported_languages,
+        )
+        DB.session.commit()
+    elif pilot_jobs is None:
+        pilot_jobs = [PilotJob(program.quantum_circuit, job, program, None)]
+
+    current_app.logger.info(f"Run shot chunk {fragment_id} of job with id {job.id} on {pilot.__class__}")
+    pilot.execute(
+        [j._replace(circuit_fragment_id=fragment_id, shots=shots, seed=seed) for j in pilot_jobs], token=token
+    )
+
+
+@CELERY.task()
+def combine_circuit_fragments(job_id: int, program_id: int):
+    """Combine the results of all fragments of a cut circuit once all fragments have been executed"""
+    job = JobDataclass.get_by_id(job_id)
+    if job is None:
+        raise QunicornError(f"Could not find job with id '{job_id}' in database!")
+    if job.state in (JobState.ERROR, JobState.CANCELED):
+        return
+
+    program: QuantumProgramDataclass = QuantumProgramDataclass.get_by_id_or_404(program_id)
+    pilot: Pilot = pilot_manager.get_matching_pilot(job.executed_on.provider.name)
+    pilot.combine_fragment_results(job, program)
+    pilot.update_job_state(job)
+    DB.session.commit()
+
+
+def _start_heartbeat(job_id: int) -> Event:
+    """Record heartbeats of the running job in a background thread until the returned event is set.
+
+    The watchdog reclaims running jobs without heartbeats (see job_watchdog_service).
+    """
+    app = current_app._get_current_object()
+    interval: int = app.config.get("JOB_HEARTBEAT_INTERVAL", DEFAULT_JOB_HEARTBEAT_INTERVAL)
+    stopped = Event()
+
+    def record_heartbeats():
+        while not stopped.wait(interval):
+            with app.app_context():
+                try:
+                    JobDataclass.record_heartbeat(job_id)
+                    DB.session.commit()
+                except Exception:
+                    app.logger.exception(f"Could not record the heartbeat of job with id {job_id}.")
+
+    if interval > 0:
+        Thread(target=record_heartbeats, name=f"qunicorn-heartbeat-{job_id}", daemon=True).start()
+    return stopped
+
+
+def _runs_parts_in_tasks(job: JobDataclass) -> bool:
+    """Check whether the fragments and shot chunks of the job are executed in their own celery tasks."""
+    return job.celery_id != "synchronous" and get_execution_backend() == ExecutionBackend.CELERY
+
+
+def _run_circuit_fragments(
+    job: JobDataclass,
+    program_id: int,
+    run_fragment=run_circuit_fragment,
+    execute_fragment: Callable[[JobDataclass, int, int], None] = _execute_circuit_fragment,
+    state_type: str = "CUT_CIRCUIT",
+):
+    """Execute all fragments of a cut circuit (or all chunks of the split shots of a program) and combine their results.
+
+    With celery every fragment is executed in its own task, so that the fragments can run in parallel on different
+    workers. A chord callback combines the results after all fragments were executed. The other execution backends
+    execute the fragments one after another in the task of the job, which handles their errors.
+    """
+    program: QuantumProgramDataclass = QuantumProgramDataclass.get_by_id_or_404(program_id)
+    circuit_fragment_ids: List[int] = _get_program_state(job, program, state_type).data["circuit_fragment_ids"]
+
+    if not _runs_parts_in_tasks(job):
+        for circuit_fragment_id in circuit_fragment_ids:
+            if JobDataclass.any_canceled([job.id]):
+                raise JobCanceledError()
+            execute_fragment(job, program_id, circuit_fragment_id)
+        combine_circuit_fragments(job.id, program_id)
+        return
+
+    if JobDataclass.any_canceled([job.id]):
+        raise JobCanceledError()  # the job was canceled while the fragments of the previous programs were executed
+    chord(run_fragment.si(job.id, program_id, i) for i in circuit_fragment_ids)(
+        combine_circuit_fragments.si(job.id, program_id)
+    )
+
+
+def _get_program_state(
+    job: JobDataclass, program: QuantumProgramDataclass, state_type: str
+) -> TransientJobStateDataclass:
+    for state in TransientJobStateDataclass.get_program_states(job.id, program.id):
+        if isinstance(state.data, dict) and state.data.get("type") == state_type:
+            return state
+    if state_type == "CUT_CIRCUIT":
+        raise QunicornError(f"Program with id '{program.id}' of job '{job.id}' has not been cut!")
+    raise QunicornError(f"The shots of program with id '{program.id}' of job '{job.id}' have not been split!")
+
+
+def _split_shots(
+    job: JobDataclass, pilot_jobs: Sequence[PilotJob], chunks: List[Tuple[int, Optional[int]]]
+) -> List[int]:
+    """Split the shots of large jobs on local simulators into chunks (see shot_splitting_service).
+
+    Returns the ids of the programs whose shots were split, their chunks are stored in the transient state.
+    """
+    programs = {j.program.id: j.program for j in pilot_jobs if j.program is not None}
+    for program in programs.values():
+        TransientJobStateDataclass(
+            job=job,
+            program=program,
+            data={"type": "SHOT_CHUNKS", "chunks": chunks, "circuit_fragment_ids": list(range(len(chunks)))},
+        ).save()
+    DB.session.commit()
+    return list(programs)
+
+
+def _handle_job_cancellation(job: JobDataclass):
+    """Discard the unsaved results of a job that was canceled while it was running and delete its transient state"""
+    DB.session.rollback()
+    current_app.logger.info(f"Stopped the execution of canceled job with id {job.id}")
+    for transient_state in job._transient:
+        transient_state.delete()
+    DB.session.commit()
+
+
+def _handle_job_error(job: JobDataclass, err: Exception):
+    if isinstance(err, QunicornError) and err.data.get("message", "").startswith("Transpilation Error"):
+        # transpilation has already saved the errors for the job, nothing to do
+        return
+    for transient_state in job._transient:
+        transient_state.delete()
+    job.save_error(err)
+
 
+def _prepare_pilot_jobs(
+    job: JobDataclass, dest_languages: Sequence[str], persist_targets: bool = False
+) -> Tuple[Sequence[PilotJob], Sequence[int]]:
+    """Transpile all programs of the job into pilot jobs.
 
-def _prepare_pilot_jobs(job: JobDataclass, dest_languages: Sequence[str]) -> Sequence[PilotJob]:
+    Programs that need to be cut are cut, but their fragments are not transpiled. With ``persist_targets`` the
+    translations into the languages of the pilot jobs are stored (serialized if necessary).
+    Returns the pilot jobs and the ids of the programs that were cut.
+    """
     max_qubits = job.cut_to_width
     try_circuit_cutting = max_qubits is not None
     circuit_cutting_service: Optional[str] = current_app.config.get("CIRCUIT_CUTTING_URL", None)
@@ -79,6 +327,7 @@ def _prepare_pilot_jobs(job: JobDataclass, dest_languages: Sequence[str]) -> Seq
         raise QunicornError("This Qunicorn instance is not configured to support circuit cutting!")
 
     pilot_jobs: List[PilotJob] = []
+    cut_programs: List[int] = []
 
     programs = job.deployment.programs if job.deployment else []
 
@@ -86,19 +335,17 @@ def _prepare_pilot_jobs(job: JobDataclass, dest_languages: Sequence[str]) -> Seq
         if program.quantum_circuit is None:
             continue  # skip empty programs
 
-        cutting_params: Optional[Tuple[dict, str]] = None
+        cutting_params: Optional[dict] = None
 
         if try_circuit_cutting:
             cutting_params = _get_circuit_cutting_params(program, max_qubits)
 
         if cutting_params is not None:
             assert isinstance(circuit_cutting_service, str)
-            pilot_jobs.extend(
-                _cut_circuit(
-                    job, program, circuit_cutting_service, cutting_params[0], cutting_params[1], dest_languages
-                )
-            )
+            _cut_circuit(job, program, circuit_cutting_service, cutting_params)
+            cut_programs.append(program.id)
         else:
+            _check_if_program_fits_device(job, program)
             circuit = program.quantum_circuit
             source_format = program.assembler_language
             if not circuit:
@@ -109,38 +356,20 @@ def _prepare_pilot_jobs(job: JobDataclass, dest_languages: Sequence[str]) -> Seq
                 continue
             pilot_jobs.extend(
                 _transpile_circuit(
-                    job=job, program=program, circuit=(source_format, circuit, 0), dest_languages=dest_languages
+                    job=job,
+                    program=program,
+                    circuit=(source_format, circuit, 0),
+                    dest_languages=dest_languages,
+                    persist_target=persist_targets,
                 )
             )
 
     DB.session.commit()
 
-    return pilot_jobs
+    return pilot_jobs, cut_programs
 
 
-def _persist_translation(
-    assembler_language: str, quantum_circuit: Any, translation_distance: int, program: QuantumProgramDataclass
-):
-    if isinstance(quantum_circuit, (str, bytes)):
-        # circuit is in a format that can be safely stored in the database
-        if any(t.assembler_language == assembler_language for t in program.translations):
-            return  # already persisted
-        is_string = isinstance(quantum_circuit, str)
-        if is_string:
-            quantum_circuit = quantum_circuit.encode()
-        translated = TranslatedProgramDataclass(
-            quantum_circuit=quantum_circuit,
-            is_string=is_string,
-            assembler_language=assembler_language,
-            translation_distance=translation_distance,
-            program=program,
-        )
-        translated.save(commit=True)
-
-
-def _get_circuit_cutting_params(  # noqa: C901
-    program: QuantumProgramDataclass, max_qubits: int
-) -> Tuple[Dict, Any] | None:
+def _get_circuit_cutting_params(program: QuantumProgramDataclass, max_qubits: int) -> Dict | None:
     if max_qubits < 1:
         raise QunicornError(f"The maximum width of a cut circuit must allow for at least one Qubit! (got {max_qubits})")
 
@@ -152,25 +381,7 @@ def _get_circuit_cutting_params(  # noqa: C901
 
     config = current_app.config
 
-    existing_translations = [(t.assembler_language, t.circuit, t.translation_distance) for t in program.translations]
-
-    try:
-        transpiled_qiskit = transpile_circuit(
-            "QISKIT",
-            (src_language, program.quantum_circuit, 0),
-            *existing_translations,
-            exclude=config.get("EXCLUDE_TRANSPILERS", None),
-            exclude_formats=config.get("EXCLUDE_FORMATS", None),
-            exclude_unsafe=config.get("EXCLUDE_UNSAFE_TRANSPILERS", True),
-            visitor=partial(_persist_translation, program=program),
-        )
-    except (KeyError, TranspilationError):
-        raise QunicornError(
-            "Failed to inspect circuit for cutting."
-            f" Circuit format {src_language} could not be transpiled into the required format for inspection."
-        )
-
-    num_qubits: int = transpiled_qiskit.num_qubits
+    num_qubits: int = _get_num_qubits(program)
 
     if num_qubits <= max_qubits:
         return
@@ -198,7 +409,8 @@ def _get_circuit_cutting_params(  # noqa: C901
                 exclude=config.get("EXCLUDE_TRANSPILERS", None),
                 exclude_formats=config.get("EXCLUDE_FORMATS", None),
                 exclude_unsafe=config.get("EXCLUDE_UNSAFE_TRANSPILERS", True),
-                visitor=partial(_persist_translation, program=program),
+                visitor=partial(persist_translation, program=program),
+                cost_model=get_transpiler_cost_model(),
             )
             return {
                 "circuit": transpiled_circuit,
@@ -207,7 +419,7 @@ def _get_circuit_cutting_params(  # noqa: C901
                 "max_num_subcircuits": max_circuits,
                 "max_cuts": max_allowed_cuts,
                 "circuit_format": "openqasm2" if target == "QASM2" else "openqasm3",
-            }, transpiled_qiskit
+            }
         except KeyError:
             pass  # did not find a valid transpiler chain
         except TranspilationError as err:
@@ -218,18 +430,71 @@ def _get_circuit_cutting_params(  # noqa: C901
     raise QunicornError("Failed to transpile circuit into a format required for cutting!")
 
 
+def _get_num_qubits(program: QuantumProgramDataclass) -> int:
+    """Get the number of qubits of the program, only transpiles the program if the metadata cannot be extracted."""
+    if program.num_qubits is not None or update_circuit_metadata(program):
+        return program.num_qubits
+
+    config = current_app.config
+    existing_translations = [(t.assembler_language, t.circuit, t.translation_distance) for t in program.translations]
+
+    try:
+        transpiled_qiskit = transpile_circuit(
+            "QISKIT",
+            (program.assembler_language, program.quantum_circuit, 0),
+            *existing_translations,
+            exclude=config.get("EXCLUDE_TRANSPILERS", None),
+            exclude_formats=config.get("EXCLUDE_FORMATS", None),
+            exclude_unsafe=config.get("EXCLUDE_UNSAFE_TRANSPILERS", True),
+            visitor=partial(persist_translation, program=program),
+            cost_model=get_transpiler_cost_model(),
+        )
+    except (KeyError, TranspilationError):
+        raise QunicornError(
+            "Failed to inspect circuit for cutting."
+            f" Circuit format {program.assembler_language} could not be transpiled into the required format for"
+            " inspection."
+        )
+
+    program.num_qubits = transpiled_qiskit.num_qubits
+    program.num_clbits = transpiled_qiskit.num_clbits
+    program.classical_registers = [{"name": reg.name, "size": reg.size} for reg in transpiled_qiskit.cregs]
+    return program.num_qubits
+
+
+def _get_cut_circuit_registers(program: QuantumProgramDataclass) -> List[Dict]:
+    """Get the register metadata for the combined results of a cut circuit.
+
+    The combined results contain the measurements of all qubits, so the name of the classical register is only used
+    if a single register measures all qubits.
+    """
+    registers = program.classical_registers or []
+    if len(registers) == 1 and registers[0]["size"] == program.num_qubits:
+        return [{"name": registers[0]["name"], "size": program.num_qubits}]
+    return [{"name": "output", "size": program.num_qubits}]
+
+
+def _check_if_program_fits_device(job: JobDataclass, program: QuantumProgramDataclass):
+    """Fail early if the program is known to use more qubits than the device of the job provides."""
+    device = job.executed_on
+    if device is None or device.num_qubits is None or device.num_qubits <= 0:
+        return  # number of qubits of the device is not limited or unknown
+    if program.num_qubits is not None and program.num_qubits > device.num_qubits:
+        raise QunicornError(
+            f"Program with id '{program.id}' uses {program.num_qubits} qubits, but device '{device.name}' only"
+            f" provides {device.num_qubits} qubits. Set 'cut_to_width' to cut the circuit into smaller circuits."
+        )
+
+
 def _cut_circuit(
     job: JobDataclass,
     program: QuantumProgramDataclass,
     circuit_cutting_service: str,
     cutting_params: dict,
-    circuit: Any,
-    dest_languages: Sequence[str],
-) -> Sequence[PilotJob]:
-    pilot_jobs: List[PilotJob] = []
-
+):
+    """Cut the circuit and store the circuit fragments in the transient state of the program"""
     try:
-        cut_data = cut_circuit(cutting_params, circuit_cutting_service)
+        cut_data = get_or_cut_circuit(cutting_params, circuit_cutting_service)
     except Exception as err:
         raise QunicornError("Failed to cut circuit.") from err
 
@@ -240,28 +505,13 @@ def _cut_circuit(
             "type": "CUT_CIRCUIT",
             "origninal_circuit": cutting_params["circuit"],
             "circuit_format": cutting_params["circuit_format"],
-            "registers": [{"name": "output", "size": circuit.num_qubits}],  # FIXME: read registers from circuit
+            "registers": _get_cut_circuit_registers(program),
             "cut_data": cut_data,
             "circuit_fragment_ids": [i for i in range(len(cut_data["individual_subcircuits"]))],
         },
     )
     cut_state.save()
 
-    source_format = "QASM2" if cutting_params["circuit_format"] == "openqasm2" else "QASM3"
-
-    for circuit_fragment_id, circuit in enumerate(cut_data["individual_subcircuits"]):
-        pilot_jobs.extend(
-            _transpile_circuit(
-                job=job,
-                program=program,
-                circuit_fragment_id=circuit_fragment_id,
-                circuit=(source_format, circuit, 0),
-                dest_languages=dest_languages,
-            )
-        )
-
-    return pilot_jobs
-
 
 def _transpile_circuit(  # noqa: C901
     job: JobDataclass,
@@ -269,6 +519,7 @@ def _transpile_circuit(  # noqa: C901
     circuit: Tuple[str, Any, int],
     dest_languages: Sequence[str],
     circuit_fragment_id: Optional[int] = None,
+    persist_target: bool = False,
 ) -> Sequence[PilotJob]:
     """Transforms all circuits of the deployment into the circuits in the destination language"""
     current_app.logger.info(f"Transpile all circuits of job with id {job.id}")
@@ -281,7 +532,13 @@ def _transpile_circuit(  # noqa: C901
 
     pilot_jobs: List[PilotJob] = []
 
-    existing_translations = [(t.assembler_language, t.circuit, t.translation_distance) for t in program.translations]
+    # translations of the program cannot be used for (or store) the circuit fragments of cut programs
+    is_fragment = circuit_fragment_id is not None
+    distances: Dict[str, int] = {}
+
+    def visitor(assembler_language: str, quantum_circuit: Any, translation_distance: int):
+        distances[assembler_language] = translation_distance
+        persist_translation(assembler_language, quantum_circuit, translation_distance, program)
 
     try:
         # Preprocess a string to a circuit object if necessary
@@ -290,13 +547,15 @@ def _transpile_circuit(  # noqa: C901
             try:
                 transpiled_circuit = transpile_circuit(
                     target,
-                    circuit,
-                    *existing_translations,
+                    *([circuit] if is_fragment else get_translation_sources(program, circuit, target)),
                     exclude=config.get("EXCLUDE_TRANSPILERS", None),
                     exclude_formats=config.get("EXCLUDE_FORMATS", None),
                     exclude_unsafe=config.get("EXCLUDE_UNSAFE_TRANSPILERS", True),
-                    visitor=partial(_persist_translation, program=program),
+                    visitor=None if is_fragment else visitor,
+                    cost_model=get_transpiler_cost_model(),
                 )
+                if persist_target and not is_fragment:
+                    persist_target_translation(program, target, transpiled_circuit, distances.get(target, 0))
                 pilot_jobs.append(
                     PilotJob(
                         circuit=transpiled_circuit, job=job, program=program, circuit_fragment_id=circuit_fragment_id
@@ -11,12 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from datetime import datetime, timezone
-from os import environ
+import json
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from hashlib import sha256
 from http import HTTPStatus
 from typing import Optional, Sequence
 
 from flask.globals import current_app
+from sqlalchemy.exc import IntegrityError
 
 from qunicorn_core.api.api_models.job_dtos import (
     JobExecutePythonFileDto,
@@ -26,6 +30,7 @@ from qunicorn_core.api.api_models.job_dtos import (
     ResultDto,
 )
 from qunicorn_core.core import job_manager_service
+from qunicorn_core.core.task_executor import submit_task
 from qunicorn_core.core.mapper import job_mapper, result_mapper
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.deployment import DeploymentDataclass
@@ -35,24 +40,45 @@ from qunicorn_core.db.models.job_state import TransientJobStateDataclass
 from qunicorn_core.db.models.result import ResultDataclass
 from qunicorn_core.static.enums.job_state import JobState
 from qunicorn_core.static.enums.job_type import JobType
+from qunicorn_core.static.enums.probability_mode import ProbabilityMode
 from qunicorn_core.static.qunicorn_exception import QunicornError
 from qunicorn_core.static.enums.error_mitigation import ErrorMitigationMethod
 from qunicorn_core.util.utils import is_running_asynchronously
 
 """
 This module contains the service layer for jobs. It is used to create and run jobs.
-It calls the job_manager_service to run the jobs with celery.
+It calls the job_manager_service to run the jobs with the configured execution backend.
 """
 
 
 # TODO: make this an option that is managed in the app config
-ASYNCHRONOUS: bool = environ.get("EXECUTE_CELERY_TASK_ASYNCHRONOUS") == "True"
+ASYNCHRONOUS: bool = is_running_asynchronously()
+
+# default time in seconds an idempotency key blocks duplicate job submissions
+DEFAULT_IDEMPOTENCY_KEY_TTL: int = 24 * 3600
 
 
 def create_and_run_job(
-    job_request_dto: JobRequestDto, is_asynchronous: bool = ASYNCHRONOUS, user_id: Optional[str] = None
+    job_request_dto: JobRequestDto,
+    is_asynchronous: bool = ASYNCHRONOUS,
+    user_id: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
 ) -> SimpleJobDto:
-    """First creates a job to let it run afterwards on a pilot"""
+    """First creates a job to let it run afterwards on a pilot
+
+    If an idempotency key is given and the user already submitted a job with the same key (within the
+    ``IDEMPOTENCY_KEY_TTL``), the existing job is returned instead of creating and running a new job.
+    Idempotency keys can only be used by authenticated users and only for identical job requests.
+    """
+    request_hash = None
+    if idempotency_key is not None:
+        if user_id is None:
+            raise QunicornError("Idempotency keys can only be used by authenticated users.", HTTPStatus.BAD_REQUEST)
+        request_hash = _get_request_hash(job_request_dto)
+        existing_job = _get_job_by_idempotency_key(idempotency_key, user_id)
+        if existing_job is not None:
+            return _get_idempotent_job(existing_job, request_hash)
+
     device: Optional[DeviceDataclass] = DeviceDataclass.get_by_name(
         job_request_dto.device_name, job_request_dto.provider_name
     )
@@ -77,28 +103,81 @@ def create_and_run_job(
         state=JobState.READY,
         started_at=datetime.now(timezone.utc),
         results=[],
+        idempotency_key=idempotency_key,
+        idempotency_request_hash=request_hash,
+        seed=job_request_dto.seed,
+        parameter_bindings=job_request_dto.parameter_bindings,
+        observables=job_request_dto.observables,
+        optimizer=job_request_dto.optimizer,
+        probability_mode=job_request_dto.probability_mode.value,
     )
 
     if not is_asynchronous:
         job.celery_id = "synchronous"
-    job.save(commit=True)
+    try:
+        job.save(commit=True)
+    except IntegrityError:
+        # a concurrent request with the same idempotency key was faster
+        DB.session.rollback()
+        existing_job = _get_job_by_idempotency_key(idempotency_key, user_id) if idempotency_key else None
+        if existing_job is None:
+            raise
+        return _get_idempotent_job(existing_job, request_hash)
     run_job_with_celery(job, is_asynchronous, token=job_request_dto.token)
     return SimpleJobDto(id=job.id, deployment_id=job.deployment_id, name=job.name, state=JobState.READY)
 
 
+def _get_request_hash(job_request_dto: JobRequestDto) -> str:
+    """Hash all fields of the job request except for the token, which may change between retries."""
+    request = asdict(job_request_dto)
+    del request["token"]
+    serialized = json.dumps(request, sort_keys=True, default=lambda v: v.value if isinstance(v, Enum) else str(v))
+    return sha256(serialized.encode()).hexdigest()
+
+
+def _get_idempotent_job(existing_job: JobDataclass, request_hash: Optional[str]) -> SimpleJobDto:
+    """Return the job previously submitted with the idempotency key if it was submitted with the same request."""
+    if existing_job.idempotency_request_hash not in (None, request_hash):
+        raise QunicornError(
+            "The idempotency key was already used for a different job request.", HTTPStatus.UNPROCESSABLE_ENTITY
+        )
+    current_app.logger.info(f"Idempotent job submission, returning existing job with id {existing_job.id}")
+    return job_mapper.dataclass_to_simple(existing_job)
+
+
+def _get_job_by_idempotency_key(idempotency_key: str, user_id: Optional[str]) -> Optional[JobDataclass]:
+    """Get the job previously submitted with this idempotency key, expired keys are released for reuse."""
+    job: Optional[JobDataclass] = JobDataclass.get_by_idempotency_key(idempotency_key, user_id)
+    if job is None:
+        return None
+    ttl = timedelta(seconds=current_app.config.get("IDEMPOTENCY_KEY_TTL", DEFAULT_IDEMPOTENCY_KEY_TTL))
+    started_at = job.started_at
+    if started_at.tzinfo is None:
+        # sqlite does not store timezone information
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    if started_at + ttl < datetime.now(timezone.utc):
+        job.idempotency_key = None
+        job.save(commit=True)
+        return None
+    return job
+
+
 def run_job_with_celery(job: JobDataclass, is_asynchronous: bool, token: Optional[str] = None):
-    """Serialize the job and run it with celery"""
+    """Serialize the job and run it with the execution backend (celery or in-process) or synchronously"""
     assert len(job._transient) == 0, "jobs should not have any state attached by default"
     if token is not None:
         state = TransientJobStateDataclass(job=job, data={"token": token})
         state.save(commit=True)  # make sure token is immediately available in DB
 
     if is_asynchronous:
-        task = job_manager_service.run_job.delay(job.id)
-        job.celery_id = task.id
+        job.celery_id = submit_task(job_manager_service.run_job, job.id)
         job.save(commit=True)
     else:
-        job_manager_service.run_job(job.id)
+        try:
+            job_manager_service.run_job(job.id)
+        finally:
+            # the job was executed with another session, reload its state from the database on the next access
+            DB.session.expire(job)
 
 
 def re_run_job_by_id(job_id: int, token: Optional[str], user_id: Optional[str] = None) -> SimpleJobDto:
@@ -116,6 +195,11 @@ def re_run_job_by_id(job_id: int, token: Optional[str], user_id: Optional[str] =
         type=JobType(job.type),
         error_mitigation=ErrorMitigationMethod(job.error_mitigation),
         cut_to_width=job.cut_to_width,
+        seed=job.seed,
+        parameter_bindings=job.parameter_bindings,
+        observables=job.observables,
+        optimizer=job.optimizer,
+        probability_mode=ProbabilityMode(job.probability_mode or ProbabilityMode.SAMPLED),
     )
     return create_and_run_job(job_request)
 
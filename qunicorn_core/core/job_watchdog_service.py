@@ -0,0 +1,100 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy.sql import delete
+
+from qunicorn_core.celery import CELERY
+from qunicorn_core.core.job_manager_service import DEFAULT_JOB_HEARTBEAT_INTERVAL, run_job
+from qunicorn_core.core.task_executor import submit_task
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.job_state import TransientJobStateDataclass
+from qunicorn_core.db.models.result import ResultDataclass
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.stuck_job_policy import StuckJobPolicy
+from qunicorn_core.static.qunicorn_exception import QunicornError
+
+"""
+Reclaims jobs whose execution stopped without finishing them, e.g. because their worker was killed.
+
+Workers record a heartbeat of every job they execute (``heartbeat_at``) every ``JOB_HEARTBEAT_INTERVAL`` seconds. The
+``reap_stuck_jobs`` task runs every ``WATCHDOG_INTERVAL`` seconds in the celery beat scheduler (start exactly one worker
+with ``--periodic-scheduler``) or, with ``EXECUTION_BACKEND=IN_PROCESS``, in every API process (see task_executor).
+It reclaims the RUNNING jobs without a heartbeat for ``JOB_HEARTBEAT_TIMEOUT`` seconds. With
+``STUCK_JOB_POLICY=REQUEUE`` jobs on local simulators are executed again (at most ``STUCK_JOB_MAX_REQUEUES`` times),
+all other stuck jobs fail with an error. No jobs are reclaimed if heartbeats are disabled (``JOB_HEARTBEAT_INTERVAL``
+of 0), as long running jobs cannot be told apart from stuck jobs then. The task also deletes the transient state of
+all jobs that are no longer running in bulk. The execution backend ``SYNCHRONOUS`` runs no periodic tasks.
+
+No heartbeats are recorded while the fragments of cut circuits or the chunks of split shots of a job wait in the celery
+queue, so the timeout must be longer than they may wait.
+"""
+
+# default number of seconds without a heartbeat after which a running job is considered stuck
+DEFAULT_JOB_HEARTBEAT_TIMEOUT: int = 900
+# default handling of stuck jobs
+DEFAULT_STUCK_JOB_POLICY: str = StuckJobPolicy.ERROR.value
+# default number of times a stuck job may be executed again with the REQUEUE policy
+DEFAULT_STUCK_JOB_MAX_REQUEUES: int = 1
+
+
+@CELERY.task(ignore_result=True)
+def reap_stuck_jobs():
+    """Reclaim the running jobs whose worker stopped recording heartbeats and purge stale transient state"""
+    config = current_app.config
+    if config.get("JOB_HEARTBEAT_INTERVAL", DEFAULT_JOB_HEARTBEAT_INTERVAL) > 0:
+        timeout: int = config.get("JOB_HEARTBEAT_TIMEOUT", DEFAULT_JOB_HEARTBEAT_TIMEOUT)
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=timeout)
+        for job in JobDataclass.get_stuck(stale_before):
+            _reap_stuck_job(job, stale_before, timeout)
+
+    purged = TransientJobStateDataclass.delete_of_inactive_jobs()
+    DB.session.commit()
+    if purged:
+        current_app.logger.info(f"Deleted {purged} transient states of jobs that are no longer running.")
+
+
+def _reap_stuck_job(job: JobDataclass, stale_before: datetime, timeout: int):
+    config = current_app.config
+    policy = StuckJobPolicy(config.get("STUCK_JOB_POLICY", DEFAULT_STUCK_JOB_POLICY).upper())
+    max_requeues: int = config.get("STUCK_JOB_MAX_REQUEUES", DEFAULT_STUCK_JOB_MAX_REQUEUES)
+    # jobs on cloud devices are not executed again, they may have been submitted to the provider already
+    is_local = job.executed_on is not None and job.executed_on.is_local
+    requeue = policy == StuckJobPolicy.REQUEUE and is_local and (job.requeue_count or 0) < max_requeues
+
+    if not JobDataclass.claim_stuck(job.id, stale_before, JobState.READY if requeue else JobState.ERROR):
+        DB.session.rollback()
+        return  # the job recorded a heartbeat (or was reclaimed by another watchdog) in the meantime
+    # the transient state of the stopped execution is deleted as orphans, a requeued job keeps its token
+    job._transient = [t for t in job._transient if requeue and isinstance(t.data, dict) and "token" in t.data]
+
+    if not requeue:
+        current_app.logger.warning(f"Job with id {job.id} is stuck, its worker did not respond for {timeout} seconds.")
+        job.save_error(QunicornError(f"The execution of the job stopped, no heartbeat for {timeout} seconds."))
+        return
+
+    current_app.logger.warning(f"Job with id {job.id} is stuck, it is executed again.")
+    # the job is executed from the start, the results of the stopped execution are discarded
+    DB.session.execute(delete(ResultDataclass).where(ResultDataclass.job_id == job.id))
+    DB.session.expire(job, ["results"])
+    job.requeue_count = (job.requeue_count or 0) + 1
+    job.heartbeat_at = None
+    job.progress = 0
+    job.finished_at = None
+    job.save(commit=True)
+    job.celery_id = submit_task(run_job, job.id)
+    job.save(commit=True)
@@ -39,4 +39,5 @@ def dataclass_to_dto(quantum_program: QuantumProgramDataclass) -> QuantumProgram
         ),
         python_file_path=quantum_program.python_file_path,
         python_file_metadata=quantum_program.python_file_metadata,
+        translation_errors=quantum_program.translation_errors,
     )
@@ -12,4 +12,5 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from . import aws_pilot, base_pilot, ibm_pilot, pilot_manager, rigetti_pilot, qmware_pilot
+# the pilots are imported on first use by the pilot manager
+from . import base_pilot, pilot_manager
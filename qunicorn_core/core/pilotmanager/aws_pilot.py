@@ -13,10 +13,14 @@
 # limitations under the License.
 
 import traceback
+from functools import cache
+from http import HTTPStatus
 from itertools import groupby
-from typing import List, Optional, Sequence, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 from flask.globals import current_app
+from braket.circuits import Circuit, Noise
+from braket.circuits.serialization import IRType
 from braket.devices import LocalSimulator
 from braket.ir.openqasm import Program
 from braket.tasks import GateModelQuantumTaskResult
@@ -24,43 +28,124 @@ from braket.tasks.local_quantum_task_batch import LocalQuantumTaskBatch
 
 from qunicorn_core.api.api_models.device_dtos import DeviceDto
 from qunicorn_core.core.pilotmanager.base_pilot import Pilot, PilotJob, PilotJobResult
+from qunicorn_core.core.simulation_executor import get_available_threads, run_simulation
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.device import DeviceDataclass
 from qunicorn_core.db.models.job import JobDataclass
 from qunicorn_core.db.models.provider import ProviderDataclass
 from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.probability_mode import ProbabilityMode
 from qunicorn_core.static.enums.provider_name import ProviderName
 from qunicorn_core.static.enums.result_type import ResultType
 from qunicorn_core.static.qunicorn_exception import QunicornError
 
 
+@cache
+def _get_local_simulator(backend: str) -> LocalSimulator:
+    """Get the local simulator of the backend, simulators are reused by all batches of a process"""
+    return LocalSimulator(backend)
+
+
 class AWSPilot(Pilot):
     """The AWS Pilot"""
 
     provider_name = ProviderName.AWS.value
     supported_languages = tuple([AssemblerLanguage.BRAKET.value])
+    supports_exact_probabilities = True
 
     def run(self, jobs: Sequence[PilotJob], token: Optional[str] = None):
         """Execute the job on a local simulator and saves results in the database"""
         if any(not j.job.executed_on or not j.job.executed_on.is_local for j in jobs):
             raise QunicornError("Device not found, device needs to be local for AWS")
 
-        batches = [(k, list(j)) for k, j in groupby(jobs, key=lambda j: j.job.shots)]
+        max_parallel = get_available_threads()
+        executed_batches = []
+
+        for (backend, shots, probability_mode), batch_jobs in self.__plan_batches(jobs):
+            cache_keys: List[Optional[str]] = []
+            for (db_job, seed), pilot_jobs in groupby(batch_jobs, key=lambda j: (j.job, self.get_shots_and_seed(j)[1])):
+                cache_keys.extend(self.get_result_cache_keys(db_job, [j.circuit for j in pilot_jobs], shots, seed))
+            uncached_jobs = self.save_cached_results(batch_jobs, cache_keys)
+            if not uncached_jobs:
+                continue
+            batch_jobs = [batch_jobs[i] for i in uncached_jobs]
+            cache_keys = [cache_keys[i] for i in uncached_jobs]
 
-        for shots, jobs in batches:
             # Since QASM is stored as a string, it needs to be converted to a QASM program before execution
             # FIXME: support circuits where not all qubits have gates
             preprocessed_circuits = [
-                (Program(source=j.circuit) if isinstance(j.circuit, str) else j.circuit) for j in jobs
+                (Program(source=j.circuit) if isinstance(j.circuit, str) else j.circuit) for j in batch_jobs
+            ]
+            # parameterized circuits are executed once for every parameter binding
+            bindings = [
+                self.get_parameter_bindings(j.job, AWSPilot.__parameters(c))
+                for j, c in zip(batch_jobs, preprocessed_circuits)
             ]
+            bound_circuits = self.bind_circuits(preprocessed_circuits, bindings, lambda c, binding: (c, binding))
 
-            quantum_tasks: LocalQuantumTaskBatch = LocalSimulator().run_batch(preprocessed_circuits, shots=shots)
+            if probability_mode != ProbabilityMode.SAMPLED:
+                for circuit in preprocessed_circuits:
+                    if not isinstance(circuit, Circuit):
+                        raise QunicornError(
+                            "Exact probabilities are only available for Braket circuits, not for OpenQASM programs!",
+                            HTTPStatus.BAD_REQUEST,
+                        )
+                    self.check_exact_probability_qubits(circuit.qubit_count)
 
-            results = AWSPilot._map_aws_results(quantum_tasks.results())
-            for result, job in zip(results, jobs):
+            results = run_simulation(
+                AWSPilot._simulate,
+                bound_circuits,
+                shots,
+                probability_mode,
+                backend,
+                min(max_parallel, len(bound_circuits)),
+                is_canceled=self.cancellation_check(batch_jobs),
+            )
+            results = self.combine_binding_results(results, bindings)
+            for result, job in zip(results, batch_jobs):
                 self.save_results(job, result, commit=False)
+            executed_batches.append((cache_keys, results))
         DB.session.commit()
 
+        for cache_keys, results in executed_batches:
+            self.cache_results(cache_keys, results)
+
+    def __plan_batches(self, jobs: Sequence[PilotJob]) -> List[Tuple[Tuple[str, int, ProbabilityMode], List[PilotJob]]]:
+        """Group the jobs into batches executed by the same simulator backend with the same shots and probability mode
+
+        The jobs are sorted by these settings first, so that jobs with interleaved settings still end up in a single
+        batch (e.g. the shot chunks of several programs).
+        """
+
+        def batch_key(job: PilotJob) -> Tuple[str, int, ProbabilityMode]:
+            return (
+                AWSPilot.__get_simulator_backend(job.circuit),
+                self.get_shots_and_seed(job)[0],
+                self.get_probability_mode(job.job),
+            )
+
+        return [(key, list(batch)) for key, batch in groupby(sorted(jobs, key=batch_key), key=batch_key)]
+
+    @staticmethod
+    def __get_simulator_backend(circuit: Union[str, Circuit, Program]) -> str:
+        """Circuits with noise need the density matrix simulator, all other circuits use the state vector simulator"""
+        if isinstance(circuit, Circuit):
+            is_noisy = any(isinstance(instruction.operator, Noise) for instruction in circuit.instructions)
+        else:
+            source = circuit.source if isinstance(circuit, Program) else circuit
+            is_noisy = "#pragma braket noise" in source
+        return "braket_dm" if is_noisy else "braket_sv"
+
+    def canonical_circuit(self, circuit: Union[str, Circuit, Program]) -> Optional[str]:
+        """Serialize the circuit as OpenQASM 3 source"""
+        if isinstance(circuit, str):
+            return circuit
+        if isinstance(circuit, Program):
+            return circuit.source
+        if isinstance(circuit, Circuit):
+            return circuit.to_ir(IRType.OPENQASM).source
+        return None
+
     def execute_provider_specific(self, jobs: Sequence[PilotJob], job_type: str, token: Optional[str] = None):
         """Execute a job of a provider specific type on a backend using a pilot"""
         raise QunicornError("No valid Job Type specified")
@@ -72,6 +157,77 @@ class AWSPilot(Pilot):
         )
         raise QunicornError("Canceling not supported on AWS devices")
 
+    @staticmethod
+    def _simulate(
+        circuits: List[Union[Circuit, Program, Tuple[Circuit, dict]]],
+        shots: int,
+        probability_mode: ProbabilityMode = ProbabilityMode.SAMPLED,
+        backend: str = "braket_sv",
+        max_parallel: int = 1,
+    ) -> List[List[PilotJobResult]]:
+        """Run the circuits on the local simulator (runs in a simulation process, see simulation_executor)
+
+        Parameterized circuits are passed together with the values of their parameters. Exact probabilities are
+        calculated in a run without shots, the counts are sampled in a second run if requested.
+        """
+        inputs = [c[1] if isinstance(c, tuple) else {} for c in circuits]
+        circuits = [c[0] if isinstance(c, tuple) else c for c in circuits]
+        simulator = _get_local_simulator(backend)
+        if probability_mode == ProbabilityMode.SAMPLED:
+            return AWSPilot._map_aws_results(AWSPilot.__run_tasks(simulator, circuits, shots, inputs, max_parallel))
+
+        exact_circuits = [c.copy().probability() for c in circuits]
+        exact_results = AWSPilot.__run_tasks(simulator, exact_circuits, 0, inputs, max_parallel)
+        if probability_mode == ProbabilityMode.EXACT:
+            return [AWSPilot._map_exact_aws_result(r, c.qubit_count) for r, c in zip(exact_results, circuits)]
+
+        results = AWSPilot._map_aws_results(AWSPilot.__run_tasks(simulator, circuits, shots, inputs, max_parallel))
+        for job_results, exact_result, circuit in zip(results, exact_results, circuits):
+            if job_results[0].result_type != ResultType.ERROR:
+                # replace the sampled probabilities with the exact probabilities
+                job_results[1:] = AWSPilot._map_exact_aws_result(exact_result, circuit.qubit_count)
+        return results
+
+    @staticmethod
+    def __run_tasks(
+        simulator: LocalSimulator, circuits: list, shots: int, inputs: List[dict], max_parallel: int
+    ) -> List[GateModelQuantumTaskResult]:
+        """Run the circuits in this process or, for max_parallel > 1, in a pool of max_parallel processes
+
+        run_batch starts a new process pool for every batch, which only pays off if several circuits are simulated.
+        """
+        if max_parallel <= 1 or len(circuits) <= 1:
+            return [simulator.run(c, shots=shots, inputs=i).result() for c, i in zip(circuits, inputs)]
+        quantum_tasks: LocalQuantumTaskBatch = simulator.run_batch(
+            circuits, shots=shots, max_parallel=max_parallel, inputs=inputs
+        )
+        return quantum_tasks.results()
+
+    @staticmethod
+    def __parameters(circuit: Any) -> List[str]:
+        # parameters of OpenQASM programs are not known, they are executed as they are
+        return sorted(p.name for p in circuit.parameters) if isinstance(circuit, Circuit) else []
+
+    @staticmethod
+    def _map_exact_aws_result(aws_result: GateModelQuantumTaskResult, num_qubits: int) -> List[PilotJobResult]:
+        """Map the result of the probability result type (a probability for every basis state) to hex strings"""
+        metadata = aws_result.additional_metadata.dict()
+        metadata["format"] = "hex"
+        metadata["registers"] = [{"name": "", "size": num_qubits}]
+        # the first qubit is the most significant bit of the index of a basis state
+        probabilities = {
+            format(index, f"0{num_qubits}b"): float(probability)
+            for index, probability in enumerate(aws_result.values[0])
+            if probability > 0
+        }
+        return [
+            PilotJobResult(
+                data=Pilot.qubit_binary_string_to_hex(probabilities, reverse_qubit_order=True),
+                meta=metadata,
+                result_type=ResultType.PROBABILITIES,
+            )
+        ]
+
     @staticmethod
     def _map_aws_results(aws_results: list[GateModelQuantumTaskResult]) -> List[List[PilotJobResult]]:
         results: List[List[PilotJobResult]] = []
@@ -14,19 +14,22 @@
 import json
 import os
 from datetime import datetime
+from functools import partial
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, List, Optional, Sequence, Tuple, Union, Generator, NamedTuple, Dict
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union, Generator, NamedTuple, Dict
 
-from celery.states import PENDING
+from flask.globals import current_app
 
 from qunicorn_core.api.api_models.device_dtos import DeviceDto
-from qunicorn_core.celery import CELERY
+from qunicorn_core.core import simulator_result_cache_service
 from qunicorn_core.core.circuit_cutting_service import (
     prepare_results_for_combination,
     combine_results,
     prepare_combined_results,
 )
+from qunicorn_core.core.shot_splitting_service import merge_chunk_results
+from qunicorn_core.core.task_executor import revoke_task
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.deployment import DeploymentDataclass
 from qunicorn_core.db.models.device import DeviceDataclass
@@ -38,16 +41,23 @@ from qunicorn_core.db.models.result import ResultDataclass
 from qunicorn_core.static.enums.error_mitigation import ErrorMitigationMethod
 from qunicorn_core.static.enums.job_state import JobState
 from qunicorn_core.static.enums.job_type import JobType
+from qunicorn_core.static.enums.probability_mode import ProbabilityMode
 from qunicorn_core.static.enums.result_type import ResultType
-from qunicorn_core.static.qunicorn_exception import QunicornError
+from qunicorn_core.static.qunicorn_exception import JobCanceledError, QunicornError
 from qunicorn_core.util.utils import is_running_asynchronously
 
+# default maximum number of measured qubits of circuits with exact probabilities (2**25 probabilities)
+DEFAULT_EXACT_PROBABILITIES_MAX_QUBITS: int = 25
+
 
 class PilotJob(NamedTuple):
     circuit: Any
     job: JobDataclass
     program: QuantumProgramDataclass
     circuit_fragment_id: Optional[int]
+    # shots and seed of a chunk of the shots of the job (see shot_splitting_service)
+    shots: Optional[int] = None
+    seed: Optional[int] = None
 
 
 class PilotJobResult(NamedTuple):
@@ -61,6 +71,8 @@ class Pilot:
 
     provider_name: str
     supported_languages: Sequence[str]
+    # whether the local simulators of the pilot can calculate exact probabilities (see ProbabilityMode)
+    supports_exact_probabilities: bool = False
 
     def run(self, jobs: Sequence[PilotJob], token: Optional[str] = None):
         """Run a job of type RUNNER on a backend using a Pilot"""
@@ -98,6 +110,16 @@ class Pilot:
 
         job_type = job_types.pop()
 
+        self.check_canceled(jobs)
+
+        if any(self.get_probability_mode(j.job) != ProbabilityMode.SAMPLED for j in jobs):
+            is_local = all(j.job.executed_on.is_local for j in jobs)
+            if job_type != JobType.RUNNER.value or not self.supports_exact_probabilities or not is_local:
+                raise QunicornError(
+                    f"Exact probabilities are not available for {job_type} jobs on this device!",
+                    HTTPStatus.BAD_REQUEST,
+                )
+
         if job_type == JobType.RUNNER.value:
             self.run(jobs, token=token)
         else:
@@ -111,11 +133,14 @@ class Pilot:
             raise QunicornError("Canceling a job is not possible in synchronous mode", HTTPStatus.NOT_IMPLEMENTED)
         job = JobDataclass.get_by_id_authenticated_or_404(job_id, user_id)
         if job.state == JobState.READY.value and not job.celery_id == "synchronous" and job.celery_id is not None:
-            res = CELERY.AsyncResult(job.celery_id)
-            if res.status == PENDING:
-                res.revoke()
+            if revoke_task(job.celery_id):
                 job.state = JobState.CANCELED.value
                 job.save(commit=True)
+        elif job.state == JobState.RUNNING and job.executed_on is not None and job.executed_on.is_local:
+            # local executions check the state of the job between (and while waiting for) the simulations and stop
+            job.state = JobState.CANCELED.value
+            job.save(commit=True)
+            current_app.logger.info(f"Requested the cancellation of running job with id {job.id}.")
         elif job.state == JobState.RUNNING:
             self.cancel_provider_specific(job, token=token)
         else:
@@ -125,19 +150,27 @@ class Pilot:
         """Cancel execution of a job at the corresponding backend"""
         raise NotImplementedError()
 
-    def save_results(self, job: PilotJob, results: Sequence[PilotJobResult], commit: bool = False):
-        contains_error = False
-        contains_fragments = False
+    @staticmethod
+    def cancellation_check(jobs: Sequence[PilotJob]) -> Callable[[], bool]:
+        """Get a function checking whether any of the jobs was canceled while it is executed (see run_simulation)."""
+        job_ids = {j.job.id for j in jobs}
+        return partial(JobDataclass.any_canceled, job_ids)
 
-        for result in results:
-            if result.result_type == ResultType.ERROR:
-                contains_error = True
+    @staticmethod
+    def check_canceled(jobs: Sequence[PilotJob]):
+        """Stop the execution of the jobs with a JobCanceledError if any of the jobs was canceled."""
+        if Pilot.cancellation_check(jobs)():
+            raise JobCanceledError()
 
-            if job.circuit_fragment_id is not None:
-                self._save_fragment_results(job, results)
-                contains_fragments = True
+    def save_results(self, job: PilotJob, results: Sequence[PilotJobResult], commit: bool = False):
+        contains_error = any(result.result_type == ResultType.ERROR for result in results)
 
-            else:
+        if job.circuit_fragment_id is not None:
+            self._save_fragment_results(job, results)
+            if not contains_error:
+                self.combine_fragment_results(job.job, job.program)
+        else:
+            for result in results:
                 res = ResultDataclass(
                     job=job.job,
                     program=job.program,
@@ -147,27 +180,169 @@ class Pilot:
                 )
                 res.save()
 
-        if contains_fragments:
-            self._check_if_all_results_available(job)
-
         if contains_error:
             job.job.state = JobState.ERROR
             job.job.save(commit=commit)
             return
 
-        new_state = self.determine_db_job_state(db_job=job.job)
-        if job.job.state != new_state:
-            job.job.state = new_state.value
-            job.job.save()
-
-        new_progress = self.determine_db_job_progress(db_job=job.job)
-        if job.job.progress != new_progress:
-            job.job.progress = new_progress
-            job.job.save()
+        self.update_job_state(job.job)
 
         if commit:
             DB.session.commit()
 
+    def update_job_state(self, db_job: JobDataclass):
+        """Update the state and progress of the job based on the results saved so far"""
+        new_state = self.determine_db_job_state(db_job=db_job)
+        if db_job.state != new_state:
+            db_job.state = new_state.value
+            db_job.save()
+
+        new_progress = self.determine_db_job_progress(db_job=db_job)
+        if db_job.progress != new_progress:
+            db_job.progress = new_progress
+            db_job.save()
+
+    def canonical_circuit(self, circuit: Any) -> Optional[str]:
+        """Serialize a circuit into a canonical string used for the result cache.
+
+        Returns None if the circuit cannot be serialized, results of such circuits are not cached.
+        """
+        return circuit if isinstance(circuit, str) else None
+
+    @staticmethod
+    def get_shots_and_seed(job: PilotJob) -> Tuple[int, Optional[int]]:
+        """Get the shots and the seed for executing the pilot job, chunks of split shots override those of the job."""
+        if job.shots is None:
+            return job.job.shots, job.job.seed
+        return job.shots, job.seed
+
+    @staticmethod
+    def get_probability_mode(job: JobDataclass) -> ProbabilityMode:
+        """Get how the probabilities of the job are determined (jobs created before the mode existed are sampled)."""
+        return ProbabilityMode(job.probability_mode or ProbabilityMode.SAMPLED)
+
+    @staticmethod
+    def check_exact_probability_qubits(num_qubits: int):
+        """Check that the exact probabilities of that many measured qubits may be calculated."""
+        max_qubits: int = current_app.config.get(
+            "EXACT_PROBABILITIES_MAX_QUBITS", DEFAULT_EXACT_PROBABILITIES_MAX_QUBITS
+        )
+        if num_qubits > max_qubits:
+            raise QunicornError(
+                f"Exact probabilities are limited to {max_qubits} measured qubits, the circuit measures {num_qubits}!",
+                HTTPStatus.BAD_REQUEST,
+            )
+
+    def get_result_cache_keys(
+        self, job: JobDataclass, circuits: Sequence[Any], shots: Optional[int] = None, seed: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Get the result cache keys for running the circuits with the settings of the job (or the shot chunk)."""
+        if not simulator_result_cache_service.is_result_cache_enabled() or (job.seed if seed is None else seed) is None:
+            return [None] * len(circuits)
+        cache_keys: List[Optional[str]] = []
+        for circuit in circuits:
+            canonical_circuit = self.canonical_circuit(circuit)
+            if canonical_circuit is None:
+                cache_keys.append(None)
+            else:
+                cache_keys.append(simulator_result_cache_service.get_cache_key(job, canonical_circuit, shots, seed))
+        return cache_keys
+
+    def save_cached_results(self, jobs: Sequence[PilotJob], cache_keys: Sequence[Optional[str]]) -> List[int]:
+        """Save the cached results of all jobs with a result cache hit.
+
+        Returns the indices of the jobs without cached results that still need to be executed.
+        """
+        uncached_jobs: List[int] = []
+        for index, (job, cache_key) in enumerate(zip(jobs, cache_keys)):
+            cached_results = simulator_result_cache_service.get_cached_results(cache_key) if cache_key else None
+            if cached_results is None:
+                uncached_jobs.append(index)
+                continue
+            current_app.logger.info(f"Using cached simulator results for job with id {job.job.id}")
+            results = [PilotJobResult(r["data"], r["meta"], ResultType(r["result_type"])) for r in cached_results]
+            self.save_results(job, results)
+        return uncached_jobs
+
+    def cache_results(self, cache_keys: Sequence[Optional[str]], results: Sequence[Sequence[PilotJobResult]]):
+        """Store the results of jobs in the result cache, error results are never cached.
+
+        All pending changes of the session are committed.
+        """
+        for cache_key, job_results in zip(cache_keys, results):
+            if cache_key is None or any(r.result_type == ResultType.ERROR for r in job_results):
+                continue
+            simulator_result_cache_service.cache_results(
+                cache_key,
+                [{"data": r.data, "meta": r.meta, "result_type": ResultType(r.result_type).value} for r in job_results],
+            )
+
+    @staticmethod
+    def get_parameter_bindings(job: JobDataclass, parameters: Sequence[str]) -> Optional[List[Dict[str, float]]]:
+        """Get the values of the parameters of a circuit for every parameter binding of the job.
+
+        Returns None if the circuit has no parameters, i.e. it is executed once regardless of the bindings.
+        """
+        if not parameters:
+            return None
+        if not job.parameter_bindings:
+            raise QunicornError(
+                f"The circuit has the unbound parameters {', '.join(parameters)}, the job needs parameter bindings!",
+                HTTPStatus.BAD_REQUEST,
+            )
+        bindings: List[Dict[str, float]] = []
+        for index, binding in enumerate(job.parameter_bindings):
+            missing = [p for p in parameters if p not in binding]
+            if missing:
+                raise QunicornError(
+                    f"Parameter binding {index} does not bind the parameters {', '.join(missing)}!",
+                    HTTPStatus.BAD_REQUEST,
+                )
+            bindings.append({p: binding[p] for p in parameters})
+        return bindings
+
+    @staticmethod
+    def bind_circuits(
+        circuits: Sequence[Any], bindings: Sequence[Optional[List[Dict[str, float]]]], bind: Callable[[Any, dict], Any]
+    ) -> List[Any]:
+        """Bind every parameterized circuit to all of its parameter bindings, circuits without parameters are kept."""
+        bound_circuits: List[Any] = []
+        for circuit, circuit_bindings in zip(circuits, bindings):
+            if circuit_bindings is None:
+                bound_circuits.append(circuit)
+            else:
+                bound_circuits.extend(bind(circuit, binding) for binding in circuit_bindings)
+        return bound_circuits
+
+    @staticmethod
+    def mark_binding_results(
+        binding_results: Sequence[Sequence[PilotJobResult]], bindings: Sequence[Dict[str, float]]
+    ) -> List[PilotJobResult]:
+        """Concatenate the results of all parameter bindings of a circuit.
+
+        The results of each binding are marked with the index and the values of the binding in their metadata.
+        """
+        return [
+            r._replace(meta={**(r.meta or {}), "binding": index, "parameters": binding})
+            for index, (binding, results) in enumerate(zip(bindings, binding_results))
+            for r in results
+        ]
+
+    @staticmethod
+    def combine_binding_results(
+        results: Sequence[Sequence[PilotJobResult]], bindings: Sequence[Optional[List[Dict[str, float]]]]
+    ) -> List[List[PilotJobResult]]:
+        """Combine the results of the circuits returned by ``bind_circuits`` into the results of the circuits."""
+        combined: List[List[PilotJobResult]] = []
+        results = iter(results)
+        for circuit_bindings in bindings:
+            if circuit_bindings is None:
+                combined.append(list(next(results)))
+            else:
+                binding_results = [next(results) for _ in circuit_bindings]
+                combined.append(Pilot.mark_binding_results(binding_results, circuit_bindings))
+        return combined
+
     def _save_fragment_results(self, job: PilotJob, results: Sequence[PilotJobResult]):
         transient_state = TransientJobStateDataclass(
             job.job,
@@ -177,30 +352,40 @@ class Pilot:
         )
         transient_state.save()
 
-    def _check_if_all_results_available(self, job: PilotJob):  # noqa: C901
-        program_state = job.job.get_transient_state(
-            program=job.program.id, filter_=lambda s: isinstance(s.data, dict) and "circuit_fragment_ids" in s.data
+    def combine_fragment_results(self, job: JobDataclass, program: QuantumProgramDataclass):  # noqa: C901
+        """Combine the results of all fragments of a cut circuit (or all chunks of split shots) into the results for the
+        program.
+
+        Nothing happens if the results of some fragments are still missing or if the results were already combined.
+        """
+        DB.session.flush()  # make fragment results of this session visible to the queries
+
+        # lock the program state to make sure the results are only combined once
+        program_states = TransientJobStateDataclass.get_program_states(job.id, program.id, for_update=True)
+        program_state = next(
+            (s for s in program_states if isinstance(s.data, dict) and "circuit_fragment_ids" in s.data), None
         )
         circuit_fragments = program_state.data.get("circuit_fragment_ids", None) if program_state else None
         if not circuit_fragments or not program_state:
             return  # no transient state present to tell how to handle fragment results!
 
-        def is_related_result(s: TransientJobStateDataclass):
-            if s.program != job.program or s.circuit_fragment_id is None:
-                return False
-            if not isinstance(s.data, dict):
-                return False
-            return s.data.get("type") == "FRAGMENT_RESULT"
-
-        all_results = [s for s in job.job._transient if is_related_result(s)]
+        all_results = [
+            s
+            for s in TransientJobStateDataclass.get_fragment_states(job.id, program.id)
+            if isinstance(s.data, dict) and s.data.get("type") == "FRAGMENT_RESULT"
+        ]
         all_results_data = {s.circuit_fragment_id: s.data["results"] for s in all_results}
 
         if set(circuit_fragments) > all_results_data.keys():
             # not all required results present
             return
 
-        if program_state.data.get("type") == "CUT_CIRCUIT":
-            try:
+        state_type = program_state.data.get("type")
+        if state_type not in ("CUT_CIRCUIT", "SHOT_CHUNKS"):
+            return
+
+        try:
+            if state_type == "CUT_CIRCUIT":
                 prepared_results = prepare_results_for_combination(all_results_data, circuit_fragments)
                 combined_results: List[float] = combine_results(
                     prepared_results,
@@ -210,26 +395,31 @@ class Pilot:
                 )
 
                 qunicorn_results = prepare_combined_results(
-                    combined_results, job.job.shots, program_state.data["registers"]
+                    combined_results, job.shots, program_state.data["registers"]
+                )
+            else:
+                qunicorn_results = merge_chunk_results(
+                    [all_results_data[i] for i in circuit_fragments],
+                    [shots for shots, _ in program_state.data["chunks"]],
                 )
 
-                for result in qunicorn_results:
-                    res = ResultDataclass(
-                        job=job.job,
-                        program=job.program,
-                        data=result[0],
-                        meta=result[1],
-                        result_type=result[2],
-                    )
-                    res.save()
-
-                DB.session.delete(program_state)
+            for result in qunicorn_results:
+                res = ResultDataclass(
+                    job=job,
+                    program=program,
+                    data=result[0],
+                    meta=result[1],
+                    result_type=result[2],
+                )
+                res.save()
 
-                for s in all_results:
-                    job.job._transient.remove(s)
+            for state in (program_state, *all_results):
+                if state in job._transient:
+                    job._transient.remove(state)
+                state.delete()
 
-            except Exception as err:
-                job.job.save_error(err, job.program)
+        except Exception as err:
+            job.save_error(err, program)
 
     def determine_db_job_progress(self, db_job: JobDataclass) -> int:
         if db_job.state in (JobState.CANCELED, JobState.ERROR, JobState.FINISHED):
@@ -238,11 +428,31 @@ class Pilot:
         if db_job.deployment:
             all_programs = set(p.id for p in db_job.deployment.programs)
             programs_with_results = set(r.program.id for r in db_job.results if r.program)
-            ratio = int((len(programs_with_results) / len(all_programs)) * 100)
+            # programs executed in fragments (or shot chunks) progress with every executed fragment
+            finished_programs = len(programs_with_results) + sum(
+                self.__get_fragment_progress(db_job, program_id) for program_id in all_programs - programs_with_results
+            )
+            ratio = int((finished_programs / len(all_programs)) * 100)
             return min(100, max(0, ratio))
 
         return 0
 
+    @staticmethod
+    def __get_fragment_progress(db_job: JobDataclass, program_id: int) -> float:
+        """Get the share of the fragments of the program that were already executed (0 if it has no fragments)."""
+        program_states = [s for s in db_job._transient if s.program_id == program_id and s.circuit_fragment_id is None]
+        program_state = next(
+            (s for s in program_states if isinstance(s.data, dict) and s.data.get("circuit_fragment_ids")), None
+        )
+        if program_state is None:
+            return 0
+        executed_fragments = [
+            s
+            for s in TransientJobStateDataclass.get_fragment_states(db_job.id, program_id)
+            if isinstance(s.data, dict) and s.data.get("type") == "FRAGMENT_RESULT"
+        ]
+        return len(executed_fragments) / len(program_state.data["circuit_fragment_ids"])
+
     def determine_db_job_state(self, db_job: JobDataclass) -> JobState:
         if db_job.state in (JobState.CANCELED, JobState.ERROR, JobState.FINISHED):
             return db_job.state
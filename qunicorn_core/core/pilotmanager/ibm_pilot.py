@@ -15,19 +15,22 @@
 import traceback
 from http import HTTPStatus
 from os import environ
+from functools import partial
 from itertools import groupby
 from pathlib import Path
-from typing import List, Optional, Sequence, Union, Dict
+from typing import Callable, List, Optional, Sequence, Tuple, Union, Dict
 
 import numpy as np
 from flask.globals import current_app
 import qiskit_aer
-from qiskit import transpile, QuantumCircuit, QiskitError
+from qiskit import QuantumCircuit, QiskitError, qasm3
 from qiskit.primitives import PrimitiveResult, PubResult
 from qiskit.providers import BackendV2, QiskitBackendNotFoundError
+from qiskit.qasm3 import QASM3ExporterError
 from qiskit.quantum_info import SparsePauliOp
 from qiskit.result import Result
 from qiskit_aer import AerSimulator
+from qiskit_aer.library import SaveProbabilitiesDict
 from qiskit_ibm_runtime import (
     EstimatorV2,
     IBMRuntimeError,
@@ -40,16 +43,22 @@ from qiskit_ibm_runtime import (
 )
 
 from qunicorn_core.api.api_models import DeviceDto
+from qunicorn_core.core.aer_options_service import get_aer_backend, get_aer_options
+from qunicorn_core.core.compilation_cache_service import compile_circuits
 from qunicorn_core.core.pilotmanager.base_pilot import Pilot, PilotJob, PilotJobResult
+from qunicorn_core.core.simulation_executor import run_simulation, simulation_session
+from qunicorn_core.core.variational_optimizer import OptimizerSettings, get_optimizer_settings, optimize
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.device import DeviceDataclass
 from qunicorn_core.db.models.job import JobDataclass
 from qunicorn_core.db.models.provider import ProviderDataclass
+from qunicorn_core.db.models.result import ResultDataclass
 from qunicorn_core.db.models.job_state import TransientJobStateDataclass
 from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
 from qunicorn_core.static.enums.error_mitigation import ErrorMitigationMethod
 from qunicorn_core.static.enums.job_state import JobState
 from qunicorn_core.static.enums.job_type import JobType
+from qunicorn_core.static.enums.probability_mode import ProbabilityMode
 from qunicorn_core.static.enums.provider_name import ProviderName
 from qunicorn_core.static.enums.result_type import ResultType
 from qunicorn_core.static.qunicorn_exception import QunicornError
@@ -60,6 +69,7 @@ class IBMPilot(Pilot):
     """The IBM Pilot"""
 
     provider_name = ProviderName.IBM.value
+    supports_exact_probabilities = True
     supported_languages = tuple([AssemblerLanguage.QISKIT.value])
 
     def execute_provider_specific(self, jobs: Sequence[PilotJob], job_type: str, token: Optional[str] = None):
@@ -69,6 +79,8 @@ class IBMPilot(Pilot):
             self.__estimate(jobs, token=token)
         elif job_type == JobType.SAMPLER.value:
             self.__sample(jobs, token=token)
+        elif job_type == JobType.VARIATIONAL.value:
+            self.__optimize(jobs, token=token)
         elif job_type == JobType.IBM_RUNNER.value:
             self.__run_ibm_program(jobs, token=token)
         elif job_type == JobType.IBM_UPLOAD.value:
@@ -86,44 +98,165 @@ class IBMPilot(Pilot):
                 db_job.save_error(QunicornError("The job does not have any device associated!"))
                 continue  # one job failing should not affect other jobs
 
+            pilot_jobs = list(pilot_jobs)
             backend: BackendV2
+            aer_options: dict = {}
             if device.is_local:
-                backend = qiskit_aer.Aer.get_backend("aer_simulator")
+                # the simulation method determines the instructions and the number of qubits supported by the simulator
+                aer_options = get_aer_options([j.circuit for j in pilot_jobs])
+                num_qubits = max(j.circuit.num_qubits for j in pilot_jobs)
+                backend = get_aer_backend(aer_options["method"], num_qubits)
             else:
                 provider = self.__get_provider_login_and_update_job(token, db_job)
                 backend = provider.backend(device.name)
 
-            pilot_jobs = list(pilot_jobs)
-
-            backend_specific_circuits = transpile([j.circuit for j in pilot_jobs], backend)
-            qiskit_job = backend.run(backend_specific_circuits, shots=db_job.shots)
-
-            job_state: Optional[TransientJobStateDataclass] = None
+            shots, seed = self.get_shots_and_seed(pilot_jobs[0])
 
-            for state in db_job._transient:
-                if state.program is not None and isinstance(state.data, dict):
-                    if state.data.get("type") == "IBM":
-                        job_state = state
-                        break
-            else:
-                job_state = TransientJobStateDataclass(db_job, data={"type": "IBM"})
+            backend_specific_circuits = compile_circuits([j.circuit for j in pilot_jobs], backend, device, db_job.seed)
 
-            provider_specific_ids = job_state.data.get("provider_ids", [])
-            provider_specific_ids.append(qiskit_job.job_id())
-            job_state.data = dict(job_state.data) | {"provider_ids": provider_specific_ids}
-            job_state.save()
+            cache_keys = self.get_result_cache_keys(db_job, backend_specific_circuits, shots, seed)
+            uncached_jobs = self.save_cached_results(pilot_jobs, cache_keys)
+            if not uncached_jobs:
+                DB.session.commit()
+                continue
+            pilot_jobs = [pilot_jobs[i] for i in uncached_jobs]
+            backend_specific_circuits = [backend_specific_circuits[i] for i in uncached_jobs]
+            cache_keys = [cache_keys[i] for i in uncached_jobs]
 
-            db_job.state = JobState.RUNNING.value
-            db_job.save(commit=True)
+            # parameterized circuits are compiled once and bound to every parameter binding afterwards
+            bindings = [
+                self.get_parameter_bindings(db_job, IBMPilot.__parameters(c)) for c in backend_specific_circuits
+            ]
+            bound_circuits = self.bind_circuits(backend_specific_circuits, bindings, QuantumCircuit.assign_parameters)
 
-            result = qiskit_job.result()
-            mapped_results: list[Sequence[PilotJobResult]] = IBMPilot.__map_runner_results(
-                result, backend_specific_circuits
-            )
+            run_options = {"shots": shots}
+            mapped_results: list[Sequence[PilotJobResult]]
+            if device.is_local:
+                run_options.update(aer_options)
+                if seed is not None:
+                    run_options["seed_simulator"] = seed
+                probability_mode = self.get_probability_mode(db_job)
+                if probability_mode != ProbabilityMode.SAMPLED:
+                    sample_counts = probability_mode == ProbabilityMode.EXACT_WITH_COUNTS
+                    bound_circuits = [IBMPilot.__save_exact_probabilities(c, sample_counts) for c in bound_circuits]
+                    if not sample_counts:
+                        run_options["shots"] = 1  # the probabilities are calculated once, nothing is sampled
+                db_job.state = JobState.RUNNING.value
+                db_job.save(commit=True)
+                is_canceled = self.cancellation_check(pilot_jobs)
+                mapped_results = run_simulation(
+                    IBMPilot._simulate_runner, bound_circuits, run_options, is_canceled=is_canceled
+                )
+            else:
+                mapped_results = self.__run_on_backend(db_job, backend, bound_circuits, run_options)
+            mapped_results = self.combine_binding_results(mapped_results, bindings)
 
             for pilot_results, pilot_job in zip(mapped_results, pilot_jobs):
                 self.save_results(pilot_job, pilot_results)
             DB.session.commit()
+            self.cache_results(cache_keys, mapped_results)
+
+    def __run_on_backend(
+        self, db_job: JobDataclass, backend: BackendV2, circuits: List[QuantumCircuit], run_options: dict
+    ) -> list[Sequence[PilotJobResult]]:
+        """Run the circuits on an IBM backend and wait for the results"""
+        qiskit_job = backend.run(circuits, **run_options)
+
+        job_state: Optional[TransientJobStateDataclass] = None
+
+        for state in db_job._transient:
+            if state.program is not None and isinstance(state.data, dict):
+                if state.data.get("type") == "IBM":
+                    job_state = state
+                    break
+        else:
+            job_state = TransientJobStateDataclass(db_job, data={"type": "IBM"})
+
+        provider_specific_ids = job_state.data.get("provider_ids", [])
+        provider_specific_ids.append(qiskit_job.job_id())
+        job_state.data = dict(job_state.data) | {"provider_ids": provider_specific_ids}
+        job_state.save()
+
+        db_job.state = JobState.RUNNING.value
+        db_job.save(commit=True)
+
+        result = qiskit_job.result()
+        return IBMPilot.__map_runner_results(result, circuits)
+
+    @staticmethod
+    def __save_exact_probabilities(circuit: QuantumCircuit, sample_counts: bool) -> QuantumCircuit:
+        """Save the probabilities of the measured qubits before the final measurements of the circuit
+
+        The measurements are removed if no counts are sampled. The indices of the classical bits the probabilities
+        belong to are stored in the metadata of the circuit (see __map_exact_probabilities).
+        """
+        exact_circuit = circuit.copy_empty_like()
+        measurements = []
+        measured_qubits = set()
+        for instruction in circuit.data:
+            if instruction.operation.name == "measure":
+                measurements.append(instruction)
+                measured_qubits.update(instruction.qubits)
+                continue
+            is_classical = bool(instruction.clbits) or getattr(instruction.operation, "condition", None) is not None
+            if instruction.operation.name != "barrier" and (is_classical or measured_qubits & set(instruction.qubits)):
+                raise QunicornError(
+                    "Exact probabilities require that all measurements are at the end of the circuit!",
+                    HTTPStatus.BAD_REQUEST,
+                )
+            exact_circuit.append(instruction)
+
+        # the last measurement into a classical bit determines its value
+        clbit_qubits = {circuit.find_bit(m.clbits[0]).index: m.qubits[0] for m in measurements}
+        clbits = sorted(clbit_qubits)
+        Pilot.check_exact_probability_qubits(len(clbits))
+        if clbits:
+            qubits = [clbit_qubits[c] for c in clbits]
+            exact_circuit.append(SaveProbabilitiesDict(len(qubits), label="probabilities"), qubits)
+        if sample_counts:
+            for measurement in measurements:
+                exact_circuit.append(measurement)
+        exact_circuit.metadata = {**(circuit.metadata or {}), "exact_probability_clbits": clbits}
+        return exact_circuit
+
+    @staticmethod
+    def __map_exact_probabilities(probabilities: Dict[int, float], circuit: QuantumCircuit) -> Dict[str, float]:
+        """Map the probabilities of the measured qubits to hex strings of the classical registers (as the counts)"""
+        clbits: List[int] = circuit.metadata["exact_probability_clbits"]
+        probabilities = {outcome: p for outcome, p in probabilities.items() if p > 0}
+        if not probabilities:
+            return {"": 0}
+
+        # weights[i, r] is the value the i-th measured qubit adds to the r-th register (or all classical bits)
+        positions = {clbit: i for i, clbit in enumerate(clbits)}
+        registers = list(reversed(circuit.cregs))
+        weights = [[0] * max(len(registers), 1) for _ in clbits]
+        if registers:
+            for r, reg in enumerate(registers):
+                for j, bit in enumerate(reg):
+                    i = positions.get(circuit.find_bit(bit).index)
+                    if i is not None:
+                        weights[i][r] |= 1 << j
+        else:
+            for i, clbit in enumerate(clbits):
+                weights[i][0] = 1 << clbit
+
+        # python integers are only needed if a value does not fit into 64 bits
+        fits_uint64 = len(clbits) < 64 and max((w for row in weights for w in row), default=0) < 1 << 63
+        dtype = np.uint64 if fits_uint64 else object
+        outcomes = np.array([int(outcome) for outcome in probabilities], dtype=dtype)
+        bits = (outcomes[:, np.newaxis] >> np.arange(len(clbits), dtype=dtype)) & 1
+        values = bits @ np.array(weights, dtype=dtype)
+
+        columns = [map(hex, values[:, r].tolist()) for r in range(values.shape[1])]
+        return dict(zip(map(" ".join, zip(*columns)), probabilities.values()))
+
+    def canonical_circuit(self, circuit: QuantumCircuit) -> Optional[str]:
+        """Serialize the circuit as OpenQASM 3, the circuit name and metadata are ignored"""
+        try:
+            return qasm3.dumps(circuit)
+        except QASM3ExporterError:
+            return None
 
     def cancel_provider_specific(self, job: JobDataclass, token: Optional[str] = None):
         """Cancel a job on an IBM backend using the IBM Pilot"""
@@ -150,64 +283,203 @@ class IBMPilot(Pilot):
             else:
                 raise QunicornError(f"Error mitigation method {db_job.error_mitigation} not supported by IBM sampler.")
 
+            cache_keys = self.get_result_cache_keys(db_job, [j.circuit for j in pilot_jobs])
+            uncached_jobs = self.save_cached_results(pilot_jobs, cache_keys)
+            if not uncached_jobs:
+                DB.session.commit()
+                continue
+            pilot_jobs = [pilot_jobs[i] for i in uncached_jobs]
+            cache_keys = [cache_keys[i] for i in uncached_jobs]
+
+            # all bindings of a parameterized circuit are sampled in a single PUB
+            bindings = [self.get_parameter_bindings(db_job, IBMPilot.__parameters(j.circuit)) for j in pilot_jobs]
+            pubs = [IBMPilot.__to_pub(j.circuit, b) for j, b in zip(pilot_jobs, bindings)]
+
             if db_job.executed_on.is_local:
-                backend = AerSimulator()
+                if db_job.seed is not None:
+                    options.simulator.seed_simulator = db_job.seed
+                aer_options = get_aer_options([j.circuit for j in pilot_jobs])
+                is_canceled = self.cancellation_check(pilot_jobs)
+                mapped_results = run_simulation(
+                    IBMPilot._simulate_sampler, pubs, options, bindings, aer_options, is_canceled=is_canceled
+                )
             else:
                 backend = self.__get_qiskit_runtime_backend(db_job, token=token)
+                sampler = Sampler(backend, options=options)
 
-            sampler = Sampler(backend, options=options)
-
-            job_from_ibm: RuntimeJobV2 = sampler.run([j.circuit for j in pilot_jobs])
-            ibm_result: PrimitiveResult = job_from_ibm.result()
-            mapped_results = IBMPilot._map_sampler_results(ibm_result)
+                job_from_ibm: RuntimeJobV2 = sampler.run(pubs)
+                ibm_result: PrimitiveResult = job_from_ibm.result()
+                mapped_results = IBMPilot._map_sampler_results(ibm_result, bindings)
 
             for pilot_results, pilot_job in zip(mapped_results, pilot_jobs):
                 self.save_results(pilot_job, pilot_results)
             DB.session.commit()
+            self.cache_results(cache_keys, mapped_results)
 
-    def __estimate(self, jobs: Sequence[PilotJob], token: Optional[str] = None):  # noqa: C901
+    @staticmethod
+    def __get_estimator_options(db_job: JobDataclass) -> EstimatorOptions:
+        options = EstimatorOptions()
+
+        if db_job.error_mitigation == ErrorMitigationMethod.none.value:
+            pass
+        elif db_job.error_mitigation == ErrorMitigationMethod.dynamical_decoupling.value:
+            options.dynamical_decoupling.enable = True
+        elif db_job.error_mitigation == ErrorMitigationMethod.pauli_twirling.value:
+            options.enable_gates = True
+        elif db_job.error_mitigation == ErrorMitigationMethod.twirled_readout_error_extinction:
+            options.resilience.measure_mitigation = True
+        elif db_job.error_mitigation == ErrorMitigationMethod.zero_noise_extrapolation:
+            options.resilience.zne_mitigation = True
+        elif db_job.error_mitigation == ErrorMitigationMethod.probabilistic_error_amplification:
+            options.resilience.zne_mitigation = True
+            options.resilience.zne.amplifier = "pea"
+        elif db_job.error_mitigation == ErrorMitigationMethod.probabilistic_error_cancellation:
+            options.resilience.pec_mitigation = True
+        else:
+            raise QunicornError(f"Error mitigation method {db_job.error_mitigation} not supported by IBM estimator.")
+
+        if db_job.executed_on.is_local and db_job.seed is not None:
+            options.simulator.seed_simulator = db_job.seed
+        return options
+
+    def __estimate(self, jobs: Sequence[PilotJob], token: Optional[str] = None):
         """Uses the Estimator to execute a job on an IBM backend using the IBM Pilot"""
         batched_jobs = [(db_job, list(pilot_jobs)) for db_job, pilot_jobs in groupby(jobs, lambda j: j.job)]
 
         for db_job, pilot_jobs in batched_jobs:
-            observables = [SparsePauliOp("Y" * job.circuit.num_qubits) for job in pilot_jobs]
-            options = EstimatorOptions()
-
-            if db_job.error_mitigation == ErrorMitigationMethod.none.value:
-                pass
-            elif db_job.error_mitigation == ErrorMitigationMethod.dynamical_decoupling.value:
-                options.dynamical_decoupling.enable = True
-            elif db_job.error_mitigation == ErrorMitigationMethod.pauli_twirling.value:
-                options.enable_gates = True
-            elif db_job.error_mitigation == ErrorMitigationMethod.twirled_readout_error_extinction:
-                options.resilience.measure_mitigation = True
-            elif db_job.error_mitigation == ErrorMitigationMethod.zero_noise_extrapolation:
-                options.resilience.zne_mitigation = True
-            elif db_job.error_mitigation == ErrorMitigationMethod.probabilistic_error_amplification:
-                options.resilience.zne_mitigation = True
-                options.resilience.zne.amplifier = "pea"
-            elif db_job.error_mitigation == ErrorMitigationMethod.probabilistic_error_cancellation:
-                options.resilience.pec_mitigation = True
-            else:
-                raise QunicornError(
-                    f"Error mitigation method {db_job.error_mitigation} not supported by IBM estimator."
-                )
-
+            observables = [IBMPilot.__observables(job) for job in pilot_jobs]
+            options = IBMPilot.__get_estimator_options(db_job)
+
+            cache_keys = self.get_result_cache_keys(db_job, [j.circuit for j in pilot_jobs])
+            uncached_jobs = self.save_cached_results(pilot_jobs, cache_keys)
+            if not uncached_jobs:
+                DB.session.commit()
+                continue
+            pilot_jobs = [pilot_jobs[i] for i in uncached_jobs]
+            observables = [observables[i] for i in uncached_jobs]
+            cache_keys = [cache_keys[i] for i in uncached_jobs]
+
+            # all observables and bindings of a circuit are estimated in a single PUB
+            bindings = [self.get_parameter_bindings(db_job, IBMPilot.__parameters(j.circuit)) for j in pilot_jobs]
+            pubs = [IBMPilot.__to_pub(j.circuit, b, o) for j, b, o in zip(pilot_jobs, bindings, observables)]
             if db_job.executed_on.is_local:
-                backend = AerSimulator()
+                aer_options = get_aer_options([j.circuit for j in pilot_jobs])
+                is_canceled = self.cancellation_check(pilot_jobs)
+                mapped_results = run_simulation(
+                    IBMPilot._simulate_estimator,
+                    pubs,
+                    observables,
+                    options,
+                    bindings,
+                    aer_options,
+                    is_canceled=is_canceled,
+                )
             else:
                 backend = self.__get_qiskit_runtime_backend(db_job, token=token)
+                estimator = EstimatorV2(backend, options=options)
 
-            estimator = EstimatorV2(backend, options=options)
-            circuits = [j.circuit for j in pilot_jobs]
-
-            job_from_ibm = estimator.run(list(zip(circuits, observables)))
-            ibm_result: PrimitiveResult = job_from_ibm.result()
-            mapped_results = IBMPilot._map_estimator_results(ibm_result, observables)
+                job_from_ibm = estimator.run(pubs)
+                ibm_result: PrimitiveResult = job_from_ibm.result()
+                mapped_results = IBMPilot._map_estimator_results(ibm_result, observables, bindings)
 
             for pilot_results, pilot_job in zip(mapped_results, pilot_jobs):
                 self.save_results(pilot_job, pilot_results)
             DB.session.commit()
+            self.cache_results(cache_keys, mapped_results)
+
+    def __optimize(self, jobs: Sequence[PilotJob], token: Optional[str] = None):
+        """Optimizes the parameters of the circuits in a hybrid loop, minimizing the estimated observables"""
+        batched_jobs = [(db_job, list(pilot_jobs)) for db_job, pilot_jobs in groupby(jobs, lambda j: j.job)]
+
+        for db_job, pilot_jobs in batched_jobs:
+            settings = get_optimizer_settings(db_job)
+            device = db_job.executed_on
+            circuits = [j.circuit.remove_final_measurements(inplace=False) for j in pilot_jobs]
+            options = IBMPilot.__get_estimator_options(db_job)
+            aer_options = dict(get_aer_options(circuits), n_qubits=max(c.num_qubits for c in circuits))
+            backend: BackendV2 = (
+                AerSimulator(**aer_options)
+                if device.is_local
+                else self.__get_qiskit_runtime_backend(db_job, token=token)
+            )
+
+            # the circuits are compiled once, the iterations only bind new parameters
+            compiled_circuits = compile_circuits(circuits, backend, device, db_job.seed)
+            estimator = None if device.is_local else EstimatorV2(backend, options=options)
+
+            db_job.state = JobState.RUNNING.value
+            db_job.save(commit=True)
+            for pilot_job, circuit in zip(pilot_jobs, compiled_circuits):
+                if not device.is_local:
+                    self.__optimize_circuit(pilot_job, circuit, partial(IBMPilot._bind_estimator, estimator), settings)
+                    continue
+                # the estimator of all iterations stays in one simulation process that is killed if the job is canceled
+                with simulation_session(self.cancellation_check([pilot_job])) as session:
+                    bind = partial(session.bind, IBMPilot._iteration_estimator, options, aer_options)
+                    self.__optimize_circuit(pilot_job, circuit, bind, settings)
+
+    def __optimize_circuit(
+        self,
+        job: PilotJob,
+        circuit: QuantumCircuit,
+        bind: Callable[[QuantumCircuit, List[SparsePauliOp]], Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]],
+        settings: OptimizerSettings,
+    ):
+        """Minimize the weighted sum of the observables, the result of every iteration is saved immediately
+
+        ``bind`` sets up the estimator for the circuit and observables, the iterations only pass the new parameters.
+        """
+        parameters = IBMPilot.__parameters(circuit)
+        if not parameters:
+            raise QunicornError("The circuit has no parameters to optimize!", HTTPStatus.BAD_REQUEST)
+        missing = [p for p in parameters if p not in settings.initial_parameters]
+        if missing:
+            raise QunicornError(
+                f"The optimizer needs initial values for the parameters {', '.join(missing)}!", HTTPStatus.BAD_REQUEST
+            )
+        observables = [o.apply_layout(circuit.layout) for o in IBMPilot.__observables(job)]
+        coefficients = np.ones(len(observables))
+        if settings.coefficients is not None:
+            coefficients = np.array(settings.coefficients[IBMPilot.__program_index(job, len(settings.coefficients))])
+        if len(coefficients) != len(observables):
+            raise QunicornError(
+                f"The program has {len(observables)} observables, but {len(coefficients)} coefficients!",
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        estimate = bind(circuit, observables)
+        iteration = 0
+
+        def objective(values: np.ndarray) -> float:
+            nonlocal iteration
+            self.check_canceled([job])
+            evs, stds = estimate(values)
+            value = float(np.dot(coefficients, evs))
+            variance = float(np.dot(coefficients**2, stds**2))
+            ResultDataclass(
+                job=job.job,
+                program=job.program,
+                data={"value": str(value), "variance": str(variance)},
+                meta={"iteration": iteration, "parameters": dict(zip(parameters, values.tolist()))},
+                result_type=ResultType.VALUE_AND_VARIANCE,
+            ).save(commit=True)
+            iteration += 1
+            return value
+
+        initial_values = np.array([settings.initial_parameters[p] for p in parameters], dtype=float)
+        result = optimize(objective, initial_values, settings.method, settings.max_iterations, job.job.seed)
+        optimization_result = PilotJobResult(
+            data={
+                "value": str(result.value),
+                "parameters": dict(zip(parameters, result.parameters.tolist())),
+                "iterations": result.iterations,
+                "success": result.success,
+                "message": result.message,
+            },
+            meta={"method": settings.method.value},
+            result_type=ResultType.OPTIMIZATION_RESULT,
+        )
+        self.save_results(job, [optimization_result], commit=True)
 
     def __get_qiskit_runtime_backend(self, job: JobDataclass, token: Optional[str]) -> BackendV2:
         """Instantiate all important configurations and updates the job_state"""
@@ -337,6 +609,118 @@ class IBMPilot(Pilot):
         service.save_account(token=token, channel="ibm_quantum", overwrite=True)
         return service
 
+    @staticmethod
+    def _simulate_runner(circuits: List[QuantumCircuit], run_options: dict) -> list[Sequence[PilotJobResult]]:
+        """Run the circuits on the aer simulator (runs in a simulation process, see simulation_executor)"""
+        result = qiskit_aer.Aer.get_backend("aer_simulator").run(circuits, **run_options).result()
+        return IBMPilot.__record_simulation_method(IBMPilot.__map_runner_results(result, circuits), run_options)
+
+    @staticmethod
+    def _simulate_sampler(
+        pubs: List[Union[QuantumCircuit, tuple]],
+        options: SamplerOptions,
+        bindings: List[Optional[List[dict]]],
+        aer_options: dict,
+    ) -> list[Sequence[PilotJobResult]]:
+        """Sample the circuits on the aer simulator (runs in a simulation process, see simulation_executor)"""
+        ibm_result: PrimitiveResult = Sampler(AerSimulator(**aer_options), options=options).run(pubs).result()
+        return IBMPilot.__record_simulation_method(IBMPilot._map_sampler_results(ibm_result, bindings), aer_options)
+
+    @staticmethod
+    def _simulate_estimator(
+        pubs: List[tuple],
+        observables: List[List[SparsePauliOp]],
+        options: EstimatorOptions,
+        bindings: List[Optional[List[dict]]],
+        aer_options: dict,
+    ) -> list[Sequence[PilotJobResult]]:
+        """Estimate the observables on the aer simulator (runs in a simulation process, see simulation_executor)"""
+        estimator = EstimatorV2(AerSimulator(**aer_options), options=options)
+        ibm_result: PrimitiveResult = estimator.run(pubs).result()
+        mapped_results = IBMPilot._map_estimator_results(ibm_result, observables, bindings)
+        return IBMPilot.__record_simulation_method(mapped_results, aer_options)
+
+    @staticmethod
+    def _iteration_estimator(
+        options: EstimatorOptions, aer_options: dict, circuit: QuantumCircuit, observables: List[SparsePauliOp]
+    ) -> Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        """Set up the aer simulator estimating the observables of the optimizer iterations (runs in a simulation
+        process, see simulation_executor.SimulationSession.bind)"""
+        return IBMPilot._bind_estimator(EstimatorV2(AerSimulator(**aer_options), options=options), circuit, observables)
+
+    @staticmethod
+    def _bind_estimator(
+        estimator: EstimatorV2, circuit: QuantumCircuit, observables: List[SparsePauliOp]
+    ) -> Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        """Get a function estimating the observables for the given parameter values with the estimator"""
+        return partial(IBMPilot._estimate_values, estimator, circuit, observables)
+
+    @staticmethod
+    def _estimate_values(
+        estimator: EstimatorV2, circuit: QuantumCircuit, observables: List[SparsePauliOp], values: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Estimate the observables for one set of parameter values, returns the expectation values and their standard
+        deviations"""
+        pub_result: PubResult = estimator.run([(circuit, observables, values)]).result()[0]
+        return pub_result.data["evs"], pub_result.data["stds"]
+
+    @staticmethod
+    def __record_simulation_method(
+        results: list[Sequence[PilotJobResult]], aer_options: dict
+    ) -> list[Sequence[PilotJobResult]]:
+        """Add the simulation method selected for the aer simulator to the metadata of the results"""
+        return [
+            [r._replace(meta={**(r.meta or {}), "simulation_method": aer_options["method"]}) for r in circuit_results]
+            for circuit_results in results
+        ]
+
+    @staticmethod
+    def __parameters(circuit: QuantumCircuit) -> List[str]:
+        return [parameter.name for parameter in circuit.parameters]
+
+    @staticmethod
+    def __program_index(job: PilotJob, expected_programs: int) -> int:
+        """Get the index of the program of the job in its deployment, checking the number of per program settings"""
+        programs = job.job.deployment.programs if job.job.deployment else []
+        if expected_programs != len(programs):
+            raise QunicornError(
+                f"The job has settings for {expected_programs} programs, but the deployment has {len(programs)} "
+                "programs!",
+                HTTPStatus.BAD_REQUEST,
+            )
+        return programs.index(job.program)
+
+    @staticmethod
+    def __observables(job: PilotJob) -> List[SparsePauliOp]:
+        """Get the observables to estimate for the program of the job (defaults to measuring Y on all qubits)"""
+        num_qubits: int = job.circuit.num_qubits
+        if job.job.observables is None:
+            return [SparsePauliOp("Y" * num_qubits)]
+        labels: List[str] = job.job.observables[IBMPilot.__program_index(job, len(job.job.observables))]
+        invalid = [label for label in labels if len(label) != num_qubits]
+        if invalid:
+            raise QunicornError(
+                f"The observables {', '.join(invalid)} do not match the {num_qubits} qubits of the circuit!",
+                HTTPStatus.BAD_REQUEST,
+            )
+        return [SparsePauliOp(label) for label in labels]
+
+    @staticmethod
+    def __to_pub(
+        circuit: QuantumCircuit, bindings: Optional[List[dict]], observables: Optional[List[SparsePauliOp]] = None
+    ) -> Union[QuantumCircuit, tuple]:
+        """Create the primitive unified bloc (PUB), the parameter values are broadcast over all bindings
+
+        The observables are broadcast over the bindings as well, i.e. the estimator returns the expectation values of
+        all observables for every binding (an array of the shape (bindings, observables)).
+        """
+        pub: tuple = (circuit,) if observables is None else (circuit, observables)
+        if bindings is not None:
+            parameters = IBMPilot.__parameters(circuit)
+            values = np.array([[binding[p] for p in parameters] for binding in bindings])
+            pub += (values if observables is None else values[:, np.newaxis, :],)
+        return pub if len(pub) > 1 else circuit
+
     @staticmethod
     def __map_runner_results(
         ibm_result: Result, circuits: List[QuantumCircuit] = None
@@ -346,7 +730,7 @@ class IBMPilot(Pilot):
         try:
             binary_counts = ibm_result.get_counts()
         except QiskitError:
-            binary_counts = [None]
+            binary_counts = [None] * len(ibm_result.results)
 
         if isinstance(binary_counts, dict):
             binary_counts = [binary_counts]
@@ -368,16 +752,24 @@ class IBMPilot(Pilot):
             metadata.pop("circuit", None)
 
             hex_counts = IBMPilot._binary_counts_to_hex(binary_counts[i])
+            exact = "exact_probability_clbits" in (circuits[i].metadata or {})
 
-            pilot_results.append(
-                PilotJobResult(
-                    result_type=ResultType.COUNTS,
-                    data=hex_counts if hex_counts else {"": 0},
-                    meta=metadata,
+            # circuits with exact probabilities only sample counts if their measurements were kept
+            if not exact or "measure" in circuits[i].count_ops():
+                pilot_results.append(
+                    PilotJobResult(
+                        result_type=ResultType.COUNTS,
+                        data=hex_counts if hex_counts else {"": 0},
+                        meta=metadata,
+                    )
                 )
-            )
 
-            probabilities: dict = utils.calculate_probabilities(hex_counts) if hex_counts else {"": 0}
+            probabilities: dict
+            if exact:
+                exact_probabilities = ibm_result.data(i).get("probabilities", {})
+                probabilities = IBMPilot.__map_exact_probabilities(exact_probabilities, circuits[i])
+            else:
+                probabilities = utils.calculate_probabilities(hex_counts) if hex_counts else {"": 0}
 
             pilot_results.append(
                 PilotJobResult(
@@ -409,57 +801,82 @@ class IBMPilot(Pilot):
 
     @staticmethod
     def _map_estimator_results(
-        ibm_result: PrimitiveResult, observables: List[SparsePauliOp]
+        ibm_result: PrimitiveResult,
+        observables: List[List[SparsePauliOp]],
+        bindings: Optional[List[Optional[List[dict]]]] = None,
     ) -> list[Sequence[PilotJobResult]]:
         mapped_results: list[Sequence[PilotJobResult]] = []
 
         for i in range(len(ibm_result)):
             pub_result: PubResult = ibm_result[i]
-            expectation_values: np.ndarray = pub_result.data["evs"]
-            standard_deviations: np.ndarray = pub_result.data["stds"]
-            variance = standard_deviations * standard_deviations
+            # the PUBs contain one value per observable, for parameterized circuits for every parameter binding
+            shape = (-1, len(observables[i]))
+            expectation_values: np.ndarray = np.reshape(pub_result.data["evs"], shape)
+            variances: np.ndarray = np.reshape(pub_result.data["stds"], shape) ** 2
 
-            mapped_results.append(
+            binding_results = [
                 [
                     PilotJobResult(
-                        data={"value": str(expectation_values.item()), "variance": str(variance.item())},
-                        meta={"observer": f"SparsePauliOp-{observables[i].paulis}"},
+                        data={"value": str(value.item()), "variance": str(variance.item())},
+                        meta={"observer": f"SparsePauliOp-{observable.paulis}"},
                         result_type=ResultType.VALUE_AND_VARIANCE,
                     )
+                    for observable, value, variance in zip(observables[i], binding_values, binding_variances)
                 ]
-            )
+                for binding_values, binding_variances in zip(expectation_values, variances)
+            ]
+            mapped_results.append(IBMPilot.__mark_pub_results(binding_results, bindings[i] if bindings else None))
 
         return mapped_results
 
     @staticmethod
-    def _map_sampler_results(ibm_result: PrimitiveResult) -> list[Sequence[PilotJobResult]]:
+    def _map_sampler_results(
+        ibm_result: PrimitiveResult, bindings: Optional[List[Optional[List[dict]]]] = None
+    ) -> list[Sequence[PilotJobResult]]:
         mapped_results: list[Sequence[PilotJobResult]] = []
 
         for i in range(len(ibm_result)):
-            pilot_results: list[PilotJobResult] = []
-            try:
-                pilot_results.append(
-                    PilotJobResult(
-                        data=Pilot.qubit_binary_string_to_hex(ibm_result[i].data["c"].get_counts()),
-                        meta={},
-                        result_type=ResultType.COUNTS,
+            pub_bindings = bindings[i] if bindings else None
+            bit_array = ibm_result[i].data["c"]
+            # the PUBs of parameterized circuits contain the samples of every parameter binding
+            locations = [None] if pub_bindings is None else range(len(pub_bindings))
+            binding_results: list[Sequence[PilotJobResult]] = []
+            for location in locations:
+                try:
+                    binding_results.append(
+                        [
+                            PilotJobResult(
+                                data=Pilot.qubit_binary_string_to_hex(bit_array.get_counts(location)),
+                                meta={},
+                                result_type=ResultType.COUNTS,
+                            )
+                        ]
                     )
-                )
-            except QunicornError as err:
-                exception_message: str = str(err)
-                stack_trace: str = "".join(traceback.format_exception(err))
-                pilot_results.append(
-                    PilotJobResult(
-                        result_type=ResultType.ERROR,
-                        data={"exception_message": exception_message},
-                        meta={"stack_trace": stack_trace},
+                except QunicornError as err:
+                    exception_message: str = str(err)
+                    stack_trace: str = "".join(traceback.format_exception(err))
+                    binding_results.append(
+                        [
+                            PilotJobResult(
+                                result_type=ResultType.ERROR,
+                                data={"exception_message": exception_message},
+                                meta={"stack_trace": stack_trace},
+                            )
+                        ]
                     )
-                )
 
-            mapped_results.append(pilot_results)
+            mapped_results.append(IBMPilot.__mark_pub_results(binding_results, pub_bindings))
 
         return mapped_results
 
+    @staticmethod
+    def __mark_pub_results(
+        binding_results: list[Sequence[PilotJobResult]], bindings: Optional[List[dict]]
+    ) -> Sequence[PilotJobResult]:
+        if bindings is None:
+            return binding_results[0]
+        return Pilot.mark_binding_results(binding_results, bindings)
+
     def get_standard_provider(self) -> ProviderDataclass:
         found_provider = ProviderDataclass.get_by_name(self.provider_name)
         if not found_provider:
@@ -13,32 +13,63 @@
 # limitations under the License.
 import uuid
 from http import HTTPStatus
-from typing import Optional, Union
+from importlib import import_module
+from threading import RLock
+from typing import Optional, Union, cast
 
 import requests
 from flask import current_app
 
 from qunicorn_core.api.api_models import DeviceDto
-from qunicorn_core.core.pilotmanager.aws_pilot import AWSPilot
 from qunicorn_core.core.pilotmanager.base_pilot import Pilot
-from qunicorn_core.core.pilotmanager.ibm_pilot import IBMPilot
-from qunicorn_core.core.pilotmanager.qmware_pilot import QMwarePilot
-from qunicorn_core.core.pilotmanager.rigetti_pilot import RigettiPilot
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.device import DeviceDataclass
 from qunicorn_core.db.models.job import JobDataclass
 from qunicorn_core.db.models.provider import ProviderDataclass
+from qunicorn_core.static.enums.provider_name import ProviderName
 from qunicorn_core.static.qunicorn_exception import QunicornError
 
-PILOTS: list[Pilot] = [IBMPilot(), AWSPilot(), RigettiPilot(), QMwarePilot()]
+# "<Qunicorn Provider Name>: <module>:<class>" of all pilots, the pilots (and their SDKs) are imported on first use
+PILOT_CLASSES: dict[str, str] = {
+    ProviderName.IBM.value: "qunicorn_core.core.pilotmanager.ibm_pilot:IBMPilot",
+    ProviderName.AWS.value: "qunicorn_core.core.pilotmanager.aws_pilot:AWSPilot",
+    ProviderName.RIGETTI.value: "qunicorn_core.core.pilotmanager.rigetti_pilot:RigettiPilot",
+    ProviderName.QMWARE.value: "qunicorn_core.core.pilotmanager.qmware_pilot:QMwarePilot",
+}
 provider_name_map = {"IBM": "ibmq"}  # "<Qunicorn Provider Name>: <QPROV Provider Name>"
 
-""""This Class is responsible for managing the pilots and their data, all pilots are saved in the PILOTS list"""
+_PILOTS: dict[str, Pilot] = {}
+_PILOTS_LOCK = RLock()
+
+""""This Class is responsible for managing the pilots and their data, the pilots are registered in PILOT_CLASSES"""
+
+
+def __getattr__(name: str):
+    # PILOTS is loaded lazily, as importing all pilots imports all quantum SDKs
+    if name == "PILOTS":
+        return get_pilots()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_pilot(provider_name: str) -> Optional[Pilot]:
+    """Get the pilot of the provider, the pilot is imported if it is used for the first time"""
+    with _PILOTS_LOCK:
+        pilot = _PILOTS.get(provider_name)
+        if pilot is None and provider_name in PILOT_CLASSES:
+            module_name, class_name = PILOT_CLASSES[provider_name].split(":")
+            pilot = getattr(import_module(module_name), class_name)()
+            _PILOTS[provider_name] = pilot
+        return pilot
+
+
+def get_pilots() -> list[Pilot]:
+    """Get all pilots, this imports the SDKs of all providers"""
+    return [cast(Pilot, get_pilot(provider_name)) for provider_name in PILOT_CLASSES]
 
 
 def save_default_jobs_and_devices_from_provider(include_default_jobs=True):
     """Get all default data from the pilots and save them to the database"""
-    for pilot in PILOTS:
+    for pilot in get_pilots():
         _, default_device = pilot.get_standard_devices()
         if include_default_jobs:
             job: JobDataclass = pilot.get_standard_job_with_deployment(default_device)
@@ -48,11 +79,16 @@ def save_default_jobs_and_devices_from_provider(include_default_jobs=True):
 
 def update_devices_from_provider(provider_id: int, token: Optional[str]):
     """Update the devices from the provider and return all devices from the database"""
+    from qunicorn_core.core.compilation_cache_service import invalidate_compiled_circuits  # imports qiskit
+
     provider: ProviderDataclass = ProviderDataclass.get_by_id_or_404(provider_id)
     pilot: Pilot = get_matching_pilot(provider.name)
     pilot.save_devices_from_provider(token)
 
     updated_provider = ProviderDataclass.get_by_id_or_404(provider_id)
+    # the targets or calibrations of the devices may have changed
+    invalidate_compiled_circuits(updated_provider.devices)
+    DB.session.commit()
     qprov_provider_name = provider_name_map[updated_provider.name]
     qprov_root_url = current_app.config.get("QPROV_URL")
 
@@ -101,7 +137,7 @@ def get_device_data_from_provider(device: Union[DeviceDataclass, DeviceDto], tok
 
 def get_matching_pilot(provider_name: str) -> Pilot:
     """Get the pilot that matches the provider name, if no pilot matches raise an error"""
-    for pilot in PILOTS:
-        if pilot.has_same_provider(provider_name):
-            return pilot
+    pilot = get_pilot(provider_name)
+    if pilot is not None and pilot.has_same_provider(provider_name):
+        return pilot
     raise QunicornError(f"No valid Target specified to get device data: {provider_name}")
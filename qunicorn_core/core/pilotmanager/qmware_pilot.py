@@ -25,6 +25,7 @@ from requests.exceptions import ConnectionError
 from qunicorn_core.celery import CELERY
 from qunicorn_core.api.api_models.device_dtos import DeviceDto
 from qunicorn_core.core.pilotmanager.base_pilot import Pilot, PilotJob, PilotJobResult
+from qunicorn_core.core.task_executor import submit_task
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.device import DeviceDataclass
 from qunicorn_core.db.models.job import JobDataclass
@@ -130,8 +131,7 @@ class QMwarePilot(Pilot):
         DB.session.commit()
 
         for qunicorn_job in jobs_to_watch.values():
-            watch_task = watch_qmware_results.s(job_id=qunicorn_job.id).delay()
-            qunicorn_job.celery_id = watch_task.id
+            qunicorn_job.celery_id = submit_task(watch_qmware_results, job_id=qunicorn_job.id)
             qunicorn_job.save(commit=True)  # commit new celery id
 
     def _get_job_results(self, qunicorn_job_id: int) -> None:  # noqa: C901
@@ -374,4 +374,7 @@ class QMwarePilot(Pilot):
     max_retries=None,
 )
 def watch_qmware_results(job_id: int):
+    # the job is running as long as the results are polled (see job_watchdog_service)
+    JobDataclass.record_heartbeat(job_id)
+    DB.session.commit()
     QMwarePilot()._get_job_results(job_id)
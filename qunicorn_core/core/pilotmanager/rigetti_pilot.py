@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import Counter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from hashlib import sha256
 from http import HTTPStatus
-from typing import Optional, Sequence, Union
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from flask.globals import current_app
-from pyquil.api import get_qc
+from pyquil import Program
+from pyquil.api import QuantumComputer, QuantumExecutable, get_qc
 
 from qunicorn_core.api.api_models import DeviceDto
 from qunicorn_core.core.pilotmanager.base_pilot import Pilot, PilotJob, PilotJobResult
+from qunicorn_core.core.simulation_executor import wait_for_result
 from qunicorn_core.db.db import DB
 from qunicorn_core.db.models.device import DeviceDataclass
 from qunicorn_core.db.models.job import JobDataclass
@@ -42,6 +49,17 @@ MEASURE(0, (\"ro\", 0)),
 MEASURE(1, (\"ro\", 1)),
 )"""
 
+# default number of programs of a batch executed concurrently on the QVM
+DEFAULT_RIGETTI_PARALLEL_PROGRAMS: int = 4
+# default number of compiled executables kept in memory
+DEFAULT_RIGETTI_EXECUTABLE_CACHE_SIZE: int = 128
+
+# idle quantum computer handles (with their QVM and quilc connections) per device
+_QUANTUM_COMPUTERS: Dict[str, List[QuantumComputer]] = {}
+# compiled executables by (program hash, device, shots), least recently used first
+_EXECUTABLES: "OrderedDict[Tuple[str, str, int], QuantumExecutable]" = OrderedDict()
+_LOCK = Lock()
+
 
 class RigettiPilot(Pilot):
     """The Rigetti Pilot"""
@@ -60,52 +78,123 @@ class RigettiPilot(Pilot):
         if any(not j.job.executed_on or not j.job.executed_on.is_local for j in jobs):
             raise QunicornError("Device need to be local for RIGETTI")
 
-        for job in jobs:
-            job.circuit.wrap_in_numshots_loop(job.job.shots)
-            qvm = get_qc(job.job.executed_on.name)
-            qvm_result = qvm.run(qvm.compile(job.circuit)).get_register_map().get("ro")
-            result_dict = RigettiPilot.result_to_dict(qvm_result)
-            result_dict = RigettiPilot.qubit_binary_string_to_hex(
-                result_dict, reverse_qubit_order=True
-            )  # FIXME: test qubit order with qasm testsuite!
-            probabilities_dict = utils.calculate_probabilities(result_dict)
-
-            pilot_results = [
-                PilotJobResult(
-                    data=result_dict,
-                    result_type=ResultType.COUNTS,
-                    meta={
-                        "format": "hex",
-                        "shots": qvm_result.shape[0],
-                        "registers": {
-                            "name": "default",
-                            "size": qvm_result.shape[1],
-                        },
+        config = current_app.config
+        parallel_programs: int = config.get("RIGETTI_PARALLEL_PROGRAMS", DEFAULT_RIGETTI_PARALLEL_PROGRAMS)
+        cache_size: int = config.get("RIGETTI_EXECUTABLE_CACHE_SIZE", DEFAULT_RIGETTI_EXECUTABLE_CACHE_SIZE)
+
+        # the programs are independent, only the execution runs in other threads, the results are saved in this thread
+        executor = ThreadPoolExecutor(max_workers=max(1, min(parallel_programs, len(jobs))))
+        try:
+            futures = [
+                executor.submit(
+                    RigettiPilot._run_program,
+                    job.job.executed_on.name,
+                    job.circuit,
+                    self.get_shots_and_seed(job)[0],
+                    cache_size,
+                )
+                for job in jobs
+            ]
+            is_canceled = self.cancellation_check(jobs)
+            for job, future in zip(jobs, futures):
+                self.__save_qvm_result(job, wait_for_result(future, is_canceled))
+        finally:
+            # a canceled job does not wait for the programs that are still running on the QVM
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.check_canceled(jobs)
+        DB.session.commit()
+
+    def __save_qvm_result(self, job: PilotJob, qvm_result: np.ndarray):
+        """Save the counts and probabilities of the bits read out into the "ro" register"""
+        result_dict = RigettiPilot.result_to_dict(qvm_result)
+        result_dict = RigettiPilot.qubit_binary_string_to_hex(
+            result_dict, reverse_qubit_order=True
+        )  # FIXME: test qubit order with qasm testsuite!
+        probabilities_dict = utils.calculate_probabilities(result_dict)
+
+        pilot_results = [
+            PilotJobResult(
+                data=result_dict,
+                result_type=ResultType.COUNTS,
+                meta={
+                    "format": "hex",
+                    "shots": qvm_result.shape[0],
+                    "registers": {
+                        "name": "default",
+                        "size": qvm_result.shape[1],
                     },
-                ),
-                PilotJobResult(
-                    data=probabilities_dict,
-                    result_type=ResultType.PROBABILITIES,
-                    meta={
-                        "format": "hex",
-                        "shots": qvm_result.shape[0],
-                        "registers": {
-                            "name": "default",
-                            "size": qvm_result.shape[1],
-                        },
+                },
+            ),
+            PilotJobResult(
+                data=probabilities_dict,
+                result_type=ResultType.PROBABILITIES,
+                meta={
+                    "format": "hex",
+                    "shots": qvm_result.shape[0],
+                    "registers": {
+                        "name": "default",
+                        "size": qvm_result.shape[1],
                     },
-                ),
-            ]
-            self.save_results(job, pilot_results)
+                },
+            ),
+        ]
+        self.save_results(job, pilot_results)
 
-        DB.session.commit()
+    @staticmethod
+    def _run_program(device_name: str, program: Program, shots: int, cache_size: int) -> np.ndarray:
+        """Run the program on a pooled handle of the device and return the bits read out into the "ro" register"""
+        with RigettiPilot._borrow_quantum_computer(device_name) as quantum_computer:
+            executable = RigettiPilot._get_executable(quantum_computer, device_name, program, shots, cache_size)
+            return quantum_computer.run(executable).get_register_map().get("ro")
+
+    @staticmethod
+    @contextmanager
+    def _borrow_quantum_computer(device_name: str) -> Iterator[QuantumComputer]:
+        """Borrow an idle handle of the device, handles are created on demand and returned to the pool after use
+
+        A handle is only used by one thread at a time. Handles of failed executions are discarded, as their
+        connections may be broken.
+        """
+        with _LOCK:
+            idle = _QUANTUM_COMPUTERS.setdefault(device_name, [])
+            quantum_computer = idle.pop() if idle else None
+        if quantum_computer is None:
+            quantum_computer = get_qc(device_name)
+        yield quantum_computer
+        with _LOCK:
+            _QUANTUM_COMPUTERS[device_name].append(quantum_computer)
+
+    @staticmethod
+    def _get_executable(
+        quantum_computer: QuantumComputer, device_name: str, program: Program, shots: int, cache_size: int
+    ) -> QuantumExecutable:
+        """Compile the program for the shots with quilc, reusing the executables of identical programs"""
+        key = (sha256(program.out().encode()).hexdigest(), device_name, shots)
+        with _LOCK:
+            executable = _EXECUTABLES.get(key)
+            if executable is not None:
+                _EXECUTABLES.move_to_end(key)
+                return executable
+
+        # the program of the job is not modified, it may be executed again with other shots
+        program = program.copy()
+        program.wrap_in_numshots_loop(shots)
+        executable = quantum_computer.compile(program)
+
+        with _LOCK:
+            _EXECUTABLES[key] = executable
+            while len(_EXECUTABLES) > cache_size:
+                _EXECUTABLES.popitem(last=False)
+        return executable
 
     @staticmethod
     def result_to_dict(results: Sequence[Sequence[int]]) -> dict:
-        """Converts the result of the qvm to a dictionary"""
-        results_as_strings = ("".join(map(str, row)) for row in results)
-        result_counter = Counter(results_as_strings)
-        return dict(result_counter)
+        """Converts the result of the qvm (one row of bits per shot) to a dictionary of the counts of the bitstrings"""
+        rows, counts = np.unique(np.asarray(results, dtype=np.uint8), axis=0, return_counts=True)
+        # only the distinct outcomes are converted to strings
+        bitstrings = ["".join(map(str, row)) for row in rows.tolist()]
+        return dict(zip(bitstrings, counts.tolist()))
 
     def execute_provider_specific(self, jobs: Sequence[PilotJob], job_type: str, token: Optional[str] = None):
         """Execute a job of a provider specific type on a backend using a Pilot"""
@@ -0,0 +1,93 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import ceil
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from flask import current_app
+
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.job_type import JobType
+from qunicorn_core.static.enums.probability_mode import ProbabilityMode
+from qunicorn_core.static.enums.result_type import ResultType
+
+"""
+Splits the shots of large jobs on local simulators into chunks that are executed in parallel.
+
+Every chunk is executed like a fragment of a cut circuit: with celery each chunk runs in its own task (and thus on any
+worker), the results of the chunks are merged once all chunks were executed. Every chunk is simulated with its own
+seed, derived from the seed of the job, so that seeded jobs stay reproducible. Set ``SHOT_CHUNK_SIZE`` to 0 to never
+split the shots of a job.
+"""
+
+# default maximum number of shots simulated by a single task
+DEFAULT_SHOT_CHUNK_SIZE: int = 1_000_000
+
+
+def get_shot_chunks(job: JobDataclass) -> Optional[List[Tuple[int, Optional[int]]]]:
+    """Get the shots and the seed of every chunk of the job, returns None if the shots of the job are not split."""
+    chunk_size: int = current_app.config.get("SHOT_CHUNK_SIZE", DEFAULT_SHOT_CHUNK_SIZE)
+    device = job.executed_on
+    if chunk_size <= 0 or job.type != JobType.RUNNER or device is None or not device.is_local:
+        return None
+    if job.shots is None or job.shots <= chunk_size or job.probability_mode == ProbabilityMode.EXACT:
+        return None
+
+    number_of_chunks = ceil(job.shots / chunk_size)
+    # distribute the shots evenly, the first chunks get one more shot if the shots cannot be divided evenly
+    shots = [job.shots // number_of_chunks + (i < job.shots % number_of_chunks) for i in range(number_of_chunks)]
+    seeds: List[Optional[int]] = [None] * number_of_chunks
+    if job.seed is not None:
+        # independent seeds, simulators accept seeds up to 2**31 - 1
+        seeds = [int(s.generate_state(1)[0] >> 1) for s in np.random.SeedSequence(job.seed).spawn(number_of_chunks)]
+    return list(zip(shots, seeds))
+
+
+def merge_chunk_results(
+    chunk_results: Sequence[Sequence[Dict[str, Any]]], chunk_shots: Sequence[int]
+) -> List[Tuple[Any, Dict[str, Any], str]]:
+    """Merge the results of all chunks into the results of the program.
+
+    Every chunk has the same results in the same order, e.g. counts and probabilities for every parameter binding.
+    Returns the data, the metadata and the result type of the merged results.
+    """
+    total_shots = sum(chunk_shots)
+    merged: List[Tuple[Any, Dict[str, Any], str]] = []
+    for results in zip(*chunk_results):
+        first = results[0]
+        meta = dict(first["meta"] or {})
+        if "shots" in meta:
+            meta["shots"] = total_shots
+        meta["shot_chunks"] = len(chunk_shots)
+
+        data = first["data"]
+        if first["result_type"] == ResultType.COUNTS:
+            keys, values = _stack([r["data"] for r in results])
+            data = dict(zip(keys, values.sum(axis=0).astype(int).tolist()))
+        elif first["result_type"] == ResultType.PROBABILITIES:
+            keys, values = _stack([r["data"] for r in results])
+            data = dict(zip(keys, np.average(values, axis=0, weights=chunk_shots).tolist()))
+        merged.append((data, meta, first["result_type"]))
+    return merged
+
+
+def _stack(results: Sequence[Dict[str, float]]) -> Tuple[List[str], np.ndarray]:
+    """Stack the results of the chunks into a matrix with one row per chunk and one column per (sorted) key."""
+    keys = sorted(set().union(*results))
+    columns = {key: i for i, key in enumerate(keys)}
+    values = np.zeros((len(results), len(keys)))
+    for row, result in enumerate(results):
+        values[row, [columns[key] for key in result]] = list(result.values())
+    return keys, values
@@ -0,0 +1,334 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import os
+from concurrent.futures import Future
+from contextlib import contextmanager
+from http import HTTPStatus
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Iterator, List, Optional, TypeVar
+
+from flask import current_app, has_app_context
+
+from qunicorn_core.static.qunicorn_exception import JobCanceledError, QunicornError
+from qunicorn_core.util.resource_limits import limit_resources
+
+"""
+Executes local simulations in a bounded pool of processes.
+
+Celery workers using the threads pool wait for cloud providers without blocking a process, but simulations in these
+threads compete for the GIL. With ``SIMULATION_PROCESSES`` set, the pilots run their simulations in a process pool of
+the worker instead, so a single worker can use all cores for simulations while the threads keep serving jobs waiting
+for the cloud providers. Each simulation process may allocate at most ``SIMULATION_MEMORY_LIMIT`` MB, so the number of
+processes bounds the memory used for simulations.
+
+Simulation functions must be picklable (i.e. module level functions or static methods) and must not use the database.
+
+Simulations of jobs that may be canceled while they are running pass a cancellation check, which is polled every
+``CANCELLATION_POLL_INTERVAL`` seconds while the calling thread waits for the simulation process. The process of a
+canceled simulation is killed, which frees its memory and its slot in the pool, and is replaced by a new process.
+Simulations running in the calling thread (``SIMULATION_PROCESSES=0``, the default) cannot be interrupted: their
+cancellation is only checked before and after the simulation, so a worker only stops large simulations of canceled
+jobs if ``SIMULATION_PROCESSES`` is set.
+
+Simulations calling the simulator repeatedly (e.g. the iterations of an optimizer) use a simulation session, which runs
+all calls in the same simulation process, so the simulator set up by ``SimulationSession.bind`` stays in the process.
+"""
+
+T = TypeVar("T")
+
+# default number of simulation processes per worker, simulations run in the calling thread if 0
+DEFAULT_SIMULATION_PROCESSES: int = 0
+# default memory in MB a simulation process may allocate in addition to the imported libraries
+DEFAULT_SIMULATION_MEMORY_LIMIT: int = 4096
+# default number of simulations (or sessions) a process executes before it is replaced (releasing fragmented memory)
+DEFAULT_SIMULATION_MAX_TASKS: int = 50
+# default interval in seconds for checking whether a running simulation was canceled
+DEFAULT_CANCELLATION_POLL_INTERVAL: int = 1
+# modules imported by the forkserver, so that new simulation processes start without importing the simulators
+PRELOADED_MODULES = [
+    "qunicorn_core.core.pilotmanager.aws_pilot",
+    "qunicorn_core.core.pilotmanager.ibm_pilot",
+]
+
+_EXECUTOR: Optional["SimulationPool"] = None
+_EXECUTOR_LOCK = Lock()
+
+
+def _bind(state: dict, factory: Callable[..., Callable[..., Any]], *args: Any):
+    state.clear()  # release the simulator of the previous session before setting up the new one
+    state["bound"] = factory(*args)
+
+
+def _call_bound(state: dict, *args: Any) -> Any:
+    return state["bound"](*args)
+
+
+def _reply(connection: Connection, function: Callable[..., Any], args: tuple):
+    try:
+        reply = (True, function(*args))
+    except Exception as err:
+        reply = (False, err)
+    try:
+        connection.send(reply)
+    except Exception as err:
+        connection.send((False, RuntimeError(f"The result of the simulation could not be returned: {err}")))
+
+
+def _serve(connection: Connection, memory_limit: int):
+    """Main loop of a simulation process, executes the received functions until the connection is closed."""
+    limit_resources(memory_limit)
+    state = {}  # the bound function of the current session
+    while True:
+        try:
+            kind, function, args = connection.recv()
+        except EOFError:
+            return
+        if kind == "bind":
+            function, args = _bind, (state, function, *args)
+        elif kind == "call_bound":
+            function, args = _call_bound, (state, *args)
+        elif kind == "unbind":
+            function, args = state.clear, ()
+        _reply(connection, function, args)
+
+
+class SimulationProcess:
+    """A process executing one simulation at a time, which is killed if the simulation is canceled."""
+
+    def __init__(self, context: BaseContext, memory_limit: int):
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child_connection, memory_limit), daemon=True)
+        self._process.start()
+        child_connection.close()
+        self._busy = False
+        self.sessions = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    def is_reusable(self) -> bool:
+        """Check whether the process is alive and does not compute a result that was not received."""
+        return not self._busy and self._process.is_alive()
+
+    def call(self, kind: str, function: Optional[Callable], args: tuple, is_canceled: Optional[Callable[[], bool]]):
+        """Execute the function in the process, kills the process as soon as ``is_canceled`` returns True."""
+        poll_interval = current_app.config.get("CANCELLATION_POLL_INTERVAL", DEFAULT_CANCELLATION_POLL_INTERVAL)
+        self._busy = True
+        try:
+            self._connection.send((kind, function, args))
+            while not self._connection.poll(poll_interval if is_canceled is not None else None):
+                if is_canceled():
+                    self.kill()
+                    raise JobCanceledError()
+            success, value = self._connection.recv()
+        except (EOFError, OSError) as err:
+            # the process was killed (e.g. by the OOM killer or a crash of the simulator)
+            self.kill()
+            raise QunicornError(
+                "The simulation process terminated unexpectedly.", HTTPStatus.INTERNAL_SERVER_ERROR
+            ) from err
+        self._busy = False
+        if not success:
+            raise value
+        return value
+
+    def kill(self):
+        """Stop the process immediately."""
+        self._process.kill()
+        self._process.join()
+        self._connection.close()
+
+
+class SimulationPool:
+    """A bounded pool of simulation processes, processes of canceled or crashed simulations are replaced."""
+
+    def __init__(self, processes: int, memory_limit: int, max_tasks: int):
+        # a forkserver is safe to use from threads, forking the (threaded) worker is not
+        self._context = get_context("forkserver")
+        self._context.set_forkserver_preload(PRELOADED_MODULES)
+        self._memory_limit = memory_limit
+        self._max_tasks = max_tasks
+        self._slots = BoundedSemaphore(processes)
+        self._idle: List[SimulationProcess] = []
+        self._lock = Lock()
+        self._closed = False
+
+    @contextmanager
+    def acquire(self) -> Iterator[SimulationProcess]:
+        """Use a simulation process exclusively, blocks until one of the processes is available."""
+        with self._slots:
+            with self._lock:
+                process = self._idle.pop() if self._idle else None
+            if process is None or not process.is_reusable():
+                process = SimulationProcess(self._context, self._memory_limit)
+            process.sessions += 1
+            try:
+                yield process
+            finally:
+                with self._lock:
+                    if not self._closed and process.is_reusable() and process.sessions < self._max_tasks:
+                        self._idle.append(process)
+                        process = None
+                if process is not None:
+                    process.kill()
+
+    def shutdown(self):
+        """Stop the idle processes, processes in use are stopped when they are released."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for process in idle:
+            process.kill()
+
+
+def get_simulation_executor() -> Optional[SimulationPool]:
+    """Get the process pool of this worker (started on first use) or None if simulations run in the calling thread."""
+    global _EXECUTOR
+    if not has_app_context():
+        return None
+    config = current_app.config
+    processes = config.get("SIMULATION_PROCESSES", DEFAULT_SIMULATION_PROCESSES)
+    if processes <= 0:
+        return None
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = SimulationPool(
+                processes,
+                config.get("SIMULATION_MEMORY_LIMIT", DEFAULT_SIMULATION_MEMORY_LIMIT),
+                config.get("SIMULATION_MAX_TASKS", DEFAULT_SIMULATION_MAX_TASKS),
+            )
+            atexit.register(_EXECUTOR.shutdown)
+        return _EXECUTOR
+
+
+def shutdown_simulation_executor():
+    """Stop all simulation processes of this worker."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown()
+            _EXECUTOR = None
+
+
+def get_available_threads() -> int:
+    """Get the number of threads a simulation may use, the cores are shared by the simulation processes."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    processes: int = current_app.config.get("SIMULATION_PROCESSES", DEFAULT_SIMULATION_PROCESSES)
+    return max(1, cores // max(processes, 1))
+
+
+def wait_for_result(future: Future, is_canceled: Optional[Callable[[], bool]] = None) -> Any:
+    """Wait for the result of the future (e.g. of a thread waiting for a remote simulator), raises a JobCanceledError
+    as soon as ``is_canceled`` returns True.
+
+    The future is canceled if it has not been started yet.
+    """
+    if is_canceled is None:
+        return future.result()
+    poll_interval = current_app.config.get("CANCELLATION_POLL_INTERVAL", DEFAULT_CANCELLATION_POLL_INTERVAL)
+    while True:
+        try:
+            return future.result(timeout=poll_interval)
+        except TimeoutError:
+            if is_canceled():
+                future.cancel()
+                raise JobCanceledError()
+
+
+class SimulationSession:
+    """Runs the simulations of a job in one simulation process (or in the calling thread if the pool is disabled).
+
+    If ``is_canceled`` is given, it is checked before and after every simulation (and while waiting for the simulation
+    process), a JobCanceledError is raised instead of returning the result of a canceled simulation.
+    """
+
+    def __init__(self, process: Optional[SimulationProcess], is_canceled: Optional[Callable[[], bool]]):
+        self._process = process
+        self._is_canceled = is_canceled
+        self._bound: Optional[Callable[..., Any]] = None  # only set without a process, else it stays in the process
+        self.is_bound = False
+
+    def run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run the simulation function."""
+        return self._call("call", function, args)
+
+    def bind(self, factory: Callable[..., Callable[..., T]], *args: Any) -> Callable[..., T]:
+        """Set up a simulation function that stays in the simulation process, e.g. a simulator that is used for many
+        simulations, returns a function running it.
+
+        ``factory`` is called with ``args`` in the simulation process and returns the simulation function, which does
+        not need to be picklable. Only the arguments of the calls of the simulation function are sent to the process.
+        A session has at most one bound simulation function, binding a new one releases the previous one.
+        """
+        if self._process is None:
+            self._check_canceled()
+            self._bound = factory(*args)
+        else:
+            self._call("bind", factory, args)
+        self.is_bound = True
+        return self._call_bound
+
+    def _call_bound(self, *args: Any) -> Any:
+        return self._call("call_bound", self._bound, args)
+
+    def _check_canceled(self):
+        if self._is_canceled is not None and self._is_canceled():
+            raise JobCanceledError()
+
+    def _call(self, kind: str, function: Optional[Callable], args: tuple) -> Any:
+        self._check_canceled()
+        if self._process is None:
+            result = function(*args)
+        else:
+            try:
+                result = self._process.call(kind, function, args, self._is_canceled)
+            except MemoryError as err:
+                memory_limit = current_app.config.get("SIMULATION_MEMORY_LIMIT", DEFAULT_SIMULATION_MEMORY_LIMIT)
+                raise QunicornError(
+                    f"The simulation exceeded the memory limit of {memory_limit} MB.", HTTPStatus.INSUFFICIENT_STORAGE
+                ) from err
+        self._check_canceled()
+        return result
+
+
+@contextmanager
+def simulation_session(is_canceled: Optional[Callable[[], bool]] = None) -> Iterator[SimulationSession]:
+    """Start a session running all simulations in the same simulation process, see SimulationSession."""
+    executor = get_simulation_executor()
+    if executor is None:
+        yield SimulationSession(None, is_canceled)
+        return
+    with executor.acquire() as process:
+        session = SimulationSession(process, is_canceled)
+        try:
+            yield session
+        finally:
+            if session.is_bound and process.is_reusable():
+                process.call("unbind", None, (), None)  # the idle process does not keep the simulator
+
+
+def run_simulation(function: Callable[..., T], *args: Any, is_canceled: Optional[Callable[[], bool]] = None) -> T:
+    """Run the simulation function in a simulation process (or in this thread if the process pool is disabled).
+
+    If ``is_canceled`` is given, it is checked before and after the simulation, the simulation process is killed if the
+    job is canceled during the simulation (see SimulationSession).
+    """
+    with simulation_session(is_canceled) as session:
+        return session.run(function, *args)
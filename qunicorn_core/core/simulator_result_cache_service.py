@@ -0,0 +1,112 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from typing import Any, Dict, List, Optional
+
+from flask.globals import current_app
+
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.simulator_result_cache import SimulatorResultCacheDataclass
+from qunicorn_core.static.enums.probability_mode import ProbabilityMode
+
+"""
+This module contains the result cache for local simulators.
+A run with a fixed seed on a local simulator only depends on the circuit and the run parameters,
+so the results of such a run can be reused for identical jobs instead of simulating the circuit again.
+The cache is disabled by default and can be enabled with the ``SIMULATOR_RESULT_CACHE`` config option.
+"""
+
+# default time in seconds a cached result can be reused
+DEFAULT_RESULT_CACHE_TTL: int = 7 * 24 * 3600
+# default maximum number of cached results, the least recently used results are evicted first
+DEFAULT_RESULT_CACHE_SIZE: int = 1000
+
+
+def is_result_cache_enabled() -> bool:
+    return bool(current_app.config.get("SIMULATOR_RESULT_CACHE", False))
+
+
+def get_cache_key(
+    job: JobDataclass, circuit: str, shots: Optional[int] = None, seed: Optional[int] = None
+) -> Optional[str]:
+    """Get the cache key for running the (canonically serialized) circuit with the settings of the job.
+
+    The shots and the seed override the settings of the job, e.g. for a chunk of the shots of the job.
+    Returns None if the results of the job must not be cached, i.e. if the cache is disabled, the job has no seed
+    or is not executed on a local simulator.
+    """
+    shots = job.shots if shots is None else shots
+    seed = job.seed if seed is None else seed
+    if not is_result_cache_enabled() or seed is None:
+        return None
+    device = job.executed_on
+    if device is None or not device.is_local:
+        return None
+    key_data = {
+        "provider": device.provider.name if device.provider else None,
+        "device": device.name,
+        "type": job.type,
+        "shots": shots,
+        "seed": seed,
+        "error_mitigation": job.error_mitigation,
+        "circuit": circuit,
+    }
+    if job.parameter_bindings is not None:
+        key_data["parameter_bindings"] = job.parameter_bindings
+    if job.observables is not None:
+        key_data["observables"] = job.observables
+    if job.probability_mode not in (None, ProbabilityMode.SAMPLED):
+        key_data["probability_mode"] = job.probability_mode
+    return sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def get_cached_results(cache_key: str) -> Optional[List[Dict[str, Any]]]:
+    """Get the cached results for the cache key, returns None if there are no (unexpired) results."""
+    entry: Optional[SimulatorResultCacheDataclass] = SimulatorResultCacheDataclass.get_by_cache_key(cache_key)
+    if entry is None:
+        return None
+    created_at = entry.created_at
+    if created_at.tzinfo is None:
+        # sqlite does not store timezone information
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    if created_at < _get_expiry_limit():
+        entry.delete(commit=True)
+        return None
+    entry.mark_used()
+    entry.save(commit=True)
+    return entry.results
+
+
+def cache_results(cache_key: str, results: List[Dict[str, Any]]):
+    """Store the results for the cache key and evict expired and least recently used results.
+
+    All pending changes of the session are committed.
+    """
+    if SimulatorResultCacheDataclass.get_by_cache_key(cache_key) is not None:
+        return
+    # a concurrent job may already have stored the results for this key
+    SimulatorResultCacheDataclass(cache_key=cache_key, results=results).save_unless_stored()
+    SimulatorResultCacheDataclass.delete_expired(_get_expiry_limit())
+    SimulatorResultCacheDataclass.delete_least_recently_used(
+        current_app.config.get("SIMULATOR_RESULT_CACHE_SIZE", DEFAULT_RESULT_CACHE_SIZE)
+    )
+    DB.session.commit()
+
+
+def _get_expiry_limit() -> datetime:
+    ttl = timedelta(seconds=current_app.config.get("SIMULATOR_RESULT_CACHE_TTL", DEFAULT_RESULT_CACHE_TTL))
+    return datetime.now(timezone.utc) - ttl
@@ -0,0 +1,283 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+from datetime import datetime, timedelta, timezone
+from importlib import import_module
+from os import getpid
+from socket import gethostname
+from threading import Event, Lock, Semaphore, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional
+
+from celery.states import PENDING
+from celery.utils.time import get_exponential_backoff_interval
+from flask import Flask, current_app, has_app_context
+
+from qunicorn_core.celery import CELERY
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.queued_task import QueuedTaskDataclass
+from qunicorn_core.static.enums.execution_backend import ExecutionBackend
+from qunicorn_core.util.utils import get_execution_backend
+
+"""
+Executes background tasks (e.g. running jobs) with the configured execution backend.
+
+With ``EXECUTION_BACKEND=CELERY`` the tasks are sent to the celery workers. With ``EXECUTION_BACKEND=IN_PROCESS``
+the tasks are stored in the database and executed by ``IN_PROCESS_WORKERS`` threads of every API process, so that
+single node installations execute jobs in the background without a broker and separate workers. The threads of all
+processes share the queue in the database, a task is claimed by exactly one thread. Tasks that were queued or running
+when the API was stopped are executed after the next start (running tasks are executed again once the lease of the
+stopped process expired). Retries (``autoretry_for``, ``retry_backoff``, ...) are configured like for celery tasks.
+The periodic tasks of the celery beat schedule (e.g. the watchdog reclaiming stuck jobs) are executed by every API
+process, so they must tolerate being executed concurrently.
+"""
+
+# prefix of the ids of tasks executed in-process, celery ids are uuids
+IN_PROCESS_TASK_PREFIX = "in-process:"
+# default number of threads executing tasks in every API process
+DEFAULT_IN_PROCESS_WORKERS: int = 4
+# default interval in seconds for polling tasks submitted by other processes and for renewing the leases
+DEFAULT_IN_PROCESS_POLL_INTERVAL: int = 5
+# running tasks are executed again if their lease was not renewed for this many poll intervals
+LEASE_POLL_INTERVALS: int = 6
+
+_EXECUTOR: Optional["InProcessExecutor"] = None
+_EXECUTOR_LOCK = Lock()
+
+
+def _utc(moment: datetime) -> datetime:
+    # sqlite does not store timezone information
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
+def _get_task_name(task: Callable) -> str:
+    return getattr(task, "name", None) or f"{task.__module__}.{task.__qualname__}"
+
+
+def _import_task(task_name: str) -> Callable:
+    module, _, name = task_name.rpartition(".")
+    return getattr(import_module(module), name)
+
+
+class InProcessExecutor:
+    """Threads executing the tasks queued in the database."""
+
+    def __init__(self, app: Flask, workers: int, poll_interval: int):
+        self.app = app
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=poll_interval * LEASE_POLL_INTERVALS)
+        self.worker_id = f"{gethostname()}:{getpid()}"[:100]
+        self._submitted = Semaphore(0)
+        self._stopped = Event()
+        self._threads: List[Thread] = [
+            Thread(target=self._work, name=f"qunicorn-task-{i}", daemon=True) for i in range(workers)
+        ]
+        self._threads.append(Thread(target=self._renew_leases, name="qunicorn-task-leases", daemon=True))
+        self._threads.append(Thread(target=self._run_periodic_tasks, name="qunicorn-task-periodic", daemon=True))
+
+    def start(self):
+        for thread in self._threads:
+            thread.start()
+
+    def notify(self):
+        """Wake up an idle thread to execute a new task."""
+        self._submitted.release()
+
+    def shutdown(self):
+        """Stop the threads after their current task, tasks still running are executed again after a restart."""
+        self._stopped.set()
+        for _ in self._threads:
+            self._submitted.release()
+
+    def _work(self):
+        while not self._stopped.is_set():
+            with self.app.app_context():
+                try:
+                    task = self._claim_next_task()
+                    timeout = self._get_timeout() if task is None else 0
+                except Exception:
+                    current_app.logger.exception("Could not claim a queued task.")
+                    task, timeout = None, self.poll_interval
+                if task is not None:
+                    self._run(task)
+            if timeout > 0:
+                self._submitted.acquire(timeout=timeout)
+
+    def _claim_next_task(self) -> Optional[QueuedTaskDataclass]:
+        while True:
+            now = datetime.now(timezone.utc)
+            task = QueuedTaskDataclass.get_next_due(now)
+            if task is None:
+                DB.session.commit()
+                return None
+            claimed = QueuedTaskDataclass.claim(task.id, self.worker_id, now, now + self.lease)
+            DB.session.commit()
+            if claimed:
+                DB.session.refresh(task)
+                return task
+
+    def _get_timeout(self) -> float:
+        """Seconds until the next task is due, at most one poll interval."""
+        due = QueuedTaskDataclass.get_next_due_time()
+        DB.session.commit()
+        if due is None:
+            return self.poll_interval
+        until_due = (_utc(due) - datetime.now(timezone.utc)).total_seconds()
+        return min(max(until_due, 0.01), self.poll_interval)
+
+    def _run(self, queued_task: QueuedTaskDataclass):
+        task_id = queued_task.id
+        task = None
+        try:
+            task = _import_task(queued_task.task)
+            run = getattr(task, "run", task)
+            run(*queued_task.arguments.get("args", []), **queued_task.arguments.get("kwargs", {}))
+        except Exception as err:
+            DB.session.rollback()
+            queued_task = QueuedTaskDataclass.get_by_id(task_id)
+            if queued_task is not None and self._should_retry(task, queued_task, err):
+                self._retry(task, queued_task)
+                return
+            current_app.logger.exception(f"In-process task {task_id} failed.")
+        DB.session.rollback()
+        QueuedTaskDataclass.delete_by_id(task_id, commit=True)
+
+    @staticmethod
+    def _should_retry(task: Any, queued_task: QueuedTaskDataclass, err: Exception) -> bool:
+        if not isinstance(err, tuple(getattr(task, "autoretry_for", ()))):
+            return False
+        max_retries = getattr(task, "max_retries", None)
+        return max_retries is None or queued_task.attempts < max_retries
+
+    def _retry(self, task: Any, queued_task: QueuedTaskDataclass):
+        # same countdown as the celery autoretry
+        retry_backoff = float(getattr(task, "retry_backoff", False))
+        if retry_backoff:
+            countdown = get_exponential_backoff_interval(
+                factor=int(max(1.0, retry_backoff)),
+                retries=queued_task.attempts,
+                maximum=int(getattr(task, "retry_backoff_max", 600)),
+                full_jitter=getattr(task, "retry_jitter", True),
+            )
+        else:
+            countdown = getattr(task, "default_retry_delay", 0)
+        queued_task.state = "QUEUED"
+        queued_task.attempts += 1
+        queued_task.worker = None
+        queued_task.locked_until = None
+        queued_task.not_before = datetime.now(timezone.utc) + timedelta(seconds=countdown)
+        queued_task.save(commit=True)
+
+    def _renew_leases(self):
+        while not self._stopped.wait(self.poll_interval):
+            with self.app.app_context():
+                try:
+                    locked_until = datetime.now(timezone.utc) + self.lease
+                    QueuedTaskDataclass.renew_leases(self.worker_id, locked_until)
+                    DB.session.commit()
+                except Exception:
+                    current_app.logger.exception("Could not renew the leases of the running tasks.")
+
+    def _run_periodic_tasks(self):
+        """Execute the tasks of the celery beat schedule (the schedules are intervals in seconds)."""
+        intervals: Dict[str, float] = {
+            entry["task"]: float(entry["schedule"]) for entry in CELERY.conf.beat_schedule.values()
+        }
+        next_runs = {task_name: monotonic() + interval for task_name, interval in intervals.items()}
+        while next_runs and not self._stopped.wait(max(min(next_runs.values()) - monotonic(), 0)):
+            for task_name, next_run in next_runs.items():
+                if next_run > monotonic():
+                    continue
+                with self.app.app_context():
+                    try:
+                        task = _import_task(task_name)
+                        getattr(task, "run", task)()
+                    except Exception:
+                        DB.session.rollback()
+                        current_app.logger.exception(f"Periodic task {task_name} failed.")
+                next_runs[task_name] = monotonic() + intervals[task_name]
+
+
+def get_in_process_executor() -> Optional[InProcessExecutor]:
+    """Get the executor of this process (started on first use) or None if the backend is not in-process."""
+    global _EXECUTOR
+    if not has_app_context() or get_execution_backend() != ExecutionBackend.IN_PROCESS:
+        return None
+    config = current_app.config
+    workers = config.get("IN_PROCESS_WORKERS", DEFAULT_IN_PROCESS_WORKERS)
+    if workers <= 0:
+        return None  # this process only submits tasks
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = InProcessExecutor(
+                current_app._get_current_object(),
+                workers=workers,
+                poll_interval=config.get("IN_PROCESS_POLL_INTERVAL", DEFAULT_IN_PROCESS_POLL_INTERVAL),
+            )
+            _EXECUTOR.start()
+            atexit.register(_EXECUTOR.shutdown)
+        return _EXECUTOR
+
+
+def shutdown_in_process_executor():
+    """Stop the threads executing tasks in this process."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown()
+            _EXECUTOR = None
+
+
+def register_task_executor(app: Flask):
+    """Start the in-process executor in the (forked) processes serving the API.
+
+    Gunicorn workers start the executor once they loaded the app (see util.gunicorn_config.post_worker_init), other
+    servers (e.g. the flask development server) start it with their first request. It is not started at app creation,
+    as it is also created by the cli commands and, with ``--preload``, in the gunicorn master.
+    """
+    if get_execution_backend() != ExecutionBackend.IN_PROCESS:
+        return
+
+    @app.before_request
+    def start_in_process_executor():
+        get_in_process_executor()
+
+
+def submit_task(task: Callable, *args: Any, **kwargs: Any) -> str:
+    """Execute the (celery) task in the background, returns the id of the task.
+
+    Callers execute the task directly in synchronous mode.
+    """
+    if get_execution_backend() != ExecutionBackend.IN_PROCESS:
+        return task.delay(*args, **kwargs).id
+    queued_task = QueuedTaskDataclass(task=_get_task_name(task), arguments={"args": list(args), "kwargs": kwargs})
+    queued_task.save(commit=True)
+    executor = get_in_process_executor()
+    if executor is not None:
+        executor.notify()
+    return f"{IN_PROCESS_TASK_PREFIX}{queued_task.id}"
+
+
+def revoke_task(task_id: str) -> bool:
+    """Revoke a task that has not been started yet, returns False if the task is already running."""
+    if task_id.startswith(IN_PROCESS_TASK_PREFIX):
+        revoked = QueuedTaskDataclass.delete_queued(int(task_id[len(IN_PROCESS_TASK_PREFIX) :]))
+        DB.session.commit()
+        return revoked
+    result = CELERY.AsyncResult(task_id)
+    if result.status != PENDING:
+        return False
+    result.revoke()
+    return True
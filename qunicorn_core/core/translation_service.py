@@ -0,0 +1,285 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from os import getpid
+from socket import gethostname
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from flask.globals import current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from qunicorn_core.api.api_models.transpiler_dtos import TranspilerDto
+from qunicorn_core.celery import CELERY
+from qunicorn_core.core.pilotmanager.pilot_manager import get_pilots
+from qunicorn_core.core.task_executor import submit_task
+from qunicorn_core.core.transpiler import TranspilationError, transpile_circuit
+from qunicorn_core.core.transpiler.circuit_transpiler import (
+    CircuitTranspiler,
+    CostModel,
+    DurationStatistics,
+    get_transpiler_chain,
+)
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.deployment import DeploymentDataclass
+from qunicorn_core.db.models.quantum_program import QuantumProgramDataclass, TranslatedProgramDataclass
+from qunicorn_core.db.models.transpiler_statistics import TranspilerStatisticsDataclass
+from qunicorn_core.util.utils import is_running_asynchronously
+
+"""
+This module manages the stored translations of quantum programs.
+Translations are stored while jobs are transpiled and can optionally be created in the background when a program is
+deployed (``PRETRANSLATE_DEPLOYMENTS``). Jobs then only need a single transpilation step from a stored translation
+to the language of their pilot.
+"""
+
+# formats of circuit objects that cannot be stored directly and the format used to store them instead
+SERIALIZED_FORMATS = {"QISKIT": "QPY"}
+# default planning of transpiler chains, see transpile_circuit
+DEFAULT_TRANSPILER_COST_MODEL: CostModel = "depth"
+# the stored transpilation durations of processes that did not store their durations for this long are deleted
+TRANSPILER_STATISTICS_MAX_AGE = timedelta(days=30)
+
+_statistics_lock = Lock()
+# the process and the version of the durations that were last stored
+_stored_statistics: Optional[Tuple[str, int]] = None
+
+
+def is_pretranslation_enabled() -> bool:
+    return bool(current_app.config.get("PRETRANSLATE_DEPLOYMENTS", False))
+
+
+def get_transpiler_cost_model() -> CostModel:
+    return current_app.config.get("TRANSPILER_COST_MODEL", DEFAULT_TRANSPILER_COST_MODEL)
+
+
+def persist_translation(
+    assembler_language: str, quantum_circuit: Any, translation_distance: int, program: QuantumProgramDataclass
+):
+    if isinstance(quantum_circuit, (str, bytes)):
+        # circuit is in a format that can be safely stored in the database
+        if any(t.assembler_language == assembler_language for t in program.translations):
+            return  # already persisted
+        is_string = isinstance(quantum_circuit, str)
+        if is_string:
+            quantum_circuit = quantum_circuit.encode()
+        translated = TranslatedProgramDataclass(
+            quantum_circuit=quantum_circuit,
+            is_string=is_string,
+            assembler_language=assembler_language,
+            translation_distance=translation_distance,
+            program=program,
+        )
+        translated.save(commit=True)
+
+
+def persist_target_translation(
+    program: QuantumProgramDataclass, target: str, quantum_circuit: Any, translation_distance: int
+):
+    """Store the translation of the program into the target format, circuit objects are stored serialized."""
+    if translation_distance == 0:
+        return  # the circuit of the program itself
+    if target in SERIALIZED_FORMATS and not isinstance(quantum_circuit, (str, bytes)):
+        transpile_circuit(
+            SERIALIZED_FORMATS[target],
+            (target, quantum_circuit, translation_distance),
+            visitor=partial(persist_translation, program=program),
+        )
+    else:
+        persist_translation(target, quantum_circuit, translation_distance, program)
+
+
+def get_translation_sources(
+    program: QuantumProgramDataclass, circuit: Tuple[str, Any, int], target: str
+) -> List[Tuple[str, Any, int]]:
+    """Get the circuits that should be used to transpile the circuit of the program into the target format.
+
+    If a stored translation is at most one transpilation step away from the target format, only this translation is
+    returned. Otherwise, the circuit and all stored translations of the program are returned.
+    """
+    sources = [circuit]
+    translations = [(t.assembler_language, t.circuit, t.translation_distance) for t in program.translations]
+    if not translations or circuit[0] == target:
+        return sources
+
+    config = current_app.config
+    try:
+        # the translations are stored already, only the steps from a translation to the target are planned
+        transpiler_chain = get_transpiler_chain(
+            target,
+            *[(t[0], t[1], 0) for t in translations],
+            exclude=config.get("EXCLUDE_TRANSPILERS", None),
+            exclude_formats=config.get("EXCLUDE_FORMATS", None),
+            exclude_unsafe=config.get("EXCLUDE_UNSAFE_TRANSPILERS", True),
+            cost_model=get_transpiler_cost_model(),
+        )
+    except (KeyError, ValueError):
+        return sources + translations
+
+    start_format = transpiler_chain[0].source if transpiler_chain else target
+    if len(transpiler_chain) <= 1:
+        return [next(t for t in translations if t[0] == start_format)]
+    return sources + translations
+
+
+def sync_transpiler_statistics():
+    """Store the transpilation durations measured by this process and load the durations measured by other processes.
+
+    Every process stores its durations separately, the durations of the other processes are merged and used for the
+    transpilers this process did not measure yet. Failures are only logged, as the durations are only used for
+    planning transpiler chains.
+    """
+    global _stored_statistics
+    with _statistics_lock:
+        process = f"{gethostname()}:{getpid()}"
+        version, measured = CircuitTranspiler.get_measured_durations()
+        try:
+            TranspilerStatisticsDataclass.delete_stale(datetime.now(timezone.utc) - TRANSPILER_STATISTICS_MAX_AGE)
+            stored = TranspilerStatisticsDataclass.get_all()
+            shared = _merge_transpiler_statistics([s for s in stored if s.process != process])
+            own = [s for s in stored if s.process == process]
+            if _stored_statistics != (process, version) or len(own) != len(measured):
+                _store_transpiler_statistics(process, measured, own)
+            DB.session.commit()
+        except SQLAlchemyError as err:
+            DB.session.rollback()
+            current_app.logger.warning(f"Could not store the transpilation durations: {err}")
+            return
+        _stored_statistics = (process, version)
+        CircuitTranspiler.set_shared_statistics({name: merged for name, (merged, _) in shared.items()})
+
+
+def _store_transpiler_statistics(
+    process: str, measured: Dict[str, DurationStatistics], stored: Sequence[TranspilerStatisticsDataclass]
+):
+    stored_by_name = {s.transpiler: s for s in stored}
+    now = datetime.now(timezone.utc)
+    for name, data in CircuitTranspiler.get_statistics().items():
+        statistics = stored_by_name.get(name)
+        if statistics is None:
+            statistics = TranspilerStatisticsDataclass(
+                process=process,
+                transpiler=name,
+                source=data["source"],
+                target=data["target"],
+                cost=data["cost"],
+                unsafe=data["unsafe"],
+                statistics={},
+            )
+        statistics.statistics = measured[name].to_dict()
+        statistics.updated_at = now
+        statistics.save()
+
+
+def _merge_transpiler_statistics(
+    statistics: Sequence[TranspilerStatisticsDataclass],
+) -> Dict[str, Tuple[DurationStatistics, TranspilerStatisticsDataclass]]:
+    """Merge the durations of all processes by transpiler, together with the most recently stored statistics."""
+    grouped: Dict[str, List[TranspilerStatisticsDataclass]] = {}
+    for s in statistics:
+        grouped.setdefault(s.transpiler, []).append(s)
+    return {
+        name: (
+            DurationStatistics.merge([DurationStatistics.from_dict(s.statistics) for s in group]),
+            max(group, key=lambda s: s.updated_at),
+        )
+        for name, group in grouped.items()
+    }
+
+
+def get_transpilers() -> List[TranspilerDto]:
+    """Get the transpilers with the transpilation durations measured by all processes.
+
+    The transpilers are read from the statistics stored by the processes that transpile circuits (see
+    sync_transpiler_statistics), the transpilers (and the quantum SDKs they need) are not loaded by this function.
+    """
+    merged = _merge_transpiler_statistics(TranspilerStatisticsDataclass.get_all())
+    return [
+        TranspilerDto(
+            name=name,
+            source=latest.source,
+            target=latest.target,
+            cost=latest.cost,
+            unsafe=latest.unsafe,
+            **statistics.summary(),
+        )
+        for name, (statistics, latest) in sorted(merged.items())
+    ]
+
+
+def schedule_pretranslation(deployment_id: int):
+    """Translate the programs of the deployment in the background if pre-translation is enabled."""
+    if not is_pretranslation_enabled():
+        return
+    if is_running_asynchronously():
+        submit_task(pretranslate_deployment, deployment_id)
+    else:
+        pretranslate_deployment(deployment_id)
+        # the programs were translated with another session, reload them from the database on the next access
+        DB.session.expire_all()
+
+
+@CELERY.task()
+def pretranslate_deployment(deployment_id: int):
+    """Translate all programs of the deployment into the languages supported by the pilots and store the results"""
+    deployment: Optional[DeploymentDataclass] = DeploymentDataclass.get_by_id(deployment_id)
+    if deployment is None:
+        return  # deployment was deleted in the meantime
+
+    targets = list(dict.fromkeys(language for pilot in get_pilots() for language in pilot.supported_languages))
+    for program in deployment.programs:
+        if program.quantum_circuit and program.assembler_language:
+            pretranslate_program(program, targets)
+    DB.session.commit()
+    sync_transpiler_statistics()
+
+
+def pretranslate_program(program: QuantumProgramDataclass, targets: Sequence[str]):
+    """Translate the program into all target formats and store all translations that can be stored.
+
+    Targets that are not reachable from the format of the program are skipped. Failing translations are stored in
+    the ``translation_errors`` of the program (returned by the deployment api), as jobs for these targets would fail
+    as well.
+    """
+    config = current_app.config
+    distances = {}
+    errors = {}
+
+    def visitor(assembler_language: str, quantum_circuit: Any, translation_distance: int):
+        distances[assembler_language] = translation_distance
+        persist_translation(assembler_language, quantum_circuit, translation_distance, program)
+
+    for target in targets:
+        try:
+            translated = transpile_circuit(
+                target,
+                (program.assembler_language, program.quantum_circuit, 0),
+                *[(t.assembler_language, t.circuit, t.translation_distance) for t in program.translations],
+                exclude=config.get("EXCLUDE_TRANSPILERS", None),
+                exclude_formats=config.get("EXCLUDE_FORMATS", None),
+                exclude_unsafe=config.get("EXCLUDE_UNSAFE_TRANSPILERS", True),
+                visitor=visitor,
+                cost_model=get_transpiler_cost_model(),
+            )
+            persist_target_translation(program, target, translated, distances.get(target, 0))
+        except (KeyError, ValueError):
+            pass  # no transpiler chain to this target
+        except TranspilationError as err:
+            cause = err.__cause__ if err.__cause__ else err
+            errors[target] = f"{type(cause).__name__}: {cause}"
+            current_app.logger.warning(
+                f"Program with id {program.id} could not be translated to {target}: {errors[target]}"
+            )
+    program.translation_errors = errors
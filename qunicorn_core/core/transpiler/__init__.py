@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .circuit_transpiler import transpile_circuit, TranspilationError  # noqa
+from .circuit_transpiler import transpile_circuit, load_transpiler_plugins, TranspilationError  # noqa
 
-# load transpile plugins
-from . import qiskit_transpiler, braket_transpiler, qrisp_transpiler, unsafe_transpilers  # noqa
+# the transpile plugins (circuit_transpiler.TRANSPILER_PLUGINS) are loaded on first use
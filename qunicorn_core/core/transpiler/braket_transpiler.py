@@ -22,6 +22,28 @@ from braket.ir.openqasm.program_v1 import Program as Qasm3Program
 from .circuit_transpiler import CircuitTranspiler
 
 
+# operand of a gate, i.e. a qubit or a qubit register with an optional index
+_OPERAND = r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?"
+
+# gates with different names in OpenQASM 3 and in the Braket IR, together with their number of qubits
+# TODO remove workaround once no longer required!
+_QASM3_TO_BRAKET_GATES = {"cx": ("cnot", 2), "ccx": ("ccnot", 3)}
+_BRAKET_TO_QASM3_GATES = {braket: (qasm3, n) for qasm3, (braket, n) in _QASM3_TO_BRAKET_GATES.items()}
+
+
+def _compile_gate_pattern(gates: dict[str, tuple[str, int]]) -> re.Pattern:
+    """Compile a single pattern matching the names of all given gates in gate calls with the right number of qubits."""
+    alternatives = []
+    for name, (_, num_qubits) in gates.items():
+        operands = r"\s*,\s*".join([_OPERAND] * num_qubits)
+        alternatives.append(rf"{name}(?=\s+{operands}\s*;)")
+    return re.compile(rf"^[ \t]*(?:{'|'.join(alternatives)})", flags=re.MULTILINE)
+
+
+_QASM3_TO_BRAKET_PATTERN = _compile_gate_pattern(_QASM3_TO_BRAKET_GATES)
+_BRAKET_TO_QASM3_PATTERN = _compile_gate_pattern(_BRAKET_TO_QASM3_GATES)
+
+
 class Qasm3ToBraket(CircuitTranspiler, source="QASM3", target="BRAKET", cost=2):
 
     def transpile_circuit(self, circuit: Any) -> Circuit:
@@ -32,29 +54,8 @@ class Qasm3ToBraket(CircuitTranspiler, source="QASM3", target="BRAKET", cost=2):
         # remove stdgates.inc import to avoid FileNotFoundError
         circuit = circuit.replace('include "stdgates.inc";', "")
 
-        # replace cx with cnot gates and ccx with ccnot gates
-        # TODO remove workaround once no longer required!
-        circuit = re.sub(
-            (
-                r"^\s*cx(\s+"  # cx
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?\s*,\s+"  # control qubit
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?;)"  # target qubit
-            ),
-            r"cnot\1",
-            circuit,
-            flags=re.MULTILINE,
-        )
-        circuit = re.sub(
-            (
-                r"^\s*ccx(\s+"  # ccx
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?\s*,\s+"  # first control qubit
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?\s*,\s+"  # second control qubit
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?;)"  # target qubit
-            ),
-            r"ccnot\1",
-            circuit,
-            flags=re.MULTILINE,
-        )
+        # replace cx with cnot gates and ccx with ccnot gates in a single pass
+        circuit = _QASM3_TO_BRAKET_PATTERN.sub(lambda m: _QASM3_TO_BRAKET_GATES[m.group().strip()][0], circuit)
 
         return Circuit.from_ir(circuit)
 
@@ -72,28 +73,7 @@ class BraketToQasm3(CircuitTranspiler, source="BRAKET", target="QASM3", cost=2):
 
         qasm_str = qasm_str.replace("OPENQASM 3.0;", 'OPENQASM 3.0;\ninclude "stdgates.inc";', 1)
 
-        # replace cnot with cx gates and ccnot with ccx gates
-        # TODO remove workaround once no longer required!
-        qasm_str = re.sub(
-            (
-                r"^\s*cnot(\s+"  # cnot
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?\s*,\s+"  # control qubit
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?;)"  # target qubit
-            ),
-            r"cx\1",
-            qasm_str,
-            flags=re.MULTILINE,
-        )
-        qasm_str = re.sub(
-            (
-                r"^\s*ccnot(\s+"  # ccnot
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?\s*,\s+"  # first control qubit
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?\s*,\s+"  # second control qubit
-                r"[a-zA-Z0-9_]+(?:\[[0-9]+\])?;)"  # target qubit
-            ),
-            r"ccx\1",
-            qasm_str,
-            flags=re.MULTILINE,
-        )
+        # replace cnot with cx gates and ccnot with ccx gates in a single pass
+        qasm_str = _BRAKET_TO_QASM3_PATTERN.sub(lambda m: _BRAKET_TO_QASM3_GATES[m.group().strip()][0], qasm_str)
 
         return qasm_str
@@ -12,8 +12,44 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import deepcopy
+from dataclasses import dataclass, field
 from heapq import heappush, heappop
-from typing import ClassVar, Any, Sequence, Callable, Union, Optional, Type, cast
+from importlib import import_module
+from threading import Lock, RLock
+from time import perf_counter
+from typing import ClassVar, Any, Sequence, Callable, Union, Optional, Type, cast, Literal
+
+CostModel = Literal["depth", "static", "measured"]
+
+# weight of the newest measurement in the exponentially weighted moving average of transpilation durations
+EWMA_ALPHA: float = 0.2
+# assumed duration in seconds for each unit of static cost of transpilers that were not measured yet
+DEFAULT_COST_UNIT_DURATION: float = 0.01
+# modules registering transpilers, they (and the quantum SDKs they need) are imported when transpilers are first used
+TRANSPILER_PLUGINS: list[str] = [
+    "qunicorn_core.core.transpiler.qiskit_transpiler",
+    "qunicorn_core.core.transpiler.qasm_transpiler",
+    "qunicorn_core.core.transpiler.braket_transpiler",
+    "qunicorn_core.core.transpiler.qrisp_transpiler",
+    "qunicorn_core.core.transpiler.unsafe_transpilers",
+]
+
+_plugins_loaded = False
+_plugins_lock = RLock()
+
+
+def load_transpiler_plugins():
+    """Import all modules in TRANSPILER_PLUGINS (only once) to register their transpilers."""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    with _plugins_lock:
+        if _plugins_loaded:
+            return
+        for module_name in TRANSPILER_PLUGINS:
+            import_module(module_name)
+        _plugins_loaded = True
 
 
 class TranspilationError(Exception):
@@ -25,6 +61,79 @@ class TranspilationError(Exception):
         self.circuit = circuit
 
 
+def get_circuit_size(circuit: Any) -> int:
+    """Get the size of a circuit, i.e. the length of serialized circuits or the number of instructions."""
+    if isinstance(circuit, (str, bytes)):
+        return len(circuit)
+    size = getattr(circuit, "size", None)
+    if callable(size):
+        size = size()
+    if isinstance(size, int):
+        return size
+    try:
+        return len(circuit)
+    except TypeError:
+        return 1
+
+
+@dataclass
+class DurationStatistics:
+    """Exponentially weighted moving average of the transpilation durations (in seconds) of a transpiler."""
+
+    duration: float = 0
+    samples: int = 0
+    by_size: dict[int, "DurationStatistics"] = field(default_factory=dict)  # keyed by the bit length of the size
+
+    def record(self, duration: float):
+        self.duration = duration if self.samples == 0 else (1 - EWMA_ALPHA) * self.duration + EWMA_ALPHA * duration
+        self.samples += 1
+
+    @staticmethod
+    def merge(statistics: Sequence["DurationStatistics"]) -> "DurationStatistics":
+        """Merge the statistics measured by different processes, the averages are weighted by their samples."""
+        merged = DurationStatistics()
+        measured = [s for s in statistics if s.samples]
+        merged.samples = sum(s.samples for s in measured)
+        if merged.samples:
+            merged.duration = sum(s.duration * s.samples for s in measured) / merged.samples
+        for size_class in sorted({c for s in measured for c in s.by_size}):
+            merged.by_size[size_class] = DurationStatistics.merge(
+                [s.by_size[size_class] for s in measured if size_class in s.by_size]
+            )
+        return merged
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duration": self.duration,
+            "samples": self.samples,
+            "by_size": {str(size_class): s.to_dict() for size_class, s in self.by_size.items()},
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "DurationStatistics":
+        return DurationStatistics(
+            duration=data["duration"],
+            samples=data["samples"],
+            by_size={int(size_class): DurationStatistics.from_dict(s) for size_class, s in data["by_size"].items()},
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize the statistics, the durations by size are keyed by the maximum size of their size class."""
+        return {
+            "samples": self.samples,
+            "duration": self.duration if self.samples else None,
+            "duration_by_size": {2**size_class - 1: s.duration for size_class, s in sorted(self.by_size.items())},
+        }
+
+    def estimate(self, size: Optional[int]) -> float:
+        """Estimate the duration for a circuit of the given size, assuming the duration grows linearly with size."""
+        if size is None or not self.by_size:
+            return self.duration
+        size_class = size.bit_length()
+        closest = min(self.by_size, key=lambda s: abs(s - size_class))
+        return self.by_size[closest].duration * 2.0 ** (size_class - closest)
+
+
 class CircuitTranspiler:
     """Base class for all circuit transpilers.
 
@@ -44,6 +153,11 @@ class CircuitTranspiler:
 
     __known_formats: set[str] = set()
     __transpilers: dict[str, list["CircuitTranspiler"]] = {}
+    __statistics: dict[str, DurationStatistics] = {}
+    __statistics_version: int = 0
+    # statistics measured by other processes, used for transpilers that were not measured in this process yet
+    __shared_statistics: dict[str, DurationStatistics] = {}
+    __statistics_lock = Lock()
 
     source: ClassVar[str] = ""
     target: ClassVar[str] = ""
@@ -75,9 +189,76 @@ class CircuitTranspiler:
         """Transpile the given circuit to the target format."""
         raise NotImplementedError()
 
+    def record_duration(self, circuit_size: int, duration: float):
+        """Record how long this transpiler took for a circuit of the given size."""
+        with CircuitTranspiler.__statistics_lock:
+            statistics = CircuitTranspiler.__statistics.setdefault(type(self).__name__, DurationStatistics())
+            statistics.record(duration)
+            statistics.by_size.setdefault(circuit_size.bit_length(), DurationStatistics()).record(duration)
+            CircuitTranspiler.__statistics_version += 1
+
+    def estimate_duration(self, circuit_size: Optional[int] = None) -> float:
+        """Estimate the duration of this transpiler from the recorded durations (or its static cost).
+
+        Durations measured by other processes are used until this process measured the transpiler itself.
+        """
+        statistics = CircuitTranspiler.__statistics.get(type(self).__name__)
+        if statistics is None or statistics.samples == 0:
+            statistics = CircuitTranspiler.__shared_statistics.get(type(self).__name__)
+        if statistics is None or statistics.samples == 0:
+            return self.cost * DEFAULT_COST_UNIT_DURATION
+        return statistics.estimate(circuit_size)
+
+    @staticmethod
+    def get_measured_durations() -> tuple[int, dict[str, DurationStatistics]]:
+        """Get a copy of the durations measured in this process together with a version that changes on every record.
+
+        All registered transpilers are included, transpilers that were not measured yet have no samples.
+        """
+        load_transpiler_plugins()
+        with CircuitTranspiler.__statistics_lock:
+            return CircuitTranspiler.__statistics_version, {
+                type(transpiler).__name__: deepcopy(
+                    CircuitTranspiler.__statistics.get(type(transpiler).__name__, DurationStatistics())
+                )
+                for transpilers in CircuitTranspiler.__transpilers.values()
+                for transpiler in transpilers
+            }
+
+    @staticmethod
+    def set_shared_statistics(statistics: dict[str, DurationStatistics]):
+        """Set the durations measured by other processes, see estimate_duration."""
+        with CircuitTranspiler.__statistics_lock:
+            CircuitTranspiler.__shared_statistics = statistics
+
+    @staticmethod
+    def get_statistics() -> dict[str, dict[str, Any]]:
+        """Get the registered transpilers with their static cost and their measured durations in this process."""
+        _, measured = CircuitTranspiler.get_measured_durations()
+        return {
+            type(transpiler).__name__: {
+                "source": transpiler.source,
+                "target": transpiler.target,
+                "cost": transpiler.cost,
+                "unsafe": transpiler.unsafe,
+                **measured[type(transpiler).__name__].summary(),
+            }
+            for transpilers in CircuitTranspiler.__transpilers.values()
+            for transpiler in transpilers
+        }
+
+    @staticmethod
+    def reset_statistics():
+        """Forget all recorded transpilation durations (including the durations measured by other processes)."""
+        with CircuitTranspiler.__statistics_lock:
+            CircuitTranspiler.__statistics.clear()
+            CircuitTranspiler.__shared_statistics = {}
+            CircuitTranspiler.__statistics_version += 1
+
     @staticmethod
     def get_known_formats() -> set[str]:
         """Get all known formats (i.e., set(target_formats) + set(source_formats))."""
+        load_transpiler_plugins()
         return CircuitTranspiler.__known_formats.copy()
 
     @staticmethod
@@ -90,6 +271,7 @@ class CircuitTranspiler:
         Returns:
             Sequence[CircuitTranspiler]: all circuit transpilers registered for this source format (may be empty)
         """
+        load_transpiler_plugins()
         try:
             return tuple(CircuitTranspiler.__transpilers[source])
         except KeyError:
@@ -108,6 +290,7 @@ class CircuitTranspiler:
         exclude_unsafe: bool = False,
     ) -> Sequence["CircuitTranspiler"]:
         """Get a list of transpilers from source to target minimizing overall transpilation cost."""
+        load_transpiler_plugins()
         if exclude_formats and target in exclude_formats:
             raise ValueError("Cannot transpile to an excluded target format!")
         frontier: list[tuple[float, str, tuple[CircuitTranspiler, ...]]] = []
@@ -181,7 +364,7 @@ class CircuitTranspiler:
 
     @staticmethod
     def get_transpilers_limit_cost(
-        source: Union[str, Sequence[str]],
+        source: Union[str, Sequence[Union[str, tuple[str, int]]]],
         target: str,
         *,
         exclude: Optional[set[Union[str, Type["CircuitTranspiler"]]]] = None,
@@ -198,14 +381,86 @@ class CircuitTranspiler:
             exclude_unsafe=exclude_unsafe,
         )
 
+    @staticmethod
+    def get_transpilers_limit_duration(
+        source: Union[str, Sequence[Union[str, tuple[str, int]]]],
+        target: str,
+        *,
+        circuit_sizes: Optional[dict[str, int]] = None,
+        exclude: Optional[set[Union[str, Type["CircuitTranspiler"]]]] = None,
+        exclude_formats: Optional[set[str]] = None,
+        exclude_unsafe: bool = False,
+    ) -> Sequence["CircuitTranspiler"]:
+        """Get a list of transpilers from source to target format using the measured transpilation durations.
+
+        The sizes of the source circuits are used to estimate the duration of the first transpilation step, later
+        steps are estimated with the average duration of the transpiler.
+        """
+        sizes = circuit_sizes if circuit_sizes else {}
+        return CircuitTranspiler._get_transpiler_chain(
+            source,
+            target,
+            cost=lambda x: x.estimate_duration(sizes.get(x.source)),
+            exclude=exclude,
+            exclude_formats=exclude_formats,
+            exclude_unsafe=exclude_unsafe,
+        )
+
 
-def transpile_circuit(
+def get_transpiler_chain(
+    target: str,
+    *circuit: tuple[str, Any, int],
+    exclude: Optional[set[Union[str, Type[CircuitTranspiler]]]] = None,
+    exclude_formats: Optional[set[str]] = None,
+    exclude_unsafe: bool = False,
+    cost_model: CostModel = "depth",
+) -> Sequence[CircuitTranspiler]:
+    """Get the transpiler chain planned by the cost model to transpile one of the circuits to the target format.
+
+    See transpile_circuit for the arguments and the raised errors.
+    """
+    if len(circuit) == 0:
+        raise ValueError("Must provide a circuit to compile!")
+    elif len(circuit) == 1:
+        source_format = circuit[0][0]
+    else:
+        source_format = [(c[0], c[2]) for c in circuit]
+
+    if cost_model == "measured":
+        # all given circuits are available without transpiling them again
+        return CircuitTranspiler.get_transpilers_limit_duration(
+            source=[c[0] for c in circuit],
+            target=target,
+            circuit_sizes={c[0]: get_circuit_size(c[1]) for c in circuit},
+            exclude=exclude,
+            exclude_formats=exclude_formats,
+            exclude_unsafe=exclude_unsafe,
+        )
+    elif cost_model == "static":
+        return CircuitTranspiler.get_transpilers_limit_cost(
+            source=source_format,
+            target=target,
+            exclude=exclude,
+            exclude_formats=exclude_formats,
+            exclude_unsafe=exclude_unsafe,
+        )
+    return CircuitTranspiler.get_transpilers_limit_depth(
+        source=source_format,
+        target=target,
+        exclude=exclude,
+        exclude_formats=exclude_formats,
+        exclude_unsafe=exclude_unsafe,
+    )
+
+
+def transpile_circuit(  # noqa: C901
     target: str,
     *circuit: tuple[str, Any, int],
     exclude: Optional[set[Union[str, Type[CircuitTranspiler]]]] = None,
     exclude_formats: Optional[set[str]] = None,
     exclude_unsafe: bool = False,
     visitor: Optional[Callable[[str, Any, int], None]] = None,
+    cost_model: CostModel = "depth",
 ) -> Any:
     """Transpile a circuit available in one or more source formats to a specific target format.
 
@@ -218,6 +473,9 @@ def transpile_circuit(
         exclude_unsafe (bool, optional): exclude unsafe transpilers from transpilation.
         Defaults to False.
         visitor (Callable[[str, Any, int], None]], optional): gets called for every translated circuit.
+        cost_model (str, optional): how transpiler chains are planned, "depth" uses the chain with the fewest steps,
+        "static" uses the static transpiler cost and "measured" uses the measured transpilation durations.
+        Defaults to "depth".
 
     Raises:
         ValueError: If no circuit is provided or either the target format or all
@@ -230,22 +488,19 @@ def transpile_circuit(
     """
     if len(circuit) == 0:
         raise ValueError("Must provide a circuit to compile!")
-    elif len(circuit) == 1:
-        source_format = circuit[0][0]
-    else:
-        source_format = [(c[0], c[2]) for c in circuit]
 
     for source, c, _ in circuit:
         if source == target:
             # return fast if target format is already available
             return c
 
-    transpiler_chain = CircuitTranspiler.get_transpilers_limit_depth(
-        source=source_format,
-        target=target,
+    transpiler_chain = get_transpiler_chain(
+        target,
+        *circuit,
         exclude=exclude,
         exclude_formats=exclude_formats,
         exclude_unsafe=exclude_unsafe,
+        cost_model=cost_model,
     )
 
     assert len(transpiler_chain) > 0, "There should always be at least one transpiler present."
@@ -257,7 +512,10 @@ def transpile_circuit(
 
     for transpiler in transpiler_chain:
         try:
+            circuit_size = get_circuit_size(current_circuit)
+            start = perf_counter()
             current_circuit = transpiler.transpile_circuit(current_circuit)
+            transpiler.record_duration(circuit_size, perf_counter() - start)
             current_cost += transpiler.cost
         except Exception as err:
             raise TranspilationError(transpiler, current_circuit) from err
@@ -0,0 +1,435 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+from .circuit_transpiler import CircuitTranspiler
+from .qiskit_transpiler import Qasm2ToQiskit, Qasm3ToQiskit, QiskitToQasm2, QiskitToQasm3
+
+"""
+Text-level translators between OpenQASM 2 and OpenQASM 3.
+Programs are split into statements with a single compiled pattern and every statement is rewritten on its own, so no
+circuit objects are constructed. Programs using constructs without a direct equivalent in the other language (e.g.,
+classical types and loops in OpenQASM 3 or opaque gates in OpenQASM 2) are translated via a Qiskit circuit instead.
+"""
+
+_STATEMENT = re.compile(
+    r"""\s*(?:
+        (?P<comment>//[^\n]*|/\*.*?\*/)
+        |(?P<block>(?:[^;{}/]|/(?![/*]))*\{(?:[^{}/]|/(?![/*])|//[^\n]*|/\*.*?\*/)*\})
+        |(?P<statement>(?:[^;{}/]|/(?![/*]))*;)
+    )""",
+    re.VERBOSE | re.DOTALL,
+)
+_KEYWORD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_VERSION = re.compile(r"OPENQASM\s+(?P<version>[0-9.]+)")
+_INCLUDE = re.compile(r'include\s+"(?P<file>[^"]*)"')
+_QASM2_REGISTER = re.compile(r"(?P<type>qreg|creg)\s+(?P<name>[a-z][A-Za-z0-9_]*)\s*\[\s*(?P<size>[0-9]+)\s*\]")
+_QASM3_REGISTER = re.compile(
+    r"(?P<type>qubit|bit)\s*(?:\[\s*(?P<size>[0-9]+)\s*\])?\s+(?P<name>[a-z][A-Za-z0-9_]*)"
+    r"(?:\s*=\s*measure\s+(?P<measured>.*))?",
+    re.DOTALL,
+)
+_MEASURE_ARROW = re.compile(r"measure\s+(?P<qubits>[^-]*?)\s*->\s*(?P<clbits>.*)", re.DOTALL)
+_MEASURE_ASSIGN = re.compile(r"(?P<clbits>[a-z][A-Za-z0-9_]*(?:\s*\[\s*[0-9]+\s*\])?)\s*=\s*measure\s+(?P<qubits>.*)")
+_CONDITION = re.compile(r"if\s*\(\s*(?P<register>[a-z][A-Za-z0-9_]*)\s*==\s*(?P<value>[0-9]+)\s*\)\s*(?P<body>.*)")
+_GATE_CALL = re.compile(
+    r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*(?:\((?P<params>.*)\))?\s*(?P<args>[^()]*)",
+    re.DOTALL,
+)
+_GATE_DEFINITION = re.compile(
+    r"gate\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*(?:\((?P<params>[^)]*)\))?\s*(?P<args>[^{]*)\{(?P<body>.*)\}",
+    re.DOTALL,
+)
+_ARGUMENT = re.compile(r"[a-z][A-Za-z0-9_]*(?:\s*\[\s*[0-9]+\s*\])?")
+_IDENTIFIER = re.compile(r"[a-z][A-Za-z0-9_]*")
+_EXPRESSION = re.compile(r"[A-Za-z0-9_.+\-*/^()\s,]*")
+_EXPRESSION_IDENTIFIER = re.compile(r"(?<![0-9.])[A-Za-z_][A-Za-z0-9_]*")
+
+# functions and constants available in the parameter expressions of both languages
+_EXPRESSION_NAMES: Mapping[str, str] = {name: name for name in ("pi", "sin", "cos", "tan", "exp", "ln", "sqrt")}
+
+# gates of stdgates.inc (OpenQASM 3)
+_STDGATES = frozenset(
+    {
+        "p", "x", "y", "z", "h", "s", "sdg", "t", "tdg", "sx", "rx", "ry", "rz", "cx", "cy", "cz", "cp", "crx", "cry",
+        "crz", "ch", "swap", "ccx", "cswap", "cu", "CX", "phase", "cphase", "id", "u1", "u2", "u3",
+    }
+)  # fmt: skip
+
+# gates of qelib1.inc (OpenQASM 2) that are not part of stdgates.inc, in the order they have to be defined
+_QELIB1_DEFINITIONS = {
+    "u0": "gate u0(_p0) q { U(0, 0, 0) q; }",
+    "u": "gate u(_p0, _p1, _p2) q { U(_p0, _p1, _p2) q; }",
+    "sxdg": "gate sxdg a { s a; h a; s a; }",
+    "cu1": "gate cu1(_p0) a, b { u1(_p0/2) a; cx a, b; u1(-_p0/2) b; cx a, b; u1(_p0/2) b; }",
+    "cu3": (
+        "gate cu3(_p0, _p1, _p2) c, t { u1((_p2+_p1)/2) c; u1((_p2-_p1)/2) t; cx c, t; "
+        "u3(-_p0/2, 0, -(_p1+_p2)/2) t; cx c, t; u3(_p0/2, _p1, 0) t; }"
+    ),
+    "csx": "gate csx a, b { h b; cu1(pi/2) a, b; h b; }",
+    "rxx": ("gate rxx(_p0) a, b { u3(pi/2, _p0, 0) a; h b; cx a, b; u1(-_p0) b; cx a, b; h b; " "u2(-pi, pi-_p0) a; }"),
+    "rzz": "gate rzz(_p0) a, b { cx a, b; u1(_p0) b; cx a, b; }",
+    "rccx": (
+        "gate rccx a, b, c { u2(0, pi) c; u1(pi/4) c; cx b, c; u1(-pi/4) c; cx a, c; u1(pi/4) c; cx b, c; "
+        "u1(-pi/4) c; u2(0, pi) c; }"
+    ),
+    "rc3x": (
+        "gate rc3x a, b, c, d { u2(0, pi) d; u1(pi/4) d; cx c, d; u1(-pi/4) d; u2(0, pi) d; cx a, d; u1(pi/4) d; "
+        "cx b, d; u1(-pi/4) d; cx a, d; u1(pi/4) d; cx b, d; u1(-pi/4) d; u2(0, pi) d; u1(pi/4) d; cx c, d; "
+        "u1(-pi/4) d; u2(0, pi) d; }"
+    ),
+    "c3x": (
+        "gate c3x a, b, c, d { h d; p(pi/8) a; p(pi/8) b; p(pi/8) c; p(pi/8) d; cx a, b; p(-pi/8) b; cx a, b; "
+        "cx b, c; p(-pi/8) c; cx a, c; p(pi/8) c; cx b, c; p(-pi/8) c; cx a, c; cx c, d; p(-pi/8) d; cx b, d; "
+        "p(pi/8) d; cx c, d; p(-pi/8) d; cx a, d; p(pi/8) d; cx c, d; p(-pi/8) d; cx b, d; p(pi/8) d; cx c, d; "
+        "p(-pi/8) d; cx a, d; h d; }"
+    ),
+    "c3sqrtx": (
+        "gate c3sqrtx a, b, c, d { h d; cu1(pi/8) a, d; h d; cx a, b; h d; cu1(-pi/8) b, d; h d; cx a, b; h d; "
+        "cu1(pi/8) b, d; h d; cx b, c; h d; cu1(-pi/8) c, d; h d; cx a, c; h d; cu1(pi/8) c, d; h d; cx b, c; "
+        "h d; cu1(-pi/8) c, d; h d; cx a, c; h d; cu1(pi/8) c, d; h d; }"
+    ),
+    "c4x": (
+        "gate c4x a, b, c, d, e { h e; cu1(pi/2) d, e; h e; c3x a, b, c, d; h e; cu1(-pi/2) d, e; h e; "
+        "c3x a, b, c, d; c3sqrtx a, b, c, e; }"
+    ),
+}
+_QELIB1_DEFINITION_TEXTS = frozenset(_QELIB1_DEFINITIONS.values())
+_QELIB1_DEPENDENCIES = {"csx": ("cu1",), "c3sqrtx": ("cu1",), "c4x": ("cu1", "c3x", "c3sqrtx")}
+
+# gates that are named differently in qelib1.inc
+_QASM3_TO_QASM2_GATES = {"phase": "p", "cphase": "cp"}
+
+# identifiers that cannot be used as names in OpenQASM 3 programs
+_QASM3_KEYWORDS = frozenset(
+    {
+        "OPENQASM", "include", "defcalgrammar", "def", "cal", "defcal", "gate", "extern", "box", "let", "break",
+        "continue", "if", "else", "end", "return", "for", "while", "in", "switch", "case", "default", "input",
+        "output", "const", "readonly", "mutable", "qreg", "qubit", "creg", "bool", "bit", "int", "uint", "float",
+        "angle", "complex", "array", "void", "duration", "stretch", "gphase", "inv", "pow", "ctrl", "negctrl", "dim",
+        "durationof", "delay", "reset", "measure", "barrier", "true", "false", "pi", "tau", "euler", "sizeof", "im",
+    }
+)  # fmt: skip
+
+
+class _UnsupportedStatement(Exception):
+    """Raised for statements that cannot be translated without constructing a circuit."""
+
+
+def _split_statements(source: str) -> Iterator[tuple[str, str]]:
+    """Split a program into (kind, text) tuples, kind is either "comment", "block" or "statement"."""
+    position, length = 0, len(source)
+    while position < length:
+        match = _STATEMENT.match(source, position)
+        if match is None or match.end() == position:
+            if source[position:].strip():
+                raise _UnsupportedStatement(source[position : position + 40])
+            return
+        position = match.end()
+        kind = match.lastgroup
+        assert kind is not None
+        yield kind, match.group(kind)
+
+
+def _translate_arguments(args: str) -> str:
+    arguments = [a.strip() for a in args.split(",")]
+    for argument in arguments:
+        if not _ARGUMENT.fullmatch(argument):
+            raise _UnsupportedStatement(args)
+    return ", ".join(arguments)
+
+
+def _translate_expression(params: str, names: Mapping[str, str], power_operator: str) -> str:
+    # "^" is the power in OpenQASM 2 but xor in OpenQASM 3, and "**" is not supported by all OpenQASM 3 importers
+    if not _EXPRESSION.fullmatch(params) or "^" in params:
+        raise _UnsupportedStatement(params)
+    identifiers = _EXPRESSION_IDENTIFIER.findall(params)
+    if any(identifier not in names for identifier in identifiers):
+        raise _UnsupportedStatement(params)
+    if any(names[identifier] != identifier for identifier in identifiers):
+        params = _EXPRESSION_IDENTIFIER.sub(lambda m: names[m.group()], params)
+    if power_operator == "^":
+        params = params.replace("**", "^")
+    elif "**" in params:
+        raise _UnsupportedStatement(params)
+    return ", ".join(p.strip() for p in params.split(","))
+
+
+def _translate_gate_call(
+    text: str, names: Mapping[str, str], power_operator: str, rename: Optional[dict[str, str]]
+) -> str:
+    match = _GATE_CALL.fullmatch(text)
+    if match is None or "@" in text:
+        raise _UnsupportedStatement(text)
+    name = match.group("name")
+    if name in _QASM3_KEYWORDS:
+        raise _UnsupportedStatement(text)
+    if rename:
+        name = rename.get(name, name)
+    args = _translate_arguments(match.group("args"))
+    params = match.group("params")
+    if params is None:
+        return f"{name} {args};"
+    return f"{name}({_translate_expression(params, names, power_operator)}) {args};"
+
+
+def _translate_gate_definition(
+    text: str, translate_body: Callable[[str, Mapping[str, str]], str], param_prefix: str
+) -> tuple[str, str]:
+    """Translate a gate definition and return the name of the gate together with the translated definition.
+
+    Parameters are renamed to the prefix followed by their position, as some importers order parameters by name.
+    """
+    match = _GATE_DEFINITION.fullmatch(text)
+    if match is None:
+        raise _UnsupportedStatement(text)
+    name = match.group("name")
+    params = [p.strip() for p in match.group("params").split(",")] if match.group("params") else []
+    args = [a.strip() for a in match.group("args").split(",")]
+    for identifier in args:
+        if not _IDENTIFIER.fullmatch(identifier) or identifier in _QASM3_KEYWORDS:
+            raise _UnsupportedStatement(text)
+    for identifier in params:
+        if not _KEYWORD.fullmatch(identifier) or identifier in _QASM3_KEYWORDS:
+            raise _UnsupportedStatement(text)
+
+    width = len(str(len(params) - 1))
+    names = dict(_EXPRESSION_NAMES)
+    names.update({param: f"{param_prefix}{i:0{width}d}" for i, param in enumerate(params)})
+    params = [names[param] for param in params]
+    if not set(params).isdisjoint(args):
+        raise _UnsupportedStatement(text)
+    body = []
+    for kind, statement in _split_statements(match.group("body")):
+        if kind == "statement":
+            body.append(translate_body(statement.rstrip(";").strip(), names))
+        elif kind == "block":
+            raise _UnsupportedStatement(statement)
+    header = f"gate {name}({', '.join(params)}) {', '.join(args)}" if params else f"gate {name} {', '.join(args)}"
+    return name, f"{header} {{ {' '.join(body)} }}" if body else f"{header} {{ }}"
+
+
+def _collect_qelib1_definitions(used: set[str]) -> list[str]:
+    required = set(used)
+    for name in used:
+        required.update(_QELIB1_DEPENDENCIES.get(name, ()))
+    return [definition for name, definition in _QELIB1_DEFINITIONS.items() if name in required]
+
+
+def qasm2_to_qasm3(source: str) -> str:  # noqa: C901
+    """Translate an OpenQASM 2 program into an OpenQASM 3 program without constructing a circuit."""
+    lines: list[str] = []
+    include_index: Optional[int] = None
+    defined: set[str] = set()
+    used: set[str] = set()
+
+    def translate_operation(text: str, names: Mapping[str, str]) -> str:
+        keyword = _KEYWORD.match(text)
+        if keyword is None:
+            raise _UnsupportedStatement(text)
+        keyword = keyword.group()
+        if keyword == "measure":
+            match = _MEASURE_ARROW.fullmatch(text)
+            if match is None:
+                raise _UnsupportedStatement(text)
+            clbits, qubits = _translate_arguments(match.group("clbits")), _translate_arguments(match.group("qubits"))
+            return f"{clbits} = measure {qubits};"
+        if keyword in ("reset", "barrier"):
+            return f"{keyword} {_translate_arguments(text[len(keyword):])};"
+        if keyword == "CX" and include_index is None:
+            raise _UnsupportedStatement(text)  # CX is no builtin gate in OpenQASM 3
+        if keyword in _QELIB1_DEFINITIONS and keyword not in defined:
+            used.add(keyword)
+        return _translate_gate_call(text, names, "**", None)
+
+    for kind, text in _split_statements(source):
+        if kind == "comment":
+            lines.append(text)
+            continue
+        if kind == "block":
+            name, definition = _translate_gate_definition(text, translate_operation, "_p")
+            if name in _STDGATES or name in _QASM3_KEYWORDS or name in defined:
+                raise _UnsupportedStatement(text)
+            defined.add(name)
+            lines.append(definition)
+            continue
+
+        text = text.rstrip(";").strip()
+        keyword = _KEYWORD.match(text)
+        keyword = keyword.group() if keyword else None
+        if keyword == "OPENQASM":
+            match = _VERSION.fullmatch(text)
+            if match is None or not match.group("version").startswith("2"):
+                raise _UnsupportedStatement(text)
+            lines.append("OPENQASM 3.0;")
+        elif keyword == "include":
+            match = _INCLUDE.fullmatch(text)
+            if match is None or match.group("file") != "qelib1.inc" or include_index is not None:
+                raise _UnsupportedStatement(text)
+            include_index = len(lines)
+            lines.append('include "stdgates.inc";')
+        elif keyword in ("qreg", "creg"):
+            match = _QASM2_REGISTER.fullmatch(text)
+            if match is None or match.group("name") in _QASM3_KEYWORDS:
+                raise _UnsupportedStatement(text)
+            register_type = "qubit" if keyword == "qreg" else "bit"
+            lines.append(f"{register_type}[{match.group('size')}] {match.group('name')};")
+        elif keyword == "if":
+            match = _CONDITION.fullmatch(text)
+            if match is None:
+                raise _UnsupportedStatement(text)
+            operation = translate_operation(match.group("body").strip(), _EXPRESSION_NAMES)
+            lines.append(f"if ({match.group('register')} == {match.group('value')}) {{ {operation} }}")
+        elif keyword == "opaque":
+            raise _UnsupportedStatement(text)
+        else:
+            lines.append(translate_operation(text, _EXPRESSION_NAMES))
+
+    if used:
+        assert include_index is not None
+        lines[include_index + 1 : include_index + 1] = _collect_qelib1_definitions(used)
+    return "\n".join(lines) + "\n"
+
+
+def qasm3_to_qasm2(source: str) -> str:  # noqa: C901
+    """Translate an OpenQASM 3 program into an OpenQASM 2 program without constructing a circuit.
+
+    Only programs consisting of register declarations, gate definitions, gate calls, measurements and conditions on
+    complete classical registers can be translated.
+    """
+    lines: list[str] = []
+    has_header = False
+    has_include = False
+    classical_registers: set[str] = set()
+
+    def translate_operation(text: str, names: Mapping[str, str]) -> str:
+        keyword = _KEYWORD.match(text)
+        if keyword is None:
+            raise _UnsupportedStatement(text)
+        keyword = keyword.group()
+        if keyword == "measure":
+            match = _MEASURE_ARROW.fullmatch(text)
+            if match is None:
+                raise _UnsupportedStatement(text)
+            qubits, clbits = _translate_arguments(match.group("qubits")), _translate_arguments(match.group("clbits"))
+            return f"measure {qubits} -> {clbits};"
+        if keyword in ("reset", "barrier"):
+            if not text[len(keyword) :].strip():
+                raise _UnsupportedStatement(text)  # barriers without arguments are not supported by OpenQASM 2
+            return f"{keyword} {_translate_arguments(text[len(keyword):])};"
+        match = _MEASURE_ASSIGN.fullmatch(text)
+        if match is not None:
+            qubits, clbits = _translate_arguments(match.group("qubits")), _translate_arguments(match.group("clbits"))
+            return f"measure {qubits} -> {clbits};"
+        if not (_IDENTIFIER.fullmatch(keyword) or keyword in ("U", "CX")):
+            raise _UnsupportedStatement(text)
+        return _translate_gate_call(text, names, "^", _QASM3_TO_QASM2_GATES)
+
+    for kind, text in _split_statements(source):
+        if kind == "comment":
+            if text.startswith("/*"):
+                raise _UnsupportedStatement(text)
+            lines.append(text)
+            continue
+        if kind == "block":
+            keyword = _KEYWORD.match(text)
+            if keyword is not None and keyword.group() == "gate":
+                if " ".join(text.split()) in _QELIB1_DEFINITION_TEXTS:
+                    continue  # definition of a qelib1.inc gate added by the translation from OpenQASM 2
+                name, definition = _translate_gate_definition(text, translate_operation, "param")
+                if not _IDENTIFIER.fullmatch(name) or name in _STDGATES or name in _QELIB1_DEFINITIONS:
+                    raise _UnsupportedStatement(text)
+                lines.append(definition)
+                continue
+            match = _CONDITION.fullmatch(text)
+            if match is None or match.group("register") not in classical_registers:
+                raise _UnsupportedStatement(text)
+            condition = f"if({match.group('register')}=={match.group('value')})"
+            body = match.group("body").strip()[1:-1]
+            for body_kind, statement in _split_statements(body):
+                if body_kind != "statement":
+                    raise _UnsupportedStatement(statement)
+                lines.append(f"{condition} {translate_operation(statement.rstrip(';').strip(), _EXPRESSION_NAMES)}")
+            continue
+
+        text = text.rstrip(";").strip()
+        keyword = _KEYWORD.match(text)
+        keyword = keyword.group() if keyword else None
+        if keyword == "OPENQASM":
+            match = _VERSION.fullmatch(text)
+            if match is None or not match.group("version").startswith("3") or has_header:
+                raise _UnsupportedStatement(text)
+            has_header = True
+            lines.append("OPENQASM 2.0;")
+        elif keyword == "include":
+            match = _INCLUDE.fullmatch(text)
+            if match is None or match.group("file") != "stdgates.inc" or has_include:
+                raise _UnsupportedStatement(text)
+            has_include = True
+            lines.append('include "qelib1.inc";')
+        elif keyword in ("qubit", "bit"):
+            match = _QASM3_REGISTER.fullmatch(text)
+            if match is None:
+                raise _UnsupportedStatement(text)
+            name, size = match.group("name"), match.group("size") or "1"
+            if keyword == "qubit":
+                if match.group("measured") is not None:
+                    raise _UnsupportedStatement(text)
+                lines.append(f"qreg {name}[{size}];")
+            else:
+                classical_registers.add(name)
+                lines.append(f"creg {name}[{size}];")
+                if match.group("measured") is not None:
+                    lines.append(f"measure {_translate_arguments(match.group('measured'))} -> {name};")
+        elif keyword in ("qreg", "creg"):
+            match = _QASM2_REGISTER.fullmatch(text)
+            if match is None:
+                raise _UnsupportedStatement(text)
+            if keyword == "creg":
+                classical_registers.add(match.group("name"))
+            lines.append(f"{text};")
+        elif keyword == "if":
+            match = _CONDITION.fullmatch(text)
+            if match is None or match.group("register") not in classical_registers:
+                raise _UnsupportedStatement(text)
+            operation = translate_operation(match.group("body").strip(), _EXPRESSION_NAMES)
+            lines.append(f"if({match.group('register')}=={match.group('value')}) {operation}")
+        else:
+            lines.append(translate_operation(text, _EXPRESSION_NAMES))
+
+    if not has_header:
+        lines.insert(0, "OPENQASM 2.0;")
+    return "\n".join(lines) + "\n"
+
+
+class Qasm2ToQasm3(CircuitTranspiler, source="QASM2", target="QASM3", cost=1):
+
+    def transpile_circuit(self, circuit: Any) -> str:
+        assert isinstance(circuit, str)
+        try:
+            return qasm2_to_qasm3(circuit)
+        except _UnsupportedStatement:
+            return QiskitToQasm3().transpile_circuit(Qasm2ToQiskit().transpile_circuit(circuit))
+
+
+class Qasm3ToQasm2(CircuitTranspiler, source="QASM3", target="QASM2", cost=1):
+
+    def transpile_circuit(self, circuit: Any) -> str:
+        assert isinstance(circuit, str)
+        try:
+            return qasm3_to_qasm2(circuit)
+        except _UnsupportedStatement:
+            return QiskitToQasm2().transpile_circuit(Qasm3ToQiskit().transpile_circuit(circuit))
@@ -0,0 +1,235 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from flask import current_app, has_app_context
+
+from . import sandbox_worker
+
+"""
+A pool of warm sandbox processes for the transpilers of the unsafe python circuit formats.
+
+The sandbox processes import the quantum SDKs once when they are started and then execute the circuit programs of
+many jobs, each program in a fresh child process forked from the sandbox process. The programs run without the
+environment (and thus the credentials) of qunicorn, with limited memory and cpu time, and are killed if they do not
+finish in time. Enable the sandbox with ``SANDBOX_UNSAFE_TRANSPILERS``.
+
+The sandbox only protects qunicorn from the mistakes of well-meaning programs, it is no security boundary:
+the processes run as the same user as qunicorn without filesystem or network isolation, so programs can read and
+write every file qunicorn can access (e.g. the sqlite database or the instance folder) and open network connections.
+Only accept the unsafe formats from trusted users, or run qunicorn in a container that only
+contains what the programs may access.
+"""
+
+# default number of sandbox processes per qunicorn process
+DEFAULT_SANDBOX_POOL_SIZE: int = 2
+# default wall clock time in seconds a circuit program may run
+DEFAULT_SANDBOX_TIMEOUT: int = 30
+# default memory in MB a sandbox process may allocate in addition to the imported libraries
+DEFAULT_SANDBOX_MEMORY_LIMIT: int = 2048
+# default number of circuit programs a sandbox process executes before it is replaced
+DEFAULT_SANDBOX_MAX_TASKS: int = 100
+# time in seconds a sandbox process may take to import the libraries
+SANDBOX_STARTUP_TIMEOUT: int = 120
+# time in seconds a sandbox process may take in addition to the timeout of the program to report its result
+SANDBOX_RESPONSE_TIMEOUT: int = 5
+
+
+class SandboxError(Exception):
+    """Raised if a circuit program failed or could not be executed in the sandbox."""
+
+
+class SandboxProgramError(SandboxError):
+    """Raised if a circuit program failed (or did not finish in time), the sandbox process can still be used."""
+
+
+class _SandboxProcess:
+    """A sandbox process together with the number of circuit programs it executed."""
+
+    def __init__(self, timeout: int, memory_limit: int, max_tasks: int):
+        self.tasks = 0
+        self.ready = False
+        self.max_tasks = max_tasks
+        self.process = subprocess.Popen(
+            [sys.executable, "-I", str(Path(sandbox_worker.__file__)), str(memory_limit), str(timeout)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=tempfile.gettempdir(),
+            env={"PATH": os.environ.get("PATH", ""), "HOME": tempfile.gettempdir()},
+            start_new_session=True,  # the process group contains the children executing the programs
+        )
+
+    def execute(self, source_format: str, program: str, timeout: float) -> tuple[str, bytes]:
+        if not self.ready:
+            startup_deadline = monotonic() + SANDBOX_STARTUP_TIMEOUT
+            if self._read_exact(len(sandbox_worker.READY_MESSAGE), startup_deadline) != sandbox_worker.READY_MESSAGE:
+                raise SandboxError("The sandbox process could not be started.")
+            self.ready = True
+        # the sandbox process stops the program after the timeout, the deadline only applies if the process hangs
+        deadline = monotonic() + timeout + SANDBOX_RESPONSE_TIMEOUT
+
+        request = json.dumps({"format": source_format, "program": program}).encode()
+        assert self.process.stdin is not None
+        try:
+            self.process.stdin.write(len(request).to_bytes(4, "big") + request)
+            self.process.stdin.flush()
+        except OSError as err:
+            raise SandboxError("The sandbox process terminated unexpectedly.") from err
+        self.tasks += 1
+
+        header = json.loads(self._read_message(deadline))
+        payload = self._read_message(deadline)
+        if not header.get("ok", False):
+            raise SandboxProgramError(str(header.get("error", "Unknown error")))
+        return str(header["format"]), payload
+
+    @property
+    def is_reusable(self) -> bool:
+        return self.tasks < self.max_tasks and self.process.poll() is None
+
+    def kill(self):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # the process and its children already terminated
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            if stream is not None:
+                with suppress(OSError):  # the unsent part of a request cannot be flushed to the terminated process
+                    stream.close()
+
+    def _read_message(self, deadline: float) -> bytes:
+        length = int.from_bytes(self._read_exact(4, deadline), "big")
+        return self._read_exact(length, deadline)
+
+    def _read_exact(self, length: int, deadline: float) -> bytes:
+        assert self.process.stdout is not None
+        fd = self.process.stdout.fileno()
+        data = bytearray()
+        while len(data) < length:
+            remaining = deadline - monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise SandboxError("The sandbox process did not respond in time.")
+            chunk = os.read(fd, length - len(data))
+            if not chunk:
+                raise SandboxError("The sandbox process terminated unexpectedly (e.g. because of the memory limit).")
+            data += chunk
+        return bytes(data)
+
+
+class SandboxPool:
+    """A fixed size pool of sandbox processes that are started ahead of time."""
+
+    def __init__(self, size: int, timeout: int, memory_limit: int, max_tasks: int):
+        self.size = max(size, 1)
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_tasks = max(max_tasks, 1)
+        self._idle: Queue[_SandboxProcess] = Queue()
+        self._processes: set[_SandboxProcess] = set()
+        self._lock = Lock()
+        for _ in range(self.size):
+            self._start_process()
+
+    def execute(self, source_format: str, program: str) -> tuple[str, bytes]:
+        """Execute the circuit program in a sandbox process and return the format and the serialized circuit."""
+        process = self._idle.get()
+        try:
+            return process.execute(source_format, program, self.timeout)
+        except SandboxProgramError:
+            raise  # the program failed in a child process, the sandbox process completed the protocol
+        except BaseException:
+            # the state of the process is unknown, e.g., it may still send the response or it terminated
+            process.kill()
+            raise
+        finally:
+            if process.is_reusable:
+                self._idle.put(process)
+            else:
+                self._replace(process)
+
+    def shutdown(self):
+        with self._lock:
+            processes, self._processes = self._processes, set()
+        for process in processes:
+            process.kill()
+        while True:
+            try:
+                self._idle.get_nowait()
+            except Empty:
+                break
+
+    def _start_process(self):
+        process = _SandboxProcess(self.timeout, self.memory_limit, self.max_tasks)
+        with self._lock:
+            self._processes.add(process)
+        self._idle.put(process)
+
+    def _replace(self, process: _SandboxProcess):
+        process.kill()
+        with self._lock:
+            self._processes.discard(process)
+        self._start_process()
+
+
+_POOL: Optional[SandboxPool] = None
+_POOL_LOCK = Lock()
+
+
+def is_sandbox_enabled() -> bool:
+    return has_app_context() and bool(current_app.config.get("SANDBOX_UNSAFE_TRANSPILERS", False))
+
+
+def get_sandbox_pool() -> SandboxPool:
+    """Get the sandbox pool of this process, the pool is started on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            config = current_app.config
+            _POOL = SandboxPool(
+                size=config.get("SANDBOX_POOL_SIZE", DEFAULT_SANDBOX_POOL_SIZE),
+                timeout=config.get("SANDBOX_TIMEOUT", DEFAULT_SANDBOX_TIMEOUT),
+                memory_limit=config.get("SANDBOX_MEMORY_LIMIT", DEFAULT_SANDBOX_MEMORY_LIMIT),
+                max_tasks=config.get("SANDBOX_MAX_TASKS", DEFAULT_SANDBOX_MAX_TASKS),
+            )
+            atexit.register(_POOL.shutdown)
+        return _POOL
+
+
+def shutdown_sandbox_pool():
+    """Stop all sandbox processes of this process, e.g. after forking."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown()
+            _POOL = None
+
+
+def execute_in_sandbox(source_format: str, program: str) -> tuple[str, bytes]:
+    return get_sandbox_pool().execute(source_format, program)
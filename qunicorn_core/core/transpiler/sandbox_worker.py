@@ -0,0 +1,225 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Worker process of the sandbox for the unsafe python circuit formats.
+
+The worker is started as a standalone script (without importing qunicorn_core), imports the quantum SDKs once and then
+executes circuit programs received from the parent process. Every program runs in a child process forked from the
+worker, so programs cannot change the state of the worker (e.g. patch the SDKs) for the programs executed after them.
+The child is killed if the program does not finish in time. Circuits are sent back serialized as QPY or as
+OpenQASM/Quil text, so the parent never needs to unpickle data produced by user code.
+
+Protocol (all integers are 4 byte big endian):
+    worker -> parent: READY_MESSAGE once all libraries are imported
+    parent -> worker: <length><json {"format": str, "program": str}>
+    worker -> parent: <length><json {"ok": bool, "format": str, "error": str}><length><payload>
+"""
+
+import json
+import os
+import runpy
+import select
+import signal
+import struct
+import sys
+from io import BytesIO
+from time import monotonic
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
+
+from braket.circuits import Circuit
+from braket.circuits.measure import Measure
+from braket.circuits.serialization import IRType
+from pyquil import Program
+from qiskit import QuantumCircuit, qpy
+from qrisp import QuantumCircuit as QrispQC
+
+READY_MESSAGE = b"READY\n"
+_LENGTH = struct.Struct(">I")
+
+# the limits are shared with the simulation processes, the module is loaded by path as qunicorn_core is not imported
+limit_resources: Callable[[int, int], None] = runpy.run_path(
+    str(Path(__file__).resolve().parents[2] / "util" / "resource_limits.py")
+)["limit_resources"]
+
+
+def load_qiskit_python(program: str) -> QuantumCircuit:
+    circuit_globals = {"QuantumCircuit": QuantumCircuit}
+    exec(program, circuit_globals)
+    try:
+        qiskit_circuit = circuit_globals["circuit"]
+    except KeyError:
+        raise ValueError("The circuit program did not contain a variable called 'circuit'!")
+    if isinstance(qiskit_circuit, QuantumCircuit):
+        return qiskit_circuit
+    raise TypeError(
+        "The circuit type does not match the expected type. "
+        f"(Expected {QuantumCircuit}, but got {type(qiskit_circuit)})"
+    )
+
+
+def load_braket_python(program: str) -> Circuit:
+    circuit_globals = {"Circuit": Circuit}
+    braket_circuit = eval(program, circuit_globals)
+    if isinstance(braket_circuit, Circuit):
+        return braket_circuit
+    raise TypeError(
+        f"The circuit type does not match the expected type. (Expected {Circuit}, but got {type(braket_circuit)})"
+    )
+
+
+def load_qrisp_python(program: str) -> QrispQC:
+    circuit_globals = {"QuantumCircuit": QrispQC}
+    exec(program, circuit_globals)
+    try:
+        qrisp_circuit = circuit_globals["circuit"]
+    except KeyError:
+        raise ValueError("The circuit program did not contain a variable called 'circuit'!")
+    if isinstance(qrisp_circuit, QrispQC):
+        return qrisp_circuit
+    raise TypeError(
+        f"The circuit type does not match the expected type. (Expected {QrispQC}, but got {type(qrisp_circuit)})"
+    )
+
+
+def load_quil_python(program: str) -> Program:
+    circuit_globals = {"Program": Program}
+    exec(program, circuit_globals)
+    try:
+        quil_circuit = circuit_globals["circuit"]
+    except KeyError:
+        raise ValueError("The circuit program did not contain a variable called 'circuit'!")
+    if isinstance(quil_circuit, Program):
+        return quil_circuit
+    raise TypeError(
+        f"The circuit type does not match the expected type. (Expected {Program}, but got {type(quil_circuit)})"
+    )
+
+
+def _dump_qpy(circuit: QuantumCircuit) -> bytes:
+    buffer = BytesIO()
+    qpy.dump(circuit, buffer)
+    return buffer.getvalue()
+
+
+def _dump_braket(circuit: Circuit) -> bytes:
+    lines = circuit.to_ir(IRType.OPENQASM).source.splitlines()
+    if not circuit.result_types and not any(isinstance(i.operator, Measure) for i in circuit.instructions):
+        # braket adds measurements of all qubits to circuits without measurements, which are not part of the circuit
+        lines = [line for line in lines if not line.startswith(("bit[", "b["))]
+    return "\n".join(lines).encode()
+
+
+# loader and serializer for every unsafe format, together with the format of the serialized circuit
+LOADERS: dict[str, tuple[Callable[[str], Any], str, Callable[[Any], bytes]]] = {
+    "QISKIT-PYTHON": (load_qiskit_python, "QPY", _dump_qpy),
+    "BRAKET-PYTHON": (load_braket_python, "BRAKET-QASM", _dump_braket),
+    "QRISP-PYTHON": (load_qrisp_python, "QPY", lambda c: _dump_qpy(c.to_qiskit())),
+    "QUIL-PYTHON": (load_quil_python, "QUIL", lambda c: c.out().encode()),
+}
+
+
+def _read_message(channel: BinaryIO) -> Optional[bytes]:
+    header = channel.read(_LENGTH.size)
+    if len(header) < _LENGTH.size:
+        return None  # parent closed the channel
+    (length,) = _LENGTH.unpack(header)
+    return channel.read(length)
+
+
+def _encode_response(header: dict, payload: bytes = b"") -> bytes:
+    encoded = json.dumps(header).encode()
+    return _LENGTH.pack(len(encoded)) + encoded + _LENGTH.pack(len(payload)) + payload
+
+
+def _run_program(message: bytes) -> bytes:
+    request = json.loads(message)
+    try:
+        load, result_format, serialize = LOADERS[request["format"]]
+        payload = serialize(load(request["program"]))
+    except BaseException as err:  # noqa: B036 report all errors of the user code to the parent
+        return _encode_response({"ok": False, "error": f"{type(err).__name__}: {err}"})
+    return _encode_response({"ok": True, "format": result_format}, payload)
+
+
+def _read_until_closed(fd: int, deadline: float) -> Optional[bytes]:
+    """Read from the file descriptor until it is closed, returns None if it is not closed before the deadline."""
+    data = bytearray()
+    while True:
+        remaining = deadline - monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            return None
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return bytes(data)
+        data += chunk
+
+
+def _execute(message: bytes, channels: tuple[BinaryIO, ...], memory_limit: int, timeout: int) -> bytes:
+    """Execute the circuit program in a forked child process, returns the encoded response."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # the child only writes to its pipe, it cannot access the channels of the worker
+        os.close(read_fd)
+        for channel in channels:
+            channel.close()
+        exit_code = 1
+        try:
+            limit_resources(memory_limit, timeout)
+            response = _run_program(message)
+            with os.fdopen(write_fd, "wb") as result_channel:
+                result_channel.write(response)
+            exit_code = 0
+        finally:
+            os._exit(exit_code)
+
+    os.close(write_fd)
+    try:
+        response = _read_until_closed(read_fd, monotonic() + timeout)
+    finally:
+        os.close(read_fd)
+    if response is None:
+        os.kill(pid, signal.SIGKILL)
+    _, status = os.waitpid(pid, 0)
+    if response is None:
+        return _encode_response({"ok": False, "error": "TimeoutError: The circuit program did not finish in time."})
+    if status != 0:
+        return _encode_response(
+            {"ok": False, "error": "The circuit program terminated unexpectedly (e.g. because of the memory limit)."}
+        )
+    return response
+
+
+def main(memory_limit: int, timeout: int):
+    # keep the original stdin/stdout for the protocol, so that user code cannot read from or write to them
+    requests = os.fdopen(os.dup(0), "rb")
+    responses = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    sys.stdin = open(os.devnull)
+    sys.stdout = open(os.devnull, "w")
+
+    responses.write(READY_MESSAGE)
+    responses.flush()
+
+    while (message := _read_message(requests)) is not None:
+        responses.write(_execute(message, (requests, responses), memory_limit, timeout))
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]), int(sys.argv[2]))
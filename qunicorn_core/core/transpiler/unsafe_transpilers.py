@@ -12,77 +12,61 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from io import BytesIO
 from typing import Any
 
 from pyquil import Program
 from qrisp import QuantumCircuit as QrispQC
 
 from braket.circuits import Circuit  # noqa
-from qiskit import QuantumCircuit  # noqa
+from qiskit import QuantumCircuit, qpy  # noqa
 
 from .circuit_transpiler import CircuitTranspiler
+from .sandbox import execute_in_sandbox, is_sandbox_enabled
+from .sandbox_worker import load_braket_python, load_qiskit_python, load_qrisp_python, load_quil_python
+
+
+def _load_qpy(serialized: bytes) -> QuantumCircuit:
+    circuits = qpy.load(BytesIO(serialized))
+    assert len(circuits) == 1 and isinstance(circuits[0], QuantumCircuit)
+    return circuits[0]
 
 
 class QiskitPythonToQiskit(CircuitTranspiler, source="QISKIT-PYTHON", target="QISKIT", cost=1):
     unsafe = True
 
     def transpile_circuit(self, circuit: Any) -> QuantumCircuit:
-        circuit_globals = {"QuantumCircuit": QuantumCircuit}
-        exec(circuit, circuit_globals)
-        try:
-            qiskit_circuit = circuit_globals["circuit"]
-        except KeyError:
-            raise ValueError("The circuit program did not contain a variable called 'circuit'!")
-        if isinstance(qiskit_circuit, QuantumCircuit):
-            return qiskit_circuit
-        raise TypeError(
-            "The circuit type does not match the expected type. "
-            f"(Expected {QuantumCircuit}, but got {type(qiskit_circuit)})"
-        )
+        if is_sandbox_enabled():
+            _, serialized = execute_in_sandbox(self.source, circuit)
+            return _load_qpy(serialized)
+        return load_qiskit_python(circuit)
 
 
 class BraketPythonToBraket(CircuitTranspiler, source="BRAKET-PYTHON", target="BRAKET", cost=1):
     unsafe = True
 
     def transpile_circuit(self, circuit: Any) -> Circuit:
-        circuit_globals = {"Circuit": Circuit}
-        braket_circuit = eval(circuit, circuit_globals)
-        if isinstance(braket_circuit, Circuit):
-            return braket_circuit
-        raise TypeError(
-            f"The circuit type does not match the expected type. (Expected {Circuit}, but got {type(braket_circuit)})"
-        )
+        if is_sandbox_enabled():
+            _, serialized = execute_in_sandbox(self.source, circuit)
+            return Circuit.from_ir(serialized.decode())
+        return load_braket_python(circuit)
 
 
 class QrispPythonToQrisp(CircuitTranspiler, source="QRISP-PYTHON", target="QRISP", cost=1):
     unsafe = True
 
     def transpile_circuit(self, circuit: Any) -> QrispQC:
-        circuit_globals = {"QuantumCircuit": QrispQC}
-        exec(circuit, circuit_globals)
-        try:
-            qrisp_circuit = circuit_globals["circuit"]
-        except KeyError:
-            raise ValueError("The circuit program did not contain a variable called 'circuit'!")
-        if isinstance(qrisp_circuit, QrispQC):
-            return qrisp_circuit
-        raise TypeError(
-            f"The circuit type does not match the expected type. (Expected {QrispQC}, but got {type(qrisp_circuit)})"
-        )
+        if is_sandbox_enabled():
+            _, serialized = execute_in_sandbox(self.source, circuit)
+            return QrispQC.from_qiskit(_load_qpy(serialized))
+        return load_qrisp_python(circuit)
 
 
 class QuilPythonToQuil(CircuitTranspiler, source="QUIL-PYTHON", target="QUIL", cost=1):
     unsafe = True
 
     def transpile_circuit(self, circuit: Any) -> Program:
-        circuit_globals = {"Program": Program}  # TODO: test this...
-        exec(circuit, circuit_globals)
-        try:
-            quil_circuit = circuit_globals["circuit"]
-        except KeyError:
-            raise ValueError("The circuit program did not contain a variable called 'circuit'!")
-        if isinstance(quil_circuit, Program):
-            return quil_circuit
-        raise TypeError(
-            f"The circuit type does not match the expected type. (Expected {Program}, but got {type(quil_circuit)})"
-        )
+        if is_sandbox_enabled():
+            _, serialized = execute_in_sandbox(self.source, circuit)
+            return Program(serialized.decode())
+        return load_quil_python(circuit)
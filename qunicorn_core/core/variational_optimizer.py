@@ -0,0 +1,152 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from http import HTTPStatus
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+from flask import current_app
+from scipy.optimize import minimize
+
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.optimizer_method import OptimizerMethod
+from qunicorn_core.static.qunicorn_exception import QunicornError
+
+"""
+Classical optimizers for the hybrid loop of VARIATIONAL jobs.
+
+The pilots run the whole optimization inside the worker: the circuit is compiled and the backend is set up once, the
+optimizer only rebinds the parameters for every evaluation of the objective. Every evaluation of the objective executes
+the circuit once, so the number of evaluations is bounded by the ``max_iterations`` of the job and by
+``VARIATIONAL_MAX_ITERATIONS``.
+"""
+
+# default upper bound for the objective evaluations (i.e. circuit executions) of a variational job
+DEFAULT_VARIATIONAL_MAX_ITERATIONS: int = 1000
+
+# methods of scipy.optimize.minimize and the name of their option for the maximum number of function evaluations
+SCIPY_METHODS = {
+    OptimizerMethod.COBYLA: ("COBYLA", "maxiter"),
+    OptimizerMethod.NELDER_MEAD: ("Nelder-Mead", "maxfev"),
+    OptimizerMethod.POWELL: ("Powell", "maxfev"),
+}
+
+# gain sequences of SPSA, the exponents as recommended by Spall, "Implementation of the simultaneous perturbation
+# algorithm for stochastic optimization" (1998), the gains for parameters that are rotation angles
+SPSA_A: float = 1.0
+SPSA_C: float = 0.2
+SPSA_ALPHA: float = 0.602
+SPSA_GAMMA: float = 0.101
+
+
+class OptimizerSettings(NamedTuple):
+    method: OptimizerMethod
+    initial_parameters: Dict[str, float]
+    max_iterations: int
+    coefficients: Optional[List[List[float]]]
+
+
+class OptimizationResult(NamedTuple):
+    parameters: np.ndarray
+    value: float
+    iterations: int
+    success: bool
+    message: str
+
+
+class _IterationsExhausted(Exception):
+    pass
+
+
+def get_optimizer_settings(job: JobDataclass) -> OptimizerSettings:
+    """Get the validated optimizer settings of a variational job."""
+    if not job.optimizer:
+        raise QunicornError("Variational jobs need optimizer settings!", HTTPStatus.BAD_REQUEST)
+    try:
+        method = OptimizerMethod(job.optimizer.get("method", OptimizerMethod.COBYLA))
+    except ValueError:
+        raise QunicornError(
+            f"The optimizer {job.optimizer['method']} is not supported, use one of "
+            f"{', '.join(m.value for m in OptimizerMethod)}!",
+            HTTPStatus.BAD_REQUEST,
+        )
+    max_iterations: int = job.optimizer.get("max_iterations", 100)
+    limit: int = current_app.config.get("VARIATIONAL_MAX_ITERATIONS", DEFAULT_VARIATIONAL_MAX_ITERATIONS)
+    if not 0 < max_iterations <= limit:
+        raise QunicornError(f"The optimizer may use between 1 and {limit} iterations!", HTTPStatus.BAD_REQUEST)
+    return OptimizerSettings(
+        method=method,
+        initial_parameters=job.optimizer.get("initial_parameters", {}),
+        max_iterations=max_iterations,
+        coefficients=job.optimizer.get("coefficients"),
+    )
+
+
+def optimize(
+    objective: Callable[[np.ndarray], float],
+    initial_parameters: np.ndarray,
+    method: OptimizerMethod,
+    max_iterations: int,
+    seed: Optional[int] = None,
+) -> OptimizationResult:
+    """Minimize the objective, evaluating it at most ``max_iterations`` times.
+
+    Returns the best parameters evaluated, even if the optimizer did not converge within the iterations.
+    """
+    best: List = [initial_parameters, np.inf]
+    iterations = 0
+
+    def bounded_objective(parameters: np.ndarray) -> float:
+        nonlocal iterations
+        if iterations >= max_iterations:
+            raise _IterationsExhausted()
+        iterations += 1
+        value = objective(parameters)
+        if value < best[1]:
+            best[:] = [np.array(parameters, dtype=float), value]
+        return value
+
+    try:
+        if method == OptimizerMethod.SPSA:
+            _spsa(bounded_objective, initial_parameters, max_iterations, np.random.default_rng(seed))
+            success, message = True, f"SPSA finished after {iterations} iterations."
+        else:
+            scipy_method, max_iterations_option = SCIPY_METHODS[method]
+            result = minimize(
+                bounded_objective,
+                initial_parameters,
+                method=scipy_method,
+                options={max_iterations_option: max_iterations},
+            )
+            success, message = bool(result.success), str(result.message)
+    except _IterationsExhausted:
+        success, message = False, f"The optimizer did not converge within {max_iterations} iterations."
+    return OptimizationResult(best[0], float(best[1]), iterations, success, message)
+
+
+def _spsa(
+    objective: Callable[[np.ndarray], float], parameters: np.ndarray, max_iterations: int, rng: np.random.Generator
+):
+    """Simultaneous perturbation stochastic approximation, every step evaluates the objective twice."""
+    stability = 0.1 * max_iterations / 2
+    parameters = np.array(parameters, dtype=float)
+    if max_iterations < 2:
+        objective(parameters)
+    for k in range(max_iterations // 2):
+        step = SPSA_A / (k + 1 + stability) ** SPSA_ALPHA
+        perturbation = SPSA_C / (k + 1) ** SPSA_GAMMA
+        delta = rng.choice([-1.0, 1.0], size=parameters.shape)
+        difference = objective(parameters + perturbation * delta) - objective(parameters - perturbation * delta)
+        # the components of delta are +-1, so multiplying by delta is the same as dividing by it
+        parameters = parameters - step * difference / (2 * perturbation) * delta
@@ -18,6 +18,9 @@
 """Module containing all SQLalchemy Models."""
 
 from . import (
+    cache_entry,
+    circuit_cut,
+    compiled_circuit,
     db_model,
     deployment,
     device,
@@ -25,5 +28,8 @@ from . import (
     provider,
     provider_assembler_language,
     quantum_program,
+    queued_task,
     result,
+    simulator_result_cache,
+    transpiler_statistics,
 )
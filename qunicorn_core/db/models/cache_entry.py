@@ -0,0 +1,82 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+from typing import Optional, Sequence, TypeVar
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import MappedColumn, mapped_column
+from sqlalchemy.sql import delete, select
+from sqlalchemy.sql import sqltypes as sql
+
+from .db_model import DbModel
+from ..db import DB
+
+C = TypeVar("C", bound="CacheEntryModel")
+
+
+def cache_key_column() -> MappedColumn[str]:
+    """Column for the hash identifying a cache entry."""
+    return mapped_column(sql.String(64), unique=True)
+
+
+def timestamp_column() -> MappedColumn[datetime]:
+    """Column for the moment a cache entry was created or last used."""
+    return mapped_column(sql.TIMESTAMP(timezone=True), default_factory=lambda: datetime.now(timezone.utc))
+
+
+class CacheEntryModel(DbModel):
+    """Base class for entries of the caches stored in the database, the least recently used entries are evicted first
+
+    The models have to declare the columns ``cache_key`` (see ``cache_key_column``), ``created_at`` and
+    ``last_used_at`` (see ``timestamp_column``) themselves, as the superclasses of mapped dataclasses cannot
+    declare columns.
+    """
+
+    @classmethod
+    def get_by_cache_key(cls: type[C], cache_key: str) -> Optional[C]:
+        q = select(cls).where(cls.cache_key == cache_key)
+        return DB.session.execute(q).scalar_one_or_none()
+
+    @classmethod
+    def get_by_cache_keys(cls: type[C], cache_keys: Sequence[str]) -> Sequence[C]:
+        q = select(cls).where(cls.cache_key.in_(cache_keys))
+        return DB.session.execute(q).scalars().all()
+
+    @classmethod
+    def delete_expired(cls, created_before: datetime):
+        """Delete all entries created before the given moment."""
+        DB.session.execute(delete(cls).where(cls.created_at < created_before))
+
+    @classmethod
+    def delete_least_recently_used(cls, keep: int):
+        """Delete all but the ``keep`` most recently used entries."""
+        keep_ids = select(cls.id).order_by(cls.last_used_at.desc()).limit(keep)
+        DB.session.execute(delete(cls).where(cls.id.not_in(keep_ids)))
+
+    def mark_used(self):
+        """Mark the entry as used now, recently used entries are evicted last."""
+        self.last_used_at = datetime.now(timezone.utc)
+
+    def save_unless_stored(self) -> bool:
+        """Insert the entry in a savepoint, the other pending changes of the session are not affected.
+
+        Returns False if an entry with the same key was stored concurrently by another job.
+        """
+        try:
+            with DB.session.begin_nested():
+                DB.session.add(self)
+        except IntegrityError:
+            return False
+        return True
@@ -0,0 +1,43 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import sqltypes as sql
+
+from .cache_entry import CacheEntryModel, cache_key_column, timestamp_column
+from ..db import REGISTRY
+
+
+@REGISTRY.mapped_as_dataclass
+class CircuitCutDataclass(CacheEntryModel):
+    """Dataclass for storing the results of the circuit cutting service for reuse
+
+    Attributes:
+        id (int): The ID of the circuit cut. (set by the database)
+        cache_key (str): Hash of the circuit and the cutting parameters sent to the circuit cutting service.
+        cut_data (dict): The response of the circuit cutting service.
+        created_at (datetime, optional): The moment the circuit was cut.
+        last_used_at (datetime, optional): The moment the cut was last used, used for evicting cuts.
+    """
+
+    # non-default arguments
+    id: Mapped[int] = mapped_column(sql.INTEGER(), primary_key=True, autoincrement=True, init=False)
+    cache_key: Mapped[str] = cache_key_column()
+    cut_data: Mapped[Dict[str, Any]] = mapped_column(sql.JSON)
+    # default arguments
+    created_at: Mapped[datetime] = timestamp_column()
+    last_used_at: Mapped[datetime] = timestamp_column()
@@ -0,0 +1,52 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import sqltypes as sql
+
+from .cache_entry import CacheEntryModel, cache_key_column, timestamp_column
+from ..db import DB, REGISTRY
+
+
+@REGISTRY.mapped_as_dataclass
+class CompiledCircuitDataclass(CacheEntryModel):
+    """Dataclass for storing circuits compiled for the instruction set architecture (ISA) of a device
+
+    Attributes:
+        id (int): The ID of the compiled circuit. (set by the database)
+        cache_key (str): Hash of the circuit, the backend version and all compilation options.
+        device_id (int): The ID of the device the circuit was compiled for.
+        quantum_circuit (bytes): The compiled circuit in QPY format.
+        created_at (datetime, optional): The moment the circuit was compiled.
+        last_used_at (datetime, optional): The moment the compiled circuit was last used, used for evicting circuits.
+    """
+
+    # non-default arguments
+    id: Mapped[int] = mapped_column(sql.INTEGER(), primary_key=True, autoincrement=True, init=False)
+    cache_key: Mapped[str] = cache_key_column()
+    device_id: Mapped[int] = mapped_column(ForeignKey("Device.id", ondelete="CASCADE"), index=True)
+    quantum_circuit: Mapped[bytes] = mapped_column(sql.LargeBinary())
+    # default arguments
+    created_at: Mapped[datetime] = timestamp_column()
+    last_used_at: Mapped[datetime] = timestamp_column()
+
+    @classmethod
+    def delete_for_devices(cls, device_ids: Sequence[int]):
+        """Delete all circuits compiled for one of the devices."""
+        DB.session.execute(delete(cls).where(cls.device_id.in_(device_ids)))
@@ -14,13 +14,13 @@
 
 import traceback
 from datetime import datetime, timezone
-from typing import List, Optional, Union, Any, Callable
+from typing import Dict, List, Optional, Union, Any, Callable, Collection, Sequence
 
 from flask import current_app
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import Select, or_, select
+from sqlalchemy.sql import Select, and_, func, or_, select, update
 from sqlalchemy.sql import sqltypes as sql
 
 from . import deployment as deployment_model
@@ -56,8 +56,35 @@ class JobDataclass(DbModel):
         provider_specific_id (str, optional): The provider specific id for the job. (Used for canceling)
         celery_id (str, optional): The celery id for the job. (Used for canceling)
         finished_at (Optional[datetime], optional): The moment the job finished successfully or with an error.
+        idempotency_key (str, optional): Client supplied key to deduplicate job submissions. \
+            (unique per user, see ``IDEMPOTENCY_KEY_TTL``)
+        idempotency_request_hash (str, optional): Hash of the job request submitted with the idempotency key, \
+            the key cannot be reused for different requests.
+        seed (int, optional): Seed for simulators, seeded runs on local simulators can be served from a cache.
+        parameter_bindings (List[dict], optional): Values for the parameters of parameterized circuits, every \
+            circuit is compiled once and executed for each binding.
+        observables (List[List[str]], optional): Pauli observables estimated by estimator jobs, one list per program \
+            of the deployment, all observables of a program are estimated in a single execution.
+        optimizer (dict, optional): Settings of the optimizer of variational jobs (method, initial_parameters, \
+            max_iterations and the coefficients of the observables).
+        probability_mode (str, optional): How the probabilities of RUNNER jobs are determined, enum \
+            ProbabilityMode. (default: SAMPLED)
+        heartbeat_at (datetime, optional): The last moment a worker reported that it is still executing the job.
+        requeue_count (int, optional): How often the job was executed again because its worker stopped.
     """
 
+    __table_args__ = (
+        UniqueConstraint("executed_by", "idempotency_key", name="uq_Job_executed_by_idempotency_key"),
+        # NULL owners are distinct in unique constraints, anonymous jobs need a partial index of their own
+        Index(
+            "uq_Job_anonymous_idempotency_key",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("executed_by IS NULL"),
+            sqlite_where=text("executed_by IS NULL"),
+        ),
+    )
+
     # non-default arguments
     id: Mapped[int] = mapped_column(sql.INTEGER(), primary_key=True, autoincrement=True, init=False)
     name: Mapped[Optional[str]] = mapped_column(sql.String(50))
@@ -85,6 +112,15 @@ class JobDataclass(DbModel):
         ForeignKey("Deployment.id", ondelete="SET NULL"), default=None, nullable=True, init=False
     )
     finished_at: Mapped[Optional[datetime]] = mapped_column(sql.TIMESTAMP(timezone=True), default=None, nullable=True)
+    idempotency_key: Mapped[Optional[str]] = mapped_column(sql.String(100), default=None, nullable=True)
+    idempotency_request_hash: Mapped[Optional[str]] = mapped_column(sql.String(64), default=None, nullable=True)
+    seed: Mapped[Optional[int]] = mapped_column(sql.INTEGER(), default=None, nullable=True)
+    parameter_bindings: Mapped[Optional[List[Dict[str, float]]]] = mapped_column(sql.JSON, default=None, nullable=True)
+    observables: Mapped[Optional[List[List[str]]]] = mapped_column(sql.JSON, default=None, nullable=True)
+    optimizer: Mapped[Optional[Dict[str, Any]]] = mapped_column(sql.JSON, default=None, nullable=True)
+    probability_mode: Mapped[Optional[str]] = mapped_column(sql.String(50), default=None, nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(sql.TIMESTAMP(timezone=True), default=None, nullable=True)
+    requeue_count: Mapped[Optional[int]] = mapped_column(sql.INTEGER(), default=None, nullable=True)
     results: Mapped[List[ResultDataclass]] = relationship(
         ResultDataclass, back_populates="job", lazy="selectin", default_factory=list
     )
@@ -123,6 +159,50 @@ class JobDataclass(DbModel):
             q = q.where(cls.deployment == deployment)
         return DB.session.execute(q).scalars().all()
 
+    @classmethod
+    def get_by_idempotency_key(cls, idempotency_key: str, user_id: Optional[str]):
+        """Get the job submitted by exactly this user with the given idempotency key."""
+        q = select(cls).where(cls.idempotency_key == idempotency_key)
+        if user_id is None:
+            q = q.where(cls.executed_by == None)  # noqa: E711
+        else:
+            q = q.where(cls.executed_by == user_id)
+        return DB.session.execute(q.order_by(cls.id).limit(1)).scalars().first()
+
+    @classmethod
+    def any_canceled(cls, job_ids: Collection[int]) -> bool:
+        """Check in the database whether any of the jobs was canceled, ignoring the jobs loaded in the session."""
+        q = select(cls.id).where(cls.id.in_(job_ids), cls.state == JobState.CANCELED.value).limit(1)
+        with DB.session.no_autoflush:
+            return DB.session.execute(q).first() is not None
+
+    @classmethod
+    def record_heartbeat(cls, job_id: int):
+        """Record that a worker is still executing the job, only running jobs are updated."""
+        q = (
+            update(cls)
+            .where(cls.id == job_id, cls.state == JobState.RUNNING.value)
+            .values(heartbeat_at=datetime.now(timezone.utc))
+        )
+        DB.session.execute(q)
+
+    @classmethod
+    def _is_stuck(cls, stale_before: datetime):
+        """Running jobs without a heartbeat (or, if no heartbeat was recorded, not started) since the given moment"""
+        return and_(cls.state == JobState.RUNNING.value, func.coalesce(cls.heartbeat_at, cls.started_at) < stale_before)
+
+    @classmethod
+    def get_stuck(cls, stale_before: datetime) -> Sequence["JobDataclass"]:
+        """Get the running jobs whose worker did not record a heartbeat since the given moment."""
+        q = select(cls).where(cls._is_stuck(stale_before)).order_by(cls.id)
+        return DB.session.execute(q).scalars().all()
+
+    @classmethod
+    def claim_stuck(cls, job_id: int, stale_before: datetime, state: Union[JobState, str]) -> bool:
+        """Set the state of the job if it is still stuck, returns False if it recorded a heartbeat in the meantime."""
+        q = update(cls).where(cls.id == job_id, cls._is_stuck(stale_before)).values(state=JobState(state).value)
+        return DB.session.execute(q).rowcount == 1
+
     def get_transient_state(
         self,
         *,
@@ -12,16 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import delete, select
 from sqlalchemy.sql import sqltypes as sql
 
 from . import job as job_model
 from . import quantum_program
 from .db_model import DbModel
-from ..db import REGISTRY
+from ..db import DB, REGISTRY
+from ...static.enums.job_state import JobState
 
 
 @REGISTRY.mapped_as_dataclass
@@ -35,6 +37,8 @@ class TransientJobStateDataclass(DbModel):
     Transient data can be stored for the job, or a specific program part of a job.
     """
 
+    __table_args__ = (Index("ix_TransientJobState_job_id_program_id", "job_id", "program_id", "circuit_fragment_id"),)
+
     id: Mapped[int] = mapped_column(sql.INTEGER(), primary_key=True, autoincrement=True, init=False)
     job_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("Job.id", ondelete="CASCADE"), default=None, nullable=False, init=False
@@ -50,3 +54,39 @@ class TransientJobStateDataclass(DbModel):
     )
     circuit_fragment_id: Mapped[Optional[int]] = mapped_column(sql.INTEGER(), nullable=True, default=None)
     data: Mapped[Any] = mapped_column(sql.JSON, default=None, nullable=True)
+
+    @classmethod
+    def get_program_states(
+        cls, job_id: int, program_id: int, for_update: bool = False
+    ) -> Sequence["TransientJobStateDataclass"]:
+        """Get the transient states of a program of a job that do not belong to a circuit fragment.
+
+        If ``for_update`` is True, the states are locked until the end of the transaction.
+        """
+        q = select(cls).where(
+            cls.job_id == job_id, cls.program_id == program_id, cls.circuit_fragment_id == None  # noqa: E711
+        )
+        if for_update:
+            q = q.with_for_update().execution_options(populate_existing=True)
+        return DB.session.execute(q).scalars().all()
+
+    @classmethod
+    def get_fragment_states(cls, job_id: int, program_id: int) -> Sequence["TransientJobStateDataclass"]:
+        """Get the transient states of all circuit fragments of a program of a job."""
+        q = select(cls).where(
+            cls.job_id == job_id, cls.program_id == program_id, cls.circuit_fragment_id != None  # noqa: E711
+        )
+        return DB.session.execute(q).scalars().all()
+
+    @classmethod
+    def delete_of_inactive_jobs(cls) -> int:
+        """Delete the transient state of all finished, cancelled or errored (and deleted) jobs in bulk.
+
+        Returns the number of deleted rows.
+        """
+        job = job_model.JobDataclass
+        active_jobs = select(job.id).where(
+            job.state.in_((JobState.READY.value, JobState.RUNNING.value, JobState.BLOCKED.value))
+        )
+        q = delete(cls).where(cls.job_id.not_in(active_jobs)).execution_options(synchronize_session=False)
+        return DB.session.execute(q).rowcount
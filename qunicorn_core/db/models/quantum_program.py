@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import ForeignKey, Select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -36,6 +36,13 @@ class QuantumProgramDataclass(DbModel):
         python_file_metadata (str|None): Part of experimental feature: metadata for the python_file.
         python_file_options (str, optional): Part of experimental feature: options for the python_file.
         python_file_input (str, optional): Part of experimental feature: inputs for the python_file.
+        num_qubits (int, optional): The number of qubits used by the quantum circuit. (extracted at deployment time)
+        num_clbits (int, optional): The number of classical bits used by the quantum circuit.
+        classical_registers (list, optional): Name and size of the classical registers in declaration order.
+        depth (int, optional): An estimate of the depth of the quantum circuit.
+        gate_counts (dict, optional): An estimate of how often each gate is used in the quantum circuit.
+        translation_errors (dict, optional): The errors of the translations that failed when the program was
+            pre-translated, keyed by the target format. (None if the program was not pre-translated)
     """
 
     # non-default arguments
@@ -64,6 +71,14 @@ class QuantumProgramDataclass(DbModel):
     python_file_options: Mapped[Optional[str]] = mapped_column(sql.String(500), default=None, nullable=True)
     python_file_inputs: Mapped[Optional[str]] = mapped_column(sql.String(500), default=None, nullable=True)
 
+    # circuit metadata
+    num_qubits: Mapped[Optional[int]] = mapped_column(sql.INTEGER(), default=None, nullable=True)
+    num_clbits: Mapped[Optional[int]] = mapped_column(sql.INTEGER(), default=None, nullable=True)
+    classical_registers: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(sql.JSON, default=None, nullable=True)
+    depth: Mapped[Optional[int]] = mapped_column(sql.INTEGER(), default=None, nullable=True)
+    gate_counts: Mapped[Optional[Dict[str, int]]] = mapped_column(sql.JSON, default=None, nullable=True)
+    translation_errors: Mapped[Optional[Dict[str, str]]] = mapped_column(sql.JSON, default=None, nullable=True)
+
     @classmethod
     def apply_authentication_filter(cls, query: Select[T], user_id: Optional[str]) -> Select[T]:
         query = query.join(deployment_model.DeploymentDataclass)
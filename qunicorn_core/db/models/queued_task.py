@@ -0,0 +1,105 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import and_, delete, func, or_, select, update
+from sqlalchemy.sql import sqltypes as sql
+
+from .db_model import DbModel
+from ..db import DB, REGISTRY
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+
+
+@REGISTRY.mapped_as_dataclass
+class QueuedTaskDataclass(DbModel):
+    """Dataclass for storing the background tasks of the in-process execution backend
+
+    Attributes:
+        id (int): The ID of the task. (set by the database)
+        task (str): The import path of the task function, e.g. "qunicorn_core.core.job_manager_service.run_job".
+        arguments (dict): The positional ("args") and keyword ("kwargs") arguments of the task.
+        state (str, optional): QUEUED until a worker claims the task, then RUNNING until the task is done.
+        attempts (int, optional): How often the task was retried.
+        worker (str, optional): The process that runs the task.
+        not_before (datetime, optional): The task is not executed before this moment, used for retries.
+        locked_until (datetime, optional): The worker renews this lease while running the task, the task is
+            executed again if the lease expires (e.g. because the worker was stopped).
+        created_at (datetime, optional): The moment the task was submitted.
+    """
+
+    # non-default arguments
+    id: Mapped[int] = mapped_column(sql.INTEGER(), primary_key=True, autoincrement=True, init=False)
+    task: Mapped[str] = mapped_column(sql.String(255))
+    arguments: Mapped[Dict[str, Any]] = mapped_column(sql.JSON)
+    # default arguments
+    state: Mapped[str] = mapped_column(sql.String(10), default=QUEUED, index=True)
+    attempts: Mapped[int] = mapped_column(sql.INTEGER(), default=0)
+    worker: Mapped[Optional[str]] = mapped_column(sql.String(100), nullable=True, default=None)
+    not_before: Mapped[datetime] = mapped_column(
+        sql.TIMESTAMP(timezone=True), default_factory=lambda: datetime.now(timezone.utc)
+    )
+    locked_until: Mapped[Optional[datetime]] = mapped_column(sql.TIMESTAMP(timezone=True), nullable=True, default=None)
+    created_at: Mapped[datetime] = mapped_column(
+        sql.TIMESTAMP(timezone=True), default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    @classmethod
+    def _is_due(cls, now: datetime):
+        """Queued tasks that may run now and running tasks whose worker stopped renewing the lease"""
+        return or_(
+            and_(cls.state == QUEUED, cls.not_before <= now),
+            and_(cls.state == RUNNING, cls.locked_until < now),
+        )
+
+    @classmethod
+    def get_next_due(cls, now: datetime) -> Optional["QueuedTaskDataclass"]:
+        q = select(cls).where(cls._is_due(now)).order_by(cls.not_before, cls.id).limit(1)
+        return DB.session.execute(q).scalar_one_or_none()
+
+    @classmethod
+    def get_next_due_time(cls) -> Optional[datetime]:
+        """Get the moment the next queued task or the next lease of a running task is due."""
+        q = select(func.min(cls.not_before)).where(cls.state == QUEUED)
+        next_queued = DB.session.execute(q).scalar_one_or_none()
+        q = select(func.min(cls.locked_until)).where(cls.state == RUNNING)
+        next_expired = DB.session.execute(q).scalar_one_or_none()
+        due_times = [due for due in (next_queued, next_expired) if due is not None]
+        return min(due_times) if due_times else None
+
+    @classmethod
+    def claim(cls, id_: int, worker: str, now: datetime, locked_until: datetime) -> bool:
+        """Atomically mark the task as running in the worker, returns False if another worker was faster."""
+        q = (
+            update(cls)
+            .where(cls.id == id_, cls._is_due(now))
+            .values(state=RUNNING, worker=worker, locked_until=locked_until)
+            .execution_options(synchronize_session=False)  # sqlite returns naive datetimes
+        )
+        return DB.session.execute(q).rowcount == 1
+
+    @classmethod
+    def renew_leases(cls, worker: str, locked_until: datetime):
+        """Renew the leases of all tasks running in the worker."""
+        q = update(cls).where(cls.state == RUNNING, cls.worker == worker).values(locked_until=locked_until)
+        DB.session.execute(q.execution_options(synchronize_session=False))
+
+    @classmethod
+    def delete_queued(cls, id_: int) -> bool:
+        """Delete the task if it has not been started yet."""
+        return DB.session.execute(delete(cls).where(cls.id == id_, cls.state == QUEUED)).rowcount == 1
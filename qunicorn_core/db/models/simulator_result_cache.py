@@ -0,0 +1,43 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import sqltypes as sql
+
+from .cache_entry import CacheEntryModel, cache_key_column, timestamp_column
+from ..db import REGISTRY
+
+
+@REGISTRY.mapped_as_dataclass
+class SimulatorResultCacheDataclass(CacheEntryModel):
+    """Dataclass for storing cached results of seeded runs on local simulators
+
+    Attributes:
+        id (int): The ID of the cache entry. (set by the database)
+        cache_key (str): Hash of the executed circuit and all run parameters that influence the result.
+        results (List[dict]): The serialized results of the run.
+        created_at (datetime, optional): The moment the entry was created, used for expiring entries.
+        last_used_at (datetime, optional): The moment the entry was last used, used for evicting entries.
+    """
+
+    # non-default arguments
+    id: Mapped[int] = mapped_column(sql.INTEGER(), primary_key=True, autoincrement=True, init=False)
+    cache_key: Mapped[str] = cache_key_column()
+    results: Mapped[List[Dict[str, Any]]] = mapped_column(sql.JSON)
+    # default arguments
+    created_at: Mapped[datetime] = timestamp_column()
+    last_used_at: Mapped[datetime] = timestamp_column()
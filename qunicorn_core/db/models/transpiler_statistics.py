@@ -0,0 +1,63 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import sqltypes as sql
+
+from .cache_entry import timestamp_column
+from .db_model import DbModel
+from ..db import DB, REGISTRY
+
+
+@REGISTRY.mapped_as_dataclass
+class TranspilerStatisticsDataclass(DbModel):
+    """Dataclass for storing the transpilation durations measured by a single process
+
+    Every process stores its own statistics, they are merged when they are read.
+
+    Attributes:
+        id (int): The ID of the statistics. (set by the database)
+        process (str): The host and the process id of the process that measured the durations.
+        transpiler (str): The class name of the transpiler.
+        source (str): The source format of the transpiler.
+        target (str): The target format of the transpiler.
+        cost (int): The static cost of the transpiler.
+        unsafe (bool): If the transpiler may execute unsafe code.
+        statistics (dict): The serialized DurationStatistics of the transpiler.
+        updated_at (datetime, optional): The moment the process last stored its statistics.
+    """
+
+    __table_args__ = (UniqueConstraint("process", "transpiler", name="uq_TranspilerStatistics_process_transpiler"),)
+
+    # non-default arguments
+    id: Mapped[int] = mapped_column(sql.INTEGER(), primary_key=True, autoincrement=True, init=False)
+    process: Mapped[str] = mapped_column(sql.String(100))
+    transpiler: Mapped[str] = mapped_column(sql.String(100))
+    source: Mapped[str] = mapped_column(sql.String(50))
+    target: Mapped[str] = mapped_column(sql.String(50))
+    cost: Mapped[int] = mapped_column(sql.INTEGER())
+    unsafe: Mapped[bool] = mapped_column(sql.BOOLEAN)
+    statistics: Mapped[Dict[str, Any]] = mapped_column(sql.JSON)
+    # default arguments
+    updated_at: Mapped[datetime] = timestamp_column()
+
+    @classmethod
+    def delete_stale(cls, updated_before: datetime):
+        """Delete the statistics of processes that did not store their statistics since the given moment."""
+        DB.session.execute(delete(cls).where(cls.updated_at < updated_before))
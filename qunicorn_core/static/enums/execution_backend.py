@@ -0,0 +1,29 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import StrEnum
+
+
+class ExecutionBackend(StrEnum):
+    """Enum to save the different backends executing the jobs (set with the EXECUTION_BACKEND env variable)
+
+    Values:
+        SYNCHRONOUS: Jobs are executed in the request that submits them
+        CELERY: Jobs are executed by celery workers (requires a broker like redis)
+        IN_PROCESS: Jobs are executed by threads of the API processes, the queue is stored in the database
+    """
+
+    SYNCHRONOUS = "SYNCHRONOUS"
+    CELERY = "CELERY"
+    IN_PROCESS = "IN_PROCESS"
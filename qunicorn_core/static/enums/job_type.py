@@ -22,11 +22,13 @@ class JobType(StrEnum):
         RUNNER: Normal execution of a job
         SAMPLER: Samples multiple quantum programs
         ESTIMATOR: Estimates multiple quantum programs
+        VARIATIONAL: Optimizes the parameters of quantum programs in a hybrid loop executed by the worker
     """
 
     RUNNER = "RUNNER"
     SAMPLER = "SAMPLER"
     ESTIMATOR = "ESTIMATOR"
+    VARIATIONAL = "VARIATIONAL"
     """IBM RUN and IBM UPLOAD are currently Experimental Job Types, they should be used with caution"""
     IBM_RUNNER = "IBM_RUNNER"
     IBM_UPLOAD = "IBM_UPLOAD"
@@ -0,0 +1,31 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import StrEnum
+
+
+class OptimizerMethod(StrEnum):
+    """Enum of the classical optimizers available for variational jobs
+
+    Values:
+        COBYLA: Constrained optimization by linear approximation (scipy)
+        NELDER_MEAD: Downhill simplex method (scipy)
+        POWELL: Powell's conjugate direction method (scipy)
+        SPSA: Simultaneous perturbation stochastic approximation, robust against shot noise
+    """
+
+    COBYLA = "COBYLA"
+    NELDER_MEAD = "NELDER_MEAD"
+    POWELL = "POWELL"
+    SPSA = "SPSA"
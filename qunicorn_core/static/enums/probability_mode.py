@@ -0,0 +1,29 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import StrEnum
+
+
+class ProbabilityMode(StrEnum):
+    """Enum of the ways the probabilities of RUNNER jobs are determined
+
+    Values:
+        SAMPLED: Probabilities are the relative frequencies of the sampled counts
+        EXACT: Probabilities are calculated from the final state of a local simulation, no counts are sampled
+        EXACT_WITH_COUNTS: Exact probabilities as with EXACT, the counts are sampled in addition
+    """
+
+    SAMPLED = "SAMPLED"
+    EXACT = "EXACT"
+    EXACT_WITH_COUNTS = "EXACT_WITH_COUNTS"
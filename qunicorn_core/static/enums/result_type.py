@@ -24,6 +24,7 @@ class ResultType(StrEnum):
         COUNTS: Classical result of a RUNNER
         QUASI_DIST: Classical result of an ESTIMATOR
         VALUE_AND_VARIANCE: Classical result of a SAMPLER
+        OPTIMIZATION_RESULT: Optimal parameters found by a VARIATIONAL job
         ERROR: Classical result of an ERROR
         UPLOAD_SUCCESSFUL: Classical result of an UPLOAD (Experimental)
     """
@@ -32,6 +33,7 @@ class ResultType(StrEnum):
     PROBABILITIES = "PROBABILITIES"
     QUASI_DIST = "QUASI_DIST"
     VALUE_AND_VARIANCE = "VALUE_AND_VARIANCE"
+    OPTIMIZATION_RESULT = "OPTIMIZATION_RESULT"
     ERROR = "ERROR"
     UPLOAD_SUCCESSFUL = "UPLOAD_SUCCESSFUL"
 
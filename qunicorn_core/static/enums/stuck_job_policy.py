@@ -0,0 +1,27 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import StrEnum
+
+
+class StuckJobPolicy(StrEnum):
+    """Enum of the ways the watchdog handles running jobs whose worker stopped (set with STUCK_JOB_POLICY)
+
+    Values:
+        REQUEUE: Jobs on local simulators are executed again (at most STUCK_JOB_MAX_REQUEUES times), other jobs fail
+        ERROR: The jobs fail with an error result
+    """
+
+    REQUEUE = "REQUEUE"
+    ERROR = "ERROR"
@@ -30,3 +30,10 @@ class QunicornError(HTTPException):
         super().__init__(msg)
         self.code = status_code  # set status code
         self.data = {"message": msg}  # for compatibility with flask smorest
+
+
+class JobCanceledError(QunicornError):
+    """Raised in a worker to stop the execution of a job that was canceled while it was running"""
+
+    def __init__(self, msg="The job was canceled.", status_code: int = HTTPStatus.CONFLICT):
+        super().__init__(msg, status_code)
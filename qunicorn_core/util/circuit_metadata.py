@@ -0,0 +1,247 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Extract metadata of circuits without parsing them into a circuit object.
+
+The extractor only looks at the statements of OpenQASM 2/3 programs and at the headers of QPY files.
+It is meant for quick decisions (e.g., if a circuit needs to be cut or fits onto a device) where loading the full
+circuit would be too expensive. Circuit depth and gate counts of OpenQASM programs are estimates, as gate definitions
+are not expanded and loops are not unrolled.
+"""
+
+import re
+import struct
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+__all__ = ["CircuitMetadata", "extract_circuit_metadata"]
+
+
+class CircuitMetadata(NamedTuple):
+    num_qubits: int
+    num_clbits: int
+    registers: Optional[List[Dict[str, int | str]]]  # classical registers in declaration order
+    depth: Optional[int]
+    gate_counts: Optional[Dict[str, int]]
+
+
+Qubit = Tuple[str, int]
+
+
+_COMMENTS = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_CONDITION = re.compile(r"^if\s*\((?:[^()]|\([^()]*\))*\)\s*")
+_QASM2_REGISTER = re.compile(r"^(qreg|creg)\s+(\w+)\s*\[\s*(\d+)\s*\]$")
+_QASM3_REGISTER = re.compile(r"^(qubit|bit)\s*(?:\[\s*(\d+)\s*\])?\s+(\w+)\s*(?:=\s*(.*))?$", re.DOTALL)
+_MEASURE_ARROW = re.compile(r"^measure\s+(.+?)(?:\s*->\s*.+)?$", re.DOTALL)
+_MEASURE_ASSIGN = re.compile(r"^.+?=\s*measure\s+(.+)$", re.DOTALL)
+_GATE_CALL = re.compile(
+    r"^((?:(?:inv|pow|ctrl|negctrl)\s*(?:\([^)]*\))?\s*@\s*)*)([A-Za-z_]\w*)\s*(?:\((?:[^()]|\([^()]*\))*\))?\s*(.*)$",
+    re.DOTALL,
+)
+_OPERAND = re.compile(r"^(\$\d+|\w+)\s*(?:\[\s*([^\]]+?)\s*\])?$")
+
+# statements that start with one of these keywords do not apply gates
+_IGNORED_KEYWORDS = {
+    "OPENQASM",
+    "include",
+    "input",
+    "output",
+    "const",
+    "let",
+    "int",
+    "uint",
+    "float",
+    "angle",
+    "bool",
+    "complex",
+    "duration",
+    "stretch",
+    "array",
+    "extern",
+    "return",
+    "break",
+    "continue",
+    "end",
+    "defcalgrammar",
+    "cal",
+    "defcal",
+    "pragma",
+    "opaque",
+    "gphase",
+    "delay",
+}
+# blocks that contain definitions instead of instructions of the circuit
+_DEFINITION_BLOCKS = {"gate", "def", "defcal", "cal", "extern"}
+
+
+def extract_circuit_metadata(
+    circuit: str | bytes | None, assembler_language: Optional[str]
+) -> Optional[CircuitMetadata]:
+    """Extract the metadata of a circuit, returns None if the format is not supported or the circuit is invalid."""
+    try:
+        if assembler_language in ("QASM2", "QASM3") and isinstance(circuit, str):
+            return _extract_qasm_metadata(circuit)
+        if assembler_language == "QPY" and isinstance(circuit, bytes):
+            return _extract_qpy_metadata(circuit)
+    except (ValueError, IndexError, struct.error):
+        return None
+    return None
+
+
+def _statements(source: str) -> Iterator[str]:
+    """Yield all statements of the OpenQASM program that are not part of gate or subroutine definitions."""
+    source = _COMMENTS.sub("", source)
+    blocks: List[bool] = []  # True for blocks containing definitions
+    current: List[str] = []
+
+    for char in source:
+        if char == "{":
+            header = "".join(current).strip()
+            current = []
+            keyword = header.split(maxsplit=1)[0] if header else ""
+            blocks.append(keyword in _DEFINITION_BLOCKS or any(blocks))
+        elif char == "}":
+            current = []
+            if blocks:
+                blocks.pop()
+        elif char == ";":
+            statement = "".join(current).strip()
+            current = []
+            if statement and not any(blocks):
+                yield statement
+        else:
+            current.append(char)
+
+
+def _extract_qasm_metadata(source: str) -> CircuitMetadata:  # noqa: C901
+    quantum_registers: Dict[str, int] = {}
+    physical_qubits: set[int] = set()
+    classical_registers: Dict[str, int] = {}
+    qubit_depth: Dict[Qubit, int] = {}
+    gate_counts: Dict[str, int] = {}
+
+    def resolve(operand: str) -> List[Qubit]:
+        match = _OPERAND.match(operand.strip())
+        if match is None:
+            raise ValueError(f"Unsupported operand '{operand}'")
+        name, index = match.groups()
+        if name.startswith("$"):
+            physical_qubits.add(int(name[1:]))
+            return [("$", int(name[1:]))]
+        if name not in quantum_registers:
+            raise ValueError(f"Unknown quantum register '{name}'")
+        if index is not None:
+            # indices computed at runtime (e.g., loop variables) refer to an unknown qubit of the register
+            return [(name, int(index) if index.isdigit() else -1)]
+        return [(name, i) for i in range(quantum_registers[name])]
+
+    def apply(name: str, operands: List[str]):
+        resolved = [resolve(o) for o in operands if o.strip()]
+        broadcast = max((len(qubits) for qubits in resolved), default=0)
+        if broadcast == 0:
+            return
+        for i in range(broadcast):
+            qubits = [q[i] if len(q) > 1 else q[0] for q in resolved]
+            gate_counts[name] = gate_counts.get(name, 0) + 1
+            layer = max(qubit_depth.get(q, 0) for q in qubits) + 1
+            for q in qubits:
+                qubit_depth[q] = layer
+
+    for statement in _statements(source):
+        statement = _CONDITION.sub("", statement)
+        keyword = statement.split(maxsplit=1)[0]
+
+        if keyword in _IGNORED_KEYWORDS:
+            continue
+        if match := _QASM2_REGISTER.match(statement):
+            kind, name, size = match.groups()
+            registers = quantum_registers if kind == "qreg" else classical_registers
+            registers[name] = int(size)
+            continue
+        if match := _QASM3_REGISTER.match(statement):
+            kind, size, name, initializer = match.groups()
+            registers = quantum_registers if kind == "qubit" else classical_registers
+            registers[name] = int(size) if size is not None else 1
+            if initializer and (measurement := _MEASURE_ARROW.match(initializer)):
+                apply("measure", [measurement.group(1)])
+            continue
+        if match := _MEASURE_ASSIGN.match(statement) or _MEASURE_ARROW.match(statement):
+            apply("measure", [match.group(1)])
+            continue
+        if "=" in statement:
+            continue  # classical assignment
+        if match := _GATE_CALL.match(statement):
+            modifiers, name, operands = match.groups()
+            if modifiers:
+                name = " @ ".join(m.strip() for m in modifiers.split("@") if m.strip()) + " @ " + name
+            if name == "barrier":
+                # a barrier is a single instruction on all of its qubits and does not add to the depth
+                for operand in operands.split(","):
+                    if operand.strip():
+                        resolve(operand)
+                gate_counts[name] = gate_counts.get(name, 0) + 1
+                continue
+            apply(name, operands.split(","))
+            continue
+        raise ValueError(f"Unsupported statement '{statement}'")
+
+    # physical qubits are addressed by their index on the device, so all qubits up to the highest index are needed
+    num_qubits = sum(quantum_registers.values()) + max(physical_qubits, default=-1) + 1
+    if num_qubits == 0:
+        raise ValueError("The program does not declare any qubits")
+    return CircuitMetadata(
+        num_qubits=num_qubits,
+        num_clbits=sum(classical_registers.values()),
+        registers=[{"name": name, "size": size} for name, size in classical_registers.items()],
+        depth=max(qubit_depth.values(), default=0),
+        gate_counts=gate_counts,
+    )
+
+
+def _extract_qpy_metadata(data: bytes) -> CircuitMetadata:
+    from qiskit.qpy import formats as qpy_formats  # imported on first use, as importing qiskit is slow
+
+    offset = 0
+
+    def unpack(pack: str):
+        nonlocal offset
+        values = struct.unpack_from(pack, data, offset)
+        offset += struct.calcsize(pack)
+        return values
+
+    header = qpy_formats.FILE_HEADER._make(unpack(qpy_formats.FILE_HEADER_PACK))
+    if header.preface != b"QISKIT":
+        raise ValueError("Not a QPY file")
+    if header.num_programs != 1:
+        raise ValueError("Only QPY files with a single circuit are supported")
+    if header.qpy_version >= 10:
+        offset += 1  # symbolic encoding
+    if header.qpy_version >= 5:
+        (type_key,) = unpack("!c")
+        if type_key != b"q":
+            raise ValueError("QPY file does not contain a circuit")
+
+    if header.qpy_version >= 12:
+        circuit_header = qpy_formats.CIRCUIT_HEADER_V12._make(unpack(qpy_formats.CIRCUIT_HEADER_V12_PACK))
+    elif header.qpy_version >= 2:
+        circuit_header = qpy_formats.CIRCUIT_HEADER_V2._make(unpack(qpy_formats.CIRCUIT_HEADER_V2_PACK))
+    else:
+        circuit_header = qpy_formats.CIRCUIT_HEADER._make(unpack(qpy_formats.CIRCUIT_HEADER_PACK))
+
+    return CircuitMetadata(
+        num_qubits=circuit_header.num_qubits,
+        num_clbits=circuit_header.num_clbits,
+        registers=None,
+        depth=None,
+        gate_counts=None,
+    )
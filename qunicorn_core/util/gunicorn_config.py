@@ -0,0 +1,77 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Gunicorn server hooks (use with ``--config python:qunicorn_core.util.gunicorn_config``).
+
+With ``--preload`` the flask app is created once in the gunicorn master and the workers are forked from it. The
+workers then share the memory pages of the imported modules and the app with the master as long as these pages are
+not written to. The hooks keep as many pages shared as possible:
+
+* the garbage collector is disabled in the master and all objects are frozen before forking, so that garbage
+  collection in the workers does not write to (and thus copy) the pages of the shared objects
+* database connections opened in the master are not shared with the workers
+
+The threads of the in-process execution backend are started in every worker once it loaded the app, so that queued
+jobs are executed without waiting for the first request of the worker.
+
+Set ``GUNICORN_PRELOAD_PLUGINS=True`` to also import all pilots and transpilers (and their quantum SDKs) in the
+master, e.g., if the API executes jobs synchronously. Otherwise, every worker imports them on first use.
+"""
+
+import gc
+from os import environ
+
+from qunicorn_core.core.pilotmanager.pilot_manager import get_pilots
+from qunicorn_core.core.task_executor import get_in_process_executor
+from qunicorn_core.core.transpiler import load_transpiler_plugins
+from qunicorn_core.db.db import DB
+from qunicorn_core.util.memory_usage import get_memory_usage
+
+
+def on_starting(server):
+    # avoid freeing objects (i.e., leaving holes in the shared pages that new objects are allocated in later)
+    gc.disable()
+
+
+def when_ready(server):
+    if server.cfg.preload_app and environ.get("GUNICORN_PRELOAD_PLUGINS", "False") == "True":
+        get_pilots()
+        load_transpiler_plugins()
+
+
+def pre_fork(server, worker):
+    # move all objects to the permanent generation, they are ignored by the garbage collector from now on
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
+    if server.cfg.preload_app:
+        # the connection pool of the master must not be used by the workers, close=False replaces the pool without
+        # closing the connections of the master (see "Using Connection Pools with Multiprocessing" in the sqlalchemy
+        # documentation)
+        with server.app.wsgi().app_context():
+            for engine in DB.engines.values():
+                engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    # threads must not be started in the master, they would not survive forking the workers
+    with worker.app.wsgi().app_context():
+        get_in_process_executor()
+    usage = get_memory_usage(worker.pid)
+    if usage is not None:
+        worker.log.info(
+            f"Worker {worker.pid} memory: {usage.uss / 2**20:.1f} MB unique, {usage.shared / 2**20:.1f} MB shared"
+        )
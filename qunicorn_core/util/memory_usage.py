@@ -0,0 +1,84 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory usage of processes (Linux only), e.g. to see how much memory forked gunicorn workers share."""
+
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+
+class MemoryUsage(NamedTuple):
+    """Memory usage of a process in bytes.
+
+    rss: resident memory, including memory shared with other processes
+    pss: proportional memory, shared memory is split evenly between the processes sharing it
+    uss: unique memory, only used by this process (the memory freed if the process exits)
+    """
+
+    pid: int
+    rss: int
+    pss: int
+    uss: int
+
+    @property
+    def shared(self) -> int:
+        return self.rss - self.uss
+
+
+def get_memory_usage(pid: int) -> Optional[MemoryUsage]:
+    """Get the memory usage of the process or None if it cannot be read."""
+    try:
+        lines = Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()
+    except OSError:
+        return None
+    values = {}
+    for line in lines[1:]:
+        key, _, value = line.partition(":")
+        values[key] = int(value.split()[0]) * 1024  # values are in kB
+    return MemoryUsage(
+        pid=pid,
+        rss=values.get("Rss", 0),
+        pss=values.get("Pss", 0),
+        uss=values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+    )
+
+
+def get_child_pids(pid: int) -> List[int]:
+    """Get the ids of the direct child processes of the process."""
+    children = []
+    for task in Path(f"/proc/{pid}/task").glob("*"):
+        try:
+            children += [int(child) for child in (task / "children").read_text().split()]
+        except OSError:
+            continue  # thread exited in the meantime
+    return sorted(children)
+
+
+def format_memory_report(master_pid: int) -> str:
+    """Format the memory usage of a (gunicorn) master process and its workers as a table in MB."""
+    rows = ["role       pid      rss      pss      uss   shared"]
+    workers = []
+    for role, pid in [("master", master_pid), *[("worker", p) for p in get_child_pids(master_pid)]]:
+        usage = get_memory_usage(pid)
+        if usage is None:
+            continue
+        if role == "worker":
+            workers.append(usage)
+        values = " ".join(f"{value / 2**20:>8.1f}" for value in (usage.rss, usage.pss, usage.uss, usage.shared))
+        rows.append(f"{role:<6} {pid:>7} {values}")
+    if workers:
+        unique = sum(w.uss for w in workers) / len(workers) / 2**20
+        total_pss = sum(w.pss for w in workers) / 2**20
+        rows.append(f"{len(workers)} workers: {unique:.1f} MB unique memory each, {total_pss:.1f} MB pss in total")
+    return "\n".join(rows)
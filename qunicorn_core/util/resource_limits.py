@@ -0,0 +1,36 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resource limits of the processes executing user code or simulations (Linux only).
+
+This module only uses the standard library, as it is also loaded by the sandbox worker that runs without qunicorn_core.
+"""
+
+import resource
+
+
+def limit_resources(memory_limit: int, cpu_limit: int = 0):
+    """Limit the additional (virtual) memory (in MB) and the total cpu time (in seconds) of this process.
+
+    The memory already used by the process (e.g., by the imported libraries) does not count towards the limit.
+    A limit of 0 or less disables the limit.
+    """
+    if memory_limit > 0:
+        with open("/proc/self/statm") as statm:
+            used = int(statm.read().split()[0]) * resource.getpagesize()
+        limit = used + memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if cpu_limit > 0:
+        used_cpu = int(resource.getrusage(resource.RUSAGE_SELF).ru_utime) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (used_cpu + cpu_limit, used_cpu + cpu_limit))
@@ -13,17 +13,24 @@
 # limitations under the License.
 import os
 
-from qiskit import QuantumCircuit
-from qiskit.qasm2 import dumps as dumps2
+from qunicorn_core.static.enums.execution_backend import ExecutionBackend
 
 
 def get_default_qasm2_string(hadamard_amount: int = 1) -> str:
-    qc = QuantumCircuit(2)
-    for _ in range(hadamard_amount):
-        qc.h(0)
-    qc.cx(0, 1)
-    qc.measure_all()
-    return dumps2(qc)
+    # written out instead of exporting a qiskit circuit, as this is used while the API is created
+    return "\n".join(
+        [
+            "OPENQASM 2.0;",
+            'include "qelib1.inc";',
+            "qreg q[2];",
+            "creg meas[2];",
+            *["h q[0];"] * hadamard_amount,
+            "cx q[0],q[1];",
+            "barrier q[0],q[1];",
+            "measure q[0] -> meas[0];",
+            "measure q[1] -> meas[1];",
+        ]
+    )
 
 
 def calculate_probabilities(counts: dict) -> dict:
@@ -44,5 +51,15 @@ def is_running_in_docker() -> bool:
     return os.environ.get("RUNNING_IN_DOCKER", "") == "True"
 
 
+def get_execution_backend() -> ExecutionBackend:
+    """Get the configured execution backend, EXECUTE_CELERY_TASK_ASYNCHRONOUS=True selects celery if unset"""
+    backend = os.environ.get("EXECUTION_BACKEND")
+    if backend:
+        return ExecutionBackend(backend.upper())
+    if os.environ.get("EXECUTE_CELERY_TASK_ASYNCHRONOUS") == "True":
+        return ExecutionBackend.CELERY
+    return ExecutionBackend.SYNCHRONOUS
+
+
 def is_running_asynchronously() -> bool:
-    return os.environ.get("EXECUTE_CELERY_TASK_ASYNCHRONOUS") == "True"
+    return get_execution_backend() != ExecutionBackend.SYNCHRONOUS
@@ -332,7 +332,7 @@ def purge_task_queues(c):
 
 
 @task
-def start_gunicorn(c, workers=1, log_level="info", docker=False):
+def start_gunicorn(c, workers=1, log_level="info", docker=False, preload=False):
     """Start the gunicorn server.
 
     This task is intended to be run in docker.
@@ -344,6 +344,9 @@ def start_gunicorn(c, workers=1, log_level="info", docker=False):
         workers (int, optional): The number of parallel workers (set this to around <nr_of_cores>*2 + 1). Defaults to 1.
         log_level (str, optional): the log level to output in console. Defaults to "info".
         docker (bool, optional): set this to True if running inside of docker. Defaults to false.
+        preload (bool, optional): create the app once in the gunicorn master and fork the workers from it, so that
+        the workers share most of their memory (can also be set with the GUNICORN_PRELOAD environment variable).
+        Defaults to False.
     """
     server_port: str = environ.get("SERVER_PORT", "8080")
     assert match(
@@ -364,8 +367,12 @@ def start_gunicorn(c, workers=1, log_level="info", docker=False):
         "--log-level",
         log_level.lower(),
         "--error-logfile=-",
-        f"{MODULE_NAME}:create_app()",
+        "--config",
+        f"python:{MODULE_NAME}.util.gunicorn_config",
     ]
+    if preload or environ.get("GUNICORN_PRELOAD", "False") == "True":
+        cmd.append("--preload")
+    cmd.append(f"{MODULE_NAME}:create_app()")
 
     print(join(cmd))
 
@@ -373,6 +380,77 @@ def start_gunicorn(c, workers=1, log_level="info", docker=False):
     replace_process(cmd[0], cmd, environ)
 
 
+@task
+def gunicorn_memory(c, pid=0):
+    """Print the memory used by the gunicorn master and each of its workers.
+
+    Args:
+        c (Context): task context
+        pid (int, optional): the process id of the gunicorn master. Defaults to the first gunicorn master serving
+        qunicorn that can be found.
+    """
+    from qunicorn_core.util.memory_usage import format_memory_report
+
+    if not pid:
+        masters = []
+        for cmdline in Path("/proc").glob("[0-9]*/cmdline"):
+            try:
+                args = cmdline.read_bytes().split(b"\0")
+                parent = int(cmdline.with_name("stat").read_text().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            if b"gunicorn" in b" ".join(args) and f"{MODULE_NAME}:create_app()".encode() in args:
+                masters.append((int(cmdline.parent.name), parent))
+        pids = {p for p, _ in masters}
+        pid = next((p for p, parent in sorted(masters) if parent not in pids), 0)
+        if not pid:
+            raise QunicornError("No running gunicorn master found, please specify the pid.")
+    print(format_memory_report(pid))
+
+
+# measures the startup of a fresh interpreter, printing "<seconds> <max rss in MB> <imported quantum SDKs>"
+STARTUP_BENCHMARK = """
+import resource, sys, time
+start = time.perf_counter()
+from qunicorn_core import create_app
+create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:", "OPENAPI_VERSION": "3.0.2", "SECRET_KEY": "benchmark"})
+if sys.argv[1] == "True":
+    from qunicorn_core.core.pilotmanager.pilot_manager import get_pilots
+    from qunicorn_core.core.transpiler import load_transpiler_plugins
+    get_pilots()
+    load_transpiler_plugins()
+duration = time.perf_counter() - start
+sdks = [m for m in ("qiskit", "qiskit_aer", "qiskit_ibm_runtime", "braket", "pyquil", "qrisp") if m in sys.modules]
+print(duration, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, ",".join(sdks) or "-")
+"""
+
+
+@task
+def benchmark_startup(c, runs=5, plugins=False):
+    """Measure the time and memory needed to import qunicorn and create the flask app.
+
+    Every run uses a fresh interpreter. Pilots and transpilers (and their quantum SDKs) are only imported on first
+    use, so the API should start without importing any quantum SDK.
+
+    Args:
+        c (Context): task context
+        runs (int, optional): the number of measurements. Defaults to 5.
+        plugins (bool, optional): also import all pilots and transpilers like a celery worker. Defaults to False.
+    """
+    c = cast(Context, c)
+    durations: List[float] = []
+    memory: List[float] = []
+    sdks = "-"
+    for _ in range(runs):
+        result: Result = c.run(join(["python", "-c", STARTUP_BENCHMARK, str(plugins)]), hide=True)
+        duration, rss, sdks = result.stdout.split()[-3:]
+        durations.append(float(duration))
+        memory.append(float(rss))
+    durations.sort()
+    print(f"create_app() over {runs} runs: min {durations[0]:.3f}s, median {durations[len(durations) // 2]:.3f}s")
+    print(f"max rss: {max(memory):.0f} MB, imported quantum SDKs: {sdks}")
+
+
 @task
 def await_db(c):
     """Docker specific task. Do not call."""
@@ -0,0 +1,112 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test selecting the simulation method and the parallelization of the aer simulator"""
+
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import aer_options_service, deployment_service, job_service, simulation_executor
+from qunicorn_core.core.aer_options_service import get_aer_options, select_simulation_method
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from tests import test_utils
+from tests.conftest import set_up_env
+
+
+def _ghz_qasm(num_qubits: int) -> str:
+    gates = "".join(f"cx q[{i}],q[{i + 1}];\n" for i in range(num_qubits - 1))
+    return (
+        f'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[{num_qubits}];\ncreg meas[{num_qubits}];\n'
+        f"h q[0];\n{gates}measure q -> meas;\n"
+    )
+
+
+def _chain(num_qubits: int, dense: bool = False) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    for i in range(num_qubits):
+        circuit.rx(0.1 * i, i)
+    pairs = [(i, j) for i in range(num_qubits) for j in range(i + 1, num_qubits)] if dense else []
+    pairs += [(i, i + 1) for i in range(num_qubits - 1)]
+    for i, j in pairs:
+        circuit.cx(i, j)
+    circuit.t(0)
+    return circuit
+
+
+def test_wide_clifford_circuits_are_simulated_with_the_stabilizer_method():
+    """Tests that Clifford circuits with more qubits than a statevector simulation supports are simulated"""
+    # GIVEN: Database Setup - a GHZ circuit with 120 qubits
+    app = set_up_env()
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {"name": "GHZ", "programs": [{"quantum_circuit": _ghz_qasm(120), "assembler_language": "QASM2"}]}
+            )
+        )
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.deployment_id = deployment.id
+
+        # WHEN: the job is executed
+        simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the circuit was simulated with the stabilizer method
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        counts = next(r for r in job.results if r.result_type == ResultType.COUNTS)
+        assert set(counts.data) <= {"0x0", hex(2**120 - 1)}
+        assert counts.meta["simulation_method"] == "stabilizer"
+
+
+def test_simulation_method_is_selected_from_the_circuits():
+    """Tests that the simulation method is selected from the gates, the width and the entanglement of the circuits"""
+    # GIVEN: a small circuit, a wide circuit with little entanglement and a wide circuit with lots of entanglement
+    small, chain, dense = _chain(5), _chain(30), _chain(24, dense=True)
+
+    # WHEN: the simulation method is selected
+    # THEN: statevector is used unless the circuit is wide and has little entanglement
+    assert select_simulation_method([small]) == "statevector"
+    assert select_simulation_method([chain]) == "matrix_product_state"
+    assert select_simulation_method([dense]) == "statevector"
+    assert select_simulation_method([small, chain]) == "matrix_product_state"
+    with patch.object(aer_options_service, "get_max_statevector_qubits", return_value=20):
+        assert select_simulation_method([dense]) == "matrix_product_state"
+
+
+def test_simulations_are_parallelized_over_the_available_cores():
+    """Tests that batches of small circuits are simulated in parallel and single circuits in parallel shots"""
+    # GIVEN: 8 cores shared by 2 simulation processes
+    app = set_up_env()
+    app.config["SIMULATION_PROCESSES"] = 2
+
+    with app.app_context(), patch.object(simulation_executor.os, "sched_getaffinity", return_value=set(range(8))):
+        # WHEN: the options are selected for a batch of circuits and for a single circuit
+        batch_options = get_aer_options([_chain(5)] * 8)
+        single_options = get_aer_options([_chain(5)])
+
+    # THEN: every simulation process uses 4 threads
+    assert batch_options == {
+        "method": "statevector",
+        "max_parallel_threads": 4,
+        "max_parallel_experiments": 4,
+        "max_parallel_shots": 1,
+    }
+    assert single_options["max_parallel_experiments"] == 1
+    assert single_options["max_parallel_shots"] == 4
@@ -0,0 +1,79 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test planning the batches of the AWS pilot and executing them on the local braket simulators"""
+
+from unittest.mock import patch
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import deployment_service, job_service
+from qunicorn_core.core.pilotmanager import aws_pilot
+from qunicorn_core.core.pilotmanager.aws_pilot import AWSPilot
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from tests import test_utils
+from tests.conftest import set_up_env
+
+BELL_CIRCUIT = "Circuit().h(0).cnot(0, 1)"
+NOISY_BELL_CIRCUIT = "Circuit().h(0).cnot(0, 1).bit_flip(0, 0.0)"
+
+
+def test_interleaved_programs_are_executed_in_one_batch_per_simulator():
+    """Tests that programs with and without noise are executed in one batch on the matching simulator each"""
+    # GIVEN: Database Setup - a deployment alternating between circuits with and without noise
+    app = set_up_env()
+    programs = [BELL_CIRCUIT, NOISY_BELL_CIRCUIT, BELL_CIRCUIT, NOISY_BELL_CIRCUIT]
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {
+                    "name": "Batches",
+                    "programs": [{"quantum_circuit": p, "assembler_language": "BRAKET-PYTHON"} for p in programs],
+                }
+            )
+        )
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        job_request_dto.deployment_id = deployment.id
+
+        # WHEN: the job is executed with two available cores
+        with (
+            patch.object(aws_pilot, "get_available_threads", return_value=2),
+            patch.object(AWSPilot, "_simulate", wraps=AWSPilot._simulate) as simulate,
+        ):
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: there is one batch per simulator, executed in parallel on both cores
+        assert sorted((len(c.args[0]), c.args[3], c.args[4]) for c in simulate.call_args_list) == [
+            (2, "braket_dm", 2),
+            (2, "braket_sv", 2),
+        ]
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        counts = [r.data for r in job.results if r.result_type == ResultType.COUNTS]
+        assert len(counts) == len(programs)
+        assert all(set(c) == {"0x0", "0x3"} and sum(c.values()) == job.shots for c in counts)
+
+
+def test_local_simulators_are_reused():
+    """Tests that the local simulators are created once per backend"""
+    # WHEN: the simulators are requested twice
+    simulators = [aws_pilot._get_local_simulator(backend) for backend in ("braket_sv", "braket_dm") * 2]
+
+    # THEN: the same simulators are returned
+    assert simulators[0] is simulators[2] and simulators[1] is simulators[3]
+    assert simulators[0] is not simulators[1]
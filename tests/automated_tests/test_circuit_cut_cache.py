@@ -0,0 +1,64 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test reusing circuit cuts"""
+
+from unittest.mock import patch
+
+from qunicorn_core.core import circuit_cutting_service
+from qunicorn_core.db.models.circuit_cut import CircuitCutDataclass
+from tests.conftest import set_up_env
+
+CUTTING_PARAMS = {
+    "circuit": "OPENQASM 2.0;",
+    "method": "automatic",
+    "max_subcircuit_width": 2,
+    "max_num_subcircuits": 2,
+    "max_cuts": 3,
+    "circuit_format": "openqasm2",
+}
+CUT_DATA = {"individual_subcircuits": ["OPENQASM 2.0;", "OPENQASM 2.0;"], "num_cuts": 1}
+
+
+def test_circuit_cut_is_reused():
+    """Tests that the same circuit with the same cutting parameters is only cut once"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        with patch.object(circuit_cutting_service, "cut_circuit", return_value=CUT_DATA) as cut_circuit:
+            # WHEN: the same circuit is cut twice
+            first_cut = circuit_cutting_service.get_or_cut_circuit(dict(CUTTING_PARAMS))
+            second_cut = circuit_cutting_service.get_or_cut_circuit(dict(CUTTING_PARAMS))
+
+        # THEN: the cutting service is only called once
+        cut_circuit.assert_called_once()
+        assert first_cut == second_cut == CUT_DATA
+        assert len(CircuitCutDataclass.get_all()) == 1
+
+
+def test_circuit_cut_with_different_parameters_is_not_reused():
+    """Tests that changing the cutting parameters results in a new cut"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        with patch.object(circuit_cutting_service, "cut_circuit", return_value=CUT_DATA) as cut_circuit:
+            # WHEN: the same circuit is cut with different parameters
+            circuit_cutting_service.get_or_cut_circuit(dict(CUTTING_PARAMS))
+            circuit_cutting_service.get_or_cut_circuit(dict(CUTTING_PARAMS, max_cuts=4))
+
+        # THEN: the cutting service is called for both cuts
+        assert cut_circuit.call_count == 2
+        assert len(CircuitCutDataclass.get_all()) == 2
@@ -0,0 +1,62 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test preparing the results of cut circuits"""
+
+import numpy as np
+
+from qunicorn_core.core.circuit_cutting_service import prepare_combined_results, prepare_results_for_combination
+from qunicorn_core.static.enums.result_type import ResultType
+
+
+def test_prepare_results_for_combination():
+    """Tests that fragment results are converted into dense probability arrays"""
+    # GIVEN: results of two fragments as counts in hex format and as probabilities in binary format
+    fragment_results = {
+        0: [
+            {
+                "result_type": ResultType.COUNTS.value,
+                "data": {"0x0": 300, "0x3": 100},
+                "meta": {"format": "hex", "registers": [{"name": "c", "size": 2}]},
+            },
+        ],
+        1: [
+            {"result_type": ResultType.ERROR.value, "data": {}, "meta": {}},
+            {"result_type": ResultType.PROBABILITIES.value, "data": {"0b10": 1.0}, "meta": {"format": "bin"}},
+        ],
+    }
+
+    # WHEN: preparing the results for the cutting service
+    prepared = prepare_results_for_combination(fragment_results, [0, 1])
+
+    # THEN: each fragment is a probability distribution over all measurements
+    assert len(prepared) == 2
+    assert np.allclose(prepared[0], [0.75, 0, 0, 0.25])
+    assert np.allclose(prepared[1], [0, 0, 1.0, 0])
+
+
+def test_prepare_combined_results():
+    """Tests that counts are sampled from the combined probabilities"""
+    # GIVEN: a combined probability distribution with a small negative reconstruction error
+    results = [0.5, -0.001, 0.0, 0.501]
+
+    # WHEN: sampling counts from the distribution
+    counts, probabilities = prepare_combined_results(results, 1000, [{"name": "output", "size": 2}])
+
+    # THEN: only valid measurements are included and all shots are accounted for
+    assert counts[2] == ResultType.COUNTS
+    assert set(counts[0].keys()) <= {"0x0", "0x3"}
+    assert sum(counts[0].values()) == 1000
+    assert probabilities[0] == {"0x0": 0.5, "0x3": 0.501}
+    assert probabilities[1]["shots"] == 1000
@@ -0,0 +1,107 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test executing the fragments of cut circuits"""
+
+from unittest.mock import patch
+
+import pytest
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import circuit_cutting_service, deployment_service, job_service
+from qunicorn_core.core.pilotmanager import base_pilot
+from qunicorn_core.core.pilotmanager.ibm_pilot import IBMPilot
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.job_state import TransientJobStateDataclass
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from tests import test_utils
+from tests.conftest import set_up_env
+
+GHZ_CIRCUIT = (
+    'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[3];\ncreg meas[3];\n'
+    "h q[0];\ncx q[0],q[1];\ncx q[1],q[2];\nmeasure q -> meas;\n"
+)
+FRAGMENT_CIRCUIT = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\ncreg meas[2];\nh q[0];\nmeasure q -> meas;\n'
+CUT_DATA = {"individual_subcircuits": [FRAGMENT_CIRCUIT, FRAGMENT_CIRCUIT]}
+COMBINED_PROBABILITIES = [0.5, 0, 0, 0, 0, 0, 0, 0.5]
+
+
+def test_cut_circuit_fragments_are_executed_and_combined():
+    """Tests that all fragments of a cut circuit are executed and their results are combined"""
+    # GIVEN: Database Setup - a job for a three qubit circuit that is cut into two qubit fragments
+    app = set_up_env()
+    app.config["CIRCUIT_CUTTING_URL"] = "http://localhost:5000"
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {"name": "Cut", "programs": [{"quantum_circuit": GHZ_CIRCUIT, "assembler_language": "QASM2"}]}
+            )
+        )
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.deployment_id = deployment.id
+        job_request_dto.cut_to_width = 2
+
+        # WHEN: the job is executed
+        with (
+            patch.object(circuit_cutting_service, "cut_circuit", return_value=CUT_DATA),
+            patch.object(base_pilot, "combine_results", return_value=COMBINED_PROBABILITIES) as combine_results,
+        ):
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the fragment results are combined once into the results of the program
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        combine_results.assert_called_once()
+        fragment_results = combine_results.call_args.args[0]
+        assert len(fragment_results) == 2
+        assert {r.result_type for r in job.results} == {ResultType.COUNTS, ResultType.PROBABILITIES}
+        counts = next(r.data for r in job.results if r.result_type == ResultType.COUNTS)
+        assert set(counts.keys()) <= {"0x0", "0x7"}
+        assert sum(counts.values()) == job.shots
+        assert len(TransientJobStateDataclass.get_fragment_states(job.id, deployment.programs[0].id)) == 0
+
+
+def test_failing_fragments_are_reported_once():
+    """Tests that a fragment failing in the task of the job saves a single error result"""
+    # GIVEN: Database Setup - a job for a three qubit circuit that is cut into two qubit fragments
+    app = set_up_env()
+    app.config["CIRCUIT_CUTTING_URL"] = "http://localhost:5000"
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {"name": "Cut", "programs": [{"quantum_circuit": GHZ_CIRCUIT, "assembler_language": "QASM2"}]}
+            )
+        )
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.deployment_id = deployment.id
+        job_request_dto.cut_to_width = 2
+
+        # WHEN: the execution of the first fragment fails
+        with (
+            patch.object(circuit_cutting_service, "cut_circuit", return_value=CUT_DATA),
+            patch.object(IBMPilot, "_simulate_runner", side_effect=ValueError("simulator failed")) as simulate,
+            pytest.raises(ValueError),
+        ):
+            job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the job failed with one error result without executing the other fragment
+        job: JobDataclass = max(JobDataclass.get_all(), key=lambda j: j.id)
+        assert job.state == JobState.ERROR
+        assert [r.result_type for r in job.results] == [ResultType.ERROR]
+        simulate.assert_called_once()
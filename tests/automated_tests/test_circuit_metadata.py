@@ -0,0 +1,203 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test extracting circuit metadata without transpiling the circuits"""
+
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from qiskit import QuantumCircuit, qasm2, qpy
+from qiskit.circuit.random import random_circuit
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import circuit_cutting_service, deployment_service, job_manager_service, job_service
+from qunicorn_core.core.pilotmanager import base_pilot
+from qunicorn_core.db.models.device import DeviceDataclass
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.quantum_program import QuantumProgramDataclass
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from qunicorn_core.static.qunicorn_exception import QunicornError
+from qunicorn_core.util.circuit_metadata import extract_circuit_metadata
+from tests import test_utils
+from tests.conftest import set_up_env
+
+GHZ_CIRCUIT = (
+    'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[3];\ncreg meas[3];\n'
+    "h q[0];\ncx q[0],q[1];\ncx q[1],q[2];\nbarrier q;\nmeasure q -> meas;\n"
+)
+QASM3_CIRCUIT = """OPENQASM 3.0;
+include "stdgates.inc";
+gate entangle a, b { h a; cx a, b; }
+qubit[2] q;
+bit[1] first;
+bit[1] second;
+entangle q[0], q[1];
+for int i in [0:1] { x q[i]; }
+first[0] = measure q[0];
+measure q[1] -> second[0];
+"""
+FRAGMENT_CIRCUIT = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\ncreg meas[2];\nh q[0];\nmeasure q -> meas;\n'
+
+
+def test_qasm2_metadata_matches_qiskit():
+    """Tests that the metadata extracted from QASM2 circuits matches the metadata of the parsed circuits"""
+    for seed in range(10):
+        # GIVEN: a random circuit
+        circuit: QuantumCircuit = random_circuit(5, 6, measure=True, seed=seed)
+
+        # WHEN: the metadata is extracted from the QASM2 representation
+        metadata = extract_circuit_metadata(qasm2.dumps(circuit), "QASM2")
+
+        # THEN: qubits, clbits, registers and depth are the same as for the parsed circuit
+        assert metadata.num_qubits == circuit.num_qubits
+        assert metadata.num_clbits == circuit.num_clbits
+        assert metadata.registers == [{"name": reg.name, "size": reg.size} for reg in circuit.cregs]
+        assert metadata.depth == circuit.depth()
+        assert sum(metadata.gate_counts.values()) == sum(circuit.count_ops().values())
+
+
+def test_qasm3_metadata_skips_definitions():
+    """Tests that gate definitions are not counted as instructions of QASM3 circuits"""
+    # WHEN: the metadata is extracted from a QASM3 circuit with a gate definition and a loop
+    metadata = extract_circuit_metadata(QASM3_CIRCUIT, "QASM3")
+
+    # THEN: the registers and instructions of the circuit are found
+    assert metadata.num_qubits == 2
+    assert metadata.num_clbits == 2
+    assert metadata.registers == [{"name": "first", "size": 1}, {"name": "second", "size": 1}]
+    assert metadata.gate_counts == {"entangle": 1, "x": 1, "measure": 2}
+
+
+def test_physical_qubits_count_up_to_the_highest_index():
+    """Tests that circuits on physical qubits need all qubits of the device up to the highest used index"""
+    # GIVEN: a QASM3 circuit that only uses the physical qubits 0 and 5
+    circuit = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nbit[2] c;\ncx $0, $5;\nc[0] = measure $0;\nc[1] = measure $5;\n'
+
+    # WHEN: the metadata is extracted
+    metadata = extract_circuit_metadata(circuit, "QASM3")
+
+    # THEN: the circuit needs a device with at least 6 qubits
+    assert metadata.num_qubits == 6
+    assert metadata.depth == 2
+
+
+def test_qpy_metadata_is_read_from_header():
+    """Tests that qubit and clbit counts are read from the header of QPY files"""
+    # GIVEN: a serialized circuit
+    circuit: QuantumCircuit = random_circuit(4, 3, measure=True, seed=1)
+    buffer = BytesIO()
+    qpy.dump(circuit, buffer)
+
+    # WHEN: the metadata is extracted
+    metadata = extract_circuit_metadata(buffer.getvalue(), "QPY")
+
+    # THEN: only the header information is available
+    assert (metadata.num_qubits, metadata.num_clbits) == (4, 4)
+    assert metadata.depth is None
+
+
+def test_unsupported_circuits_have_no_metadata():
+    """Tests that no metadata is extracted for invalid circuits or unsupported formats"""
+    assert extract_circuit_metadata("not a circuit;", "QASM2") is None
+    assert extract_circuit_metadata("circuit = QuantumCircuit(2)", "QISKIT") is None
+    assert extract_circuit_metadata(b"not qpy", "QPY") is None
+
+
+def test_metadata_is_stored_at_deployment_time():
+    """Tests that the circuit metadata of programs is stored when they are deployed"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: a deployment is created
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {"name": "GHZ", "programs": [{"quantum_circuit": GHZ_CIRCUIT, "assembler_language": "QASM2"}]}
+            )
+        )
+
+        # THEN: the metadata of the program is stored in the database
+        program = QuantumProgramDataclass.get_by_id_or_404(deployment.programs[0].id)
+        assert program.num_qubits == 3
+        assert program.num_clbits == 3
+        assert program.classical_registers == [{"name": "meas", "size": 3}]
+        assert program.depth == 4
+        assert program.gate_counts == {"h": 1, "cx": 2, "barrier": 1, "measure": 3}
+
+
+def test_cut_circuit_uses_stored_metadata():
+    """Tests that cutting decisions and result registers use the stored metadata instead of transpiling"""
+    # GIVEN: Database Setup - a job for a three qubit circuit that is cut into two qubit fragments
+    app = set_up_env()
+    app.config["CIRCUIT_CUTTING_URL"] = "http://localhost:5000"
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {"name": "Cut", "programs": [{"quantum_circuit": GHZ_CIRCUIT, "assembler_language": "QASM2"}]}
+            )
+        )
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.deployment_id = deployment.id
+        job_request_dto.cut_to_width = 2
+
+        # WHEN: the job is executed
+        cut_data = {"individual_subcircuits": [FRAGMENT_CIRCUIT, FRAGMENT_CIRCUIT]}
+        with (
+            patch.object(circuit_cutting_service, "cut_circuit", return_value=cut_data),
+            patch.object(base_pilot, "combine_results", return_value=[0.5, 0, 0, 0, 0, 0, 0, 0.5]),
+            patch.object(job_manager_service, "transpile_circuit", wraps=job_manager_service.transpile_circuit) as t,
+        ):
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the program was not transpiled to qiskit and the results use the register of the circuit
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        assert ("QISKIT", ("QASM2", GHZ_CIRCUIT, 0)) not in [call.args[:2] for call in t.call_args_list]
+        counts = next(r for r in job.results if r.result_type == ResultType.COUNTS)
+        assert counts.meta["registers"] == [{"name": "meas", "size": 3}]
+
+
+def test_program_too_large_for_device_fails():
+    """Tests that jobs fail early if a program uses more qubits than the device provides"""
+    # GIVEN: Database Setup - a device with fewer qubits than the deployed program uses
+    app = set_up_env()
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {"name": "GHZ", "programs": [{"quantum_circuit": GHZ_CIRCUIT, "assembler_language": "QASM2"}]}
+            )
+        )
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.deployment_id = deployment.id
+        device = DeviceDataclass.get_by_name(job_request_dto.device_name, job_request_dto.provider_name)
+        device.num_qubits = 2
+        device.save(commit=True)
+
+        # WHEN: the job is executed on the small device
+        with (
+            patch.object(job_manager_service, "_transpile_circuit") as transpile,
+            pytest.raises(QunicornError, match="only provides 2 qubits"),
+        ):
+            job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the job fails without transpiling the program
+        job: JobDataclass = JobDataclass.get_all()[-1]
+        assert job.state == JobState.ERROR
+        transpile.assert_not_called()
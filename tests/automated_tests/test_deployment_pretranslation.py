@@ -0,0 +1,154 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test translating deployed programs before jobs are executed"""
+
+from unittest.mock import patch
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import deployment_service, job_service, translation_service
+from qunicorn_core.core.transpiler.qiskit_transpiler import Qasm2ToQiskit
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.quantum_program import QuantumProgramDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from tests import test_utils
+from tests.conftest import set_up_env
+
+INVALID_CIRCUIT = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\nunknown_gate q[0];\n'
+
+
+def test_deployed_programs_are_pretranslated():
+    """Tests that programs are translated into the languages of the pilots when they are deployed"""
+    # GIVEN: Database Setup - pre-translation is enabled
+    app = set_up_env()
+    app.config["PRETRANSLATE_DEPLOYMENTS"] = True
+
+    with app.app_context():
+        # WHEN: a deployment is created
+        deployment = deployment_service.create_deployment(
+            test_utils.get_test_deployment_request([AssemblerLanguage.QASM2])
+        )
+
+        # THEN: the translations needed by the IBM (qpy) and AWS (qasm3) pilots are stored without errors
+        for program in deployment.programs:
+            translations = QuantumProgramDataclass.get_by_id_or_404(program.id).translations
+            assert {"QPY", "QASM3"} <= {t.assembler_language for t in translations}
+        assert all(p.translation_errors == {} for p in deployment_service.get_deployment_by_id(deployment.id).programs)
+
+
+def test_pretranslation_is_disabled_by_default():
+    """Tests that programs are not translated on deployment by default"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: a deployment is created
+        deployment = deployment_service.create_deployment(
+            test_utils.get_test_deployment_request([AssemblerLanguage.QASM2])
+        )
+
+        # THEN: no translations are stored and the programs are not validated
+        for program in deployment.programs:
+            assert QuantumProgramDataclass.get_by_id_or_404(program.id).translations == []
+            assert program.translation_errors is None
+
+
+def test_jobs_use_pretranslated_programs():
+    """Tests that jobs transpile the stored translation instead of the deployed program"""
+    # GIVEN: Database Setup - a pre-translated deployment
+    app = set_up_env()
+    app.config["PRETRANSLATE_DEPLOYMENTS"] = True
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: a job is executed
+        with patch.object(Qasm2ToQiskit, "transpile_circuit") as parse_qasm2:
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the job finished without parsing the qasm program again
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        parse_qasm2.assert_not_called()
+        test_utils.check_if_job_runner_result_correct(job)
+
+
+def test_invalid_programs_are_reported_on_deployment():
+    """Tests that programs that cannot be translated are reported when they are deployed"""
+    # GIVEN: Database Setup - pre-translation is enabled
+    app = set_up_env()
+    app.config["PRETRANSLATE_DEPLOYMENTS"] = True
+
+    with app.app_context(), patch.object(app.logger, "warning") as warning:
+        # WHEN: a deployment with an invalid circuit is created
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto.from_dict(
+                {"name": "Invalid", "programs": [{"quantum_circuit": INVALID_CIRCUIT, "assembler_language": "QASM2"}]}
+            )
+        )
+
+        # THEN: the failed translation is logged, the deployment is still stored and returns the failed translations
+        assert warning.call_count > 0
+        assert "could not be translated" in warning.call_args.args[0]
+        stored = deployment_service.get_deployment_by_id(deployment.id)
+        assert stored.name == "Invalid"
+        errors = stored.programs[0].translation_errors
+        assert errors and all("unknown_gate" in error for error in errors.values())
+
+
+def test_program_is_preferred_without_close_translation():
+    """Tests that the deployed program is used if no translation is close to the target format"""
+    # GIVEN: Database Setup - a deployment without translations
+    app = set_up_env()
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            test_utils.get_test_deployment_request([AssemblerLanguage.QASM2])
+        )
+        program = QuantumProgramDataclass.get_by_id_or_404(deployment.programs[0].id)
+        circuit = (program.assembler_language, program.quantum_circuit, 0)
+
+        # WHEN: the sources for the transpilation are determined
+        sources = translation_service.get_translation_sources(program, circuit, "QISKIT")
+
+        # THEN: only the deployed program is used
+        assert sources == [circuit]
+
+
+def test_translation_sources_use_the_configured_cost_model():
+    """Tests that the transpiler chains from the stored translations are planned with the configured cost model"""
+    # GIVEN: Database Setup - a pre-translated deployment and the static cost model
+    app = set_up_env()
+    app.config["PRETRANSLATE_DEPLOYMENTS"] = True
+    app.config["TRANSPILER_COST_MODEL"] = "static"
+
+    with app.app_context():
+        deployment = deployment_service.create_deployment(
+            test_utils.get_test_deployment_request([AssemblerLanguage.QASM2])
+        )
+        program = QuantumProgramDataclass.get_by_id_or_404(deployment.programs[0].id)
+        circuit = (program.assembler_language, program.quantum_circuit, 0)
+
+        # WHEN: the sources for the transpilation are determined
+        with patch.object(
+            translation_service, "get_transpiler_chain", wraps=translation_service.get_transpiler_chain
+        ) as get_transpiler_chain:
+            translation_service.get_translation_sources(program, circuit, "BRAKET")
+
+        # THEN: the chain was planned with the static cost model
+        assert get_transpiler_chain.call_args.kwargs["cost_model"] == "static"
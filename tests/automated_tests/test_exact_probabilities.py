@@ -0,0 +1,156 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test calculating exact probabilities on local simulators instead of sampling them"""
+
+import pytest
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import deployment_service, job_service
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.job_type import JobType
+from qunicorn_core.static.enums.probability_mode import ProbabilityMode
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from qunicorn_core.static.qunicorn_exception import QunicornError
+from tests import test_utils
+from tests.conftest import set_up_env
+
+# a bell pair measured into one register and a flipped qubit measured into a second register
+TWO_REGISTER_QASM = (
+    'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[3];\ncreg a[2];\ncreg b[1];\n'
+    "h q[0];\ncx q[0],q[1];\nx q[2];\nmeasure q[0] -> a[0];\nmeasure q[1] -> a[1];\nmeasure q[2] -> b[0];\n"
+)
+MID_CIRCUIT_MEASUREMENT_QASM = (
+    'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\ncreg c[1];\nh q[0];\nmeasure q[0] -> c[0];\nh q[0];\n'
+)
+
+
+def _run_qasm_job(circuit: str, probability_mode: ProbabilityMode) -> JobDataclass:
+    deployment = deployment_service.create_deployment(
+        DeploymentUpdateDto.from_dict(
+            {"name": "Exact", "programs": [{"quantum_circuit": circuit, "assembler_language": "QASM2"}]}
+        )
+    )
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+    job_request_dto.deployment_id = deployment.id
+    job_request_dto.probability_mode = probability_mode
+    simple_job = job_service.create_and_run_job(job_request_dto, False)
+    return JobDataclass.get_by_id_or_404(simple_job.id)
+
+
+def _get_results(job: JobDataclass, result_type: ResultType) -> list:
+    return [r.data for r in job.results if r.result_type == result_type]
+
+
+def test_exact_probabilities_of_aer_simulations():
+    """Tests that the exact probabilities are calculated for every register and no counts are sampled"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: a job with exact probabilities is executed
+        job = _run_qasm_job(TWO_REGISTER_QASM, ProbabilityMode.EXACT)
+
+        # THEN: the probabilities are exact and have the format of the counts
+        assert job.state == JobState.FINISHED
+        assert _get_results(job, ResultType.COUNTS) == []
+        [probabilities] = _get_results(job, ResultType.PROBABILITIES)
+        assert probabilities == pytest.approx({"0x1 0x0": 0.5, "0x1 0x3": 0.5})
+
+
+def test_counts_are_sampled_on_request():
+    """Tests that counts are sampled in addition to the exact probabilities if requested"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: a job with exact probabilities and counts is executed
+        job = _run_qasm_job(TWO_REGISTER_QASM, ProbabilityMode.EXACT_WITH_COUNTS)
+
+        # THEN: the counts are sampled and the probabilities are exact
+        assert job.state == JobState.FINISHED
+        [counts] = _get_results(job, ResultType.COUNTS)
+        assert set(counts) == {"0x1 0x0", "0x1 0x3"}
+        assert sum(counts.values()) == job.shots
+        [probabilities] = _get_results(job, ResultType.PROBABILITIES)
+        assert probabilities == pytest.approx({"0x1 0x0": 0.5, "0x1 0x3": 0.5})
+
+
+@pytest.mark.parametrize(
+    "probability_mode,result_types",
+    [
+        (ProbabilityMode.EXACT, [ResultType.PROBABILITIES]),
+        (ProbabilityMode.EXACT_WITH_COUNTS, [ResultType.COUNTS, ResultType.PROBABILITIES]),
+    ],
+)
+def test_exact_probabilities_of_braket_simulations(probability_mode: ProbabilityMode, result_types: list):
+    """Tests that the local braket simulator calculates exact probabilities"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+    job_request_dto.probability_mode = probability_mode
+
+    with app.app_context():
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.BRAKET])
+
+        # WHEN: the job is executed
+        simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the probabilities of both programs are exact
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        assert sorted(r.result_type for r in job.results) == sorted(result_types * 2)
+        assert _get_results(job, ResultType.PROBABILITIES) == [
+            pytest.approx({"0x0": 0.5, "0x3": 0.5}),
+            pytest.approx({"0x0": 1.0}),
+        ]
+
+
+def test_exact_probabilities_require_final_measurements():
+    """Tests that exact probabilities are rejected for circuits with measurements in the middle of the circuit"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: a circuit with a mid-circuit measurement is executed with exact probabilities
+        with pytest.raises(QunicornError, match="all measurements are at the end"):
+            _run_qasm_job(MID_CIRCUIT_MEASUREMENT_QASM, ProbabilityMode.EXACT)
+
+        # THEN: the job failed
+        job = JobDataclass.get_all()[-1]
+        assert job.state == JobState.ERROR
+
+
+def test_exact_probabilities_are_only_available_for_runner_jobs():
+    """Tests that exact probabilities are rejected for other job types"""
+    # GIVEN: Database Setup - a sampler job with exact probabilities
+    app = set_up_env()
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+    job_request_dto.type = JobType.SAMPLER
+    job_request_dto.probability_mode = ProbabilityMode.EXACT
+
+    with app.app_context():
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: the job is executed
+        with pytest.raises(QunicornError, match="Exact probabilities are not available"):
+            job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the job failed
+        job = JobDataclass.get_all()[-1]
+        assert job.state == JobState.ERROR
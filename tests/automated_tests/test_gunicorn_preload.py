@@ -0,0 +1,90 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test the gunicorn hooks for preloading the app and the memory report of the workers"""
+
+import gc
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from flask import current_app
+from sqlalchemy.engine import Engine
+
+from qunicorn_core.db.db import DB
+from qunicorn_core.util import gunicorn_config
+from qunicorn_core.util.memory_usage import format_memory_report, get_child_pids, get_memory_usage
+from tests.conftest import set_up_env
+
+
+def test_workers_do_not_share_database_connections():
+    """Tests that forked workers replace the connection pools created in the gunicorn master"""
+    # GIVEN: an app created in the master
+    app = set_up_env()
+    server = SimpleNamespace(cfg=SimpleNamespace(preload_app=True), app=SimpleNamespace(wsgi=lambda: app))
+    with app.app_context():
+        engines = list(DB.engines.values())
+
+    # WHEN: a worker was forked
+    gunicorn_config.on_starting(server)
+    gunicorn_config.pre_fork(server, None)
+    with patch.object(Engine, "dispose", autospec=True) as dispose:
+        gunicorn_config.post_fork(server, None)
+    gc.unfreeze()
+
+    # THEN: the garbage collector is enabled again and the pools were replaced without closing the connections
+    assert gc.isenabled()
+    assert [call.args[0] for call in dispose.call_args_list] == engines
+    assert all(call.kwargs == {"close": False} for call in dispose.call_args_list)
+
+
+def test_workers_start_the_in_process_executor():
+    """Tests that workers start the in-process executor once they loaded the app instead of on the first request"""
+    # GIVEN: a worker that loaded the app
+    app = set_up_env()
+    worker = SimpleNamespace(app=SimpleNamespace(wsgi=lambda: app), pid=os.getpid(), log=Mock())
+    started_for = []
+
+    # WHEN: the worker was initialized
+    with patch.object(
+        gunicorn_config,
+        "get_in_process_executor",
+        side_effect=lambda: started_for.append(current_app._get_current_object()),
+    ):
+        gunicorn_config.post_worker_init(worker)
+
+    # THEN: the executor was started with the app of the worker
+    assert started_for == [app]
+
+
+def test_memory_of_workers_is_reported():
+    """Tests that the memory usage of a process and its child processes is reported"""
+    # GIVEN: a child process
+    child = subprocess.Popen([sys.executable, "-c", "import sys; sys.stdin.read()"], stdin=subprocess.PIPE)
+    try:
+        # WHEN: the memory usage is read
+        usage = get_memory_usage(os.getpid())
+        children = get_child_pids(os.getpid())
+        report = format_memory_report(os.getpid())
+    finally:
+        child.communicate()
+
+    # THEN: the memory of this process and of the child are reported
+    assert usage is not None
+    assert 0 < usage.uss <= usage.pss <= usage.rss
+    assert child.pid in children
+    assert f"worker {child.pid:>7}" in report
+    assert get_memory_usage(child.pid) is None
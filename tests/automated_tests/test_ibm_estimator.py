@@ -14,8 +14,13 @@
 
 """Test class to test the functionality of the sampler"""
 
+from unittest.mock import patch
+
+import pytest
+
 from qunicorn_core.api.api_models import JobRequestDto, SimpleJobDto
 from qunicorn_core.core import job_service
+from qunicorn_core.core.pilotmanager import ibm_pilot
 from qunicorn_core.db.models.job import JobDataclass
 from qunicorn_core.db.models.result import ResultDataclass
 from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
@@ -55,6 +60,36 @@ def create_and_run_estimator_with_device(device_name: str):
         check_if_job_estimate_result_correct(job)
 
 
+def test_estimate_multiple_observables_in_one_pub():
+    """Tests that all observables of a program are estimated in a single PUB"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+    job_request_dto.type = JobType.ESTIMATOR
+    job_request_dto.observables = [["ZZ", "XX", "YY"], ["ZZ", "ZI"]]
+
+    with app.app_context():
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QISKIT])
+
+        # WHEN: the estimator job is executed for a (measured) bell state and |00>
+        with patch.object(
+            ibm_pilot.IBMPilot, "_simulate_estimator", wraps=ibm_pilot.IBMPilot._simulate_estimator
+        ) as simulate_estimator:
+            return_dto: SimpleJobDto = job_service.create_and_run_job(job_request_dto, IS_ASYNCHRONOUS)
+
+        # THEN: every program was estimated once with one result per observable
+        assert len(simulate_estimator.call_args.args[0]) == 2
+        job: JobDataclass = JobDataclass.get_by_id_or_404(return_dto.id)
+        test_utils.check_if_job_finished(job)
+        results = sorted(job.results, key=lambda r: r.id)
+        assert [r.result_type for r in results] == [ResultType.VALUE_AND_VARIANCE] * 5
+        assert [r.meta["observer"] for r in results] == [
+            f"SparsePauliOp-['{label}']" for label in ("ZZ", "XX", "YY", "ZZ", "ZI")
+        ]
+        values = [float(r.data["value"]) for r in results]
+        assert values == pytest.approx([1, 0, 0, 1, 1], abs=0.1)
+
+
 def check_if_job_estimate_result_correct(job: JobDataclass):
     test_utils.check_job_data(job)
 
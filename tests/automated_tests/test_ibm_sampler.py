@@ -71,7 +71,7 @@ def check_if_job_sample_result_correct(job: JobDataclass):
 
     for i in range(len(count_results)):
         result: ResultDataclass = count_results[i]
-        assert len(result.meta) == 0
+        assert result.meta == {"simulation_method": "stabilizer"}
         counts: dict = result.data
         shots = 0
 
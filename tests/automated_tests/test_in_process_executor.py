@@ -0,0 +1,154 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test executing jobs in the background with the in-process execution backend"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from qunicorn_core import create_app
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto, SimpleJobDto
+from qunicorn_core.celery import CELERY
+from qunicorn_core.core import job_service
+from qunicorn_core.core.task_executor import (
+    get_in_process_executor,
+    revoke_task,
+    shutdown_in_process_executor,
+    submit_task,
+)
+from qunicorn_core.db.cli import create_db_function, load_db_function
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.queued_task import QueuedTaskDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from tests import test_utils
+from tests.conftest import DEFAULT_TEST_CONFIG
+
+CALLS: list = []
+
+
+@CELERY.task(autoretry_for=(ConnectionError,), retry_backoff=False, default_retry_delay=0, max_retries=None)
+def flaky_task(name: str, failures: int):
+    CALLS.append(name)
+    if CALLS.count(name) <= failures:
+        raise ConnectionError("not yet")
+
+
+@CELERY.task()
+def periodic_task():
+    CALLS.append("periodic")
+
+
+def _wait_for(condition, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.1)
+        DB.session.rollback()  # see the commits of the executor
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("EXECUTION_BACKEND", "IN_PROCESS")
+    # the executor threads need their own connections, an in memory database cannot be shared
+    app = create_app(
+        {
+            **DEFAULT_TEST_CONFIG,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'qunicorn.db'}",
+            "IN_PROCESS_WORKERS": 2,
+            "IN_PROCESS_POLL_INTERVAL": 1,
+        }
+    )
+    with app.app_context():
+        create_db_function(app)
+        load_db_function(app)
+        yield app
+        shutdown_in_process_executor()
+
+
+def test_jobs_are_executed_in_the_background(app):
+    """Tests that submitted jobs are queued in the database and executed by the threads of the API"""
+    # GIVEN: a job on a local simulator
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+    test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+    # WHEN: the job is submitted asynchronously
+    return_dto: SimpleJobDto = job_service.create_and_run_job(job_request_dto, is_asynchronous=True)
+
+    # THEN: the job is executed in the background and the task is removed from the queue afterwards
+    job: JobDataclass = JobDataclass.get_by_id_or_404(return_dto.id)
+    assert job.celery_id.startswith("in-process:")
+    _wait_for(lambda: JobDataclass.get_by_id(return_dto.id).state == JobState.FINISHED)
+    _wait_for(lambda: not QueuedTaskDataclass.get_all())
+    job = JobDataclass.get_by_id_or_404(return_dto.id)
+    test_utils.check_if_job_finished(job)
+    test_utils.check_if_job_runner_result_correct(job)
+
+
+def test_tasks_are_retried_and_recovered(app):
+    """Tests that tasks are retried like celery tasks and that tasks of stopped processes are executed again"""
+    # GIVEN: a task that was running in a stopped process
+    expired = datetime.now(timezone.utc) - timedelta(seconds=1)
+    QueuedTaskDataclass(
+        task=flaky_task.name,
+        arguments={"args": ["recovered", 0], "kwargs": {}},
+        state="RUNNING",
+        worker="stopped-host:1",
+        locked_until=expired,
+    ).save(commit=True)
+
+    # WHEN: the executor runs and a failing task is submitted
+    submit_task(flaky_task, "flaky", failures=2)
+
+    # THEN: the failing task is retried until it succeeds and the running task is executed again
+    _wait_for(lambda: not QueuedTaskDataclass.get_all())
+    assert CALLS.count("flaky") == 3
+    assert CALLS.count("recovered") == 1
+
+
+def test_queued_jobs_can_be_canceled(app):
+    """Tests that jobs whose task has not been started yet can be canceled"""
+    # GIVEN: a job waiting in the queue
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+    test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+    app.config["IN_PROCESS_WORKERS"] = 0  # only submit the task
+    return_dto: SimpleJobDto = job_service.create_and_run_job(job_request_dto, is_asynchronous=True)
+    task_id = JobDataclass.get_by_id_or_404(return_dto.id).celery_id
+
+    # WHEN: the job is canceled
+    job_service.cancel_job_by_id(return_dto.id, token=None)
+
+    # THEN: the task is removed from the queue and cannot be revoked again
+    assert JobDataclass.get_by_id_or_404(return_dto.id).state == JobState.CANCELED
+    assert not QueuedTaskDataclass.get_all()
+    assert not revoke_task(task_id)
+
+
+def test_periodic_tasks_are_executed(app):
+    """Tests that the API processes execute the tasks of the celery beat schedule (e.g. the watchdog)"""
+    # GIVEN: a periodic task executed every 100 milliseconds
+    schedule = {"periodic": {"task": periodic_task.name, "schedule": 0.1}}
+    CALLS.clear()
+
+    with patch.dict(CELERY.conf.beat_schedule, schedule, clear=True):
+        # WHEN: the executor is started
+        get_in_process_executor()
+
+        # THEN: the task is executed repeatedly
+        _wait_for(lambda: CALLS.count("periodic") >= 2)
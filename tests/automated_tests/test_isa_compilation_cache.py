@@ -0,0 +1,166 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test the cache for circuits compiled for the ISA of a device"""
+
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+from qiskit.providers.fake_provider import GenericBackendV2
+
+from qunicorn_core.core import compilation_cache_service
+from qunicorn_core.db.models.compiled_circuit import CompiledCircuitDataclass
+from qunicorn_core.db.models.device import DeviceDataclass
+from tests.conftest import set_up_env
+
+
+def _ghz_circuit(num_qubits: int = 3) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    circuit.h(0)
+    for i in range(num_qubits - 1):
+        circuit.cx(i, i + 1)
+    circuit.measure(range(num_qubits), range(num_qubits))
+    return circuit
+
+
+def test_compiled_circuits_are_reused():
+    """Tests that identical circuits are only compiled once for a device"""
+    # GIVEN: Database Setup - a remote device and its backend
+    app = set_up_env()
+
+    with app.app_context():
+        device = DeviceDataclass.get_by_name("ibmq_manila", "IBM")
+        backend = GenericBackendV2(5, seed=42)
+
+        # WHEN: the same circuit is compiled twice
+        first = compilation_cache_service.compile_circuits([_ghz_circuit()], backend, device, seed=1)
+        with patch.object(compilation_cache_service, "transpile") as transpile:
+            second = compilation_cache_service.compile_circuits([_ghz_circuit()], backend, device, seed=1)
+
+        # THEN: the second compilation is loaded from the cache
+        transpile.assert_not_called()
+        assert len(CompiledCircuitDataclass.get_all()) == 1
+        assert first == second
+        assert second[0].layout is not None
+
+
+def test_compilation_options_are_part_of_the_cache_key():
+    """Tests that circuits are compiled again for different seeds and optimization levels"""
+    # GIVEN: Database Setup - a remote device and its backend
+    app = set_up_env()
+
+    with app.app_context():
+        device = DeviceDataclass.get_by_name("ibmq_manila", "IBM")
+        backend = GenericBackendV2(5, seed=42)
+
+        # WHEN: the circuit is compiled with different options
+        compilation_cache_service.compile_circuits([_ghz_circuit()], backend, device, seed=1)
+        compilation_cache_service.compile_circuits([_ghz_circuit()], backend, device, seed=2)
+        compilation_cache_service.compile_circuits([_ghz_circuit()], backend, device, seed=2, optimization_level=0)
+
+        # THEN: every compilation is stored separately
+        assert len(CompiledCircuitDataclass.get_all()) == 3
+
+
+def test_local_simulator_circuits_are_not_cached():
+    """Tests that circuits for local simulators are not stored"""
+    # GIVEN: Database Setup - the local aer simulator
+    app = set_up_env()
+
+    with app.app_context():
+        device = DeviceDataclass.get_by_name("aer_simulator", "IBM")
+
+        # WHEN: a circuit is compiled
+        compiled = compilation_cache_service.compile_circuits([_ghz_circuit()], GenericBackendV2(5), device)
+
+        # THEN: nothing is stored
+        assert len(compiled) == 1
+        assert len(CompiledCircuitDataclass.get_all()) == 0
+
+
+def test_compiled_circuits_are_invalidated():
+    """Tests that compiled circuits of a device are deleted when the device data is refreshed"""
+    # GIVEN: Database Setup - compiled circuits for two devices
+    app = set_up_env()
+
+    with app.app_context():
+        manila = DeviceDataclass.get_by_name("ibmq_manila", "IBM")
+        quito = DeviceDataclass.get_by_name("ibmq_quito", "IBM")
+        compilation_cache_service.compile_circuits([_ghz_circuit()], GenericBackendV2(5, seed=1), manila)
+        compilation_cache_service.compile_circuits([_ghz_circuit(2)], GenericBackendV2(5, seed=1), quito)
+
+        # WHEN: the compiled circuits of one device are invalidated
+        compilation_cache_service.invalidate_compiled_circuits([manila])
+
+        # THEN: only the circuits of the other device remain
+        assert [c.device_id for c in CompiledCircuitDataclass.get_all()] == [quito.id]
+
+
+def test_least_recently_used_circuits_are_evicted():
+    """Tests that the cache does not grow beyond the configured size"""
+    # GIVEN: Database Setup - a cache for a single compiled circuit
+    app = set_up_env()
+    app.config["ISA_COMPILATION_CACHE_SIZE"] = 1
+
+    with app.app_context():
+        device = DeviceDataclass.get_by_name("ibmq_manila", "IBM")
+
+        # WHEN: two different circuits are compiled
+        compilation_cache_service.compile_circuits([_ghz_circuit(2), _ghz_circuit(3)], GenericBackendV2(5), device)
+
+        # THEN: only one of them is kept
+        assert len(CompiledCircuitDataclass.get_all()) == 1
+
+
+def test_cached_circuits_keep_the_name_of_the_compiled_circuit():
+    """Tests that circuits loaded from the cache have the name of the circuit that is compiled"""
+    # GIVEN: Database Setup - a circuit compiled for a remote device
+    app = set_up_env()
+
+    with app.app_context():
+        device = DeviceDataclass.get_by_name("ibmq_manila", "IBM")
+        backend = GenericBackendV2(5, seed=42)
+        first_circuit, second_circuit = _ghz_circuit(), _ghz_circuit()
+        first_circuit.name, second_circuit.name = "first", "second"
+        compilation_cache_service.compile_circuits([first_circuit], backend, device)
+
+        # WHEN: the same circuit with another name is compiled
+        compiled = compilation_cache_service.compile_circuits([second_circuit], backend, device)
+
+        # THEN: the compiled circuit was loaded from the cache with the new name
+        assert len(CompiledCircuitDataclass.get_all()) == 1
+        assert compiled[0].name == "second"
+
+
+def test_backend_versions_are_reused_until_the_devices_are_refreshed():
+    """Tests that the properties of a backend are only requested again after its device was refreshed"""
+    # GIVEN: Database Setup - a remote device without a known backend version
+    app = set_up_env()
+
+    with app.app_context():
+        device = DeviceDataclass.get_by_name("ibmq_manila", "IBM")
+        backend = GenericBackendV2(5, seed=42)
+        compilation_cache_service.invalidate_compiled_circuits([device])
+
+        with patch.object(
+            compilation_cache_service, "get_backend_version", wraps=compilation_cache_service.get_backend_version
+        ) as get_backend_version:
+            # WHEN: circuits are compiled before and after the device is refreshed
+            compilation_cache_service.compile_circuits([_ghz_circuit(2)], backend, device)
+            compilation_cache_service.compile_circuits([_ghz_circuit(3)], backend, device)
+            compilation_cache_service.invalidate_compiled_circuits([device])
+            compilation_cache_service.compile_circuits([_ghz_circuit(3)], backend, device)
+
+        # THEN: the version was only determined for the first compilation and after the refresh
+        assert get_backend_version.call_count == 2
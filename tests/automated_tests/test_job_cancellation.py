@@ -0,0 +1,72 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test canceling jobs while they are running on local simulators"""
+
+from unittest.mock import patch
+
+import pytest
+
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import job_service
+from qunicorn_core.core.pilotmanager import aws_pilot, ibm_pilot
+from qunicorn_core.core.simulation_executor import run_simulation
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.job_state import TransientJobStateDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from tests import test_utils
+from tests.conftest import set_up_env
+
+
+@pytest.mark.parametrize(
+    "provider,languages,pilot_module",
+    [
+        (ProviderName.IBM, [AssemblerLanguage.QASM2], ibm_pilot),
+        (ProviderName.AWS, [AssemblerLanguage.BRAKET], aws_pilot),
+    ],
+)
+def test_running_jobs_stop_after_cancellation(monkeypatch, provider: ProviderName, languages: list, pilot_module):
+    """Tests that a job canceled during a simulation stops before saving results or running the next shot chunk"""
+    # GIVEN: Database Setup - a job simulated in chunks of at most 1500 shots
+    app = set_up_env()
+    app.config["SHOT_CHUNK_SIZE"] = 1500
+    simulations = []
+
+    def cancel_during_simulation(function, *args, is_canceled=None):
+        simulations.append(function)
+        if len(simulations) == 1:
+            # the job is canceled by another request while the first chunk is simulated
+            with app.app_context(), monkeypatch.context() as m:
+                m.setenv("EXECUTION_BACKEND", "IN_PROCESS")
+                running_job_id = max(j.id for j in JobDataclass.get_all() if j.state == JobState.RUNNING)
+                job_service.cancel_job_by_id(running_job_id, token=None)
+        return run_simulation(function, *args, is_canceled=is_canceled)
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(provider)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, languages)
+
+        # WHEN: the job is executed and canceled while the first chunk is simulated
+        with patch.object(pilot_module, "run_simulation", side_effect=cancel_during_simulation):
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the job stopped after the first simulation without results or transient state
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.CANCELED
+        assert len(simulations) == 1
+        assert job.results == []
+        for program in job.deployment.programs:
+            assert TransientJobStateDataclass.get_program_states(job.id, program.id) == []
@@ -0,0 +1,179 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test idempotent job submission"""
+
+from dataclasses import replace
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from qunicorn_core.api.api_models.job_dtos import SimpleJobDto, JobRequestDto
+from qunicorn_core.core import job_service
+from qunicorn_core.db.db import DB
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.qunicorn_exception import QunicornError
+from tests import test_utils
+from tests.conftest import set_up_env
+
+IS_ASYNCHRONOUS: bool = False
+USER_ID: str = "user"
+
+
+def test_repeated_submission_returns_existing_job():
+    """Tests that a retried submission with the same idempotency key does not create a second job"""
+    # GIVEN: Database Setup - AWS added as a provider
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+        job_count = len(JobDataclass.get_all())
+
+        # WHEN: the same job is submitted twice with the same idempotency key
+        first_dto: SimpleJobDto = job_service.create_and_run_job(
+            job_request_dto, IS_ASYNCHRONOUS, user_id=USER_ID, idempotency_key="retry-key"
+        )
+        second_dto: SimpleJobDto = job_service.create_and_run_job(
+            replace(job_request_dto, token="new-token"), IS_ASYNCHRONOUS, user_id=USER_ID, idempotency_key="retry-key"
+        )
+
+        # THEN: only one job was created and both submissions return it
+        assert first_dto.id == second_dto.id
+        assert len(JobDataclass.get_all()) == job_count + 1
+
+
+def test_repeated_key_with_different_request_is_rejected():
+    """Tests that an idempotency key cannot be reused for a different job request"""
+    # GIVEN: Database Setup - AWS added as a provider and a job submitted with an idempotency key
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+        job_service.create_and_run_job(job_request_dto, IS_ASYNCHRONOUS, user_id=USER_ID, idempotency_key="reused")
+        job_count = len(JobDataclass.get_all())
+
+        # WHEN: a job with a different number of shots is submitted with the same key
+        with pytest.raises(QunicornError) as error:
+            job_service.create_and_run_job(
+                replace(job_request_dto, shots=job_request_dto.shots + 1),
+                IS_ASYNCHRONOUS,
+                user_id=USER_ID,
+                idempotency_key="reused",
+            )
+
+        # THEN: the request is rejected without creating a job
+        assert error.value.code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert len(JobDataclass.get_all()) == job_count
+
+
+def test_anonymous_idempotency_key_is_refused():
+    """Tests that anonymous users cannot use idempotency keys, as they share a single key namespace"""
+    # GIVEN: Database Setup - AWS added as a provider
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+        job_count = len(JobDataclass.get_all())
+
+        # WHEN: an anonymous job is submitted with an idempotency key
+        with pytest.raises(QunicornError) as error:
+            job_service.create_and_run_job(job_request_dto, IS_ASYNCHRONOUS, idempotency_key="anonymous")
+
+        # THEN: the request is rejected without creating a job
+        assert error.value.code == HTTPStatus.BAD_REQUEST
+        assert len(JobDataclass.get_all()) == job_count
+
+
+def test_anonymous_idempotency_key_is_unique():
+    """Tests that the database rejects a second anonymous job with the same idempotency key"""
+    # GIVEN: Database Setup - AWS added as a provider and an anonymous job with an idempotency key
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+        first_dto = job_service.create_and_run_job(job_request_dto, IS_ASYNCHRONOUS)
+        first_job = JobDataclass.get_by_id_or_404(first_dto.id)
+        first_job.idempotency_key = "anonymous"
+        first_job.save(commit=True)
+
+        # WHEN: another anonymous job with the same key is inserted directly, bypassing the lookup
+        duplicate = JobDataclass(
+            name=first_job.name,
+            executed_by=None,
+            executed_on=first_job.executed_on,
+            deployment=first_job.deployment,
+            progress=0,
+            state=first_job.state,
+            shots=first_job.shots,
+            error_mitigation=first_job.error_mitigation,
+            type=first_job.type,
+            idempotency_key="anonymous",
+        )
+        DB.session.add(duplicate)
+
+        # THEN: the unique index prevents the duplicate
+        with pytest.raises(IntegrityError):
+            DB.session.flush()
+        DB.session.rollback()
+
+
+def test_idempotency_key_is_scoped_per_user():
+    """Tests that different users can use the same idempotency key independently"""
+    # GIVEN: Database Setup - AWS added as a provider
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+
+        # WHEN: the same key is used by two users
+        first_dto = job_service.create_and_run_job(
+            job_request_dto, IS_ASYNCHRONOUS, user_id=USER_ID, idempotency_key="shared"
+        )
+        second_dto = job_service.create_and_run_job(
+            job_request_dto, IS_ASYNCHRONOUS, user_id="other-user", idempotency_key="shared"
+        )
+
+        # THEN: two different jobs were created
+        assert first_dto.id != second_dto.id
+
+
+def test_expired_idempotency_key_creates_new_job():
+    """Tests that an idempotency key can be reused after its TTL has passed"""
+    # GIVEN: Database Setup - AWS added as a provider and keys that expire immediately
+    app = set_up_env()
+    app.config["IDEMPOTENCY_KEY_TTL"] = -1
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+
+        # WHEN: the same job is submitted twice with an expired key
+        first_dto = job_service.create_and_run_job(
+            job_request_dto, IS_ASYNCHRONOUS, user_id=USER_ID, idempotency_key="expired"
+        )
+        second_dto = job_service.create_and_run_job(
+            job_request_dto, IS_ASYNCHRONOUS, user_id=USER_ID, idempotency_key="expired"
+        )
+
+        # THEN: a new job was created and the key moved to the new job
+        assert first_dto.id != second_dto.id
+        assert JobDataclass.get_by_idempotency_key("expired", USER_ID).id == second_dto.id
@@ -0,0 +1,155 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test reclaiming stuck jobs and purging transient state with the watchdog"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import job_service
+from qunicorn_core.core.job_watchdog_service import reap_stuck_jobs
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.queued_task import QueuedTaskDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from tests import test_utils
+from tests.conftest import set_up_env
+
+
+@pytest.fixture
+def app():
+    app = set_up_env()
+    app.config["JOB_HEARTBEAT_TIMEOUT"] = 600
+    return app
+
+
+def _create_job(state: JobState, heartbeat_age: timedelta) -> int:
+    """Execute a job and reset it to the given state and heartbeat, the token of the job stays in its transient state"""
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+    test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+    simple_job = job_service.create_and_run_job(job_request_dto, False)
+    job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+    job.state = state.value
+    job.heartbeat_at = datetime.now(timezone.utc) - heartbeat_age
+    job.save(commit=True)
+    assert job._transient != []
+    return job.id
+
+
+def test_stuck_jobs_fail(app):
+    """Tests that running jobs without a heartbeat fail and their transient state is deleted"""
+    # GIVEN: a running job without a heartbeat for 15 minutes and a running job with a recent heartbeat
+    with app.app_context():
+        stuck_job_id = _create_job(JobState.RUNNING, timedelta(minutes=15))
+        running_job_id = _create_job(JobState.RUNNING, timedelta(minutes=1))
+
+    # WHEN: the watchdog runs
+    reap_stuck_jobs()
+
+    # THEN: only the stuck job failed
+    with app.app_context():
+        stuck_job: JobDataclass = JobDataclass.get_by_id_or_404(stuck_job_id)
+        assert stuck_job.state == JobState.ERROR
+        assert stuck_job.results[-1].result_type == ResultType.ERROR
+        assert "no heartbeat for 600 seconds" in stuck_job.results[-1].data["exception_message"]
+        assert stuck_job._transient == []
+        running_job: JobDataclass = JobDataclass.get_by_id_or_404(running_job_id)
+        assert running_job.state == JobState.RUNNING
+        assert running_job._transient != []
+
+
+def test_stuck_local_jobs_are_requeued(app, monkeypatch):
+    """Tests that stuck jobs on local simulators are executed again at most STUCK_JOB_MAX_REQUEUES times"""
+    # GIVEN: the requeue policy and a stuck job on a local simulator
+    monkeypatch.setenv("EXECUTION_BACKEND", "IN_PROCESS")
+    app.config.update(STUCK_JOB_POLICY="REQUEUE", STUCK_JOB_MAX_REQUEUES=1, IN_PROCESS_WORKERS=0)
+    with app.app_context():
+        job_id = _create_job(JobState.RUNNING, timedelta(minutes=15))
+
+    # WHEN: the watchdog runs
+    reap_stuck_jobs()
+
+    # THEN: the results of the stopped execution are discarded and the job is queued again
+    with app.app_context():
+        job: JobDataclass = JobDataclass.get_by_id_or_404(job_id)
+        assert job.state == JobState.READY
+        assert job.requeue_count == 1
+        assert job.results == []
+        assert [t.data for t in job._transient] == [{"token": ""}]
+        [queued_task] = QueuedTaskDataclass.get_all()
+        assert queued_task.arguments == {"args": [job_id], "kwargs": {}}
+        assert job.celery_id == f"in-process:{queued_task.id}"
+
+        # WHEN: the job gets stuck again
+        job.state = JobState.RUNNING.value
+        job.heartbeat_at = datetime.now(timezone.utc) - timedelta(minutes=15)
+        job.save(commit=True)
+    reap_stuck_jobs()
+
+    # THEN: the job fails
+    with app.app_context():
+        assert JobDataclass.get_by_id_or_404(job_id).state == JobState.ERROR
+
+
+def test_jobs_are_not_reclaimed_without_heartbeats(app):
+    """Tests that no jobs are reclaimed if the heartbeats are disabled, as long running jobs look stuck then"""
+    # GIVEN: disabled heartbeats and a job running for 15 minutes
+    app.config["JOB_HEARTBEAT_INTERVAL"] = 0
+    with app.app_context():
+        job_id = _create_job(JobState.RUNNING, timedelta(minutes=15))
+
+    # WHEN: the watchdog runs
+    reap_stuck_jobs()
+
+    # THEN: the job is still running
+    with app.app_context():
+        assert JobDataclass.get_by_id_or_404(job_id).state == JobState.RUNNING
+
+
+def test_transient_state_of_inactive_jobs_is_purged(app):
+    """Tests that the transient state of jobs that are no longer running is deleted in bulk"""
+    # GIVEN: finished, canceled and ready jobs with transient state
+    with app.app_context():
+        finished_job_id = _create_job(JobState.FINISHED, timedelta(0))
+        canceled_job_id = _create_job(JobState.CANCELED, timedelta(0))
+        ready_job_id = _create_job(JobState.READY, timedelta(0))
+
+    # WHEN: the watchdog runs
+    reap_stuck_jobs()
+
+    # THEN: only the transient state of the ready job is kept
+    with app.app_context():
+        assert JobDataclass.get_by_id_or_404(finished_job_id)._transient == []
+        assert JobDataclass.get_by_id_or_404(canceled_job_id)._transient == []
+        assert JobDataclass.get_by_id_or_404(ready_job_id)._transient != []
+
+
+def test_running_jobs_record_heartbeats(app):
+    """Tests that the worker records a heartbeat when it starts to execute a job"""
+    # GIVEN: a job
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: the job is executed
+        simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the heartbeat of the job was recorded
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        assert job.heartbeat_at is not None
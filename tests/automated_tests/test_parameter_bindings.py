@@ -0,0 +1,146 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test executing parameterized circuits for multiple parameter bindings"""
+
+from math import pi
+from unittest.mock import patch
+
+import pytest
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto, JobRequestDto, QuantumProgramRequestDto
+from qunicorn_core.core import deployment_service, job_service
+from qunicorn_core.core.pilotmanager import ibm_pilot
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.job_type import JobType
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from tests import test_utils
+from tests.conftest import set_up_env
+
+PARAMETERIZED_CIRCUIT = """OPENQASM 3.0;
+include "stdgates.inc";
+input float[64] theta;
+qubit[1] q;
+bit[1] c;
+rx(theta) q[0];
+c[0] = measure q[0];
+"""
+BINDINGS = [{"theta": 0.0}, {"theta": pi}, {"theta": 0.0}]
+
+
+def _run_parameterized_job(provider: ProviderName, job_type: JobType = JobType.RUNNER) -> JobDataclass:
+    job_request_dto: JobRequestDto = test_utils.get_test_job(provider)
+    job_request_dto.type = job_type
+    job_request_dto.parameter_bindings = BINDINGS
+    deployment = deployment_service.create_deployment(
+        DeploymentUpdateDto(
+            programs=[QuantumProgramRequestDto(PARAMETERIZED_CIRCUIT, AssemblerLanguage.QASM3)], name="Sweep"
+        )
+    )
+    job_request_dto.deployment_id = deployment.id
+    simple_job = job_service.create_and_run_job(job_request_dto, is_asynchronous=False)
+    return JobDataclass.get_by_id_or_404(simple_job.id)
+
+
+def _check_counts_per_binding(job: JobDataclass):
+    assert job.state == JobState.FINISHED
+    counts = [r for r in job.results if r.result_type == ResultType.COUNTS]
+    assert [r.meta["binding"] for r in counts] == [0, 1, 2]
+    assert [r.meta["parameters"] for r in counts] == BINDINGS
+    assert [list(r.data) for r in counts] == [["0x0"], ["0x1"], ["0x0"]]
+
+
+@pytest.mark.parametrize("provider", [ProviderName.IBM, ProviderName.AWS])
+def test_parameterized_circuit_is_executed_for_every_binding(provider: ProviderName):
+    """Tests that a parameterized circuit is compiled once and executed for every parameter binding"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: a job with parameter bindings is executed for a parameterized program
+        with patch.object(ibm_pilot, "compile_circuits", wraps=ibm_pilot.compile_circuits) as compile_circuits:
+            job = _run_parameterized_job(provider)
+
+        # THEN: the program has results for every binding
+        _check_counts_per_binding(job)
+        if provider == ProviderName.IBM:
+            compile_circuits.assert_called_once()
+            assert len(compile_circuits.call_args.args[0]) == 1
+
+
+def test_parameter_bindings_are_broadcast_in_a_single_sampler_pub():
+    """Tests that the sampler executes all parameter bindings of a circuit in a single PUB"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: a sampler job with parameter bindings is executed
+        with patch.object(
+            ibm_pilot.IBMPilot, "_simulate_sampler", wraps=ibm_pilot.IBMPilot._simulate_sampler
+        ) as simulate_sampler:
+            job = _run_parameterized_job(ProviderName.IBM, JobType.SAMPLER)
+
+        # THEN: the circuit was sampled once with all bindings
+        pubs = simulate_sampler.call_args.args[0]
+        assert len(pubs) == 1
+        assert pubs[0][1].shape == (len(BINDINGS), 1)
+        _check_counts_per_binding(job)
+
+
+def test_observables_are_estimated_for_every_binding():
+    """Tests that the estimator estimates all observables for every parameter binding"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: an estimator job with parameter bindings and multiple observables is executed
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.observables = [["Z", "X"]]
+        with patch.object(test_utils, "get_test_job", return_value=job_request_dto):
+            job = _run_parameterized_job(ProviderName.IBM, JobType.ESTIMATOR)
+
+        # THEN: the program has the values of all observables for every binding
+        assert job.state == JobState.FINISHED
+        results = sorted(job.results, key=lambda r: r.id)
+        assert [(r.meta["binding"], r.meta["observer"]) for r in results] == [
+            (binding, f"SparsePauliOp-['{label}']") for binding in range(len(BINDINGS)) for label in ("Z", "X")
+        ]
+        values = [float(r.data["value"]) for r in results]
+        assert values == pytest.approx([1, 0, -1, 0, 1, 0], abs=0.1)
+
+
+def test_unbound_parameters_fail_the_job():
+    """Tests that jobs fail if a parameterized circuit is executed without parameter bindings"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        deployment = deployment_service.create_deployment(
+            DeploymentUpdateDto(
+                programs=[QuantumProgramRequestDto(PARAMETERIZED_CIRCUIT, AssemblerLanguage.QASM3)], name="Sweep"
+            )
+        )
+        job_request_dto.deployment_id = deployment.id
+
+        # WHEN: the job is executed without parameter bindings
+        with pytest.raises(Exception, match="unbound parameters theta"):
+            job_service.create_and_run_job(job_request_dto, is_asynchronous=False)
+
+        # THEN: the job failed
+        job = JobDataclass.get_all()[-1]
+        assert job.state == JobState.ERROR
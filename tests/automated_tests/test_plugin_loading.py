@@ -0,0 +1,78 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test that pilots and transpilers (and their quantum SDKs) are only imported on first use"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from qunicorn_core.core.pilotmanager import pilot_manager
+from qunicorn_core.static.qunicorn_exception import QunicornError
+
+QUANTUM_SDKS = ("qiskit", "qiskit_aer", "qiskit_ibm_runtime", "braket", "pyquil", "qrisp")
+CREATE_APP = """
+import sys
+from qunicorn_core import create_app
+app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:", "OPENAPI_VERSION": "3.0.2"})
+"""
+GET_AWS_PILOT = """
+from qunicorn_core.core.pilotmanager.pilot_manager import get_matching_pilot
+assert type(get_matching_pilot("AWS")).__name__ == "AWSPilot"
+"""
+
+
+def _imported_sdks(script: str) -> list[str]:
+    """Run the script in a fresh interpreter and return the quantum SDKs imported by it"""
+    script += f"\nprint(','.join(m for m in {QUANTUM_SDKS!r} if m in sys.modules))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [m for m in result.stdout.splitlines()[-1].split(",") if m]
+
+
+def test_api_starts_without_quantum_sdks():
+    """Tests that creating the flask app does not import any quantum SDK"""
+    # WHEN: the app is created in a fresh interpreter
+    imported = _imported_sdks(CREATE_APP)
+
+    # THEN: no quantum SDK was imported
+    assert imported == []
+
+
+def test_only_the_used_pilot_is_imported():
+    """Tests that getting a pilot only imports the SDK of this pilot"""
+    # WHEN: the AWS pilot is used
+    imported = _imported_sdks(CREATE_APP + GET_AWS_PILOT)
+
+    # THEN: only braket was imported
+    assert imported == ["braket"]
+
+
+def test_all_pilots_are_available():
+    """Tests that all registered pilots are loaded when they are listed"""
+    # WHEN: all pilots are listed
+    pilots = pilot_manager.PILOTS
+
+    # THEN: every provider has its pilot and unknown providers are rejected
+    assert [pilot.provider_name for pilot in pilots] == list(pilot_manager.PILOT_CLASSES)
+    assert pilot_manager.get_matching_pilot("IBM") is pilots[0]
+    with pytest.raises(QunicornError):
+        pilot_manager.get_matching_pilot("UNKNOWN")
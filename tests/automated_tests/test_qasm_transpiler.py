@@ -0,0 +1,149 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""conformance tests of the text-level QASM translators against the translation via qiskit circuits"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+from qiskit import QuantumCircuit, qasm2, qasm3
+from qiskit.circuit.random import random_circuit
+from qiskit.quantum_info import Operator
+
+from qunicorn_core.core.transpiler import transpile_circuit
+from qunicorn_core.core.transpiler.circuit_transpiler import CircuitTranspiler
+from qunicorn_core.core.transpiler.qasm_transpiler import Qasm2ToQasm3, Qasm3ToQasm2
+from qunicorn_core.core.transpiler.qiskit_transpiler import Qasm2ToQiskit, Qasm3ToQiskit, QiskitToQasm2
+
+QASM2_CIRCUIT = """OPENQASM 2.0;
+include "qelib1.inc";
+gate rot(theta,phi) a { u3(theta,phi,0) a; }
+qreg q[3];
+creg c[3];
+// prepare a rotated GHZ state
+h q[0];
+cx q[0],q[1];
+cu1(pi/8) q[1],q[2];
+rot(pi/2,-0.25) q[2];
+barrier q;
+measure q -> c;
+if(c==3) x q[0];
+"""
+# gates with the same name in qiskit and braket, together with their number of qubits and parameters
+BRAKET_GATES = [
+    ("h", 1, 0),
+    ("x", 1, 0),
+    ("y", 1, 0),
+    ("z", 1, 0),
+    ("s", 1, 0),
+    ("t", 1, 0),
+    ("rx", 1, 1),
+    ("ry", 1, 1),
+    ("rz", 1, 1),
+    ("cx", 2, 0),
+    ("cz", 2, 0),
+    ("swap", 2, 0),
+    ("ccx", 3, 0),
+]
+QASM3_MODIFIER_CIRCUIT = """OPENQASM 3.0;
+include "stdgates.inc";
+gate _hadamard _gate_q_0 { h _gate_q_0; }
+qubit[2] q;
+bit[2] c;
+_hadamard q[0];
+ctrl @ x q[0], q[1];
+c = measure q;
+"""
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_qasm2_to_qasm3_conforms_to_qiskit(seed: int):
+    # GIVEN: a random circuit in QASM2
+    circuit: QuantumCircuit = random_circuit(4, 5, seed=seed)
+    source = qasm2.dumps(circuit)
+
+    # WHEN: the circuit is translated directly
+    translated = Qasm2ToQasm3().transpile_circuit(source)
+
+    # THEN: the translated circuit implements the same unitary as the circuit parsed by qiskit
+    assert Operator(qasm3.loads(translated)).equiv(Operator(Qasm2ToQiskit().transpile_circuit(source)))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_qasm3_to_qasm2_conforms_to_qiskit(seed: int):
+    # GIVEN: a random circuit in QASM3 (as produced by the QASM2 translator)
+    circuit: QuantumCircuit = random_circuit(4, 5, seed=seed)
+    source = Qasm2ToQasm3().transpile_circuit(qasm2.dumps(circuit))
+
+    # WHEN: the circuit is translated back directly
+    with patch.object(Qasm3ToQiskit, "transpile_circuit") as parse_qasm3:
+        translated = Qasm3ToQasm2().transpile_circuit(source)
+
+    # THEN: no qiskit circuit was created and the circuit implements the same unitary
+    parse_qasm3.assert_not_called()
+    assert Operator(Qasm2ToQiskit().transpile_circuit(translated)).equiv(Operator(circuit))
+
+
+def test_measurements_and_conditions_are_translated():
+    # WHEN: a circuit with measurements and conditions is translated to QASM3 and back
+    qasm3_circuit = Qasm2ToQasm3().transpile_circuit(QASM2_CIRCUIT)
+    qasm2_circuit = Qasm3ToQasm2().transpile_circuit(qasm3_circuit)
+
+    # THEN: all translations have the same operations as the circuit parsed by qiskit
+    expected = Qasm2ToQiskit().transpile_circuit(QASM2_CIRCUIT)
+    assert "c = measure q;" in qasm3_circuit
+    assert "if (c == 3) { x q[0]; }" in qasm3_circuit
+    for translated in (qasm3.loads(qasm3_circuit), Qasm2ToQiskit().transpile_circuit(qasm2_circuit)):
+        assert translated.num_qubits == expected.num_qubits
+        assert translated.num_clbits == expected.num_clbits
+        assert translated.count_ops()["measure"] == expected.count_ops()["measure"]
+        assert len(translated.data) == len(expected.data)
+
+
+def test_unsupported_programs_are_translated_via_qiskit():
+    # WHEN: a QASM3 circuit with gate modifiers and identifiers that are invalid in QASM2 is translated
+    translated = Qasm3ToQasm2().transpile_circuit(QASM3_MODIFIER_CIRCUIT)
+
+    # THEN: the translation is the same as the translation via a qiskit circuit
+    assert translated == QiskitToQasm2().transpile_circuit(Qasm3ToQiskit().transpile_circuit(QASM3_MODIFIER_CIRCUIT))
+
+
+def test_direct_translators_are_preferred():
+    # WHEN: transpiler chains between QASM2 and QASM3 are planned
+    to_qasm3 = CircuitTranspiler.get_transpilers_limit_cost("QASM2", "QASM3")
+    to_qasm2 = CircuitTranspiler.get_transpilers_limit_depth("QASM3", "QASM2")
+
+    # THEN: the direct translators are used
+    assert [type(t) for t in to_qasm3] == [Qasm2ToQasm3]
+    assert [type(t) for t in to_qasm2] == [Qasm3ToQasm2]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_qasm2_to_braket_conforms_to_qiskit(seed: int):
+    # GIVEN: a random circuit using gates that are supported by braket
+    rng = random.Random(seed)
+    circuit = QuantumCircuit(3, 3)
+    for _ in range(20):
+        gate, num_qubits, num_params = rng.choice(BRAKET_GATES)
+        getattr(circuit, gate)(*[rng.uniform(0, 6) for _ in range(num_params)], *rng.sample(range(3), num_qubits))
+    circuit.measure(range(3), range(3))
+    source = qasm2.dumps(circuit)
+
+    # WHEN: the circuit is translated directly and via a qiskit circuit
+    translated = transpile_circuit("BRAKET", ("QASM2", source, 0))
+    expected = transpile_circuit("BRAKET", ("QASM2", source, 0), exclude={Qasm2ToQasm3})
+
+    # THEN: both braket circuits are the same
+    assert translated.instructions == expected.instructions
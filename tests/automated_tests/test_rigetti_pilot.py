@@ -0,0 +1,98 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test the Rigetti pilot against a stand-in for the QVM and quilc (a quantum computer simulated by the PyQVM)"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from pyquil.api import QuantumComputer
+from pyquil.api._abstract_compiler import AbstractCompiler
+from pyquil.pyqvm import PyQVM
+
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto, SimpleJobDto
+from qunicorn_core.core import job_service
+from qunicorn_core.core.pilotmanager import rigetti_pilot
+from qunicorn_core.core.pilotmanager.rigetti_pilot import RigettiPilot
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.provider_name import ProviderName
+from tests import test_utils
+from tests.conftest import set_up_env
+
+
+class _StandInCompiler(AbstractCompiler):
+    """Compiler that executes the programs as they are instead of compiling them with quilc"""
+
+    compiled_programs: list = []
+
+    def __init__(self):
+        pass  # no connection to quilc
+
+    def quil_to_native_quil(self, program, *, protoquil=None):
+        _StandInCompiler.compiled_programs.append(program)
+        return program
+
+    def native_quil_to_executable(self, nq_program, **kwargs):
+        return nq_program
+
+
+def _get_stand_in_qc(name: str) -> QuantumComputer:
+    return QuantumComputer(name=name, qam=PyQVM(n_qubits=2), compiler=_StandInCompiler())
+
+
+@pytest.fixture(autouse=True)
+def stand_in_qvm():
+    _StandInCompiler.compiled_programs = []
+    with patch.object(rigetti_pilot, "get_qc", side_effect=_get_stand_in_qc) as get_qc:
+        yield get_qc
+    rigetti_pilot._QUANTUM_COMPUTERS.clear()
+    rigetti_pilot._EXECUTABLES.clear()
+
+
+def test_rigetti_jobs_reuse_handles_and_executables(stand_in_qvm):
+    """Tests that the quantum computer handles and the compiled programs are reused by later jobs"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.RIGETTI)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QUIL])
+
+        # WHEN: the job is executed twice
+        first_dto: SimpleJobDto = job_service.create_and_run_job(job_request_dto, False)
+        second_dto: SimpleJobDto = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: both jobs have correct results, each program was compiled once and the handles were reused
+        for job_dto in (first_dto, second_dto):
+            job: JobDataclass = JobDataclass.get_by_id_or_404(job_dto.id)
+            assert job.state == "FINISHED"
+            test_utils.check_if_job_runner_result_correct(job)
+        assert len(_StandInCompiler.compiled_programs) == 2
+        assert all(p.num_shots == job_request_dto.shots for p in _StandInCompiler.compiled_programs)
+        assert stand_in_qvm.call_count <= 2
+        assert sum(len(handles) for handles in rigetti_pilot._QUANTUM_COMPUTERS.values()) == stand_in_qvm.call_count
+
+
+def test_qvm_results_are_counted():
+    """Tests that the bits read out by the QVM are counted as bitstrings"""
+    # GIVEN: the bits of four shots
+    results = np.array([[0, 1, 1], [1, 0, 0], [0, 1, 1], [0, 0, 0]])
+
+    # WHEN: the results are converted
+    counts = RigettiPilot.result_to_dict(results)
+
+    # THEN: every bitstring is counted
+    assert counts == {"011": 2, "100": 1, "000": 1}
@@ -0,0 +1,180 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test splitting the shots of large jobs on local simulators into chunks"""
+
+from unittest.mock import patch
+
+import pytest
+
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import job_manager_service, job_service
+from qunicorn_core.core.pilotmanager.base_pilot import Pilot
+from qunicorn_core.core.pilotmanager.ibm_pilot import IBMPilot
+from qunicorn_core.core.shot_splitting_service import get_shot_chunks, merge_chunk_results
+from qunicorn_core.core.transpiler.qiskit_transpiler import Qasm2ToQiskit
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.job_state import TransientJobStateDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from tests import test_utils
+from tests.conftest import set_up_env
+
+
+@pytest.mark.parametrize(
+    "provider,languages",
+    [(ProviderName.IBM, [AssemblerLanguage.QASM2]), (ProviderName.AWS, [AssemblerLanguage.BRAKET])],
+)
+def test_shots_are_split_into_chunks(provider: ProviderName, languages: list):
+    """Tests that the shots of large jobs are executed in chunks and the counts of the chunks are merged"""
+    # GIVEN: Database Setup - chunks of at most 1500 shots
+    app = set_up_env()
+    app.config["SHOT_CHUNK_SIZE"] = 1500
+    progress = []
+    determine_db_job_progress = Pilot.determine_db_job_progress
+
+    def record_progress(pilot: Pilot, db_job: JobDataclass) -> int:
+        progress.append(determine_db_job_progress(pilot, db_job))
+        return progress[-1]
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(provider)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, languages)
+
+        # WHEN: a job with 4000 shots is executed
+        with patch.object(Pilot, "determine_db_job_progress", autospec=True, side_effect=record_progress):
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: every program was executed in three chunks and the counts of all shots were merged
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        test_utils.check_if_job_finished(job)
+        test_utils.check_if_job_runner_result_correct(job)
+        counts = [r for r in job.results if r.result_type == ResultType.COUNTS]
+        assert len(counts) == len(job.deployment.programs)
+        assert all(sum(r.data.values()) == 4000 and r.meta["shot_chunks"] == 3 for r in counts)
+        assert progress[0] < progress[1] < progress[2] < 100
+        for program in job.deployment.programs:
+            assert TransientJobStateDataclass.get_program_states(job.id, program.id) == []
+            assert TransientJobStateDataclass.get_fragment_states(job.id, program.id) == []
+
+
+def test_chunks_are_simulated_with_independent_seeds():
+    """Tests that every chunk of a seeded job is simulated with its own seed"""
+    # GIVEN: Database Setup - chunks of at most 1000 shots
+    app = set_up_env()
+    app.config["SHOT_CHUNK_SIZE"] = 1000
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.seed = 42
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: the seeded job is executed
+        with patch.object(IBMPilot, "_simulate_runner", wraps=IBMPilot._simulate_runner) as simulate_runner:
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the chunks were simulated with the seeds derived from the seed of the job
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        chunks = get_shot_chunks(job)
+        assert [shots for shots, _ in chunks] == [1000] * 4
+        assert len(set(seed for _, seed in chunks)) == 4
+        run_options = [(c.args[1]["shots"], c.args[1]["seed_simulator"]) for c in simulate_runner.call_args_list]
+        assert run_options == chunks * len(job.deployment.programs)
+
+
+def test_chunks_reuse_the_translation_of_the_job():
+    """Tests that the chunks executed by the task of the job are not transpiled again"""
+    # GIVEN: Database Setup - chunks of at most 1000 shots
+    app = set_up_env()
+    app.config["SHOT_CHUNK_SIZE"] = 1000
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: the job is executed in four chunks
+        transpile = Qasm2ToQiskit.transpile_circuit
+        with patch.object(Qasm2ToQiskit, "transpile_circuit", autospec=True, side_effect=transpile) as parse_qasm2:
+            simple_job = job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: every program was transpiled once
+        job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+        assert job.state == JobState.FINISHED
+        assert parse_qasm2.call_count == len(job.deployment.programs)
+
+
+def test_chunk_tasks_start_from_a_stored_translation():
+    """Tests that the translations into the pilot languages are stored for the chunks executed in other tasks"""
+    # GIVEN: Database Setup - a deployed QASM2 program
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+        job = JobDataclass.get_by_id_or_404(job_service.create_and_run_job(job_request_dto, False).id)
+
+        # WHEN: the pilot jobs are prepared for chunks executed by other tasks
+        pilot_jobs, _ = job_manager_service._prepare_pilot_jobs(job, ["QISKIT"], persist_targets=True)
+
+        # THEN: the circuits of the pilot jobs are stored serialized
+        for pilot_job in pilot_jobs:
+            assert "QPY" in [t.assembler_language for t in pilot_job.program.translations]
+
+
+def test_failing_chunks_are_reported_once():
+    """Tests that a chunk failing in the task of the job saves a single error result"""
+    # GIVEN: Database Setup - chunks of at most 1500 shots and a failing simulator
+    app = set_up_env()
+    app.config["SHOT_CHUNK_SIZE"] = 1500
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: the job is executed
+        with patch.object(IBMPilot, "_simulate_runner", side_effect=ValueError("simulator failed")):
+            with pytest.raises(ValueError):
+                job_service.create_and_run_job(job_request_dto, False)
+
+        # THEN: the job failed with one error result
+        job: JobDataclass = max(JobDataclass.get_all(), key=lambda j: j.id)
+        assert job.state == JobState.ERROR
+        assert [r.result_type for r in job.results] == [ResultType.ERROR]
+
+
+def test_chunk_results_are_merged():
+    """Tests that counts are summed and probabilities are weighted by the shots of the chunks"""
+    # GIVEN: the results of two chunks with different shots
+    chunk_results = [
+        [
+            {"data": {"0x0": 300, "0x1": 100}, "meta": {"shots": 400}, "result_type": ResultType.COUNTS},
+            {"data": {"0x0": 0.75, "0x1": 0.25}, "meta": {"shots": 400}, "result_type": ResultType.PROBABILITIES},
+        ],
+        [
+            {"data": {"0x1": 100}, "meta": {"shots": 100}, "result_type": ResultType.COUNTS},
+            {"data": {"0x1": 1.0}, "meta": {"shots": 100}, "result_type": ResultType.PROBABILITIES},
+        ],
+    ]
+
+    # WHEN: the results are merged
+    merged = merge_chunk_results(chunk_results, [400, 100])
+
+    # THEN: the merged results contain all shots
+    assert merged == [
+        ({"0x0": 300, "0x1": 200}, {"shots": 500, "shot_chunks": 2}, ResultType.COUNTS),
+        ({"0x0": 0.6, "0x1": 0.4}, {"shots": 500, "shot_chunks": 2}, ResultType.PROBABILITIES),
+    ]
@@ -0,0 +1,142 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test running local simulations in the simulation processes of a worker"""
+
+import os
+import time
+from itertools import count
+from typing import Callable, Tuple
+
+import pytest
+
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto, SimpleJobDto
+from qunicorn_core.core import job_service, simulation_executor
+from qunicorn_core.core.simulation_executor import run_simulation, shutdown_simulation_executor, simulation_session
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.qunicorn_exception import JobCanceledError, QunicornError
+from tests import test_utils
+from tests.conftest import set_up_env
+
+
+def _get_pid() -> int:
+    return os.getpid()
+
+
+def _allocate(megabytes: int) -> int:
+    return len(bytearray(megabytes * 1024 * 1024))
+
+
+def _crash():
+    os._exit(1)
+
+
+def _counter(start: int) -> Callable[[], Tuple[int, int]]:
+    values = count(start)
+    return lambda: (os.getpid(), next(values))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def simulation_processes():
+    yield
+    shutdown_simulation_executor()
+
+
+@pytest.fixture
+def app():
+    app = set_up_env()
+    app.config["SIMULATION_PROCESSES"] = 2
+    app.config["SIMULATION_MEMORY_LIMIT"] = 256
+    with app.app_context():
+        yield app
+
+
+@pytest.mark.parametrize(
+    "provider,languages",
+    [(ProviderName.IBM, [AssemblerLanguage.QASM2]), (ProviderName.AWS, [AssemblerLanguage.BRAKET])],
+)
+def test_jobs_are_simulated_in_simulation_processes(app, provider: ProviderName, languages: list):
+    """Tests that jobs on local simulators are simulated in the simulation processes"""
+    # GIVEN: a job on a local simulator
+    job_request_dto: JobRequestDto = test_utils.get_test_job(provider)
+    test_utils.save_deployment_and_add_id_to_job(job_request_dto, languages)
+
+    # WHEN: the job is executed
+    return_dto: SimpleJobDto = job_service.create_and_run_job(job_request_dto)
+
+    # THEN: the job was simulated in the process pool and has the correct results
+    assert simulation_executor._EXECUTOR is not None
+    job: JobDataclass = JobDataclass.get_by_id_or_404(return_dto.id)
+    test_utils.check_if_job_finished(job)
+    test_utils.check_if_job_runner_result_correct(job)
+
+
+def test_simulations_are_limited(app):
+    """Tests that simulations run in other processes with limited memory"""
+    # WHEN: simulations are run
+    pid = run_simulation(_get_pid)
+
+    # THEN: they run in another process and may not exceed the memory limit
+    assert pid != os.getpid()
+    assert run_simulation(_allocate, 16) == 16 * 1024 * 1024
+    with pytest.raises(QunicornError, match="memory limit of 256 MB"):
+        run_simulation(_allocate, 512)
+
+
+def test_crashed_simulation_processes_are_replaced(app):
+    """Tests that the process pool is replaced if a simulation process crashed"""
+    # WHEN: a simulation process crashes
+    with pytest.raises(QunicornError, match="terminated unexpectedly"):
+        run_simulation(_crash)
+
+    # THEN: later simulations still run
+    assert run_simulation(_get_pid) != os.getpid()
+
+
+def test_canceled_simulations_are_killed(app):
+    """Tests that the simulation process of a simulation that was canceled while it is running is killed"""
+    # GIVEN: a simulation that is canceled after it was started in the process that ran the last simulation
+    pid = run_simulation(_get_pid)
+    checks = []
+
+    def is_canceled() -> bool:
+        checks.append(time.monotonic())
+        return len(checks) > 1
+
+    # WHEN: the simulation is run
+    start = time.monotonic()
+    with pytest.raises(JobCanceledError):
+        run_simulation(time.sleep, 30, is_canceled=is_canceled)
+
+    # THEN: the calling thread stopped waiting and the simulation process was killed and replaced
+    assert time.monotonic() - start < 5
+    assert len(checks) == 2
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+    assert run_simulation(_get_pid) not in (pid, os.getpid())
+
+
+def test_bound_simulations_stay_in_the_simulation_process(app):
+    """Tests that the function bound in a simulation session is set up once and called in the same process"""
+    # WHEN: a bound function is called several times in a session
+    with simulation_session() as session:
+        call = session.bind(_counter, 5)
+        results = [call() for _ in range(3)]
+
+    # THEN: all calls ran in the same simulation process and reused the state of the function
+    assert [value for _, value in results] == [5, 6, 7]
+    assert len({pid for pid, _ in results}) == 1
+    assert results[0][0] != os.getpid()
@@ -0,0 +1,142 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test the result cache for seeded runs on local simulators"""
+
+from unittest.mock import patch
+
+from braket.devices import LocalSimulator
+
+from qunicorn_core.api.api_models.job_dtos import JobRequestDto
+from qunicorn_core.core import job_service
+from qunicorn_core.core.simulator_result_cache_service import cache_results
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.db.models.simulator_result_cache import SimulatorResultCacheDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.provider_name import ProviderName
+from tests import test_utils
+from tests.conftest import set_up_env
+
+IS_ASYNCHRONOUS: bool = False
+
+
+def _run_job(job_request_dto: JobRequestDto) -> JobDataclass:
+    simple_job = job_service.create_and_run_job(job_request_dto, IS_ASYNCHRONOUS)
+    job: JobDataclass = JobDataclass.get_by_id_or_404(simple_job.id)
+    assert job.state == JobState.FINISHED
+    return job
+
+
+def _result_data(job: JobDataclass) -> list:
+    return [(r.program_id, r.result_type, r.data) for r in job.results]
+
+
+def test_seeded_aws_job_is_served_from_cache():
+    """Tests that a repeated seeded job on the braket local simulator reuses the cached results"""
+    # GIVEN: Database Setup - AWS added as a provider and the result cache is enabled
+    app = set_up_env()
+    app.config["SIMULATOR_RESULT_CACHE"] = True
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        job_request_dto.seed = 42
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+
+        # WHEN: the same seeded job is executed twice
+        first_job = _run_job(job_request_dto)
+        with patch.object(LocalSimulator, "run_batch") as run_batch:
+            second_job = _run_job(job_request_dto)
+
+        # THEN: the simulator is not used for the second job and the results are the same
+        run_batch.assert_not_called()
+        assert len(SimulatorResultCacheDataclass.get_all()) == len(first_job.deployment.programs)
+        assert _result_data(first_job) == _result_data(second_job)
+        test_utils.check_if_job_runner_result_correct(second_job)
+
+
+def test_aer_simulator_is_deterministic_for_seeded_jobs():
+    """Tests that seeded jobs on the aer simulator produce the same results without using the cache"""
+    # GIVEN: Database Setup - IBM added as a provider and the result cache is disabled
+    app = set_up_env()
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        job_request_dto.seed = 1234
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: the same seeded job is executed twice
+        first_job = _run_job(job_request_dto)
+        second_job = _run_job(job_request_dto)
+
+        # THEN: both jobs have the same results and nothing was cached
+        assert _result_data(first_job) == _result_data(second_job)
+        assert len(SimulatorResultCacheDataclass.get_all()) == 0
+
+
+def test_unseeded_jobs_are_not_cached():
+    """Tests that jobs without a seed are never stored in the result cache"""
+    # GIVEN: Database Setup - AWS added as a provider and the result cache is enabled
+    app = set_up_env()
+    app.config["SIMULATOR_RESULT_CACHE"] = True
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.AWS)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM3])
+
+        # WHEN: a job without seed is executed
+        _run_job(job_request_dto)
+
+        # THEN: no results were cached
+        assert len(SimulatorResultCacheDataclass.get_all()) == 0
+
+
+def test_least_recently_used_results_are_evicted():
+    """Tests that the result cache does not grow beyond the configured size"""
+    # GIVEN: Database Setup - IBM added as a provider and a result cache with a single entry
+    app = set_up_env()
+    app.config["SIMULATOR_RESULT_CACHE"] = True
+    app.config["SIMULATOR_RESULT_CACHE_SIZE"] = 1
+
+    with app.app_context():
+        job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+        test_utils.save_deployment_and_add_id_to_job(job_request_dto, [AssemblerLanguage.QASM2])
+
+        # WHEN: jobs with different seeds are executed
+        for seed in (1, 2):
+            job_request_dto.seed = seed
+            _run_job(job_request_dto)
+
+        # THEN: only a single result is kept in the cache
+        assert len(SimulatorResultCacheDataclass.get_all()) == 1
+
+
+def test_concurrently_cached_results_keep_pending_changes():
+    """Tests that results cached concurrently by another job neither fail nor discard other pending changes"""
+    # GIVEN: Database Setup - results already cached by another job and an unrelated pending change
+    app = set_up_env()
+    app.config["SIMULATOR_RESULT_CACHE"] = True
+
+    with app.app_context():
+        SimulatorResultCacheDataclass(cache_key="concurrent", results=[{"data": "first"}]).save(commit=True)
+        SimulatorResultCacheDataclass(cache_key="pending", results=[]).save()
+
+        # WHEN: the same key is cached again without seeing the stored entry
+        with patch.object(SimulatorResultCacheDataclass, "get_by_cache_key", return_value=None):
+            cache_results("concurrent", [{"data": "second"}])
+
+    # THEN: the first results were kept and the pending change was committed
+    with app.app_context():
+        entries = {e.cache_key: e.results for e in SimulatorResultCacheDataclass.get_all()}
+        assert entries == {"concurrent": [{"data": "first"}], "pending": []}
@@ -0,0 +1,141 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test planning transpiler chains with measured transpilation durations"""
+
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit, qasm2, qasm3
+
+from qunicorn_core.core import translation_service
+from qunicorn_core.core.transpiler import transpile_circuit
+from qunicorn_core.core.transpiler.circuit_transpiler import (
+    CircuitTranspiler,
+    DEFAULT_COST_UNIT_DURATION,
+    DurationStatistics,
+)
+from qunicorn_core.core.transpiler.qiskit_transpiler import Qasm2ToQiskit, Qasm3ToQiskit
+from qunicorn_core.db.models.transpiler_statistics import TranspilerStatisticsDataclass
+from tests.conftest import set_up_env
+
+
+def _bell_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    return circuit
+
+
+def test_transpilation_durations_are_recorded():
+    """Tests that every transpilation step records its duration"""
+    # GIVEN: no recorded durations
+    CircuitTranspiler.reset_statistics()
+
+    # WHEN: a circuit is transpiled in two steps
+    transpile_circuit("QPY", ("QASM2", qasm2.dumps(_bell_circuit()), 0))
+
+    # THEN: the durations of both steps are recorded
+    statistics = CircuitTranspiler.get_statistics()
+    assert statistics["Qasm2ToQiskit"]["samples"] == 1
+    assert statistics["QiskitToQPY"]["samples"] == 1
+    assert statistics["Qasm2ToQiskit"]["duration"] > 0
+    assert len(statistics["Qasm2ToQiskit"]["duration_by_size"]) == 1
+    assert statistics["Qasm3ToQiskit"]["duration"] is None
+
+
+def test_measured_cost_model_avoids_slow_transpilers():
+    """Tests that the measured cost model prefers the source format with the faster transpiler"""
+    # GIVEN: a slow QASM2 parser and a circuit available as QASM2 and QASM3
+    CircuitTranspiler.reset_statistics()
+    Qasm2ToQiskit().record_duration(1000, 10.0)
+    circuit = _bell_circuit()
+    sources = [("QASM2", qasm2.dumps(circuit), 0), ("QASM3", qasm3.dumps(circuit), 0)]
+
+    # WHEN: the circuit is transpiled with the measured cost model
+    with patch.object(Qasm3ToQiskit, "transpile_circuit", return_value=circuit) as parse_qasm3:
+        transpiled = transpile_circuit("QISKIT", *sources, cost_model="measured")
+
+    # THEN: the QASM3 circuit is parsed instead of the QASM2 circuit
+    parse_qasm3.assert_called_once()
+    assert transpiled is circuit
+
+
+def test_duration_estimates_scale_with_circuit_size():
+    """Tests that durations are estimated from the closest measured circuit size"""
+    # GIVEN: a measured duration for small circuits
+    CircuitTranspiler.reset_statistics()
+    transpiler = Qasm2ToQiskit()
+    assert transpiler.estimate_duration(100) == transpiler.cost * DEFAULT_COST_UNIT_DURATION
+    transpiler.record_duration(100, 0.5)
+
+    # WHEN: the duration for a larger circuit is estimated
+    estimate = transpiler.estimate_duration(400)
+
+    # THEN: the estimate grows with the size of the circuit
+    assert estimate == 2.0
+
+
+def test_transpiler_statistics_are_listed():
+    """Tests that the transpiler service lists the transpilers with the durations stored by the workers"""
+    # GIVEN: a recorded duration that was stored by the worker
+    app = set_up_env()
+    with app.app_context():
+        CircuitTranspiler.reset_statistics()
+        transpile_circuit("QASM3", ("QISKIT", _bell_circuit(), 0))
+        translation_service.sync_transpiler_statistics()
+
+        # WHEN: the transpilers are listed
+        transpilers = {t.name: t for t in translation_service.get_transpilers()}
+
+    # THEN: the static and the measured costs are included
+    assert transpilers["QiskitToQasm3"].source == "QISKIT"
+    assert transpilers["QiskitToQasm3"].target == "QASM3"
+    assert transpilers["QiskitToQasm3"].samples == 1
+    assert not transpilers["QiskitToQasm3"].unsafe
+    assert transpilers["QiskitPythonToQiskit"].unsafe
+
+
+def test_transpiler_statistics_are_merged_across_processes():
+    """Tests that the durations measured by other processes are listed and used for planning transpiler chains"""
+    # GIVEN: a slow QASM2 parser measured by another worker and a duration measured by this process
+    app = set_up_env()
+    with app.app_context():
+        CircuitTranspiler.reset_statistics()
+        Qasm3ToQiskit().record_duration(100, 0.5)
+        measured = DurationStatistics()
+        measured.record(10.0)
+        measured.by_size[(100).bit_length()] = DurationStatistics(duration=10.0, samples=1)
+        for name, statistics in [("Qasm2ToQiskit", measured), ("Qasm3ToQiskit", DurationStatistics(1.5, 3))]:
+            TranspilerStatisticsDataclass(
+                process="other-host:1",
+                transpiler=name,
+                source=name[:5].upper(),
+                target="QISKIT",
+                cost=1,
+                unsafe=False,
+                statistics=statistics.to_dict(),
+            ).save(commit=True)
+
+        # WHEN: the statistics are synchronized and listed
+        translation_service.sync_transpiler_statistics()
+        transpilers = {t.name: t for t in translation_service.get_transpilers()}
+
+    # THEN: the durations of both processes are merged and the durations of the other process are used for planning
+    assert transpilers["Qasm2ToQiskit"].samples == 1
+    assert transpilers["Qasm2ToQiskit"].duration == 10.0
+    assert transpilers["Qasm3ToQiskit"].samples == 4
+    assert transpilers["Qasm3ToQiskit"].duration == (0.5 + 3 * 1.5) / 4
+    assert Qasm2ToQiskit().estimate_duration(100) == 10.0
+    assert Qasm3ToQiskit().estimate_duration(100) == 0.5
@@ -0,0 +1,130 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test executing the unsafe python circuit formats in the sandbox processes"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from qunicorn_core.core.transpiler import unsafe_transpilers
+from qunicorn_core.core.transpiler.sandbox import SandboxError, get_sandbox_pool, shutdown_sandbox_pool
+from qunicorn_core.core.transpiler.unsafe_transpilers import BraketPythonToBraket, QiskitPythonToQiskit
+from tests.conftest import set_up_env
+
+QISKIT_PROGRAM = """circuit = QuantumCircuit(2, 2)
+circuit.h(0)
+circuit.cx(0, 1)
+circuit.measure([0, 1], [0, 1])
+"""
+ENVIRONMENT_PROGRAM = """import os
+circuit = QuantumCircuit(1, name=",".join(sorted(os.environ)))
+"""
+BRAKET_PROGRAM = "Circuit().h(0).cnot(0, 1)"
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = set_up_env()
+    app.config["SANDBOX_UNSAFE_TRANSPILERS"] = True
+    app.config["SANDBOX_POOL_SIZE"] = 2
+    app.config["SANDBOX_TIMEOUT"] = 5
+    with app.app_context():
+        yield app
+    shutdown_sandbox_pool()
+
+
+def test_programs_are_executed_in_warm_processes(app):
+    """Tests that circuit programs are executed in the sandbox processes, which are reused"""
+    # WHEN: a circuit program is transpiled twice
+    first = QiskitPythonToQiskit().transpile_circuit(QISKIT_PROGRAM)
+    processes = {p.process.pid for p in get_sandbox_pool()._processes}
+    second = QiskitPythonToQiskit().transpile_circuit(QISKIT_PROGRAM)
+
+    # THEN: the circuit is the same as the circuit executed in this process and no process was replaced
+    with patch.object(unsafe_transpilers, "is_sandbox_enabled", return_value=False):
+        expected = QiskitPythonToQiskit().transpile_circuit(QISKIT_PROGRAM)
+    assert first == expected and second == expected
+    assert {p.process.pid for p in get_sandbox_pool()._processes} == processes
+
+
+def test_programs_cannot_read_the_environment(app):
+    """Tests that the environment of qunicorn (e.g. credentials) is not passed to the sandbox processes"""
+    # GIVEN: a secret in the environment of qunicorn
+    with patch.dict(os.environ, {"QUNICORN_TEST_SECRET": "secret"}):
+        # WHEN: a circuit program reads the environment
+        circuit = QiskitPythonToQiskit().transpile_circuit(ENVIRONMENT_PROGRAM)
+
+    # THEN: the secret is not available, only the minimal environment of the sandbox
+    names = circuit.name.split(",")
+    assert "QUNICORN_TEST_SECRET" not in names
+    assert "PATH" in names and "HOME" in names
+
+
+def test_braket_circuits_are_not_changed(app):
+    """Tests that braket circuits without measurements are returned without additional measurements"""
+    # WHEN: a braket circuit program is transpiled
+    circuit = BraketPythonToBraket().transpile_circuit(BRAKET_PROGRAM)
+
+    # THEN: the circuit is the same as the circuit executed in this process
+    with patch.object(unsafe_transpilers, "is_sandbox_enabled", return_value=False):
+        assert circuit == BraketPythonToBraket().transpile_circuit(BRAKET_PROGRAM)
+
+
+def test_failing_programs_are_reported(app):
+    """Tests that errors and timeouts of circuit programs are reported without replacing the sandbox processes"""
+    processes = {p.process.pid for p in get_sandbox_pool()._processes}
+
+    # WHEN: a circuit program raises an error
+    with pytest.raises(SandboxError, match="ValueError"):
+        QiskitPythonToQiskit().transpile_circuit("x = 1")
+
+    # WHEN: a circuit program does not finish in time
+    with pytest.raises(SandboxError, match="in time"):
+        QiskitPythonToQiskit().transpile_circuit("while True: pass")
+
+    # THEN: the programs failed in their own child processes, the warm sandbox processes can still be used
+    assert {p.process.pid for p in get_sandbox_pool()._processes} == processes
+    assert QiskitPythonToQiskit().transpile_circuit(QISKIT_PROGRAM).num_qubits == 2
+
+
+def test_programs_cannot_change_the_sandbox_process(app):
+    """Tests that changes of a program to the imported libraries are not visible to the following programs"""
+    # GIVEN: a program that breaks the serialization of the circuits
+    patching_program = "from qiskit import qpy\nqpy.dump = None\n" + QISKIT_PROGRAM
+    with pytest.raises(SandboxError, match="TypeError"):
+        QiskitPythonToQiskit().transpile_circuit(patching_program)
+
+    # WHEN: other programs are executed by the same sandbox processes
+    circuits = [QiskitPythonToQiskit().transpile_circuit(QISKIT_PROGRAM) for _ in range(get_sandbox_pool().size)]
+
+    # THEN: their circuits are serialized with the original libraries
+    assert all(circuit.num_qubits == 2 for circuit in circuits)
+
+
+def test_broken_sandbox_processes_are_replaced(app):
+    """Tests that a sandbox process that terminated is replaced"""
+    # GIVEN: the next sandbox process was killed
+    pool = get_sandbox_pool()
+    processes = {p.process.pid for p in pool._processes}
+    pool._idle.queue[0].process.kill()
+
+    # WHEN: a circuit program is executed by the killed process
+    with pytest.raises(SandboxError, match="terminated unexpectedly"):
+        QiskitPythonToQiskit().transpile_circuit(QISKIT_PROGRAM)
+
+    # THEN: the process was replaced and the pool can still be used
+    assert len(processes - {p.process.pid for p in pool._processes}) == 1
+    assert QiskitPythonToQiskit().transpile_circuit(QISKIT_PROGRAM).num_qubits == 2
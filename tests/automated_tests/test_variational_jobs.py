@@ -0,0 +1,172 @@
+# Copyright 2026 University of Stuttgart
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""test optimizing the parameters of circuits in the hybrid loop of variational jobs"""
+
+from unittest.mock import patch
+
+import pytest
+
+from qunicorn_core.api.api_models import DeploymentUpdateDto, JobRequestDto, QuantumProgramRequestDto
+from qunicorn_core.core import deployment_service, job_service
+from qunicorn_core.core.pilotmanager.ibm_pilot import IBMPilot
+from qunicorn_core.core.simulation_executor import shutdown_simulation_executor
+from qunicorn_core.db.models.job import JobDataclass
+from qunicorn_core.static.enums.assembler_languages import AssemblerLanguage
+from qunicorn_core.static.enums.job_state import JobState
+from qunicorn_core.static.enums.job_type import JobType
+from qunicorn_core.static.enums.optimizer_method import OptimizerMethod
+from qunicorn_core.static.enums.provider_name import ProviderName
+from qunicorn_core.static.enums.result_type import ResultType
+from tests import test_utils
+from tests.conftest import set_up_env
+
+ANSATZ = """OPENQASM 3.0;
+include "stdgates.inc";
+input float[64] theta;
+qubit[1] q;
+bit[1] c;
+rx(theta) q[0];
+c[0] = measure q[0];
+"""
+
+
+def _run_variational_job(optimizer: dict) -> JobDataclass:
+    job_request_dto: JobRequestDto = test_utils.get_test_job(ProviderName.IBM)
+    job_request_dto.type = JobType.VARIATIONAL
+    job_request_dto.seed = 42
+    job_request_dto.observables = [["Z"]]
+    job_request_dto.optimizer = optimizer
+    deployment = deployment_service.create_deployment(
+        DeploymentUpdateDto(programs=[QuantumProgramRequestDto(ANSATZ, AssemblerLanguage.QASM3)], name="Ansatz")
+    )
+    job_request_dto.deployment_id = deployment.id
+    simple_job = job_service.create_and_run_job(job_request_dto, is_asynchronous=False)
+    return JobDataclass.get_by_id_or_404(simple_job.id)
+
+
+@pytest.mark.parametrize("method", [OptimizerMethod.COBYLA, OptimizerMethod.SPSA])
+def test_variational_job_minimizes_observables(method: OptimizerMethod):
+    """Tests that variational jobs find the parameters minimizing the expectation value of the observables"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: the expectation value of Z is minimized for rx(theta)|0>
+        job = _run_variational_job({"method": method, "initial_parameters": {"theta": 0.5}, "max_iterations": 60})
+
+        # THEN: the result of every iteration and the optimal parameters (theta = pi) were saved
+        assert job.state == JobState.FINISHED
+        results = sorted(job.results, key=lambda r: r.id)
+        iterations = [r for r in results if r.result_type == ResultType.VALUE_AND_VARIANCE]
+        assert [r.meta["iteration"] for r in iterations] == list(range(len(iterations)))
+        assert 0 < len(iterations) <= 60
+        assert results[-1].result_type == ResultType.OPTIMIZATION_RESULT
+        assert results[-1].data["iterations"] == len(iterations)
+        assert float(results[-1].data["value"]) == pytest.approx(-1, abs=0.05)
+        assert abs(results[-1].data["parameters"]["theta"]) == pytest.approx(3.14, abs=0.4)
+
+
+def test_variational_job_iterations_are_bounded():
+    """Tests that the optimizer stops after the maximum number of iterations"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+
+    with app.app_context():
+        # WHEN: the optimizer may only execute the circuit three times
+        job = _run_variational_job(
+            {"method": OptimizerMethod.NELDER_MEAD, "initial_parameters": {"theta": 0.5}, "max_iterations": 3}
+        )
+
+        # THEN: the job finished with the best parameters of the three iterations
+        assert job.state == JobState.FINISHED
+        iterations = [r for r in job.results if r.result_type == ResultType.VALUE_AND_VARIANCE]
+        assert len(iterations) == 3
+        optimization_result = next(r for r in job.results if r.result_type == ResultType.OPTIMIZATION_RESULT)
+        assert optimization_result.data["success"] is False
+        assert float(optimization_result.data["value"]) == min(float(r.data["value"]) for r in iterations)
+
+
+def test_variational_job_iterations_are_simulated_in_simulation_processes():
+    """Tests that the estimator of the iterations can be bound in a simulation process of the worker"""
+    # GIVEN: Database Setup with simulation processes
+    app = set_up_env()
+    app.config["SIMULATION_PROCESSES"] = 2
+
+    try:
+        with app.app_context():
+            # WHEN: the job is executed
+            job = _run_variational_job(
+                {"method": OptimizerMethod.NELDER_MEAD, "initial_parameters": {"theta": 0.5}, "max_iterations": 5}
+            )
+
+            # THEN: every iteration was estimated by the bound estimator
+            assert job.state == JobState.FINISHED
+            iterations = [r for r in job.results if r.result_type == ResultType.VALUE_AND_VARIANCE]
+            assert len(iterations) == 5
+    finally:
+        shutdown_simulation_executor()
+
+
+def test_variational_job_iterations_are_limited_by_the_configuration():
+    """Tests that variational jobs may not exceed the configured maximum number of iterations"""
+    # GIVEN: Database Setup with at most 10 iterations per job
+    app = set_up_env()
+    app.config["VARIATIONAL_MAX_ITERATIONS"] = 10
+
+    with app.app_context():
+        # WHEN: a job with more iterations is executed
+        with pytest.raises(Exception, match="between 1 and 10 iterations"):
+            _run_variational_job({"initial_parameters": {"theta": 0.5}, "max_iterations": 11})
+
+        # THEN: the job failed
+        assert JobDataclass.get_all()[-1].state == JobState.ERROR
+
+
+def test_variational_job_iterations_can_be_canceled(monkeypatch):
+    """Tests that the iterations reuse one estimator and the optimization stops when the job is canceled"""
+    # GIVEN: Database Setup
+    app = set_up_env()
+    estimators = []
+    iterations = []
+    iteration_estimator = IBMPilot._iteration_estimator
+
+    def cancel_during_third_iteration(*args):
+        estimate = iteration_estimator(*args)
+        estimators.append(estimate)
+
+        def estimate_and_cancel(values):
+            iterations.append(values)
+            if len(iterations) == 3:
+                # the job is canceled by another request while the third iteration is simulated
+                with app.app_context(), monkeypatch.context() as m:
+                    m.setenv("EXECUTION_BACKEND", "IN_PROCESS")
+                    running_job_id = max(j.id for j in JobDataclass.get_all() if j.state == JobState.RUNNING)
+                    job_service.cancel_job_by_id(running_job_id, token=None)
+            return estimate(values)
+
+        return estimate_and_cancel
+
+    with app.app_context():
+        # WHEN: the job is canceled during the third iteration
+        with patch.object(IBMPilot, "_iteration_estimator", side_effect=cancel_during_third_iteration):
+            job = _run_variational_job(
+                {"method": OptimizerMethod.NELDER_MEAD, "initial_parameters": {"theta": 0.5}, "max_iterations": 10}
+            )
+
+        # THEN: the estimator was set up once and the optimization stopped without saving the third iteration
+        assert job.state == JobState.CANCELED
+        assert len(estimators) == 1
+        assert len(iterations) == 3
+        assert [r.result_type for r in job.results] == [ResultType.VALUE_AND_VARIANCE] * 2